@@ -13,162 +13,205 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import importlib
+from typing import TYPE_CHECKING
+
 from google.cloud.container_v1 import gapic_version as package_version
 
 __version__ = package_version.__version__
 
 
-from .services.cluster_manager import ClusterManagerAsyncClient, ClusterManagerClient
-from .types.cluster_service import (
-    AcceleratorConfig,
-    AdditionalPodRangesConfig,
-    AddonsConfig,
-    AdvancedMachineFeatures,
-    AuthenticatorGroupsConfig,
-    Autopilot,
-    AutoprovisioningNodePoolDefaults,
-    AutoUpgradeOptions,
-    BinaryAuthorization,
-    BlueGreenSettings,
-    CancelOperationRequest,
-    ClientCertificateConfig,
-    CloudRunConfig,
-    Cluster,
-    ClusterAutoscaling,
-    ClusterUpdate,
-    CompleteIPRotationRequest,
-    CompleteNodePoolUpgradeRequest,
-    ConfidentialNodes,
-    ConfigConnectorConfig,
-    CostManagementConfig,
-    CreateClusterRequest,
-    CreateNodePoolRequest,
-    DailyMaintenanceWindow,
-    DatabaseEncryption,
-    DatapathProvider,
-    DefaultSnatStatus,
-    DeleteClusterRequest,
-    DeleteNodePoolRequest,
-    DnsCacheConfig,
-    DNSConfig,
-    EphemeralStorageLocalSsdConfig,
-    FastSocket,
-    Fleet,
-    GatewayAPIConfig,
-    GcePersistentDiskCsiDriverConfig,
-    GcfsConfig,
-    GcpFilestoreCsiDriverConfig,
-    GetClusterRequest,
-    GetJSONWebKeysRequest,
-    GetJSONWebKeysResponse,
-    GetNodePoolRequest,
-    GetOpenIDConfigRequest,
-    GetOpenIDConfigResponse,
-    GetOperationRequest,
-    GetServerConfigRequest,
-    GkeBackupAgentConfig,
-    GPUSharingConfig,
-    HorizontalPodAutoscaling,
-    HttpLoadBalancing,
-    IdentityServiceConfig,
-    ILBSubsettingConfig,
-    IntraNodeVisibilityConfig,
-    IPAllocationPolicy,
-    IPv6AccessType,
-    Jwk,
-    KubernetesDashboard,
-    LegacyAbac,
-    LinuxNodeConfig,
-    ListClustersRequest,
-    ListClustersResponse,
-    ListNodePoolsRequest,
-    ListNodePoolsResponse,
-    ListOperationsRequest,
-    ListOperationsResponse,
-    ListUsableSubnetworksRequest,
-    ListUsableSubnetworksResponse,
-    LocalNvmeSsdBlockConfig,
-    LoggingComponentConfig,
-    LoggingConfig,
-    LoggingVariantConfig,
-    MaintenanceExclusionOptions,
-    MaintenancePolicy,
-    MaintenanceWindow,
-    ManagedPrometheusConfig,
-    MasterAuth,
-    MasterAuthorizedNetworksConfig,
-    MaxPodsConstraint,
-    MeshCertificates,
-    MonitoringComponentConfig,
-    MonitoringConfig,
-    NetworkConfig,
-    NetworkPolicy,
-    NetworkPolicyConfig,
-    NetworkTags,
-    NodeConfig,
-    NodeConfigDefaults,
-    NodeKubeletConfig,
-    NodeLabels,
-    NodeManagement,
-    NodeNetworkConfig,
-    NodePool,
-    NodePoolAutoConfig,
-    NodePoolAutoscaling,
-    NodePoolDefaults,
-    NodePoolLoggingConfig,
-    NodePoolUpdateStrategy,
-    NodeTaint,
-    NodeTaints,
-    NotificationConfig,
-    Operation,
-    OperationProgress,
-    PodCIDROverprovisionConfig,
-    PrivateClusterConfig,
-    PrivateClusterMasterGlobalAccessConfig,
-    PrivateIPv6GoogleAccess,
-    RecurringTimeWindow,
-    ReleaseChannel,
-    ReservationAffinity,
-    ResourceLabels,
-    ResourceLimit,
-    ResourceUsageExportConfig,
-    RollbackNodePoolUpgradeRequest,
-    SandboxConfig,
-    SecurityBulletinEvent,
-    ServerConfig,
-    ServiceExternalIPsConfig,
-    SetAddonsConfigRequest,
-    SetLabelsRequest,
-    SetLegacyAbacRequest,
-    SetLocationsRequest,
-    SetLoggingServiceRequest,
-    SetMaintenancePolicyRequest,
-    SetMasterAuthRequest,
-    SetMonitoringServiceRequest,
-    SetNetworkPolicyRequest,
-    SetNodePoolAutoscalingRequest,
-    SetNodePoolManagementRequest,
-    SetNodePoolSizeRequest,
-    ShieldedInstanceConfig,
-    ShieldedNodes,
-    StackType,
-    StartIPRotationRequest,
-    StatusCondition,
-    TimeWindow,
-    UpdateClusterRequest,
-    UpdateMasterRequest,
-    UpdateNodePoolRequest,
-    UpgradeAvailableEvent,
-    UpgradeEvent,
-    UpgradeResourceType,
-    UsableSubnetwork,
-    UsableSubnetworkSecondaryRange,
-    VerticalPodAutoscaling,
-    VirtualNIC,
-    WindowsNodeConfig,
-    WorkloadIdentityConfig,
-    WorkloadMetadataConfig,
-)
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .services.cluster_manager import (
+        ClusterManagerAsyncClient,
+        ClusterManagerClient,
+    )
+    from .types.cluster_service import (
+        AcceleratorConfig,
+        AdditionalPodRangesConfig,
+        AddonsConfig,
+        AdvancedMachineFeatures,
+        AuthenticatorGroupsConfig,
+        Autopilot,
+        AutoprovisioningNodePoolDefaults,
+        AutoUpgradeOptions,
+        BinaryAuthorization,
+        BlueGreenSettings,
+        CancelOperationRequest,
+        ClientCertificateConfig,
+        CloudRunConfig,
+        Cluster,
+        ClusterAutoscaling,
+        ClusterUpdate,
+        CompleteIPRotationRequest,
+        CompleteNodePoolUpgradeRequest,
+        ConfidentialNodes,
+        ConfigConnectorConfig,
+        CostManagementConfig,
+        CreateClusterRequest,
+        CreateNodePoolRequest,
+        DailyMaintenanceWindow,
+        DatabaseEncryption,
+        DatapathProvider,
+        DefaultSnatStatus,
+        DeleteClusterRequest,
+        DeleteNodePoolRequest,
+        DnsCacheConfig,
+        DNSConfig,
+        EphemeralStorageLocalSsdConfig,
+        FastSocket,
+        Fleet,
+        GatewayAPIConfig,
+        GcePersistentDiskCsiDriverConfig,
+        GcfsConfig,
+        GcpFilestoreCsiDriverConfig,
+        GetClusterRequest,
+        GetJSONWebKeysRequest,
+        GetJSONWebKeysResponse,
+        GetNodePoolRequest,
+        GetOpenIDConfigRequest,
+        GetOpenIDConfigResponse,
+        GetOperationRequest,
+        GetServerConfigRequest,
+        GkeBackupAgentConfig,
+        GPUSharingConfig,
+        HorizontalPodAutoscaling,
+        HttpLoadBalancing,
+        IdentityServiceConfig,
+        ILBSubsettingConfig,
+        IntraNodeVisibilityConfig,
+        IPAllocationPolicy,
+        IPv6AccessType,
+        Jwk,
+        KubernetesDashboard,
+        LegacyAbac,
+        LinuxNodeConfig,
+        ListClustersRequest,
+        ListClustersResponse,
+        ListNodePoolsRequest,
+        ListNodePoolsResponse,
+        ListOperationsRequest,
+        ListOperationsResponse,
+        ListUsableSubnetworksRequest,
+        ListUsableSubnetworksResponse,
+        LocalNvmeSsdBlockConfig,
+        LoggingComponentConfig,
+        LoggingConfig,
+        LoggingVariantConfig,
+        MaintenanceExclusionOptions,
+        MaintenancePolicy,
+        MaintenanceWindow,
+        ManagedPrometheusConfig,
+        MasterAuth,
+        MasterAuthorizedNetworksConfig,
+        MaxPodsConstraint,
+        MeshCertificates,
+        MonitoringComponentConfig,
+        MonitoringConfig,
+        NetworkConfig,
+        NetworkPolicy,
+        NetworkPolicyConfig,
+        NetworkTags,
+        NodeConfig,
+        NodeConfigDefaults,
+        NodeKubeletConfig,
+        NodeLabels,
+        NodeManagement,
+        NodeNetworkConfig,
+        NodePool,
+        NodePoolAutoConfig,
+        NodePoolAutoscaling,
+        NodePoolDefaults,
+        NodePoolLoggingConfig,
+        NodePoolUpdateStrategy,
+        NodeTaint,
+        NodeTaints,
+        NotificationConfig,
+        Operation,
+        OperationProgress,
+        PodCIDROverprovisionConfig,
+        PrivateClusterConfig,
+        PrivateClusterMasterGlobalAccessConfig,
+        PrivateIPv6GoogleAccess,
+        RecurringTimeWindow,
+        ReleaseChannel,
+        ReservationAffinity,
+        ResourceLabels,
+        ResourceLimit,
+        ResourceUsageExportConfig,
+        RollbackNodePoolUpgradeRequest,
+        SandboxConfig,
+        SecurityBulletinEvent,
+        ServerConfig,
+        ServiceExternalIPsConfig,
+        SetAddonsConfigRequest,
+        SetLabelsRequest,
+        SetLegacyAbacRequest,
+        SetLocationsRequest,
+        SetLoggingServiceRequest,
+        SetMaintenancePolicyRequest,
+        SetMasterAuthRequest,
+        SetMonitoringServiceRequest,
+        SetNetworkPolicyRequest,
+        SetNodePoolAutoscalingRequest,
+        SetNodePoolManagementRequest,
+        SetNodePoolSizeRequest,
+        ShieldedInstanceConfig,
+        ShieldedNodes,
+        StackType,
+        StartIPRotationRequest,
+        StatusCondition,
+        TimeWindow,
+        UpdateClusterRequest,
+        UpdateMasterRequest,
+        UpdateNodePoolRequest,
+        UpgradeAvailableEvent,
+        UpgradeEvent,
+        UpgradeResourceType,
+        UsableSubnetwork,
+        UsableSubnetworkSecondaryRange,
+        VerticalPodAutoscaling,
+        VirtualNIC,
+        WindowsNodeConfig,
+        WorkloadIdentityConfig,
+        WorkloadMetadataConfig,
+    )
+
+# The clients and message classes are imported on first access (PEP 562),
+# so that importing this package stays cheap for short-lived processes.
+_LAZY_MODULES = {
+    "ClusterManagerAsyncClient": ".services.cluster_manager",
+    "ClusterManagerClient": ".services.cluster_manager",
+}
+_TYPES_MODULE = ".types.cluster_service"
+
+# The submodules, and the modules to import to bind them, as the eager
+# imports of the clients and types did.
+_SUBMODULES = {
+    "gapic_version": ".gapic_version",
+    "services": ".services.cluster_manager",
+    "types": ".types.cluster_service",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        importlib.import_module(_SUBMODULES[name], __name__)
+        return importlib.import_module("." + name, __name__)
+    if name in _LAZY_MODULES:
+        module_name = _LAZY_MODULES[name]
+    elif name in __all__:
+        module_name = _TYPES_MODULE
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = (
     "ClusterManagerAsyncClient",
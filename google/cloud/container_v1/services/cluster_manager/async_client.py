@@ -14,10 +14,12 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import copy
 import functools
 import re
 from typing import (
     Dict,
+    Iterable,
     Mapping,
     MutableMapping,
     MutableSequence,
@@ -45,11 +47,23 @@ except AttributeError:  # pragma: NO COVER
 
 from google.rpc import status_pb2  # type: ignore
 
-from google.cloud.container_v1.services.cluster_manager import pagers
+from google.cloud.container_v1.services.cluster_manager import (
+    cache,
+    fleet,
+    node_pools,
+    pagers,
+    projection,
+    request_builder,
+)
 from google.cloud.container_v1.types import cluster_service
 
 from .client import ClusterManagerClient
-from .transports.base import DEFAULT_CLIENT_INFO, ClusterManagerTransport
+from .transports.base import (
+    DEFAULT_CLIENT_INFO,
+    DEFAULT_WARM_UP_TIMEOUT,
+    ClusterManagerTransport,
+)
+from .transports.compression import Compression
 from .transports.grpc_asyncio import ClusterManagerGrpcAsyncIOTransport
 
 
@@ -166,6 +180,26 @@ class ClusterManagerAsyncClient:
         """
         return self._client.transport
 
+    def with_response_format(self, response_format: str) -> "ClusterManagerAsyncClient":
+        """Returns a client whose calls return responses in ``response_format``.
+
+        See :meth:`ClusterManagerClient.with_response_format`.
+
+        Args:
+            response_format (str): ``"proto-plus"``, ``"protobuf"`` or
+                ``"bytes"``.
+
+        Returns:
+            ClusterManagerAsyncClient: This client if the transport already
+                returns ``response_format``, otherwise a new client.
+        """
+        client = self._client.with_response_format(response_format)
+        if client is self._client:
+            return self
+        async_client = copy.copy(self)
+        async_client._client = client
+        return async_client
+
     get_transport_class = functools.partial(
         type(ClusterManagerClient).get_transport_class, type(ClusterManagerClient)
     )
@@ -177,6 +211,9 @@ class ClusterManagerAsyncClient:
         transport: Union[str, ClusterManagerTransport] = "grpc_asyncio",
         client_options: Optional[ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[cache.ResponseCache] = None,
+        request_coalescer: Optional[cache.RequestCoalescer] = None,
+        compression: Optional[Compression] = None,
     ) -> None:
         """Instantiates the cluster manager client.
 
@@ -205,6 +242,21 @@ class ClusterManagerAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            response_cache (Optional[google.cloud.container_v1.services.cluster_manager.cache.ResponseCache]):
+                An optional cache for the responses of slowly changing
+                methods such as ``get_server_config`` and
+                ``get_json_web_keys``. If ``None``, every call is sent
+                to the server.
+            request_coalescer (Optional[google.cloud.container_v1.services.cluster_manager.cache.RequestCoalescer]):
+                Shares one in-flight call between identical concurrent
+                reads such as ``get_cluster`` and ``get_node_pool``. If
+                ``None``, every call sends its own request.
+            compression (Optional[Union[str, grpc.Compression]]): How the
+                requests of calls made without a ``compression`` of their
+                own are compressed: ``"none"``, ``"gzip"``, ``"deflate"``,
+                or ``"auto"`` to compress large requests only. If ``None``,
+                the transport's setting is used. See
+                :mod:`~.transports.compression`.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -215,8 +267,27 @@ class ClusterManagerAsyncClient:
             transport=transport,
             client_options=client_options,
             client_info=client_info,
+            response_cache=response_cache,
+            request_coalescer=request_coalescer,
+            compression=compression,
         )
 
+    async def warm_up(self, timeout: Optional[float] = DEFAULT_WARM_UP_TIMEOUT) -> None:
+        """Connects the client's channel and refreshes its credentials.
+
+        Await it after creating the client, so that the first call does
+        not wait for the connection and token.
+
+        Args:
+            timeout (Optional[float]): The longest to wait, in seconds.
+                Waits until the channel is ready if None.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel is
+                not ready within ``timeout``.
+        """
+        await self._client._transport.warm_up(timeout)
+
     async def list_clusters(
         self,
         request: Optional[Union[cluster_service.ListClustersRequest, dict]] = None,
@@ -227,6 +298,8 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.ListClustersResponse:
         r"""Lists all clusters owned by a project in either the
         specified zone or all zones.
@@ -293,6 +366,13 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                each cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. ``missing_zones`` is always
+                returned. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1.types.ListClustersResponse:
@@ -301,57 +381,51 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListClustersRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if parent is not None:
-            request.parent = parent
+        builder = request_builder.BUILDERS["list_clusters"]
+        request = builder.build(request, project_id, zone, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_clusters,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_clusters"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+        if fields is not None:
+            metadata += (
+                projection.field_mask_metadata(
+                    fields, prefix="clusters", extra=("missing_zones",)
+                ),
+            )
 
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "list_clusters"
+        ):
+            response = await request_coalescer.call_async(
+                "list_clusters",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -367,6 +441,8 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.Cluster:
         r"""Gets the details of a specific cluster.
 
@@ -440,65 +516,57 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                the cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1.types.Cluster:
                 A Google Kubernetes Engine cluster.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["get_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_cluster,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+        if fields is not None:
+            metadata += (projection.field_mask_metadata(fields),)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces("get_cluster"):
+            response = await request_coalescer.call_async(
+                "get_cluster",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -514,6 +582,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a cluster, consisting of the specified number and type
         of Google Compute Engine instances.
@@ -597,6 +666,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -607,41 +679,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CreateClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster is not None:
-            request.cluster = cluster
-        if parent is not None:
-            request.parent = parent
+        builder = request_builder.BUILDERS["create_cluster"]
+        request = builder.build(request, project_id, zone, cluster, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_cluster,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["create_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -649,6 +697,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -666,6 +715,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the settings of a specific cluster.
 
@@ -746,6 +796,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -756,43 +809,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, update, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.UpdateClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if update is not None:
-            request.update = update
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["update_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, update, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_cluster,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["update_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -800,6 +827,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -812,6 +840,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the version and/or image type for the
         specified node pool.
@@ -852,6 +881,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -862,21 +894,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.UpdateNodePoolRequest(request)
+        builder = request_builder.BUILDERS["update_node_pool"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_node_pool,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["update_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -884,6 +912,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -898,6 +927,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the autoscaling settings for the specified node
         pool.
@@ -936,6 +966,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -946,21 +979,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetNodePoolAutoscalingRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_autoscaling"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_node_pool_autoscaling,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_node_pool_autoscaling"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -968,6 +997,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -985,6 +1015,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the logging service for a specific cluster.
 
@@ -1078,6 +1109,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1088,45 +1122,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, logging_service, name]
+        builder = request_builder.BUILDERS["set_logging_service"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, logging_service, name
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetLoggingServiceRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if logging_service is not None:
-            request.logging_service = logging_service
-        if name is not None:
-            request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_logging_service,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_logging_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1134,6 +1142,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1153,6 +1162,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the monitoring service for a specific cluster.
 
@@ -1248,6 +1258,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1258,45 +1271,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, monitoring_service, name]
+        builder = request_builder.BUILDERS["set_monitoring_service"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, monitoring_service, name
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetMonitoringServiceRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if monitoring_service is not None:
-            request.monitoring_service = monitoring_service
-        if name is not None:
-            request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_monitoring_service,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_monitoring_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1304,6 +1291,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1321,6 +1309,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the addons for a specific cluster.
 
@@ -1402,6 +1391,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1412,43 +1404,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, addons_config, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetAddonsConfigRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if addons_config is not None:
-            request.addons_config = addons_config
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["set_addons_config"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, addons_config, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_addons_config,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_addons_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1456,6 +1424,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1473,6 +1442,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the locations for a specific cluster. Deprecated. Use
         `projects.locations.clusters.update <https://cloud.google.com/kubernetes-engine/docs/reference/rest/v1/projects.locations.clusters/update>`__
@@ -1563,6 +1533,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1577,43 +1550,17 @@ class ClusterManagerAsyncClient:
         )
 
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, locations, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetLocationsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if name is not None:
-            request.name = name
-        if locations:
-            request.locations.extend(locations)
+        builder = request_builder.BUILDERS["set_locations"]
+        request = builder.build(request, project_id, zone, cluster_id, locations, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_locations,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_locations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1621,6 +1568,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1638,6 +1586,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the master for a specific cluster.
 
@@ -1731,6 +1680,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1741,43 +1693,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, master_version, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.UpdateMasterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if master_version is not None:
-            request.master_version = master_version
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["update_master"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, master_version, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_master,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["update_master"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1785,6 +1713,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1797,6 +1726,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets master auth materials. Currently supports
         changing the admin password or a specific cluster,
@@ -1838,6 +1768,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1848,21 +1781,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetMasterAuthRequest(request)
+        builder = request_builder.BUILDERS["set_master_auth"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_master_auth,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_master_auth"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1870,6 +1799,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1886,6 +1816,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes the cluster, including the Kubernetes
         endpoint and all worker nodes.
@@ -1968,6 +1899,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1978,51 +1912,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.DeleteClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["delete_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_cluster,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["delete_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -2030,6 +1930,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -2044,6 +1945,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListOperationsResponse:
         r"""Lists all operations in a project in a specific zone
         or all zones.
@@ -2102,6 +2004,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.ListOperationsResponse:
@@ -2110,55 +2015,45 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListOperationsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
+        builder = request_builder.BUILDERS["list_operations"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_operations,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_operations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "list_operations"
+        ):
+            response = await request_coalescer.call_async(
+                "list_operations",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2174,6 +2069,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Gets the specified operation.
 
@@ -2246,6 +2142,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -2256,59 +2155,45 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetOperationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if operation_id is not None:
-            request.operation_id = operation_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["get_operation"]
+        request = builder.build(request, project_id, zone, operation_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_operation,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "get_operation"
+        ):
+            response = await request_coalescer.call_async(
+                "get_operation",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2324,6 +2209,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""Cancels the specified operation.
 
@@ -2393,43 +2279,22 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CancelOperationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if operation_id is not None:
-            request.operation_id = operation_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["cancel_operation"]
+        request = builder.build(request, project_id, zone, operation_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.cancel_operation,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["cancel_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         await rpc(
@@ -2437,6 +2302,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     async def get_server_config(
@@ -2449,6 +2315,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ServerConfig:
         r"""Returns configuration info about the Google
         Kubernetes Engine service.
@@ -2513,6 +2380,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.ServerConfig:
@@ -2521,57 +2391,43 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetServerConfigRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["get_server_config"]
+        request = builder.build(request, project_id, zone, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_server_config,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_server_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or serve it from the response cache.
+        response_cache = self._client._response_cache
+        if response_cache is not None and response_cache.caches("get_server_config"):
+            response = await response_cache.get_or_load_async(
+                "get_server_config",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2583,6 +2439,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.GetJSONWebKeysResponse:
         r"""Gets the public component of the cluster signing keys
         in JSON Web Key format.
@@ -2626,6 +2483,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.GetJSONWebKeysResponse:
@@ -2635,29 +2495,43 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.GetJSONWebKeysRequest(request)
+        builder = request_builder.BUILDERS["get_json_web_keys"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_json_web_keys,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_json_web_keys"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or serve it from the response cache.
+        response_cache = self._client._response_cache
+        if response_cache is not None and response_cache.caches("get_json_web_keys"):
+            response = await response_cache.get_or_load_async(
+                "get_json_web_keys",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2673,6 +2547,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListNodePoolsResponse:
         r"""Lists the node pools for a cluster.
 
@@ -2745,6 +2620,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.ListNodePoolsResponse:
@@ -2753,59 +2631,45 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListNodePoolsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if parent is not None:
-            request.parent = parent
+        builder = request_builder.BUILDERS["list_node_pools"]
+        request = builder.build(request, project_id, zone, cluster_id, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_node_pools,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_node_pools"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "list_node_pools"
+        ):
+            response = await request_coalescer.call_async(
+                "list_node_pools",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2822,6 +2686,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.NodePool:
         r"""Retrieves the requested node pool.
 
@@ -2902,6 +2767,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.NodePool:
@@ -2918,61 +2786,47 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetNodePoolRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool_id is not None:
-            request.node_pool_id = node_pool_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["get_node_pool"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_node_pool,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "get_node_pool"
+        ):
+            response = await request_coalescer.call_async(
+                "get_node_pool",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2989,6 +2843,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a node pool for a cluster.
 
@@ -3066,6 +2921,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3076,43 +2934,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CreateNodePoolRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool is not None:
-            request.node_pool = node_pool
-        if parent is not None:
-            request.parent = parent
+        builder = request_builder.BUILDERS["create_node_pool"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool, parent
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_node_pool,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["create_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3120,6 +2954,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3137,6 +2972,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes a node pool from a cluster.
 
@@ -3218,6 +3054,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3228,53 +3067,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.DeleteNodePoolRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool_id is not None:
-            request.node_pool_id = node_pool_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["delete_node_pool"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_node_pool,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["delete_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3282,6 +3087,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3296,6 +3102,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""CompleteNodePoolUpgrade will signal an on-going node
         pool upgrade to complete.
@@ -3332,23 +3139,22 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.CompleteNodePoolUpgradeRequest(request)
+        builder = request_builder.BUILDERS["complete_node_pool_upgrade"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.complete_node_pool_upgrade,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["complete_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         await rpc(
@@ -3356,6 +3162,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     async def rollback_node_pool_upgrade(
@@ -3372,6 +3179,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Rolls back a previously Aborted or Failed NodePool
         upgrade. This makes no changes if the last upgrade
@@ -3460,6 +3268,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3470,43 +3281,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.RollbackNodePoolUpgradeRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool_id is not None:
-            request.node_pool_id = node_pool_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["rollback_node_pool_upgrade"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.rollback_node_pool_upgrade,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["rollback_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3514,6 +3301,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3528,6 +3316,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the NodeManagement options for a node pool.
 
@@ -3566,6 +3355,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3576,21 +3368,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetNodePoolManagementRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_management"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_node_pool_management,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_node_pool_management"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3598,6 +3386,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3610,6 +3399,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets labels on a cluster.
 
@@ -3651,6 +3441,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3661,21 +3454,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetLabelsRequest(request)
+        builder = request_builder.BUILDERS["set_labels"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_labels,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_labels"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3683,6 +3472,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3700,6 +3490,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables the ABAC authorization mechanism
         on a cluster.
@@ -3783,6 +3574,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3793,43 +3587,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, enabled, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetLegacyAbacRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if enabled is not None:
-            request.enabled = enabled
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["set_legacy_abac"]
+        request = builder.build(request, project_id, zone, cluster_id, enabled, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_legacy_abac,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_legacy_abac"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3837,6 +3605,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3853,6 +3622,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Starts master IP rotation.
 
@@ -3927,6 +3697,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3937,41 +3710,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.StartIPRotationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["start_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.start_ip_rotation,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["start_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3979,6 +3728,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3997,6 +3747,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Completes master IP rotation.
 
@@ -4069,6 +3820,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4079,41 +3833,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CompleteIPRotationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["complete_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.complete_ip_rotation,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["complete_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4121,6 +3851,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4133,6 +3864,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the size for a specific node pool. The new size will be
         used for all replicas, including future replicas created by
@@ -4174,6 +3906,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4184,21 +3919,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetNodePoolSizeRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_size"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_node_pool_size,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_node_pool_size"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4206,6 +3937,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4223,6 +3955,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables Network Policy for a cluster.
 
@@ -4303,6 +4036,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4313,43 +4049,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, network_policy, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetNetworkPolicyRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if network_policy is not None:
-            request.network_policy = network_policy
-        if name is not None:
-            request.name = name
+        builder = request_builder.BUILDERS["set_network_policy"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, network_policy, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_network_policy,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_network_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4357,6 +4069,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4376,6 +4089,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the maintenance policy for a cluster.
 
@@ -4455,6 +4169,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4465,45 +4182,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, maintenance_policy, name]
+        builder = request_builder.BUILDERS["set_maintenance_policy"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, maintenance_policy, name
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetMaintenancePolicyRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if maintenance_policy is not None:
-            request.maintenance_policy = maintenance_policy
-        if name is not None:
-            request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_maintenance_policy,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_maintenance_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4511,6 +4202,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4525,6 +4217,8 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        prefetch: int = 0,
     ) -> pagers.ListUsableSubnetworksAsyncPager:
         r"""Lists subnetworks that are usable for creating
         clusters in a project.
@@ -4565,6 +4259,13 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            prefetch (int): The maximum number of pages to request in
+                the background ahead of the caller while iterating the
+                returned pager. ``0`` (the default) fetches each page
+                only once the previous one has been consumed.
 
         Returns:
             google.cloud.container_v1.services.cluster_manager.pagers.ListUsableSubnetworksAsyncPager:
@@ -4578,21 +4279,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.ListUsableSubnetworksRequest(request)
+        builder = request_builder.BUILDERS["list_usable_subnetworks"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_usable_subnetworks,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_usable_subnetworks"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4600,20 +4297,76 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListUsableSubnetworksAsyncPager(
-            method=rpc,
+            method=functools.partial(rpc, compression=call_compression),
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
         return response
 
+    async def batch_get_node_pools(
+        self,
+        names: Iterable[str],
+        *,
+        list_ratio: float = node_pools.DEFAULT_LIST_RATIO,
+        pool_counts: Optional[MutableMapping[str, int]] = None,
+        max_concurrency: int = fleet.DEFAULT_MAX_WORKERS,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Dict[str, node_pools.NodePoolResult]:
+        r"""Gets many node pools, across any number of clusters.
+
+        The names are grouped by cluster. Each cluster is read with one
+        ``list_node_pools`` call if the requested pools make up at least
+        ``list_ratio`` of its pools, and with a ``get_node_pool`` call
+        per requested pool otherwise. See :mod:`~.node_pools`.
+
+        Args:
+            names (Iterable[str]):
+                The node pool names, in the format
+                ``projects/*/locations/*/clusters/*/nodePools/*``.
+            list_ratio (float):
+                The share of a cluster's pools from which the cluster is
+                listed.
+            pool_counts (Optional[MutableMapping[str, int]]):
+                The number of pools of each cluster, by cluster name,
+                updated from every listing. A cluster whose count is
+                unknown is listed, unless a single pool is requested.
+            max_concurrency (int):
+                The maximum number of calls in flight.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each call.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Dict[str, google.cloud.container_v1.services.cluster_manager.node_pools.NodePoolResult]:
+                A result per distinct name, in the order of ``names``,
+                holding the node pool or the error that prevented
+                reading it.
+        """
+        return await node_pools.get_node_pools(
+            self,
+            names,
+            list_ratio=list_ratio,
+            pool_counts=pool_counts,
+            max_concurrency=max_concurrency,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
     async def __aenter__(self):
         return self
 
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side response caching and request coalescing.
+
+``get_server_config`` and ``get_json_web_keys`` return data that changes
+rarely. A :class:`ResponseCache` passed to
+:class:`~google.cloud.container_v1.services.cluster_manager.ClusterManagerClient`
+(or its async counterpart) serves repeated calls for these methods from
+memory until their time-to-live expires.
+
+Reads that must be fresh can still avoid duplicate work: with a
+:class:`RequestCoalescer`, identical ``get_cluster``, ``get_node_pool``
+and other read calls made while one of them is in flight share its
+response instead of each sending an RPC.
+"""
+import asyncio
+from collections import OrderedDict
+import concurrent.futures
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from google.api_core import exceptions as core_exceptions
+from google.protobuf import message as protobuf_message  # type: ignore
+import proto  # type: ignore
+
+from google.cloud.container_v1.services.cluster_manager import projection
+
+_ROUTING_HEADER = "x-goog-request-params"
+
+# The metadata that changes the response of a call.
+_KEY_HEADERS = (_ROUTING_HEADER, projection.FIELD_MASK_HEADER)
+
+DEFAULT_TTLS: Mapping[str, float] = {
+    "get_server_config": 300.0,
+    "get_json_web_keys": 60.0,
+}
+
+DEFAULT_COALESCED_METHODS = frozenset(
+    (
+        "get_cluster",
+        "get_node_pool",
+        "get_operation",
+        "list_clusters",
+        "list_node_pools",
+        "list_operations",
+    )
+)
+
+
+def cache_key(
+    method: str, request: proto.Message, metadata: Sequence[Tuple[str, str]] = ()
+) -> Tuple[str, bytes, Tuple[str, ...]]:
+    """Returns the cache key for a call.
+
+    Calls share a key when they target the same method with the same
+    serialized request, routing header and field mask. Other metadata,
+    such as tracing headers, does not affect the key.
+    """
+    headers = tuple(
+        "{}={}".format(key, value) for key, value in metadata if key in _KEY_HEADERS
+    )
+    return method, type(request).serialize(request), headers
+
+
+def _copy(response):
+    # Hand out copies so that callers cannot modify a shared response.
+    if isinstance(response, proto.Message):
+        return type(response)(response)
+    if isinstance(response, protobuf_message.Message):
+        copied = type(response)()
+        copied.CopyFrom(response)
+        return copied
+    return response
+
+
+def _wait_timeout(timeout) -> Optional[float]:
+    # The client default (gapic_v1.method.DEFAULT) bounds the call that is
+    # waited on, so only explicit timeouts bound the wait.
+    if isinstance(timeout, (int, float)):
+        return timeout
+    return None
+
+
+def _waited_too_long(timeout: float) -> core_exceptions.DeadlineExceeded:
+    return core_exceptions.DeadlineExceeded(
+        "Timed out after {:.3f}s waiting for an identical call in flight.".format(
+            timeout
+        )
+    )
+
+
+class RequestCoalescer:
+    """Shares one in-flight call between identical concurrent reads.
+
+    A call made while an identical call (see :func:`cache_key`) is in
+    flight sends no RPC of its own. It waits for the in-flight call and
+    receives a copy of its response, or the same error. Nothing is kept
+    once the call finishes, so responses are never stale.
+
+    A call that joins another still honours its own timeout: it fails
+    with :class:`~google.api_core.exceptions.DeadlineExceeded` if the
+    response does not arrive in time, while the call it joined goes on.
+
+    A coalescer may be shared by several clients, sync and async alike.
+    Sync calls are coalesced across threads, and async calls across the
+    tasks of each event loop.
+
+    Args:
+        methods (Collection[str]): The client methods to coalesce. Only
+            methods without side effects should be listed.
+    """
+
+    def __init__(self, methods: Collection[str] = DEFAULT_COALESCED_METHODS):
+        self._methods = frozenset(methods)
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, concurrent.futures.Future] = {}
+        # Keyed by event loop too, since futures belong to one loop.
+        self._async_inflight: Dict[
+            Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future
+        ] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def coalesces(self, method: str) -> bool:
+        """Returns whether calls of ``method`` are coalesced."""
+        return method in self._methods
+
+    def in_flight(self) -> int:
+        """Returns the number of calls in flight."""
+        with self._lock:
+            return len(self._inflight) + len(self._async_inflight)
+
+    def call(
+        self,
+        method: str,
+        request: proto.Message,
+        metadata: Sequence[Tuple[str, str]],
+        load: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Returns the response of a call, joining an identical one in flight.
+
+        Args:
+            method (str): The client method name.
+            request (proto.Message): The request message.
+            metadata (Sequence[Tuple[str, str]]): The call metadata,
+                including the routing header.
+            load (Callable[[], Any]): Performs the RPC if no identical call
+                is in flight.
+            timeout (Optional[float]): The timeout of the call, in seconds.
+                Bounds the wait when joining another call. Other values,
+                such as the client default, leave the wait unbounded.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the joined call
+                does not finish within ``timeout``.
+        """
+        response, shared = self._call(
+            cache_key(method, request, metadata), load, timeout
+        )
+        return _copy(response) if shared else response
+
+    async def call_async(
+        self,
+        method: str,
+        request: proto.Message,
+        metadata: Sequence[Tuple[str, str]],
+        load: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Like :meth:`call`, for coroutines."""
+        response, shared = await self._call_async(
+            cache_key(method, request, metadata), load, timeout
+        )
+        return _copy(response) if shared else response
+
+    def _call(
+        self, key: Hashable, load: Callable[[], Any], timeout=None
+    ) -> Tuple[Any, bool]:
+        # Returns the response, and whether it came from another call.
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = concurrent.futures.Future()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            timeout = _wait_timeout(timeout)
+            try:
+                return future.result(timeout=timeout), True
+            except concurrent.futures.TimeoutError:
+                if future.done():
+                    # The joined call failed with a TimeoutError of its own.
+                    raise
+                raise _waited_too_long(timeout) from None
+
+        try:
+            response = load()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._inflight[key]
+        future.set_result(response)
+        return response, False
+
+    async def _call_async(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]], timeout=None
+    ) -> Tuple[Any, bool]:
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, key)
+        with self._lock:
+            future = self._async_inflight.get(inflight_key)
+            leader = future is None
+            if leader:
+                future = loop.create_future()
+                self._async_inflight[inflight_key] = future
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            wait_timeout = _wait_timeout(timeout)
+            try:
+                return (
+                    await asyncio.wait_for(asyncio.shield(future), wait_timeout),
+                    True,
+                )
+            except asyncio.TimeoutError:
+                if future.done():
+                    raise
+                raise _waited_too_long(wait_timeout) from None
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The call we were waiting on was cancelled; make our own.
+            return await self._call_async(key, load, timeout)
+
+        try:
+            response = await load()
+        except BaseException as exc:
+            with self._lock:
+                del self._async_inflight[inflight_key]
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Mark the exception as retrieved when nobody else waits.
+                future.exception()
+            raise
+        with self._lock:
+            del self._async_inflight[inflight_key]
+        future.set_result(response)
+        return response, False
+
+
+class ResponseCache:
+    """A size-bounded LRU cache with per-method time-to-live.
+
+    Only methods listed in ``ttls`` are cached. Concurrent misses for the
+    same key are coalesced into a single RPC by a
+    :class:`RequestCoalescer`, whose result (or error) is shared with
+    every waiter. Errors are never cached.
+
+    Args:
+        ttls (Mapping[str, float]): The time-to-live, in seconds, of each
+            cacheable client method, keyed by method name.
+        maxsize (int): The maximum number of responses kept. The least
+            recently used response is evicted first.
+        clock (Callable[[], float]): The monotonic clock used to expire
+            entries.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        *,
+        maxsize: int = 128,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self._ttls = dict(ttls)
+        self._maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Maps a key to an (expiry, response) pair, least recently used first.
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._misses = RequestCoalescer(self._ttls)
+        # Bumped on invalidation so in-flight loads do not repopulate
+        # entries that were invalidated while they ran.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def caches(self, method: str) -> bool:
+        """Returns whether responses of ``method`` are cached."""
+        return method in self._ttls
+
+    def invalidate(self, method: Optional[str] = None) -> None:
+        """Drops cached responses.
+
+        Args:
+            method (Optional[str]): Only drop the responses of this client
+                method. All responses are dropped if unset.
+        """
+        with self._lock:
+            self._generation += 1
+            if method is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == method]:
+                    del self._entries[key]
+
+    def _peek(self, key: Hashable) -> Tuple[bool, Any]:
+        # Must be called with the lock held.
+        entry = self._entries.get(key)
+        if entry is not None:
+            expiry, response = entry
+            if expiry > self._clock():
+                self._entries.move_to_end(key)
+                return True, response
+            del self._entries[key]
+        return False, None
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        # Must be called with the lock held.
+        found, response = self._peek(key)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found, response
+
+    def _store(self, key: Hashable, response: Any, generation: int) -> None:
+        # Must be called with the lock held.
+        if generation != self._generation:
+            return
+        self._entries[key] = (self._clock() + self._ttls[key[0]], response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_load(
+        self,
+        method: str,
+        request: proto.Message,
+        metadata: Sequence[Tuple[str, str]],
+        load: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Returns the cached response for a call, loading it on a miss.
+
+        Args:
+            method (str): The client method name.
+            request (proto.Message): The request message.
+            metadata (Sequence[Tuple[str, str]]): The call metadata,
+                including the routing header.
+            load (Callable[[], Any]): Performs the RPC on a miss.
+            timeout (Optional[float]): The timeout of the call, in seconds.
+                Bounds the wait for an identical miss in flight.
+        """
+        key = cache_key(method, request, metadata)
+        with self._lock:
+            found, response = self._lookup(key)
+            if found:
+                return _copy(response)
+            generation = self._generation
+
+        def load_and_store():
+            with self._lock:
+                # Another call may have stored the response since the miss.
+                found, response = self._peek(key)
+                if found:
+                    return response
+            response = load()
+            with self._lock:
+                self._store(key, response, generation)
+            return response
+
+        response, _ = self._misses._call(key, load_and_store, timeout)
+        return _copy(response)
+
+    async def get_or_load_async(
+        self,
+        method: str,
+        request: proto.Message,
+        metadata: Sequence[Tuple[str, str]],
+        load: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Like :meth:`get_or_load`, for coroutines.
+
+        Args:
+            method (str): The client method name.
+            request (proto.Message): The request message.
+            metadata (Sequence[Tuple[str, str]]): The call metadata,
+                including the routing header.
+            load (Callable[[], Awaitable[Any]]): Performs the RPC on a miss.
+            timeout (Optional[float]): The timeout of the call, in seconds.
+                Bounds the wait for an identical miss in flight.
+        """
+        key = cache_key(method, request, metadata)
+        with self._lock:
+            found, response = self._lookup(key)
+            if found:
+                return _copy(response)
+            generation = self._generation
+
+        async def load_and_store():
+            with self._lock:
+                found, response = self._peek(key)
+                if found:
+                    return response
+            response = await load()
+            with self._lock:
+                self._store(key, response, generation)
+            return response
+
+        response, _ = await self._misses._call_async(key, load_and_store, timeout)
+        return _copy(response)
+
+
+__all__ = (
+    "DEFAULT_COALESCED_METHODS",
+    "DEFAULT_TTLS",
+    "RequestCoalescer",
+    "ResponseCache",
+    "cache_key",
+)
@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import copy
+import functools
 import os
 import re
 from typing import (
@@ -39,6 +41,7 @@ from google.auth.exceptions import MutualTLSChannelError  # type: ignore
 from google.auth.transport import mtls  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
+import grpc  # type: ignore
 
 from google.cloud.container_v1 import gapic_version as package_version
 
@@ -49,12 +52,24 @@ except AttributeError:  # pragma: NO COVER
 
 from google.rpc import status_pb2  # type: ignore
 
-from google.cloud.container_v1.services.cluster_manager import pagers
+from google.cloud.container_v1.services.cluster_manager import (
+    cache,
+    pagers,
+    projection,
+    request_builder,
+)
 from google.cloud.container_v1.types import cluster_service
 
-from .transports.base import DEFAULT_CLIENT_INFO, ClusterManagerTransport
+from .transports.base import (
+    DEFAULT_CLIENT_INFO,
+    DEFAULT_WARM_UP_TIMEOUT,
+    ClusterManagerTransport,
+)
+from .transports.compression import Compression, check_compression
+from .transports.compression import algorithm as compression_algorithm
 from .transports.grpc import ClusterManagerGrpcTransport
 from .transports.grpc_asyncio import ClusterManagerGrpcAsyncIOTransport
+from .transports.registry import ChannelRegistry
 
 
 class ClusterManagerClientMeta(type):
@@ -178,6 +193,70 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         """
         return self._transport
 
+    def with_response_format(self, response_format: str) -> "ClusterManagerClient":
+        """Returns a client whose calls return responses in ``response_format``.
+
+        The returned client shares this client's channel, and asking for
+        the same format again is cheap, so it can be used per call:
+
+        .. code-block:: python
+
+            raw_client = client.with_response_format("protobuf")
+            response = raw_client.list_clusters(parent=parent)
+            # response is a cluster_service_pb2.ListClustersResponse
+
+        Use :func:`~.transports.raw.wrap` to turn a raw response into a
+        proto-plus message later. The response cache and request coalescer
+        of this client are not used by clients with a different format, and
+        paged methods do not support ``"bytes"``.
+
+        Args:
+            response_format (str): ``"proto-plus"``, ``"protobuf"`` for the
+                underlying protobuf messages, or ``"bytes"`` for the
+                serialized responses.
+
+        Returns:
+            ClusterManagerClient: This client if the transport already
+                returns ``response_format``, otherwise a new client.
+
+        Raises:
+            ValueError: If ``response_format`` is unknown.
+        """
+        transport = self._transport.with_response_format(response_format)
+        if transport is self._transport:
+            return self
+        client = copy.copy(self)
+        client._transport = transport
+        client._response_cache = None
+        client._request_coalescer = None
+        return client
+
+    def warm_up(self, timeout: Optional[float] = DEFAULT_WARM_UP_TIMEOUT) -> None:
+        """Connects the client's channel and refreshes its credentials.
+
+        Call it after creating the client, or pass ``prewarm=True``, so
+        that the first call does not wait for the connection and token.
+
+        Args:
+            timeout (Optional[float]): The longest to wait, in seconds.
+                Waits until the channel is ready if None.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel is
+                not ready within ``timeout``.
+        """
+        self._transport.warm_up(timeout)
+
+    def _call_compression(self, compression, request) -> Optional[grpc.Compression]:
+        """Returns the algorithm that compresses the request of a call.
+
+        If neither the call nor the client set a compression, returns
+        None to leave the choice to the transport.
+        """
+        if compression is None:
+            compression = self._compression
+        return compression_algorithm(compression, request)
+
     @staticmethod
     def topic_path(
         project: str,
@@ -346,6 +425,11 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         transport: Optional[Union[str, ClusterManagerTransport]] = None,
         client_options: Optional[Union[client_options_lib.ClientOptions, dict]] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[cache.ResponseCache] = None,
+        request_coalescer: Optional[cache.RequestCoalescer] = None,
+        compression: Optional[Compression] = None,
+        prewarm: bool = False,
+        channel_registry: Optional[ChannelRegistry] = None,
     ) -> None:
         """Instantiates the cluster manager client.
 
@@ -379,11 +463,41 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            response_cache (Optional[google.cloud.container_v1.services.cluster_manager.cache.ResponseCache]):
+                An optional cache for the responses of slowly changing
+                methods such as ``get_server_config`` and
+                ``get_json_web_keys``. If ``None``, every call is sent
+                to the server.
+            request_coalescer (Optional[google.cloud.container_v1.services.cluster_manager.cache.RequestCoalescer]):
+                Shares one in-flight call between identical concurrent
+                reads such as ``get_cluster`` and ``get_node_pool``. If
+                ``None``, every call sends its own request.
+            compression (Optional[Union[str, grpc.Compression]]): How the
+                requests of calls made without a ``compression`` of their
+                own are compressed: ``"none"``, ``"gzip"``, ``"deflate"``,
+                or ``"auto"`` to compress large requests only. If ``None``,
+                the transport's setting is used. See
+                :mod:`~.transports.compression`.
+            prewarm (bool): Whether to connect the channel and refresh the
+                credentials before returning, so that the first call does
+                not wait for them. See :meth:`warm_up`.
+            channel_registry (Optional[google.cloud.container_v1.services.cluster_manager.transports.registry.ChannelRegistry]):
+                Shares the gRPC channel with the other clients of the
+                registry that have the same endpoint, credentials and
+                options, such as those of
+                :func:`~.transports.registry.default_registry`. Closing the
+                client releases the channel. It won't take effect if a
+                ``transport`` instance is provided.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
                 creation failed for any reason.
         """
+        self._response_cache = response_cache
+        self._request_coalescer = request_coalescer
+        check_compression(compression)
+        self._compression = compression
+
         if isinstance(client_options, dict):
             client_options = client_options_lib.from_dict(client_options)
         if client_options is None:
@@ -415,6 +529,11 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if channel_registry is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its channel "
+                    "registry directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -427,6 +546,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 )
 
             Transport = type(self).get_transport_class(transport)
+            transport_kwargs = {}
+            if channel_registry is not None:
+                transport_kwargs["channel_registry"] = channel_registry
             self._transport = Transport(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
@@ -437,8 +559,12 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 client_info=client_info,
                 always_use_jwt_access=True,
                 api_audience=client_options.api_audience,
+                **transport_kwargs,
             )
 
+        if prewarm:
+            self.warm_up()
+
     def list_clusters(
         self,
         request: Optional[Union[cluster_service.ListClustersRequest, dict]] = None,
@@ -449,6 +575,8 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.ListClustersResponse:
         r"""Lists all clusters owned by a project in either the
         specified zone or all zones.
@@ -515,6 +643,13 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                each cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. ``missing_zones`` is always
+                returned. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1.types.ListClustersResponse:
@@ -523,47 +658,50 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListClustersRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListClustersRequest):
-            request = cluster_service.ListClustersRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if parent is not None:
-                request.parent = parent
+        builder = request_builder.BUILDERS["list_clusters"]
+        request = builder.build(request, project_id, zone, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_clusters]
+        rpc = self._transport._dispatch["list_clusters"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
+        if fields is not None:
+            metadata += (
+                projection.field_mask_metadata(
+                    fields, prefix="clusters", extra=("missing_zones",)
+                ),
+            )
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "list_clusters"
+        ):
+            response = self._request_coalescer.call(
+                "list_clusters",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -579,6 +717,8 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.Cluster:
         r"""Gets the details of a specific cluster.
 
@@ -652,55 +792,58 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                the cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1.types.Cluster:
                 A Google Kubernetes Engine cluster.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetClusterRequest):
-            request = cluster_service.GetClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["get_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_cluster]
+        rpc = self._transport._dispatch["get_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
+        if fields is not None:
+            metadata += (projection.field_mask_metadata(fields),)
+
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "get_cluster"
+        ):
+            response = self._request_coalescer.call(
+                "get_cluster",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -716,6 +859,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a cluster, consisting of the specified number and type
         of Google Compute Engine instances.
@@ -799,6 +943,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -809,41 +956,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CreateClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CreateClusterRequest):
-            request = cluster_service.CreateClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster is not None:
-                request.cluster = cluster
-            if parent is not None:
-                request.parent = parent
+        builder = request_builder.BUILDERS["create_cluster"]
+        request = builder.build(request, project_id, zone, cluster, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_cluster]
+        rpc = self._transport._dispatch["create_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -851,6 +974,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -868,6 +992,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the settings of a specific cluster.
 
@@ -948,6 +1073,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -958,43 +1086,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, update, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.UpdateClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.UpdateClusterRequest):
-            request = cluster_service.UpdateClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if update is not None:
-                request.update = update
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["update_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, update, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_cluster]
+        rpc = self._transport._dispatch["update_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1002,6 +1104,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1014,6 +1117,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the version and/or image type for the
         specified node pool.
@@ -1054,6 +1158,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1064,22 +1171,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.UpdateNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.UpdateNodePoolRequest):
-            request = cluster_service.UpdateNodePoolRequest(request)
+        builder = request_builder.BUILDERS["update_node_pool"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_node_pool]
+        rpc = self._transport._dispatch["update_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1087,6 +1189,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1101,6 +1204,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the autoscaling settings for the specified node
         pool.
@@ -1139,6 +1243,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1149,24 +1256,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNodePoolAutoscalingRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNodePoolAutoscalingRequest):
-            request = cluster_service.SetNodePoolAutoscalingRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_autoscaling"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.set_node_pool_autoscaling
-        ]
+        rpc = self._transport._dispatch["set_node_pool_autoscaling"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1174,6 +1274,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1191,6 +1292,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the logging service for a specific cluster.
 
@@ -1284,6 +1386,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1294,45 +1399,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, logging_service, name]
+        builder = request_builder.BUILDERS["set_logging_service"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, logging_service, name
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLoggingServiceRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLoggingServiceRequest):
-            request = cluster_service.SetLoggingServiceRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if logging_service is not None:
-                request.logging_service = logging_service
-            if name is not None:
-                request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_logging_service]
+        rpc = self._transport._dispatch["set_logging_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1340,6 +1419,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1359,6 +1439,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the monitoring service for a specific cluster.
 
@@ -1454,6 +1535,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1464,45 +1548,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, monitoring_service, name]
+        builder = request_builder.BUILDERS["set_monitoring_service"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, monitoring_service, name
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetMonitoringServiceRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetMonitoringServiceRequest):
-            request = cluster_service.SetMonitoringServiceRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if monitoring_service is not None:
-                request.monitoring_service = monitoring_service
-            if name is not None:
-                request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_monitoring_service]
+        rpc = self._transport._dispatch["set_monitoring_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1510,6 +1568,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1527,6 +1586,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the addons for a specific cluster.
 
@@ -1608,6 +1668,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1618,43 +1681,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, addons_config, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetAddonsConfigRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetAddonsConfigRequest):
-            request = cluster_service.SetAddonsConfigRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if addons_config is not None:
-                request.addons_config = addons_config
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["set_addons_config"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, addons_config, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_addons_config]
+        rpc = self._transport._dispatch["set_addons_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1662,6 +1701,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1679,6 +1719,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the locations for a specific cluster. Deprecated. Use
         `projects.locations.clusters.update <https://cloud.google.com/kubernetes-engine/docs/reference/rest/v1/projects.locations.clusters/update>`__
@@ -1769,6 +1810,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1783,43 +1827,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         )
 
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, locations, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLocationsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLocationsRequest):
-            request = cluster_service.SetLocationsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if locations is not None:
-                request.locations = locations
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["set_locations"]
+        request = builder.build(request, project_id, zone, cluster_id, locations, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_locations]
+        rpc = self._transport._dispatch["set_locations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1827,6 +1845,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1844,6 +1863,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the master for a specific cluster.
 
@@ -1937,6 +1957,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -1947,43 +1970,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, master_version, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.UpdateMasterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.UpdateMasterRequest):
-            request = cluster_service.UpdateMasterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if master_version is not None:
-                request.master_version = master_version
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["update_master"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, master_version, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_master]
+        rpc = self._transport._dispatch["update_master"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1991,6 +1990,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -2003,6 +2003,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets master auth materials. Currently supports
         changing the admin password or a specific cluster,
@@ -2044,6 +2045,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -2054,22 +2058,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetMasterAuthRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetMasterAuthRequest):
-            request = cluster_service.SetMasterAuthRequest(request)
+        builder = request_builder.BUILDERS["set_master_auth"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_master_auth]
+        rpc = self._transport._dispatch["set_master_auth"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -2077,6 +2076,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -2093,6 +2093,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes the cluster, including the Kubernetes
         endpoint and all worker nodes.
@@ -2175,6 +2176,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -2185,41 +2189,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.DeleteClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.DeleteClusterRequest):
-            request = cluster_service.DeleteClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["delete_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_cluster]
+        rpc = self._transport._dispatch["delete_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -2227,6 +2207,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -2241,6 +2222,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListOperationsResponse:
         r"""Lists all operations in a project in a specific zone
         or all zones.
@@ -2299,6 +2281,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.ListOperationsResponse:
@@ -2307,45 +2292,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListOperationsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListOperationsRequest):
-            request = cluster_service.ListOperationsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
+        builder = request_builder.BUILDERS["list_operations"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_operations]
+        rpc = self._transport._dispatch["list_operations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "list_operations"
+        ):
+            response = self._request_coalescer.call(
+                "list_operations",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2361,6 +2345,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Gets the specified operation.
 
@@ -2433,6 +2418,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -2443,49 +2431,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetOperationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetOperationRequest):
-            request = cluster_service.GetOperationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if operation_id is not None:
-                request.operation_id = operation_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["get_operation"]
+        request = builder.build(request, project_id, zone, operation_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_operation]
+        rpc = self._transport._dispatch["get_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "get_operation"
+        ):
+            response = self._request_coalescer.call(
+                "get_operation",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2501,6 +2484,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""Cancels the specified operation.
 
@@ -2570,43 +2554,22 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CancelOperationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CancelOperationRequest):
-            request = cluster_service.CancelOperationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if operation_id is not None:
-                request.operation_id = operation_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["cancel_operation"]
+        request = builder.build(request, project_id, zone, operation_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.cancel_operation]
+        rpc = self._transport._dispatch["cancel_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         rpc(
@@ -2614,6 +2577,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     def get_server_config(
@@ -2626,6 +2590,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ServerConfig:
         r"""Returns configuration info about the Google
         Kubernetes Engine service.
@@ -2690,6 +2655,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.ServerConfig:
@@ -2698,47 +2666,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetServerConfigRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetServerConfigRequest):
-            request = cluster_service.GetServerConfigRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["get_server_config"]
+        request = builder.build(request, project_id, zone, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_server_config]
+        rpc = self._transport._dispatch["get_server_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or serve it from the response cache.
+        if self._response_cache is not None and self._response_cache.caches(
+            "get_server_config"
+        ):
+            response = self._response_cache.get_or_load(
+                "get_server_config",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2750,6 +2715,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.GetJSONWebKeysResponse:
         r"""Gets the public component of the cluster signing keys
         in JSON Web Key format.
@@ -2793,6 +2759,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.GetJSONWebKeysResponse:
@@ -2802,30 +2771,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetJSONWebKeysRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetJSONWebKeysRequest):
-            request = cluster_service.GetJSONWebKeysRequest(request)
+        builder = request_builder.BUILDERS["get_json_web_keys"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_json_web_keys]
+        rpc = self._transport._dispatch["get_json_web_keys"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or serve it from the response cache.
+        if self._response_cache is not None and self._response_cache.caches(
+            "get_json_web_keys"
+        ):
+            response = self._response_cache.get_or_load(
+                "get_json_web_keys",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2841,6 +2824,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListNodePoolsResponse:
         r"""Lists the node pools for a cluster.
 
@@ -2913,6 +2897,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.ListNodePoolsResponse:
@@ -2921,49 +2908,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListNodePoolsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListNodePoolsRequest):
-            request = cluster_service.ListNodePoolsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if parent is not None:
-                request.parent = parent
+        builder = request_builder.BUILDERS["list_node_pools"]
+        request = builder.build(request, project_id, zone, cluster_id, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_node_pools]
+        rpc = self._transport._dispatch["list_node_pools"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "list_node_pools"
+        ):
+            response = self._request_coalescer.call(
+                "list_node_pools",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2980,6 +2962,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.NodePool:
         r"""Retrieves the requested node pool.
 
@@ -3060,6 +3043,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.NodePool:
@@ -3076,51 +3062,46 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetNodePoolRequest):
-            request = cluster_service.GetNodePoolRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool_id is not None:
-                request.node_pool_id = node_pool_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["get_node_pool"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_node_pool]
+        rpc = self._transport._dispatch["get_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "get_node_pool"
+        ):
+            response = self._request_coalescer.call(
+                "get_node_pool",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -3137,6 +3118,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a node pool for a cluster.
 
@@ -3214,6 +3196,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3224,43 +3209,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool, parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CreateNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CreateNodePoolRequest):
-            request = cluster_service.CreateNodePoolRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool is not None:
-                request.node_pool = node_pool
-            if parent is not None:
-                request.parent = parent
+        builder = request_builder.BUILDERS["create_node_pool"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool, parent
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_node_pool]
+        rpc = self._transport._dispatch["create_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3268,6 +3229,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3285,6 +3247,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes a node pool from a cluster.
 
@@ -3366,6 +3329,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3376,43 +3342,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.DeleteNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.DeleteNodePoolRequest):
-            request = cluster_service.DeleteNodePoolRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool_id is not None:
-                request.node_pool_id = node_pool_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["delete_node_pool"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_node_pool]
+        rpc = self._transport._dispatch["delete_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3420,6 +3362,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3434,6 +3377,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""CompleteNodePoolUpgrade will signal an on-going node
         pool upgrade to complete.
@@ -3470,26 +3414,22 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CompleteNodePoolUpgradeRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CompleteNodePoolUpgradeRequest):
-            request = cluster_service.CompleteNodePoolUpgradeRequest(request)
+        builder = request_builder.BUILDERS["complete_node_pool_upgrade"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.complete_node_pool_upgrade
-        ]
+        rpc = self._transport._dispatch["complete_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         rpc(
@@ -3497,6 +3437,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     def rollback_node_pool_upgrade(
@@ -3513,6 +3454,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Rolls back a previously Aborted or Failed NodePool
         upgrade. This makes no changes if the last upgrade
@@ -3601,6 +3543,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3611,45 +3556,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.RollbackNodePoolUpgradeRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.RollbackNodePoolUpgradeRequest):
-            request = cluster_service.RollbackNodePoolUpgradeRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool_id is not None:
-                request.node_pool_id = node_pool_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["rollback_node_pool_upgrade"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.rollback_node_pool_upgrade
-        ]
+        rpc = self._transport._dispatch["rollback_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3657,6 +3576,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3671,6 +3591,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the NodeManagement options for a node pool.
 
@@ -3709,6 +3630,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3719,22 +3643,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNodePoolManagementRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNodePoolManagementRequest):
-            request = cluster_service.SetNodePoolManagementRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_management"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_node_pool_management]
+        rpc = self._transport._dispatch["set_node_pool_management"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3742,6 +3661,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3754,6 +3674,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets labels on a cluster.
 
@@ -3795,6 +3716,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3805,22 +3729,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLabelsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLabelsRequest):
-            request = cluster_service.SetLabelsRequest(request)
+        builder = request_builder.BUILDERS["set_labels"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_labels]
+        rpc = self._transport._dispatch["set_labels"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3828,6 +3747,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3845,6 +3765,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables the ABAC authorization mechanism
         on a cluster.
@@ -3928,6 +3849,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -3938,43 +3862,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, enabled, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLegacyAbacRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLegacyAbacRequest):
-            request = cluster_service.SetLegacyAbacRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if enabled is not None:
-                request.enabled = enabled
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["set_legacy_abac"]
+        request = builder.build(request, project_id, zone, cluster_id, enabled, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_legacy_abac]
+        rpc = self._transport._dispatch["set_legacy_abac"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3982,6 +3880,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3998,6 +3897,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Starts master IP rotation.
 
@@ -4072,6 +3972,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4082,41 +3985,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.StartIPRotationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.StartIPRotationRequest):
-            request = cluster_service.StartIPRotationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["start_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.start_ip_rotation]
+        rpc = self._transport._dispatch["start_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4124,6 +4003,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4142,6 +4022,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Completes master IP rotation.
 
@@ -4214,6 +4095,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4224,41 +4108,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CompleteIPRotationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CompleteIPRotationRequest):
-            request = cluster_service.CompleteIPRotationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["complete_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id, name)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.complete_ip_rotation]
+        rpc = self._transport._dispatch["complete_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4266,6 +4126,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4278,6 +4139,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the size for a specific node pool. The new size will be
         used for all replicas, including future replicas created by
@@ -4319,6 +4181,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4329,22 +4194,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNodePoolSizeRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNodePoolSizeRequest):
-            request = cluster_service.SetNodePoolSizeRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_size"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_node_pool_size]
+        rpc = self._transport._dispatch["set_node_pool_size"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4352,6 +4212,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4369,6 +4230,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables Network Policy for a cluster.
 
@@ -4449,6 +4311,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4459,43 +4324,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, network_policy, name])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNetworkPolicyRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNetworkPolicyRequest):
-            request = cluster_service.SetNetworkPolicyRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if network_policy is not None:
-                request.network_policy = network_policy
-            if name is not None:
-                request.name = name
+        builder = request_builder.BUILDERS["set_network_policy"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, network_policy, name
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_network_policy]
+        rpc = self._transport._dispatch["set_network_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4503,6 +4344,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4522,6 +4364,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the maintenance policy for a cluster.
 
@@ -4601,6 +4444,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1.types.Operation:
@@ -4611,45 +4457,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, maintenance_policy, name]
+        builder = request_builder.BUILDERS["set_maintenance_policy"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, maintenance_policy, name
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetMaintenancePolicyRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetMaintenancePolicyRequest):
-            request = cluster_service.SetMaintenancePolicyRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if maintenance_policy is not None:
-                request.maintenance_policy = maintenance_policy
-            if name is not None:
-                request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_maintenance_policy]
+        rpc = self._transport._dispatch["set_maintenance_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4657,6 +4477,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4671,6 +4492,8 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        prefetch: int = 0,
     ) -> pagers.ListUsableSubnetworksPager:
         r"""Lists subnetworks that are usable for creating
         clusters in a project.
@@ -4711,6 +4534,13 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            prefetch (int): The maximum number of pages to request in
+                the background ahead of the caller while iterating the
+                returned pager. ``0`` (the default) fetches each page
+                only once the previous one has been consumed.
 
         Returns:
             google.cloud.container_v1.services.cluster_manager.pagers.ListUsableSubnetworksPager:
@@ -4724,22 +4554,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListUsableSubnetworksRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListUsableSubnetworksRequest):
-            request = cluster_service.ListUsableSubnetworksRequest(request)
+        builder = request_builder.BUILDERS["list_usable_subnetworks"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_usable_subnetworks]
+        rpc = self._transport._dispatch["list_usable_subnetworks"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4747,15 +4572,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListUsableSubnetworksPager(
-            method=rpc,
+            method=functools.partial(rpc, compression=call_compression),
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -0,0 +1,899 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""An in-process fake of the ClusterManager service for local testing.
+
+:class:`FakeClusterManager` keeps clusters, node pools and operations in
+memory and implements the ClusterManager RPCs on top of them, with
+configurable latency, error injection and operation progression.
+:class:`FakeServer` serves it on a local port so that clients, waiters
+and channel pools can be exercised end to end without network access::
+
+    with FakeServer(FakeClusterManager(latency=0.01)) as server:
+        client = server.client()
+        server.servicer.add_cluster(
+            "projects/p/locations/us-central1", Cluster(name="c")
+        )
+        client.list_clusters(parent="projects/p/locations/-")
+
+The fake implements the behaviour of the service that clients depend on,
+not the full semantics of every field.
+"""
+from concurrent import futures
+import datetime
+import itertools
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from google.protobuf import empty_pb2  # type: ignore
+from google.rpc import status_pb2  # type: ignore
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+import proto  # type: ignore
+
+from google.cloud.container_v1.services.cluster_manager import projection
+from google.cloud.container_v1.services.cluster_manager.async_client import (
+    ClusterManagerAsyncClient,
+)
+from google.cloud.container_v1.services.cluster_manager.client import (
+    ClusterManagerClient,
+)
+from google.cloud.container_v1.services.cluster_manager.transports.grpc import (
+    ClusterManagerGrpcTransport,
+)
+from google.cloud.container_v1.services.cluster_manager.transports.grpc_asyncio import (
+    ClusterManagerGrpcAsyncIOTransport,
+)
+from google.cloud.container_v1.types import cluster_service
+
+SERVICE_NAME = "google.container.v1.ClusterManager"
+
+_Op = cluster_service.Operation
+_DEFAULT_VERSION = "1.27.3-gke.100"
+
+
+class _RpcError(Exception):
+    def __init__(self, code: grpc.StatusCode, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _not_found(name: str) -> _RpcError:
+    return _RpcError(grpc.StatusCode.NOT_FOUND, "{} not found.".format(name))
+
+
+def _now() -> str:
+    return datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _copy(message):
+    return type(message)(message)
+
+
+def _location_path(project: str, location: str) -> str:
+    return "projects/{}/locations/{}".format(project, location)
+
+
+def _resolve(request, field: str, *parts: Tuple[str, str]) -> str:
+    """Returns the resource name a request refers to.
+
+    Uses ``request.<field>`` when set, and otherwise builds the name from
+    the deprecated ``project_id`` / ``zone`` / ``*_id`` fields.
+    """
+    value = getattr(request, field)
+    if value:
+        return value.replace("/zones/", "/locations/")
+    name = _location_path(request.project_id, request.zone)
+    for collection, id_field in parts:
+        name += "/{}/{}".format(collection, getattr(request, id_field))
+    return name
+
+
+def _cluster_name(request) -> str:
+    return _resolve(request, "name", ("clusters", "cluster_id"))
+
+
+def _node_pool_name(request) -> str:
+    return _resolve(
+        request, "name", ("clusters", "cluster_id"), ("nodePools", "node_pool_id")
+    )
+
+
+def _split(name: str, collection: str) -> Tuple[str, str]:
+    parent, _, resource_id = name.rpartition("/{}/".format(collection))
+    return parent, resource_id
+
+
+def _in_parent(name: str, parent: str) -> bool:
+    """Returns whether ``name`` belongs to ``parent``, which may use ``-``."""
+    project, location = parent.split("/")[1], parent.split("/")[3]
+    segments = name.split("/")
+    return segments[1] == project and location in ("-", segments[3])
+
+
+class FakeClusterManager:
+    """An in-memory implementation of the ClusterManager service.
+
+    Mutating calls return an operation in the ``RUNNING`` state and only
+    take effect once the operation is ``DONE``. Operations complete when
+    they are observed through ``get_operation`` or ``list_operations``
+    after ``operation_duration`` seconds, and report their progress in
+    between.
+
+    Args:
+        latency (Union[float, Callable[[str], float]]): Seconds to wait
+            before handling each call, or a function of the RPC name (for
+            example ``"GetCluster"``) returning them.
+        operation_duration (float): Seconds an operation stays running.
+        error_rate (float): The probability that a call fails with
+            ``error_code`` regardless of its request.
+        error_code (grpc.StatusCode): The code used for random failures.
+        seed (Optional[int]): Seeds the random failures.
+        clock (Callable[[], float]): The clock used for operations.
+        one_operation_per_cluster (bool): Whether to reject mutations of
+            a cluster, or of its node pools, with ``FAILED_PRECONDITION``
+            while another operation on the cluster is running, as the
+            service does.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Union[float, Callable[[str], float]] = 0.0,
+        operation_duration: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        one_operation_per_cluster: bool = False,
+    ):
+        self.latency = latency
+        self.operation_duration = operation_duration
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self._clusters: Dict[str, cluster_service.Cluster] = {}
+        # Maps an operation name to the operation, its start time and the
+        # change it applies once done.
+        self._operations: Dict[
+            str, Tuple[cluster_service.Operation, float, Optional[Callable]]
+        ] = {}
+        self._errors: Dict[str, List[Tuple[grpc.StatusCode, str]]] = {}
+        self._operation_errors: Dict[str, List[Tuple[grpc.StatusCode, str]]] = {}
+        self.one_operation_per_cluster = one_operation_per_cluster
+        # Maps a cluster name to its latest operation.
+        self._cluster_operations: Dict[str, str] = {}
+        self.subnetworks: List[cluster_service.UsableSubnetwork] = []
+        self.server_config = cluster_service.ServerConfig(
+            default_cluster_version=_DEFAULT_VERSION,
+            valid_master_versions=[_DEFAULT_VERSION],
+            valid_node_versions=[_DEFAULT_VERSION],
+            default_image_type="COS_CONTAINERD",
+            valid_image_types=["COS_CONTAINERD", "UBUNTU_CONTAINERD"],
+        )
+        self.calls: Dict[str, int] = {}
+        self._rpcs = self._handlers()
+
+    # Store access.
+
+    def add_cluster(self, parent: str, cluster: cluster_service.Cluster) -> str:
+        """Adds a running cluster to the store and returns its name.
+
+        Args:
+            parent (str): The ``projects/*/locations/*`` to add it to.
+            cluster (google.cloud.container_v1.types.Cluster): The
+                cluster. Its node pools are added with it.
+        """
+        with self._lock:
+            name = "{}/clusters/{}".format(parent, cluster.name)
+            cluster = self._new_cluster(parent, cluster)
+            cluster.status = cluster_service.Cluster.Status.RUNNING
+            for node_pool in cluster.node_pools:
+                node_pool.status = cluster_service.NodePool.Status.RUNNING
+            self._clusters[name] = cluster
+            return name
+
+    def clusters(self) -> Dict[str, cluster_service.Cluster]:
+        """Returns a copy of the stored clusters, keyed by name."""
+        with self._lock:
+            return {name: _copy(cluster) for name, cluster in self._clusters.items()}
+
+    def operations(self) -> Dict[str, cluster_service.Operation]:
+        """Returns a copy of the stored operations, keyed by name."""
+        with self._lock:
+            return {
+                name: _copy(operation)
+                for name, (operation, _, _) in self._operations.items()
+            }
+
+    def inject_error(
+        self,
+        method: str,
+        code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        message: str = "Injected error.",
+        count: int = 1,
+    ) -> None:
+        """Makes the next ``count`` calls to ``method`` fail.
+
+        Args:
+            method (str): The RPC name, for example ``"GetCluster"``, or
+                ``"*"`` for any RPC.
+            code (grpc.StatusCode): The status code to fail with.
+            message (str): The error message.
+            count (int): The number of calls to fail.
+        """
+        with self._lock:
+            self._errors.setdefault(method, []).extend([(code, message)] * count)
+
+    def inject_operation_error(
+        self,
+        method: str,
+        code: grpc.StatusCode = grpc.StatusCode.INTERNAL,
+        message: str = "Injected operation error.",
+        count: int = 1,
+    ) -> None:
+        """Makes the operations of the next ``count`` calls to ``method`` fail.
+
+        The calls themselves succeed, but their operations finish with
+        ``Operation.error`` set and without applying their change.
+        """
+        with self._lock:
+            self._operation_errors.setdefault(method, []).extend(
+                [(code, message)] * count
+            )
+
+    def complete_operations(self) -> None:
+        """Completes every running operation immediately."""
+        with self._lock:
+            for name in list(self._operations):
+                self._advance(name, force=True)
+
+    # Internals.
+
+    def _new_cluster(self, parent, cluster):
+        cluster = _copy(cluster)
+        location = parent.split("/")[3]
+        name = "{}/clusters/{}".format(parent, cluster.name)
+        cluster.location = location
+        cluster.zone = location
+        cluster.self_link = "https://container.googleapis.com/v1/" + name
+        cluster.id = "{:032x}".format(next(self._ids))
+        cluster.create_time = _now()
+        cluster.current_master_version = (
+            cluster.initial_cluster_version or _DEFAULT_VERSION
+        )
+        cluster.current_node_version = cluster.current_master_version
+        cluster.endpoint = "10.0.0.{}".format(next(self._ids) % 256)
+        if not cluster.node_pools:
+            cluster.node_pools = [
+                cluster_service.NodePool(
+                    name="default-pool",
+                    initial_node_count=cluster.initial_node_count or 3,
+                    config=cluster.node_config,
+                )
+            ]
+        for node_pool in cluster.node_pools:
+            self._init_node_pool(name, node_pool, cluster.current_node_version)
+        cluster.current_node_count = sum(
+            node_pool.initial_node_count for node_pool in cluster.node_pools
+        )
+        self._touch(cluster)
+        return cluster
+
+    def _init_node_pool(self, cluster_name, node_pool, version):
+        node_pool.self_link = (
+            "https://container.googleapis.com/v1/{}/nodePools/{}".format(
+                cluster_name, node_pool.name
+            )
+        )
+        node_pool.version = node_pool.version or version
+        node_pool.status = cluster_service.NodePool.Status.PROVISIONING
+        node_pool.etag = "{:x}".format(next(self._ids))
+
+    def _touch(self, resource) -> None:
+        resource.etag = "{:x}".format(next(self._ids))
+
+    def _get_cluster(self, name: str) -> cluster_service.Cluster:
+        cluster = self._clusters.get(name)
+        if cluster is None:
+            raise _not_found("Cluster " + name)
+        return cluster
+
+    def _get_node_pool(self, name: str) -> cluster_service.NodePool:
+        cluster_name, node_pool_id = _split(name, "nodePools")
+        for node_pool in self._get_cluster(cluster_name).node_pools:
+            if node_pool.name == node_pool_id:
+                return node_pool
+        raise _not_found("Node pool " + name)
+
+    def _start_operation(
+        self,
+        method: str,
+        target: str,
+        operation_type: _Op.Type,
+        apply: Optional[Callable[[], None]] = None,
+    ) -> cluster_service.Operation:
+        segments = target.split("/")
+        project, location = segments[1], segments[3]
+        cluster_name = "/".join(segments[:6])
+        if self.one_operation_per_cluster:
+            running = self._cluster_operations.get(cluster_name)
+            if running is not None and self._advance(running).status != _Op.Status.DONE:
+                raise _RpcError(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    "Cluster is running incompatible operation {}.".format(
+                        running.rpartition("/")[2]
+                    ),
+                )
+        operation_id = "operation-{}".format(next(self._ids))
+        name = "{}/operations/{}".format(
+            _location_path(project, location), operation_id
+        )
+        operation = cluster_service.Operation(
+            name=operation_id,
+            zone=location,
+            location=location,
+            operation_type=operation_type,
+            status=_Op.Status.RUNNING,
+            self_link="https://container.googleapis.com/v1/" + name,
+            target_link="https://container.googleapis.com/v1/" + target,
+            start_time=_now(),
+        )
+        pending = self._operation_errors.get(method)
+        if pending:
+            code, message = pending.pop(0)
+            operation.error = status_pb2.Status(code=code.value[0], message=message)
+            apply = None
+        self._operations[name] = (operation, self._clock(), apply)
+        self._cluster_operations[cluster_name] = name
+        self._advance(name)
+        return _copy(operation)
+
+    def _advance(self, name: str, force: bool = False) -> cluster_service.Operation:
+        operation, started, apply = self._operations[name]
+        if operation.status == _Op.Status.DONE:
+            return operation
+        elapsed = self._clock() - started
+        if force or elapsed >= self.operation_duration:
+            operation.status = _Op.Status.DONE
+            operation.end_time = _now()
+            operation.progress = cluster_service.OperationProgress(
+                status=_Op.Status.DONE
+            )
+            if apply is not None and not operation.error.code:
+                apply()
+        else:
+            done = int(100 * elapsed / self.operation_duration)
+            operation.progress = cluster_service.OperationProgress(
+                status=_Op.Status.RUNNING,
+                metrics=[
+                    cluster_service.OperationProgress.Metric(
+                        name="progress", int_value=done
+                    ),
+                    cluster_service.OperationProgress.Metric(
+                        name="progress scale", int_value=100
+                    ),
+                ],
+            )
+        return operation
+
+    # RPC implementations. Each takes the request and returns the response
+    # with the store lock held.
+
+    def ListClusters(self, request):
+        parent = _resolve(request, "parent")
+        return cluster_service.ListClustersResponse(
+            clusters=[
+                _copy(cluster)
+                for name, cluster in sorted(self._clusters.items())
+                if _in_parent(name, parent)
+            ]
+        )
+
+    def GetCluster(self, request):
+        return _copy(self._get_cluster(_cluster_name(request)))
+
+    def CreateCluster(self, request):
+        parent = _resolve(request, "parent")
+        name = "{}/clusters/{}".format(parent, request.cluster.name)
+        if not request.cluster.name:
+            raise _RpcError(grpc.StatusCode.INVALID_ARGUMENT, "Missing cluster name.")
+        if name in self._clusters:
+            raise _RpcError(
+                grpc.StatusCode.ALREADY_EXISTS, "Cluster {} exists.".format(name)
+            )
+        cluster = self._new_cluster(parent, request.cluster)
+        cluster.status = cluster_service.Cluster.Status.PROVISIONING
+        self._clusters[name] = cluster
+
+        def apply():
+            cluster.status = cluster_service.Cluster.Status.RUNNING
+            for node_pool in cluster.node_pools:
+                node_pool.status = cluster_service.NodePool.Status.RUNNING
+            self._touch(cluster)
+
+        return self._start_operation(
+            "CreateCluster", name, _Op.Type.CREATE_CLUSTER, apply
+        )
+
+    def DeleteCluster(self, request):
+        name = _cluster_name(request)
+        cluster = self._get_cluster(name)
+        cluster.status = cluster_service.Cluster.Status.STOPPING
+        self._touch(cluster)
+
+        def apply():
+            self._clusters.pop(name, None)
+
+        return self._start_operation(
+            "DeleteCluster", name, _Op.Type.DELETE_CLUSTER, apply
+        )
+
+    def UpdateCluster(self, request):
+        name = _cluster_name(request)
+        cluster = self._get_cluster(name)
+        update = request.update
+
+        def apply():
+            if update.desired_master_version:
+                cluster.current_master_version = update.desired_master_version
+            if update.desired_node_version:
+                cluster.current_node_version = update.desired_node_version
+            self._touch(cluster)
+
+        return self._start_operation(
+            "UpdateCluster", name, _Op.Type.UPDATE_CLUSTER, apply
+        )
+
+    def SetLabels(self, request):
+        name = _cluster_name(request)
+        cluster = self._get_cluster(name)
+        if request.label_fingerprint != cluster.label_fingerprint:
+            raise _RpcError(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                "Labels of {} have changed; fetch the cluster again.".format(name),
+            )
+        labels = dict(request.resource_labels)
+
+        def apply():
+            cluster.resource_labels = labels
+            cluster.label_fingerprint = "{:08x}".format(next(self._ids))
+            self._touch(cluster)
+
+        return self._start_operation("SetLabels", name, _Op.Type.SET_LABELS, apply)
+
+    def ListNodePools(self, request):
+        cluster = self._get_cluster(
+            _resolve(request, "parent", ("clusters", "cluster_id"))
+        )
+        return cluster_service.ListNodePoolsResponse(
+            node_pools=[_copy(node_pool) for node_pool in cluster.node_pools]
+        )
+
+    def GetNodePool(self, request):
+        return _copy(self._get_node_pool(_node_pool_name(request)))
+
+    def CreateNodePool(self, request):
+        cluster_name = _resolve(request, "parent", ("clusters", "cluster_id"))
+        cluster = self._get_cluster(cluster_name)
+        if any(pool.name == request.node_pool.name for pool in cluster.node_pools):
+            raise _RpcError(
+                grpc.StatusCode.ALREADY_EXISTS,
+                "Node pool {} exists.".format(request.node_pool.name),
+            )
+        node_pool = _copy(request.node_pool)
+        self._init_node_pool(cluster_name, node_pool, cluster.current_node_version)
+        cluster.node_pools.append(node_pool)
+        node_pool_name = "{}/nodePools/{}".format(cluster_name, node_pool.name)
+
+        def apply():
+            self._get_node_pool(
+                node_pool_name
+            ).status = cluster_service.NodePool.Status.RUNNING
+            self._touch(cluster)
+
+        return self._start_operation(
+            "CreateNodePool", node_pool_name, _Op.Type.CREATE_NODE_POOL, apply
+        )
+
+    def DeleteNodePool(self, request):
+        name = _node_pool_name(request)
+        self._get_node_pool(name).status = cluster_service.NodePool.Status.STOPPING
+        cluster_name, node_pool_id = _split(name, "nodePools")
+
+        def apply():
+            cluster = self._clusters.get(cluster_name)
+            if cluster is None:
+                return
+            cluster.node_pools = [
+                pool for pool in cluster.node_pools if pool.name != node_pool_id
+            ]
+            self._touch(cluster)
+
+        return self._start_operation(
+            "DeleteNodePool", name, _Op.Type.DELETE_NODE_POOL, apply
+        )
+
+    def SetNodePoolSize(self, request):
+        name = _node_pool_name(request)
+        self._get_node_pool(name)
+        cluster_name, _ = _split(name, "nodePools")
+        node_count = request.node_count
+
+        def apply():
+            node_pool = self._get_node_pool(name)
+            node_pool.initial_node_count = node_count
+            self._touch(node_pool)
+            cluster = self._get_cluster(cluster_name)
+            cluster.current_node_count = sum(
+                pool.initial_node_count for pool in cluster.node_pools
+            )
+            self._touch(cluster)
+
+        return self._start_operation(
+            "SetNodePoolSize", name, _Op.Type.SET_NODE_POOL_SIZE, apply
+        )
+
+    def SetNodePoolAutoscaling(self, request):
+        name = _node_pool_name(request)
+        self._get_node_pool(name)
+        autoscaling = _copy(request.autoscaling)
+
+        def apply():
+            node_pool = self._get_node_pool(name)
+            node_pool.autoscaling = autoscaling
+            self._touch(node_pool)
+
+        return self._start_operation(
+            "SetNodePoolAutoscaling", name, _Op.Type.UPDATE_CLUSTER, apply
+        )
+
+    def CompleteNodePoolUpgrade(self, request):
+        self._get_node_pool(_node_pool_name(request))
+        return empty_pb2.Empty()
+
+    def ListOperations(self, request):
+        parent = _resolve(request, "parent")
+        return cluster_service.ListOperationsResponse(
+            operations=[
+                _copy(self._advance(name))
+                for name in list(self._operations)
+                if _in_parent(name, parent)
+            ]
+        )
+
+    def GetOperation(self, request):
+        name = _resolve(request, "name", ("operations", "operation_id"))
+        if name not in self._operations:
+            raise _not_found("Operation " + name)
+        return _copy(self._advance(name))
+
+    def CancelOperation(self, request):
+        name = _resolve(request, "name", ("operations", "operation_id"))
+        if name not in self._operations:
+            raise _not_found("Operation " + name)
+        operation, _, _ = self._operations[name]
+        if operation.status != _Op.Status.DONE:
+            operation.status = _Op.Status.DONE
+            operation.end_time = _now()
+            operation.error = status_pb2.Status(
+                code=grpc.StatusCode.CANCELLED.value[0],
+                message="Operation was cancelled.",
+            )
+        return empty_pb2.Empty()
+
+    def GetServerConfig(self, request):
+        return _copy(self.server_config)
+
+    def GetJSONWebKeys(self, request):
+        return cluster_service.GetJSONWebKeysResponse(
+            keys=[cluster_service.Jwk(kty="RSA", alg="RS256", use="sig", kid="fake")]
+        )
+
+    def ListUsableSubnetworks(self, request):
+        start = int(request.page_token or 0)
+        size = request.page_size or 500
+        end = start + size
+        return cluster_service.ListUsableSubnetworksResponse(
+            subnetworks=self.subnetworks[start:end],
+            next_page_token=str(end) if end < len(self.subnetworks) else "",
+        )
+
+    def _generic_operation(self, method, operation_type, node_pool=False):
+        def handler(request):
+            if node_pool:
+                name = _node_pool_name(request)
+                resource = self._get_node_pool(name)
+            else:
+                name = _cluster_name(request)
+                resource = self._get_cluster(name)
+            return self._start_operation(
+                method, name, operation_type, lambda: self._touch(resource)
+            )
+
+        return handler
+
+    def _handlers(self) -> Dict[str, Tuple[Callable, type, type]]:
+        """Maps each RPC name to its implementation and message types."""
+        c = cluster_service
+        handlers = {
+            "ListClusters": (
+                self.ListClusters,
+                c.ListClustersRequest,
+                c.ListClustersResponse,
+            ),
+            "GetCluster": (self.GetCluster, c.GetClusterRequest, c.Cluster),
+            "CreateCluster": (self.CreateCluster, c.CreateClusterRequest, c.Operation),
+            "UpdateCluster": (self.UpdateCluster, c.UpdateClusterRequest, c.Operation),
+            "DeleteCluster": (self.DeleteCluster, c.DeleteClusterRequest, c.Operation),
+            "SetLabels": (self.SetLabels, c.SetLabelsRequest, c.Operation),
+            "ListNodePools": (
+                self.ListNodePools,
+                c.ListNodePoolsRequest,
+                c.ListNodePoolsResponse,
+            ),
+            "GetNodePool": (self.GetNodePool, c.GetNodePoolRequest, c.NodePool),
+            "CreateNodePool": (
+                self.CreateNodePool,
+                c.CreateNodePoolRequest,
+                c.Operation,
+            ),
+            "DeleteNodePool": (
+                self.DeleteNodePool,
+                c.DeleteNodePoolRequest,
+                c.Operation,
+            ),
+            "SetNodePoolSize": (
+                self.SetNodePoolSize,
+                c.SetNodePoolSizeRequest,
+                c.Operation,
+            ),
+            "SetNodePoolAutoscaling": (
+                self.SetNodePoolAutoscaling,
+                c.SetNodePoolAutoscalingRequest,
+                c.Operation,
+            ),
+            "CompleteNodePoolUpgrade": (
+                self.CompleteNodePoolUpgrade,
+                c.CompleteNodePoolUpgradeRequest,
+                empty_pb2.Empty,
+            ),
+            "ListOperations": (
+                self.ListOperations,
+                c.ListOperationsRequest,
+                c.ListOperationsResponse,
+            ),
+            "GetOperation": (self.GetOperation, c.GetOperationRequest, c.Operation),
+            "CancelOperation": (
+                self.CancelOperation,
+                c.CancelOperationRequest,
+                empty_pb2.Empty,
+            ),
+            "GetServerConfig": (
+                self.GetServerConfig,
+                c.GetServerConfigRequest,
+                c.ServerConfig,
+            ),
+            "GetJSONWebKeys": (
+                self.GetJSONWebKeys,
+                c.GetJSONWebKeysRequest,
+                c.GetJSONWebKeysResponse,
+            ),
+            "ListUsableSubnetworks": (
+                self.ListUsableSubnetworks,
+                c.ListUsableSubnetworksRequest,
+                c.ListUsableSubnetworksResponse,
+            ),
+        }
+        # Mutations without a modelled effect still produce operations.
+        for method, request_type, operation_type, node_pool in (
+            ("SetLoggingService", c.SetLoggingServiceRequest, "UPDATE_CLUSTER", False),
+            (
+                "SetMonitoringService",
+                c.SetMonitoringServiceRequest,
+                "UPDATE_CLUSTER",
+                False,
+            ),
+            ("SetAddonsConfig", c.SetAddonsConfigRequest, "UPDATE_CLUSTER", False),
+            ("SetLocations", c.SetLocationsRequest, "UPDATE_CLUSTER", False),
+            ("UpdateMaster", c.UpdateMasterRequest, "UPGRADE_MASTER", False),
+            ("SetMasterAuth", c.SetMasterAuthRequest, "SET_MASTER_AUTH", False),
+            ("UpdateNodePool", c.UpdateNodePoolRequest, "UPGRADE_NODES", True),
+            (
+                "RollbackNodePoolUpgrade",
+                c.RollbackNodePoolUpgradeRequest,
+                "UPGRADE_NODES",
+                True,
+            ),
+            (
+                "SetNodePoolManagement",
+                c.SetNodePoolManagementRequest,
+                "SET_NODE_POOL_MANAGEMENT",
+                True,
+            ),
+            ("SetLegacyAbac", c.SetLegacyAbacRequest, "UPDATE_CLUSTER", False),
+            ("StartIPRotation", c.StartIPRotationRequest, "UPDATE_CLUSTER", False),
+            (
+                "CompleteIPRotation",
+                c.CompleteIPRotationRequest,
+                "UPDATE_CLUSTER",
+                False,
+            ),
+            (
+                "SetNetworkPolicy",
+                c.SetNetworkPolicyRequest,
+                "SET_NETWORK_POLICY",
+                False,
+            ),
+            (
+                "SetMaintenancePolicy",
+                c.SetMaintenancePolicyRequest,
+                "SET_MAINTENANCE_POLICY",
+                False,
+            ),
+        ):
+            handlers[method] = (
+                self._generic_operation(method, _Op.Type[operation_type], node_pool),
+                request_type,
+                c.Operation,
+            )
+        return handlers
+
+    def handle(self, method: str, request, metadata: Sequence[Tuple[str, str]] = ()):
+        """Handles one call to ``method`` as the server would.
+
+        Applies the configured latency and injected errors, then runs the
+        RPC against the store. A field mask in ``metadata`` (see
+        :mod:`~.projection`) trims the response to the requested fields.
+
+        Failures are raised as an internal exception that
+        :meth:`generic_handler` turns into the status of the call.
+        """
+        latency = self.latency(method) if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            for key in (method, "*"):
+                pending = self._errors.get(key)
+                if pending:
+                    raise _RpcError(*pending.pop(0))
+            if self.error_rate and self._random.random() < self.error_rate:
+                raise _RpcError(self.error_code, "Injected random error.")
+            implementation, _, _ = self._rpcs[method]
+            response = implementation(request)
+        fields = projection.field_mask_from_metadata(metadata)
+        if fields is not None:
+            try:
+                response = projection.project(response, fields)
+            except ValueError as exc:
+                raise _RpcError(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+        return response
+
+    def generic_handler(self) -> grpc.GenericRpcHandler:
+        """Returns a handler that serves this fake on a :class:`grpc.Server`."""
+
+        def serve(method):
+            def handler(request, context):
+                try:
+                    return self.handle(method, request, context.invocation_metadata())
+                except _RpcError as exc:
+                    context.abort(exc.code, exc.message)
+
+            return handler
+
+        method_handlers = {}
+        for method, (_, request_type, response_type) in self._rpcs.items():
+            if isinstance(response_type, type) and issubclass(
+                response_type, proto.Message
+            ):
+                serializer = response_type.serialize
+            else:
+                serializer = response_type.SerializeToString
+            method_handlers[method] = grpc.unary_unary_rpc_method_handler(
+                serve(method),
+                request_deserializer=request_type.deserialize,
+                response_serializer=serializer,
+            )
+        return grpc.method_handlers_generic_handler(SERVICE_NAME, method_handlers)
+
+
+class FakeServer:
+    """Serves a :class:`FakeClusterManager` on a local port.
+
+    Args:
+        servicer (Optional[FakeClusterManager]): The fake to serve. A new
+            one is created if unset.
+        address (str): The address to bind, ``localhost:0`` picks a free
+            port.
+        max_workers (int): The number of threads handling calls.
+        compression (Optional[grpc.Compression]): The algorithm responses
+            are compressed with. Responses are sent uncompressed if unset.
+            Clients read responses the same way either way, so this only
+            changes the bytes on the wire, as measured by the benchmarks.
+            It has no effect on how clients compress their requests.
+    """
+
+    def __init__(
+        self,
+        servicer: Optional[FakeClusterManager] = None,
+        *,
+        address: str = "localhost:0",
+        max_workers: int = 16,
+        compression: Optional[grpc.Compression] = None,
+    ):
+        self.servicer = servicer or FakeClusterManager()
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=max_workers),
+            compression=compression,
+        )
+        self._server.add_generic_rpc_handlers((self.servicer.generic_handler(),))
+        host = address.rpartition(":")[0]
+        port = self._server.add_insecure_port(address)
+        self.address = "{}:{}".format(host, port)
+
+    def start(self) -> "FakeServer":
+        self._server.start()
+        return self
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        self._server.stop(grace).wait()
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def channel(self) -> grpc.Channel:
+        """Returns a new insecure channel to the server."""
+        return grpc.insecure_channel(self.address)
+
+    def client(self, channel: Optional[grpc.Channel] = None) -> ClusterManagerClient:
+        """Returns a client that talks to the server.
+
+        Args:
+            channel (Optional[grpc.Channel]): The channel to use, for
+                example a :class:`~.transports.pool.ChannelPool`. A new
+                channel is created if unset.
+        """
+        transport = ClusterManagerGrpcTransport(channel=channel or self.channel())
+        return ClusterManagerClient(transport=transport)
+
+    def async_client(
+        self, channel: Optional[aio.Channel] = None
+    ) -> ClusterManagerAsyncClient:
+        """Returns an async client that talks to the server.
+
+        Must be called with an event loop running.
+        """
+        transport = ClusterManagerGrpcAsyncIOTransport(
+            channel=channel or aio.insecure_channel(self.address)
+        )
+        return ClusterManagerAsyncClient(transport=transport)
+
+
+__all__ = (
+    "FakeClusterManager",
+    "FakeServer",
+    "SERVICE_NAME",
+)
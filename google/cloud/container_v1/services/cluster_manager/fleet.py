@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Concurrent reads across many projects and locations.
+
+The helpers in this module issue one ``list_clusters`` (or
+``get_cluster``) call per parent concurrently, with a bound on the total
+number of calls in flight and a separate bound per project, and yield
+each result as soon as its call completes::
+
+    for result in fleet.list_clusters(client, parents):
+        if result.error is not None:
+            log.warning("%s: %s", result.parent, result.error)
+            continue
+        for zone in result.missing_zones:
+            log.warning("%s: %s is unavailable", result.parent, zone)
+        inventory.extend(result.response.clusters)
+"""
+import asyncio
+from collections import OrderedDict, deque
+import concurrent.futures
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from google.api_core import gapic_v1
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_PER_PROJECT_LIMIT = 4
+
+
+class FleetResult(NamedTuple):
+    """The outcome of one call made by a fan-out helper.
+
+    Attributes:
+        parent (str): The parent (or cluster name) the call was made for.
+        response (Any): The response, or ``None`` if the call failed.
+        error (Optional[Exception]): The error raised by the call, or
+            ``None`` if it succeeded.
+    """
+
+    parent: str
+    response: Any
+    error: Optional[Exception]
+
+    @property
+    def missing_zones(self) -> Sequence[str]:
+        """The zones the server could not list clusters from, if any."""
+        return tuple(getattr(self.response, "missing_zones", ()))
+
+
+def project_of(parent: str) -> str:
+    """Returns the project of a ``projects/{project}/...`` resource name.
+
+    Names that do not start with ``projects/`` are returned unchanged, so
+    they are each treated as a project of their own.
+    """
+    segments = parent.split("/")
+    if len(segments) >= 2 and segments[0] == "projects":
+        return segments[1]
+    return parent
+
+
+def _check_limits(max_workers: int, per_project_limit: int) -> None:
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if per_project_limit < 1:
+        raise ValueError("per_project_limit must be at least 1.")
+
+
+def _queue_by_project(parents: Iterable[str]) -> Dict[str, Deque[str]]:
+    queues: Dict[str, Deque[str]] = OrderedDict()
+    for parent in parents:
+        queues.setdefault(project_of(parent), deque()).append(parent)
+    return queues
+
+
+def fan_out(
+    call: Callable[[str], Any],
+    parents: Iterable[str],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_project_limit: int = DEFAULT_PER_PROJECT_LIMIT,
+) -> Iterator[FleetResult]:
+    """Calls ``call(parent)`` for every parent on a pool of threads.
+
+    At most ``max_workers`` calls run at once, and at most
+    ``per_project_limit`` of them for the same project. Calls are started
+    round-robin across projects, so one large project does not starve the
+    others. Results are yielded in completion order; closing the iterator
+    early cancels the calls that have not started yet.
+
+    Args:
+        call (Callable[[str], Any]): Makes the call for one parent.
+        parents (Iterable[str]): The parents to call. Duplicates are
+            called once each.
+        max_workers (int): The maximum number of calls in flight.
+        per_project_limit (int): The maximum number of calls in flight
+            for any single project.
+
+    Yields:
+        FleetResult: The outcome of each call.
+    """
+    _check_limits(max_workers, per_project_limit)
+    queues = _queue_by_project(parents)
+    running: Dict[str, int] = {project: 0 for project in queues}
+    futures: Dict[concurrent.futures.Future, Tuple[str, str]] = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def schedule():
+        progressed = True
+        while progressed and len(futures) < max_workers:
+            progressed = False
+            for project, queue in queues.items():
+                if len(futures) >= max_workers:
+                    break
+                if queue and running[project] < per_project_limit:
+                    parent = queue.popleft()
+                    running[project] += 1
+                    futures[executor.submit(call, parent)] = (project, parent)
+                    progressed = True
+
+    try:
+        schedule()
+        while futures:
+            done, _ = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                project, parent = futures.pop(future)
+                running[project] -= 1
+                schedule()
+                exc = future.exception()
+                if exc is not None:
+                    yield FleetResult(parent, None, exc)
+                else:
+                    yield FleetResult(parent, future.result(), None)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def fan_out_async(
+    call: Callable[[str], Any],
+    parents: Iterable[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_WORKERS,
+    per_project_limit: int = DEFAULT_PER_PROJECT_LIMIT,
+) -> AsyncIterator[FleetResult]:
+    """Like :func:`fan_out`, running ``await call(parent)`` as tasks.
+
+    Args:
+        call (Callable[[str], Awaitable[Any]]): Makes the call for one
+            parent.
+        parents (Iterable[str]): The parents to call.
+        max_concurrency (int): The maximum number of calls in flight.
+        per_project_limit (int): The maximum number of calls in flight
+            for any single project.
+
+    Yields:
+        FleetResult: The outcome of each call.
+    """
+    _check_limits(max_concurrency, per_project_limit)
+    queues = _queue_by_project(parents)
+    running: Dict[str, int] = {project: 0 for project in queues}
+    tasks: Dict[asyncio.Future, Tuple[str, str]] = {}
+
+    def schedule():
+        progressed = True
+        while progressed and len(tasks) < max_concurrency:
+            progressed = False
+            for project, queue in queues.items():
+                if len(tasks) >= max_concurrency:
+                    break
+                if queue and running[project] < per_project_limit:
+                    parent = queue.popleft()
+                    running[project] += 1
+                    tasks[asyncio.ensure_future(call(parent))] = (project, parent)
+                    progressed = True
+
+    try:
+        schedule()
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                project, parent = tasks.pop(task)
+                running[project] -= 1
+                schedule()
+                if task.cancelled():
+                    yield FleetResult(parent, None, asyncio.CancelledError())
+                elif task.exception() is not None:
+                    yield FleetResult(parent, None, task.exception())
+                else:
+                    yield FleetResult(parent, task.result(), None)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def list_clusters(
+    client,
+    parents: Iterable[str],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_project_limit: int = DEFAULT_PER_PROJECT_LIMIT,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[FleetResult]:
+    """Lists the clusters of many parents concurrently.
+
+    Args:
+        client (ClusterManagerClient): The client to call.
+        parents (Iterable[str]): The parents, in the format
+            ``projects/*/locations/*``. Use ``-`` as the location to list
+            every location of a project.
+        max_workers (int): The maximum number of calls in flight.
+        per_project_limit (int): The maximum number of calls in flight
+            for any single project.
+        retry (google.api_core.retry.Retry): Designation of what errors,
+            if any, should be retried.
+        timeout (float): The timeout for each call.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+        fields (Optional[Sequence[str]]): Return only these fields of
+            each cluster. See :mod:`~.projection`.
+
+    Yields:
+        FleetResult: A result per parent, whose ``response`` is a
+        ``ListClustersResponse``, in completion order.
+    """
+
+    def call(parent):
+        return client.list_clusters(
+            request={"parent": parent},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+            fields=fields,
+        )
+
+    return fan_out(
+        call, parents, max_workers=max_workers, per_project_limit=per_project_limit
+    )
+
+
+def get_clusters(
+    client,
+    names: Iterable[str],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_project_limit: int = DEFAULT_PER_PROJECT_LIMIT,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[FleetResult]:
+    """Gets many clusters concurrently.
+
+    Args:
+        client (ClusterManagerClient): The client to call.
+        names (Iterable[str]): The cluster names, in the format
+            ``projects/*/locations/*/clusters/*``.
+        max_workers (int): The maximum number of calls in flight.
+        per_project_limit (int): The maximum number of calls in flight
+            for any single project.
+        retry (google.api_core.retry.Retry): Designation of what errors,
+            if any, should be retried.
+        timeout (float): The timeout for each call.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+        fields (Optional[Sequence[str]]): Return only these fields of
+            each cluster. See :mod:`~.projection`.
+
+    Yields:
+        FleetResult: A result per name, whose ``response`` is a
+        ``Cluster``, in completion order.
+    """
+
+    def call(name):
+        return client.get_cluster(
+            request={"name": name},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+            fields=fields,
+        )
+
+    return fan_out(
+        call, names, max_workers=max_workers, per_project_limit=per_project_limit
+    )
+
+
+def list_clusters_async(
+    client,
+    parents: Iterable[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_WORKERS,
+    per_project_limit: int = DEFAULT_PER_PROJECT_LIMIT,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+    fields: Optional[Sequence[str]] = None,
+) -> AsyncIterator[FleetResult]:
+    """Like :func:`list_clusters`, for ``ClusterManagerAsyncClient``."""
+
+    def call(parent):
+        return client.list_clusters(
+            request={"parent": parent},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+            fields=fields,
+        )
+
+    return fan_out_async(
+        call,
+        parents,
+        max_concurrency=max_concurrency,
+        per_project_limit=per_project_limit,
+    )
+
+
+def get_clusters_async(
+    client,
+    names: Iterable[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_WORKERS,
+    per_project_limit: int = DEFAULT_PER_PROJECT_LIMIT,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+    fields: Optional[Sequence[str]] = None,
+) -> AsyncIterator[FleetResult]:
+    """Like :func:`get_clusters`, for ``ClusterManagerAsyncClient``."""
+
+    def call(name):
+        return client.get_cluster(
+            request={"name": name},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+            fields=fields,
+        )
+
+    return fan_out_async(
+        call,
+        names,
+        max_concurrency=max_concurrency,
+        per_project_limit=per_project_limit,
+    )
+
+
+__all__ = (
+    "FleetResult",
+    "fan_out",
+    "fan_out_async",
+    "get_clusters",
+    "get_clusters_async",
+    "list_clusters",
+    "list_clusters_async",
+    "project_of",
+)
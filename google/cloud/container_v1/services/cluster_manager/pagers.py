@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import queue
+import threading
 from typing import (
     Any,
     AsyncIterator,
@@ -26,6 +29,10 @@ from typing import (
 
 from google.cloud.container_v1.types import cluster_service
 
+# How often, in seconds, a background prefetch thread re-checks whether
+# the consumer has abandoned iteration while it waits on a full buffer.
+_PREFETCH_POLL_INTERVAL = 0.1
+
 
 class ListUsableSubnetworksPager:
     """A pager for iterating through ``list_usable_subnetworks`` requests.
@@ -43,6 +50,12 @@ class ListUsableSubnetworksPager:
     All the usual :class:`google.cloud.container_v1.types.ListUsableSubnetworksResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
+
+    If ``prefetch`` is greater than zero, additional pages are requested
+    on a background thread while the caller consumes the current one,
+    buffering at most ``prefetch`` pages ahead. Pages are still yielded in
+    order, and an error raised while fetching a page is re-raised at the
+    point where that page would have been yielded.
     """
 
     def __init__(
@@ -51,7 +64,8 @@ class ListUsableSubnetworksPager:
         request: cluster_service.ListUsableSubnetworksRequest,
         response: cluster_service.ListUsableSubnetworksResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0
     ):
         """Instantiate the pager.
 
@@ -64,23 +78,82 @@ class ListUsableSubnetworksPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The maximum number of pages to request ahead
+                of the caller. ``0`` disables prefetching.
         """
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer.")
         self._method = method
         self._request = cluster_service.ListUsableSubnetworksRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterator[cluster_service.ListUsableSubnetworksResponse]:
+        if self._prefetch:
+            yield from self._prefetched_pages()
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    def _prefetched_pages(
+        self,
+    ) -> Iterator[cluster_service.ListUsableSubnetworksResponse]:
+        yield self._response
+        if not self._response.next_page_token:
+            return
+
+        buffer: "queue.Queue[Tuple[bool, Any]]" = queue.Queue(maxsize=self._prefetch)
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    buffer.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch(next_page_token):
+            try:
+                while next_page_token and not stopped.is_set():
+                    self._request.page_token = next_page_token
+                    page = self._method(self._request, metadata=self._metadata)
+                    if not put((True, page)):
+                        return
+                    next_page_token = page.next_page_token
+            except Exception as exc:
+                put((False, exc))
+                return
+            put((True, None))
+
+        worker = threading.Thread(
+            target=fetch,
+            args=(self._response.next_page_token,),
+            name="ListUsableSubnetworksPager-prefetch",
+            daemon=True,
+        )
+        worker.start()
+        try:
+            while True:
+                ok, page = buffer.get()
+                if not ok:
+                    raise page
+                if page is None:
+                    return
+                self._response = page
+                yield page
+        finally:
+            stopped.set()
+
     def __iter__(self) -> Iterator[cluster_service.UsableSubnetwork]:
         for page in self.pages:
             yield from page.subnetworks
@@ -105,6 +178,12 @@ class ListUsableSubnetworksAsyncPager:
     All the usual :class:`google.cloud.container_v1.types.ListUsableSubnetworksResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
+
+    If ``prefetch`` is greater than zero, additional pages are requested
+    in a background task while the caller consumes the current one,
+    buffering at most ``prefetch`` pages ahead. Pages are still yielded in
+    order, and an error raised while fetching a page is re-raised at the
+    point where that page would have been yielded.
     """
 
     def __init__(
@@ -113,7 +192,8 @@ class ListUsableSubnetworksAsyncPager:
         request: cluster_service.ListUsableSubnetworksRequest,
         response: cluster_service.ListUsableSubnetworksResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0
     ):
         """Instantiates the pager.
 
@@ -126,11 +206,16 @@ class ListUsableSubnetworksAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The maximum number of pages to request ahead
+                of the caller. ``0`` disables prefetching.
         """
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer.")
         self._method = method
         self._request = cluster_service.ListUsableSubnetworksRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
@@ -139,12 +224,55 @@ class ListUsableSubnetworksAsyncPager:
     async def pages(
         self,
     ) -> AsyncIterator[cluster_service.ListUsableSubnetworksResponse]:
+        if self._prefetch:
+            async for page in self._prefetched_pages():
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    async def _prefetched_pages(
+        self,
+    ) -> AsyncIterator[cluster_service.ListUsableSubnetworksResponse]:
+        yield self._response
+        if not self._response.next_page_token:
+            return
+
+        buffer: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue(
+            maxsize=self._prefetch
+        )
+
+        async def fetch(next_page_token):
+            try:
+                while next_page_token:
+                    self._request.page_token = next_page_token
+                    page = await self._method(self._request, metadata=self._metadata)
+                    await buffer.put((True, page))
+                    next_page_token = page.next_page_token
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await buffer.put((False, exc))
+                return
+            await buffer.put((True, None))
+
+        worker = asyncio.ensure_future(fetch(self._response.next_page_token))
+        try:
+            while True:
+                ok, page = await buffer.get()
+                if not ok:
+                    raise page
+                if page is None:
+                    return
+                self._response = page
+                yield page
+        finally:
+            if not worker.done():
+                worker.cancel()
+
     def __aiter__(self) -> AsyncIterator[cluster_service.UsableSubnetwork]:
         async def async_generator():
             async for page in self.pages:
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Request construction for the client methods.
+
+Every method of :class:`~.ClusterManagerClient` and
+:class:`~.ClusterManagerAsyncClient` turns its ``request`` and flattened
+arguments into a request message, and sends the routing field of the
+request in the ``x-goog-request-params`` header. :data:`BUILDERS` holds
+one precomputed :class:`RequestBuilder` per method, so a call builds its
+request with a single constructor call and reuses the routing header of
+earlier calls for the same resource.
+"""
+import functools
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
+
+from google.api_core import gapic_v1
+import proto  # type: ignore
+
+from google.cloud.container_v1.types import cluster_service
+
+ROUTING_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=ROUTING_CACHE_SIZE)
+def routing_metadata(field: str, value: str) -> Tuple[str, str]:
+    """Returns the ``x-goog-request-params`` entry routing on ``field``.
+
+    The entries of recently used resources are cached; they are
+    immutable, so calls share them.
+    """
+    return gapic_v1.routing_header.to_grpc_metadata(((field, value),))
+
+
+class RequestBuilder:
+    """Builds the request of one client method.
+
+    Args:
+        request_type (Type[proto.Message]): The request message class.
+        flattened (Sequence[str]): The request fields the method takes
+            as keyword arguments, in the order of the arguments.
+        routing_field (str): The request field sent in the
+            ``x-goog-request-params`` header.
+    """
+
+    __slots__ = ("request_type", "flattened", "routing_field")
+
+    def __init__(
+        self,
+        request_type: Type[proto.Message],
+        flattened: Sequence[str] = (),
+        routing_field: str = "name",
+    ):
+        self.request_type = request_type
+        self.flattened = tuple(flattened)
+        self.routing_field = routing_field
+
+    def build(
+        self, request: Optional[Union[proto.Message, Dict[str, Any]]], *values: Any
+    ) -> proto.Message:
+        """Returns the request of a call.
+
+        Args:
+            request (Optional[Union[proto.Message, dict]]): The ``request``
+                argument of the call. A request message is returned
+                as is, without a copy.
+            values (Any): The flattened arguments of the call, in the
+                order of :attr:`flattened`. ``None`` values are not set.
+
+        Raises:
+            ValueError: If both ``request`` and flattened arguments
+                are set.
+        """
+        # Quick check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any(values):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+        if isinstance(request, self.request_type):
+            return request
+        if request is None:
+            # One constructor call is cheaper than setting the fields
+            # one at a time.
+            return self.request_type(
+                **{
+                    name: value
+                    for name, value in zip(self.flattened, values)
+                    if value is not None
+                }
+            )
+        request = self.request_type(request)
+        for name, value in zip(self.flattened, values):
+            if value is not None:
+                setattr(request, name, value)
+        return request
+
+    def routing_metadata(self, request: proto.Message) -> Tuple[str, str]:
+        """Returns the ``x-goog-request-params`` entry of ``request``."""
+        # Reading the protobuf field skips the proto-plus marshal.
+        value = getattr(self.request_type.pb(request), self.routing_field)
+        return routing_metadata(self.routing_field, value)
+
+
+BUILDERS: Dict[str, RequestBuilder] = {
+    "list_clusters": RequestBuilder(
+        cluster_service.ListClustersRequest,
+        ("project_id", "zone", "parent"),
+        routing_field="parent",
+    ),
+    "get_cluster": RequestBuilder(
+        cluster_service.GetClusterRequest, ("project_id", "zone", "cluster_id", "name")
+    ),
+    "create_cluster": RequestBuilder(
+        cluster_service.CreateClusterRequest,
+        ("project_id", "zone", "cluster", "parent"),
+        routing_field="parent",
+    ),
+    "update_cluster": RequestBuilder(
+        cluster_service.UpdateClusterRequest,
+        ("project_id", "zone", "cluster_id", "update", "name"),
+    ),
+    "update_node_pool": RequestBuilder(cluster_service.UpdateNodePoolRequest),
+    "set_node_pool_autoscaling": RequestBuilder(
+        cluster_service.SetNodePoolAutoscalingRequest
+    ),
+    "set_logging_service": RequestBuilder(
+        cluster_service.SetLoggingServiceRequest,
+        ("project_id", "zone", "cluster_id", "logging_service", "name"),
+    ),
+    "set_monitoring_service": RequestBuilder(
+        cluster_service.SetMonitoringServiceRequest,
+        ("project_id", "zone", "cluster_id", "monitoring_service", "name"),
+    ),
+    "set_addons_config": RequestBuilder(
+        cluster_service.SetAddonsConfigRequest,
+        ("project_id", "zone", "cluster_id", "addons_config", "name"),
+    ),
+    "set_locations": RequestBuilder(
+        cluster_service.SetLocationsRequest,
+        ("project_id", "zone", "cluster_id", "locations", "name"),
+    ),
+    "update_master": RequestBuilder(
+        cluster_service.UpdateMasterRequest,
+        ("project_id", "zone", "cluster_id", "master_version", "name"),
+    ),
+    "set_master_auth": RequestBuilder(cluster_service.SetMasterAuthRequest),
+    "delete_cluster": RequestBuilder(
+        cluster_service.DeleteClusterRequest,
+        ("project_id", "zone", "cluster_id", "name"),
+    ),
+    "list_operations": RequestBuilder(
+        cluster_service.ListOperationsRequest,
+        ("project_id", "zone"),
+        routing_field="parent",
+    ),
+    "get_operation": RequestBuilder(
+        cluster_service.GetOperationRequest,
+        ("project_id", "zone", "operation_id", "name"),
+    ),
+    "cancel_operation": RequestBuilder(
+        cluster_service.CancelOperationRequest,
+        ("project_id", "zone", "operation_id", "name"),
+    ),
+    "get_server_config": RequestBuilder(
+        cluster_service.GetServerConfigRequest, ("project_id", "zone", "name")
+    ),
+    "get_json_web_keys": RequestBuilder(
+        cluster_service.GetJSONWebKeysRequest, routing_field="parent"
+    ),
+    "list_node_pools": RequestBuilder(
+        cluster_service.ListNodePoolsRequest,
+        ("project_id", "zone", "cluster_id", "parent"),
+        routing_field="parent",
+    ),
+    "get_node_pool": RequestBuilder(
+        cluster_service.GetNodePoolRequest,
+        ("project_id", "zone", "cluster_id", "node_pool_id", "name"),
+    ),
+    "create_node_pool": RequestBuilder(
+        cluster_service.CreateNodePoolRequest,
+        ("project_id", "zone", "cluster_id", "node_pool", "parent"),
+        routing_field="parent",
+    ),
+    "delete_node_pool": RequestBuilder(
+        cluster_service.DeleteNodePoolRequest,
+        ("project_id", "zone", "cluster_id", "node_pool_id", "name"),
+    ),
+    "complete_node_pool_upgrade": RequestBuilder(
+        cluster_service.CompleteNodePoolUpgradeRequest
+    ),
+    "rollback_node_pool_upgrade": RequestBuilder(
+        cluster_service.RollbackNodePoolUpgradeRequest,
+        ("project_id", "zone", "cluster_id", "node_pool_id", "name"),
+    ),
+    "set_node_pool_management": RequestBuilder(
+        cluster_service.SetNodePoolManagementRequest
+    ),
+    "set_labels": RequestBuilder(cluster_service.SetLabelsRequest),
+    "set_legacy_abac": RequestBuilder(
+        cluster_service.SetLegacyAbacRequest,
+        ("project_id", "zone", "cluster_id", "enabled", "name"),
+    ),
+    "start_ip_rotation": RequestBuilder(
+        cluster_service.StartIPRotationRequest,
+        ("project_id", "zone", "cluster_id", "name"),
+    ),
+    "complete_ip_rotation": RequestBuilder(
+        cluster_service.CompleteIPRotationRequest,
+        ("project_id", "zone", "cluster_id", "name"),
+    ),
+    "set_node_pool_size": RequestBuilder(cluster_service.SetNodePoolSizeRequest),
+    "set_network_policy": RequestBuilder(
+        cluster_service.SetNetworkPolicyRequest,
+        ("project_id", "zone", "cluster_id", "network_policy", "name"),
+    ),
+    "set_maintenance_policy": RequestBuilder(
+        cluster_service.SetMaintenancePolicyRequest,
+        ("project_id", "zone", "cluster_id", "maintenance_policy", "name"),
+    ),
+    "list_usable_subnetworks": RequestBuilder(
+        cluster_service.ListUsableSubnetworksRequest, routing_field="parent"
+    ),
+}
+"""The request builder of each client method."""
@@ -0,0 +1,543 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Bulk node-pool resizing.
+
+:func:`plan` compares a desired state, given as :class:`NodePoolTarget`
+entries, with the current node pools and returns the
+``set_node_pool_autoscaling`` and ``set_node_pool_size`` calls needed to
+reach it, leaving out the pools that are already there. :func:`execute`
+applies them. A cluster runs one operation at a time, so the changes of
+a cluster are made one after the other, while different clusters are
+changed concurrently. Each operation is followed with
+:func:`~.waiter.wait_for_operation`, and the progress is reported as a
+stream of :class:`ResizeEvent`::
+
+    targets = [
+        resize.NodePoolTarget(pool, node_count=5),
+        resize.NodePoolTarget(
+            other_pool,
+            autoscaling=container_v1.NodePoolAutoscaling(
+                enabled=True, min_node_count=1, max_node_count=10
+            ),
+        ),
+    ]
+    for event in resize.execute(client, resize.plan(client, targets)):
+        log.info("%s %s: %s", event.change.method, event.change.node_pool, event.state)
+"""
+import asyncio
+from collections import OrderedDict
+import concurrent.futures
+import itertools
+import queue
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+
+from google.cloud.container_v1.services.cluster_manager import fleet, waiter
+from google.cloud.container_v1.types import cluster_service
+
+SET_AUTOSCALING = "set_node_pool_autoscaling"
+SET_SIZE = "set_node_pool_size"
+
+STARTED = "started"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_CONFLICT_RETRIES = 3
+DEFAULT_CONFLICT_DELAY = 10.0
+
+
+class NodePoolTarget(NamedTuple):
+    """The desired state of a node pool.
+
+    Attributes:
+        node_pool (str): The node pool name, in the format
+            ``projects/*/locations/*/clusters/*/nodePools/*``.
+        node_count (Optional[int]): The desired number of nodes per zone,
+            or ``None`` to keep the current size.
+        autoscaling (Optional[google.cloud.container_v1.types.NodePoolAutoscaling]):
+            The desired autoscaling, or ``None`` to keep the current one.
+            Only its fields that are set are compared; a disabled
+            autoscaling matches any other disabled autoscaling.
+    """
+
+    node_pool: str
+    node_count: Optional[int] = None
+    autoscaling: Optional[cluster_service.NodePoolAutoscaling] = None
+
+
+class NodePoolChange(NamedTuple):
+    """A call needed to bring a node pool to its desired state.
+
+    Attributes:
+        node_pool (str): The node pool name.
+        method (str): :data:`SET_AUTOSCALING` or :data:`SET_SIZE`.
+        request (Any): The ``SetNodePoolAutoscalingRequest`` or
+            ``SetNodePoolSizeRequest`` to send.
+        current (Any): The current autoscaling or node count.
+    """
+
+    node_pool: str
+    method: str
+    request: Any
+    current: Any
+
+    @property
+    def cluster(self) -> str:
+        """The name of the cluster of the node pool."""
+        return cluster_of(self.node_pool)
+
+
+class ResizeEvent(NamedTuple):
+    """The progress of a change made by :func:`execute`.
+
+    Attributes:
+        change (NodePoolChange): The change.
+        state (str): :data:`STARTED` once the call returned an
+            operation, then :data:`DONE` or :data:`FAILED`.
+        operation (Optional[google.cloud.container_v1.types.Operation]):
+            The operation of the change, or ``None`` if the call failed.
+        error (Optional[Exception]): The error of a failed change.
+    """
+
+    change: NodePoolChange
+    state: str
+    operation: Optional[cluster_service.Operation]
+    error: Optional[Exception]
+
+
+def cluster_of(node_pool: str) -> str:
+    """Returns the cluster name of a node pool name.
+
+    Raises:
+        ValueError: If ``node_pool`` is not a node pool name.
+    """
+    cluster, sep, _ = node_pool.rpartition("/nodePools/")
+    if not sep or not cluster:
+        raise ValueError("{!r} is not a node pool name.".format(node_pool))
+    return cluster
+
+
+def _autoscaling_matches(
+    target: cluster_service.NodePoolAutoscaling,
+    current: cluster_service.NodePoolAutoscaling,
+) -> bool:
+    if not target.enabled:
+        return not current.enabled
+    current_pb = cluster_service.NodePoolAutoscaling.pb(current)
+    return all(
+        getattr(current_pb, field.name) == value
+        for field, value in cluster_service.NodePoolAutoscaling.pb(target).ListFields()
+    )
+
+
+def diff(
+    targets: Iterable[NodePoolTarget],
+    node_pools: Mapping[str, cluster_service.NodePool],
+) -> List[NodePoolChange]:
+    """Returns the changes bringing ``node_pools`` to ``targets``.
+
+    Targets the node pools already match are left out. When a target
+    changes both, the autoscaling is changed before the size.
+
+    Args:
+        targets (Iterable[NodePoolTarget]): The desired states.
+        node_pools (Mapping[str, google.cloud.container_v1.types.NodePool]):
+            The current node pools, keyed by node pool name.
+
+    Raises:
+        ValueError: If a node pool has more than one target.
+        google.api_core.exceptions.NotFound: If a target node pool is
+            not in ``node_pools``.
+    """
+    changes = []
+    seen = set()
+    for target in targets:
+        name = target.node_pool
+        if name in seen:
+            raise ValueError("Node pool {} has more than one target.".format(name))
+        seen.add(name)
+        node_pool = node_pools.get(name)
+        if node_pool is None:
+            raise core_exceptions.NotFound("Node pool {} not found.".format(name))
+        if target.autoscaling is not None and not _autoscaling_matches(
+            target.autoscaling, node_pool.autoscaling
+        ):
+            changes.append(
+                NodePoolChange(
+                    name,
+                    SET_AUTOSCALING,
+                    cluster_service.SetNodePoolAutoscalingRequest(
+                        name=name, autoscaling=target.autoscaling
+                    ),
+                    node_pool.autoscaling,
+                )
+            )
+        if (
+            target.node_count is not None
+            and target.node_count != node_pool.initial_node_count
+        ):
+            changes.append(
+                NodePoolChange(
+                    name,
+                    SET_SIZE,
+                    cluster_service.SetNodePoolSizeRequest(
+                        name=name, node_count=target.node_count
+                    ),
+                    node_pool.initial_node_count,
+                )
+            )
+    return changes
+
+
+def _clusters(targets: Sequence[NodePoolTarget]) -> List[str]:
+    return list(OrderedDict.fromkeys(cluster_of(t.node_pool) for t in targets))
+
+
+def _by_name(
+    cluster: str, response: cluster_service.ListNodePoolsResponse
+) -> Dict[str, cluster_service.NodePool]:
+    return {
+        "{}/nodePools/{}".format(cluster, node_pool.name): node_pool
+        for node_pool in response.node_pools
+    }
+
+
+def plan(
+    client,
+    targets: Iterable[NodePoolTarget],
+    *,
+    max_workers: int = fleet.DEFAULT_MAX_WORKERS,
+    per_project_limit: int = fleet.DEFAULT_PER_PROJECT_LIMIT,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> List[NodePoolChange]:
+    """Lists the node pools of the target clusters and diffs them.
+
+    Each cluster is listed once with ``list_node_pools``, concurrently
+    as in :func:`~.fleet.fan_out`.
+
+    Args:
+        client (ClusterManagerClient): The client to call.
+        targets (Iterable[NodePoolTarget]): The desired states.
+        max_workers (int): The maximum number of calls in flight.
+        per_project_limit (int): The maximum number of calls in flight
+            for any single project.
+        retry (google.api_core.retry.Retry): Designation of what errors,
+            if any, should be retried.
+        timeout (float): The timeout for each call.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Returns:
+        List[NodePoolChange]: The changes, as returned by :func:`diff`.
+
+    Raises:
+        google.api_core.exceptions.GoogleAPICallError: If a cluster
+            could not be listed, or a node pool does not exist.
+    """
+    targets = list(targets)
+
+    def call(cluster):
+        return client.list_node_pools(
+            request={"parent": cluster},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    node_pools: Dict[str, cluster_service.NodePool] = {}
+    for result in fleet.fan_out(
+        call,
+        _clusters(targets),
+        max_workers=max_workers,
+        per_project_limit=per_project_limit,
+    ):
+        if result.error is not None:
+            raise result.error
+        node_pools.update(_by_name(result.parent, result.response))
+    return diff(targets, node_pools)
+
+
+async def plan_async(
+    client,
+    targets: Iterable[NodePoolTarget],
+    *,
+    max_concurrency: int = fleet.DEFAULT_MAX_WORKERS,
+    per_project_limit: int = fleet.DEFAULT_PER_PROJECT_LIMIT,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> List[NodePoolChange]:
+    """Like :func:`plan`, for ``ClusterManagerAsyncClient``."""
+    targets = list(targets)
+
+    def call(cluster):
+        return client.list_node_pools(
+            request={"parent": cluster},
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    node_pools: Dict[str, cluster_service.NodePool] = {}
+    results = fleet.fan_out_async(
+        call,
+        _clusters(targets),
+        max_concurrency=max_concurrency,
+        per_project_limit=per_project_limit,
+    )
+    async for result in results:
+        if result.error is not None:
+            raise result.error
+        node_pools.update(_by_name(result.parent, result.response))
+    return diff(targets, node_pools)
+
+
+def _group(changes: Iterable[NodePoolChange]) -> List[List[NodePoolChange]]:
+    groups: Dict[str, List[NodePoolChange]] = OrderedDict()
+    for change in changes:
+        groups.setdefault(change.cluster, []).append(change)
+    return list(groups.values())
+
+
+def _check(max_workers: int, conflict_retries: int) -> None:
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if conflict_retries < 0:
+        raise ValueError("conflict_retries must not be negative.")
+
+
+def execute(
+    client,
+    changes: Iterable[NodePoolChange],
+    *,
+    max_workers: int = fleet.DEFAULT_MAX_WORKERS,
+    deadline: Optional[float] = None,
+    policy: waiter.PollingPolicy = waiter.DEFAULT_POLLING_POLICY,
+    conflict_retries: int = DEFAULT_CONFLICT_RETRIES,
+    conflict_delay: float = DEFAULT_CONFLICT_DELAY,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> Iterator[ResizeEvent]:
+    """Applies node-pool changes, one cluster operation at a time.
+
+    The changes of a cluster are made in order, each once the operation
+    of the previous one is done, on a pool of threads shared by the
+    clusters. A failed change does not stop the next ones. A call
+    rejected with ``FAILED_PRECONDITION``, which is how the service
+    turns away a call while another operation runs on the cluster, is
+    sent again after ``conflict_delay`` seconds, up to
+    ``conflict_retries`` times.
+
+    Closing the iterator early cancels the running operations with
+    ``cancel_operation`` and skips the changes that have not started.
+
+    Args:
+        client (ClusterManagerClient): The client to call.
+        changes (Iterable[NodePoolChange]): The changes, for example
+            from :func:`plan`.
+        max_workers (int): The maximum number of clusters changed at
+            once.
+        deadline (Optional[float]): The maximum number of seconds to
+            wait for each operation. ``None`` waits indefinitely.
+        policy (google.cloud.container_v1.services.cluster_manager.waiter.PollingPolicy):
+            Controls the delay between operation polls.
+        conflict_retries (int): How many times a call rejected with
+            ``FAILED_PRECONDITION`` is sent again.
+        conflict_delay (float): Seconds to wait before sending it again.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Yields:
+        ResizeEvent: The progress of each change, in the order it
+        happens.
+    """
+    _check(max_workers, conflict_retries)
+    groups = _group(changes)
+    events: "queue.Queue[Optional[ResizeEvent]]" = queue.Queue()
+    stop = threading.Event()
+
+    def send(change):
+        for attempt in itertools.count():
+            try:
+                return getattr(client, change.method)(
+                    request=change.request, metadata=metadata
+                )
+            except core_exceptions.FailedPrecondition:
+                if attempt >= conflict_retries or stop.wait(conflict_delay):
+                    raise
+
+    def run(cluster_changes):
+        try:
+            for change in cluster_changes:
+                if stop.is_set():
+                    break
+                operation = None
+                try:
+                    operation = send(change)
+                    events.put(ResizeEvent(change, STARTED, operation, None))
+                    operation = waiter.wait_for_operation(
+                        client,
+                        operation,
+                        deadline=deadline,
+                        policy=policy,
+                        cancel_event=stop,
+                        metadata=metadata,
+                    )
+                except Exception as exc:
+                    events.put(ResizeEvent(change, FAILED, operation, exc))
+                else:
+                    events.put(ResizeEvent(change, DONE, operation, None))
+        finally:
+            events.put(None)
+
+    if not groups:
+        return
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(groups))
+    )
+    try:
+        for cluster_changes in groups:
+            executor.submit(run, cluster_changes)
+        running = len(groups)
+        while running:
+            event = events.get()
+            if event is None:
+                running -= 1
+            else:
+                yield event
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+
+async def execute_async(
+    client,
+    changes: Iterable[NodePoolChange],
+    *,
+    max_concurrency: int = fleet.DEFAULT_MAX_WORKERS,
+    deadline: Optional[float] = None,
+    policy: waiter.PollingPolicy = waiter.DEFAULT_POLLING_POLICY,
+    conflict_retries: int = DEFAULT_CONFLICT_RETRIES,
+    conflict_delay: float = DEFAULT_CONFLICT_DELAY,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> AsyncIterator[ResizeEvent]:
+    """Like :func:`execute`, running each cluster as a task.
+
+    Closing the iterator early cancels the tasks, and with them the
+    running operations.
+
+    Args:
+        client (ClusterManagerAsyncClient): The client to call.
+        changes (Iterable[NodePoolChange]): The changes.
+        max_concurrency (int): The maximum number of clusters changed at
+            once.
+        deadline (Optional[float]): The maximum number of seconds to
+            wait for each operation.
+        policy (google.cloud.container_v1.services.cluster_manager.waiter.PollingPolicy):
+            Controls the delay between operation polls.
+        conflict_retries (int): How many times a call rejected with
+            ``FAILED_PRECONDITION`` is sent again.
+        conflict_delay (float): Seconds to wait before sending it again.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Yields:
+        ResizeEvent: The progress of each change.
+    """
+    _check(max_concurrency, conflict_retries)
+    groups = _group(changes)
+    events: "asyncio.Queue[Optional[ResizeEvent]]" = asyncio.Queue()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(change):
+        for attempt in itertools.count():
+            try:
+                return await getattr(client, change.method)(
+                    request=change.request, metadata=metadata
+                )
+            except core_exceptions.FailedPrecondition:
+                if attempt >= conflict_retries:
+                    raise
+                await asyncio.sleep(conflict_delay)
+
+    async def run(cluster_changes):
+        try:
+            async with semaphore:
+                for change in cluster_changes:
+                    operation = None
+                    try:
+                        operation = await send(change)
+                        events.put_nowait(ResizeEvent(change, STARTED, operation, None))
+                        operation = await waiter.wait_for_operation_async(
+                            client,
+                            operation,
+                            deadline=deadline,
+                            policy=policy,
+                            metadata=metadata,
+                        )
+                    except Exception as exc:
+                        events.put_nowait(ResizeEvent(change, FAILED, operation, exc))
+                    else:
+                        events.put_nowait(ResizeEvent(change, DONE, operation, None))
+        finally:
+            events.put_nowait(None)
+
+    tasks = [asyncio.ensure_future(run(cluster_changes)) for cluster_changes in groups]
+    try:
+        running = len(tasks)
+        while running:
+            event = await events.get()
+            if event is None:
+                running -= 1
+            else:
+                yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+__all__ = (
+    "DONE",
+    "FAILED",
+    "NodePoolChange",
+    "NodePoolTarget",
+    "ResizeEvent",
+    "SET_AUTOSCALING",
+    "SET_SIZE",
+    "STARTED",
+    "cluster_of",
+    "diff",
+    "execute",
+    "execute_async",
+    "plan",
+    "plan_async",
+)
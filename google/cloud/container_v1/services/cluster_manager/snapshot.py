@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Incremental cluster snapshots.
+
+:class:`SnapshotStore` keeps the last listed state of every cluster and
+turns each new listing into field-level :class:`ChangeEvent` objects::
+
+    store = snapshot.SnapshotStore()
+    while True:
+        for event in store.poll(client, ["projects/p/locations/-"]):
+            log.info("%s %s %s: %r -> %r", event.action, event.name,
+                     event.field, event.old, event.new)
+        time.sleep(60)
+
+The server changes ``Cluster.etag`` and ``NodePool.etag`` whenever a
+resource changes. A cluster or node pool whose etag is unchanged is
+therefore not compared at all, so the cost of a poll grows with the
+number of changed resources rather than with the size of the fleet.
+"""
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from google.api_core import gapic_v1
+from google.protobuf import descriptor  # type: ignore
+from google.protobuf import json_format  # type: ignore
+
+from google.cloud.container_v1.services.cluster_manager import fleet
+from google.cloud.container_v1.types import cluster_service
+
+CLUSTER = "cluster"
+NODE_POOL = "node_pool"
+
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+
+# Fields that are not compared field by field: etags change with every
+# other change, and node pools are compared one by one.
+_CLUSTER_IGNORED = frozenset(["etag", "node_pools"])
+_NODE_POOL_IGNORED = frozenset(["etag"])
+
+_FieldDescriptor = descriptor.FieldDescriptor
+
+
+class ChangeEvent(NamedTuple):
+    """A change between two snapshots.
+
+    Attributes:
+        kind (str): ``"cluster"`` or ``"node_pool"``.
+        action (str): ``"added"``, ``"removed"`` or ``"modified"``.
+        name (str): The resource name, for example
+            ``projects/p/locations/l/clusters/c/nodePools/np``.
+        field (Optional[str]): The dotted path of the changed field, for
+            ``"modified"`` events.
+        old (Any): The previous value of ``field``, ``None`` if it was
+            unset. Enums are given by name and messages as dicts.
+        new (Any): The new value of ``field``, ``None`` if it is unset.
+    """
+
+    kind: str
+    action: str
+    name: str
+    field: Optional[str] = None
+    old: Any = None
+    new: Any = None
+
+
+def _value(field, value) -> Any:
+    if value is None:
+        return None
+    if field.message_type is not None:
+        if field.message_type.GetOptions().map_entry:
+            value_field = field.message_type.fields_by_name["value"]
+            return {key: _value(value_field, item) for key, item in value.items()}
+        if field.label == _FieldDescriptor.LABEL_REPEATED:
+            return [
+                json_format.MessageToDict(item, preserving_proto_field_name=True)
+                for item in value
+            ]
+        return json_format.MessageToDict(value, preserving_proto_field_name=True)
+    if field.label == _FieldDescriptor.LABEL_REPEATED:
+        return [_scalar(field, item) for item in value]
+    return _scalar(field, value)
+
+
+def _scalar(field, value) -> Any:
+    if field.enum_type is not None:
+        enum_value = field.enum_type.values_by_number.get(value)
+        return enum_value.name if enum_value is not None else value
+    return value
+
+
+def diff_messages(
+    old, new, prefix: str = "", ignore: Iterable[str] = ()
+) -> Iterator[Tuple[str, Any, Any]]:
+    """Yields ``(path, old, new)`` for every field that differs.
+
+    Singular message fields are compared field by field; repeated and
+    map fields are reported as a whole.
+
+    Args:
+        old (google.protobuf.message.Message): The previous message.
+        new (google.protobuf.message.Message): The new message, of the
+            same type.
+        prefix (str): Prepended to every path.
+        ignore (Iterable[str]): Top-level fields to skip.
+    """
+    if old == new:
+        return
+    old_values = {field.name: value for field, value in old.ListFields()}
+    new_values = {field.name: value for field, value in new.ListFields()}
+    for field in old.DESCRIPTOR.fields:
+        name = field.name
+        if name in ignore:
+            continue
+        old_value = old_values.get(name)
+        new_value = new_values.get(name)
+        if old_value == new_value:
+            continue
+        path = prefix + name
+        if (
+            field.message_type is not None
+            and field.label != _FieldDescriptor.LABEL_REPEATED
+            and old_value is not None
+            and new_value is not None
+        ):
+            yield from diff_messages(old_value, new_value, path + ".")
+        else:
+            yield path, _value(field, old_value), _value(field, new_value)
+
+
+def cluster_path(parent: str, cluster) -> str:
+    """Returns the resource name of a cluster listed under ``parent``."""
+    return "projects/{}/locations/{}/clusters/{}".format(
+        fleet.project_of(parent), cluster.location, cluster.name
+    )
+
+
+def _scope(parent: str) -> str:
+    # The prefix shared by the names of the clusters listed under parent.
+    segments = parent.split("/")
+    if len(segments) >= 4 and segments[3] != "-":
+        return "projects/{}/locations/{}/".format(segments[1], segments[3])
+    return "projects/{}/".format(fleet.project_of(parent))
+
+
+class SnapshotStore:
+    """The last known state of a set of clusters.
+
+    Attributes:
+        compared (int): The clusters and node pools compared field by
+            field during the last update.
+        skipped (int): The clusters and node pools skipped during the
+            last update because their etag was unchanged.
+        errors (List[Tuple[str, Exception]]): The parents that could not
+            be listed during the last :meth:`poll`. Their clusters are
+            left as they were.
+    """
+
+    def __init__(self):
+        self._clusters: Dict[str, Any] = {}
+        self.compared = 0
+        self.skipped = 0
+        self.errors: List[Tuple[str, Exception]] = []
+
+    def __len__(self) -> int:
+        return len(self._clusters)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._clusters
+
+    def names(self) -> List[str]:
+        """Returns the names of the clusters in the store."""
+        return sorted(self._clusters)
+
+    def get(self, name: str) -> Optional[cluster_service.Cluster]:
+        """Returns a copy of the stored cluster named ``name``, if any."""
+        cluster = self._clusters.get(name)
+        if cluster is None:
+            return None
+        copy = type(cluster)()
+        copy.CopyFrom(cluster)
+        return cluster_service.Cluster.wrap(copy)
+
+    def clear(self) -> None:
+        """Forgets every cluster."""
+        self._clusters.clear()
+
+    def update(
+        self,
+        parent: str,
+        clusters: Iterable[cluster_service.Cluster],
+        missing_zones: Sequence[str] = (),
+    ) -> List[ChangeEvent]:
+        """Replaces the clusters of ``parent`` and returns what changed.
+
+        Args:
+            parent (str): The parent the clusters were listed from, in the
+                format ``projects/*/locations/*``.
+            clusters (Iterable[google.cloud.container_v1.types.Cluster]):
+                Every cluster of ``parent``, as proto-plus or protobuf
+                messages.
+            missing_zones (Sequence[str]): The locations the listing could
+                not reach. Their clusters are not reported as removed.
+
+        Returns:
+            List[ChangeEvent]: The changes, clusters in name order.
+        """
+        self.compared = self.skipped = 0
+        events: List[ChangeEvent] = []
+        seen = set()
+        for cluster in clusters:
+            if isinstance(cluster, cluster_service.Cluster):
+                cluster = cluster_service.Cluster.pb(cluster)
+            name = cluster_path(parent, cluster)
+            seen.add(name)
+            old = self._clusters.get(name)
+            if old is not None and cluster.etag and cluster.etag == old.etag:
+                self.skipped += 1
+                continue
+            stored = type(cluster)()
+            stored.CopyFrom(cluster)
+            self._clusters[name] = stored
+            if old is None:
+                events.append(ChangeEvent(CLUSTER, ADDED, name))
+                events.extend(
+                    ChangeEvent(NODE_POOL, ADDED, name + "/nodePools/" + pool.name)
+                    for pool in cluster.node_pools
+                )
+            else:
+                self.compared += 1
+                events.extend(self._diff_cluster(name, old, cluster))
+
+        scope = _scope(parent)
+        unreachable = set(missing_zones)
+        for name in [name for name in self._clusters if name.startswith(scope)]:
+            if name in seen or self._clusters[name].location in unreachable:
+                continue
+            old = self._clusters.pop(name)
+            events.append(ChangeEvent(CLUSTER, REMOVED, name))
+            events.extend(
+                ChangeEvent(NODE_POOL, REMOVED, name + "/nodePools/" + pool.name)
+                for pool in old.node_pools
+            )
+        events.sort(key=lambda event: event.name)
+        return events
+
+    def _diff_cluster(self, name, old, new) -> Iterator[ChangeEvent]:
+        for path, old_value, new_value in diff_messages(
+            old, new, ignore=_CLUSTER_IGNORED
+        ):
+            yield ChangeEvent(CLUSTER, MODIFIED, name, path, old_value, new_value)
+
+        old_pools = {pool.name: pool for pool in old.node_pools}
+        for pool in new.node_pools:
+            pool_name = name + "/nodePools/" + pool.name
+            old_pool = old_pools.pop(pool.name, None)
+            if old_pool is None:
+                yield ChangeEvent(NODE_POOL, ADDED, pool_name)
+            elif pool.etag and pool.etag == old_pool.etag:
+                self.skipped += 1
+            else:
+                self.compared += 1
+                for path, old_value, new_value in diff_messages(
+                    old_pool, pool, ignore=_NODE_POOL_IGNORED
+                ):
+                    yield ChangeEvent(
+                        NODE_POOL, MODIFIED, pool_name, path, old_value, new_value
+                    )
+        for pool_name in old_pools:
+            yield ChangeEvent(NODE_POOL, REMOVED, name + "/nodePools/" + pool_name)
+
+    def poll(
+        self,
+        client,
+        parents: Iterable[str],
+        *,
+        max_workers: int = fleet.DEFAULT_MAX_WORKERS,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> List[ChangeEvent]:
+        """Lists the clusters of ``parents`` and returns what changed.
+
+        The parents are listed concurrently with
+        :func:`~.fleet.list_clusters`.
+
+        Args:
+            client (ClusterManagerClient): The client to call.
+            parents (Iterable[str]): The parents, in the format
+                ``projects/*/locations/*``.
+            max_workers (int): The maximum number of calls in flight.
+            retry (google.api_core.retry.Retry): Designation of what
+                errors, if any, should be retried.
+            timeout (float): The timeout for each call.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            List[ChangeEvent]: The changes, clusters in name order.
+        """
+        results = fleet.list_clusters(
+            client,
+            parents,
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return self._apply(list(results))
+
+    async def poll_async(
+        self,
+        client,
+        parents: Iterable[str],
+        *,
+        max_concurrency: int = fleet.DEFAULT_MAX_WORKERS,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> List[ChangeEvent]:
+        """Like :meth:`poll`, for ``ClusterManagerAsyncClient``."""
+        results = [
+            result
+            async for result in fleet.list_clusters_async(
+                client,
+                parents,
+                max_concurrency=max_concurrency,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        ]
+        return self._apply(results)
+
+    def _apply(self, results: List[fleet.FleetResult]) -> List[ChangeEvent]:
+        events: List[ChangeEvent] = []
+        compared = skipped = 0
+        errors = []
+        for result in sorted(results, key=lambda result: result.parent):
+            if result.error is not None:
+                errors.append((result.parent, result.error))
+                continue
+            events.extend(
+                self.update(
+                    result.parent, result.response.clusters, result.missing_zones
+                )
+            )
+            compared += self.compared
+            skipped += self.skipped
+        self.compared, self.skipped, self.errors = compared, skipped, errors
+        events.sort(key=lambda event: event.name)
+        return events
+
+
+__all__ = (
+    "ADDED",
+    "CLUSTER",
+    "ChangeEvent",
+    "MODIFIED",
+    "NODE_POOL",
+    "REMOVED",
+    "SnapshotStore",
+    "cluster_path",
+    "diff_messages",
+)
@@ -22,16 +22,22 @@ from google.api_core import gapic_v1
 from google.api_core import retry as retries
 import google.auth  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
+import google.auth.transport.requests  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
 from google.cloud.container_v1 import gapic_version as package_version
 from google.cloud.container_v1.types import cluster_service
 
+from . import compression
+
 DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
     gapic_version=package_version.__version__
 )
 
+DEFAULT_WARM_UP_TIMEOUT = 10.0
+"""The seconds :meth:`ClusterManagerTransport.warm_up` waits by default."""
+
 
 class ClusterManagerTransport(abc.ABC):
     """Abstract transport class for ClusterManager."""
@@ -40,6 +46,15 @@ class ClusterManagerTransport(abc.ABC):
 
     DEFAULT_HOST: str = "container.googleapis.com"
 
+    # The metrics registry set by transports that support instrumentation.
+    _metrics = None
+
+    # The rate limiter set by transports that support rate limiting.
+    _rate_limiter = None
+
+    # The retry budget that pays for the default retries, if any.
+    _retry_budget = None
+
     def __init__(
         self,
         *,
@@ -120,16 +135,39 @@ class ClusterManagerTransport(abc.ABC):
             host += ":443"
         self._host = host
 
+    def _retry_predicate(self, *exception_types) -> Callable[[Exception], bool]:
+        """Returns the predicate of a default retry.
+
+        Retries of ``exception_types`` are limited by the retry budget,
+        if the transport has one.
+        """
+        predicate = retries.if_exception_type(*exception_types)
+        if self._retry_budget is not None:
+            predicate = self._retry_budget.predicate(predicate)
+        return predicate
+
+    def _wrap_method(self, func, **kwargs):
+        """Wraps an RPC method with its defaults and error handling.
+
+        The wrapped method forwards the ``compression`` of calls.
+        """
+        return compression.wrap_method(gapic_v1.method.wrap_method, func, **kwargs)
+
+    def _instrument_call(self, method: str, func: Callable) -> Callable:
+        """Returns a wrapped method that records the latency of calls."""
+        return self._metrics.instrument_call(method, func)
+
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_clusters: gapic_v1.method.wrap_method(
+        # Precompute the wrapped methods, by RPC method name, so that a
+        # call finds its method with a single lookup.
+        self._dispatch = {
+            "list_clusters": self._wrap_method(
                 self.list_clusters,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -138,13 +176,13 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.get_cluster: gapic_v1.method.wrap_method(
+            "get_cluster": self._wrap_method(
                 self.get_cluster,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -153,63 +191,63 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.create_cluster: gapic_v1.method.wrap_method(
+            "create_cluster": self._wrap_method(
                 self.create_cluster,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.update_cluster: gapic_v1.method.wrap_method(
+            "update_cluster": self._wrap_method(
                 self.update_cluster,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.update_node_pool: gapic_v1.method.wrap_method(
+            "update_node_pool": self._wrap_method(
                 self.update_node_pool,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_node_pool_autoscaling: gapic_v1.method.wrap_method(
+            "set_node_pool_autoscaling": self._wrap_method(
                 self.set_node_pool_autoscaling,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_logging_service: gapic_v1.method.wrap_method(
+            "set_logging_service": self._wrap_method(
                 self.set_logging_service,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_monitoring_service: gapic_v1.method.wrap_method(
+            "set_monitoring_service": self._wrap_method(
                 self.set_monitoring_service,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_addons_config: gapic_v1.method.wrap_method(
+            "set_addons_config": self._wrap_method(
                 self.set_addons_config,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_locations: gapic_v1.method.wrap_method(
+            "set_locations": self._wrap_method(
                 self.set_locations,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.update_master: gapic_v1.method.wrap_method(
+            "update_master": self._wrap_method(
                 self.update_master,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_master_auth: gapic_v1.method.wrap_method(
+            "set_master_auth": self._wrap_method(
                 self.set_master_auth,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.delete_cluster: gapic_v1.method.wrap_method(
+            "delete_cluster": self._wrap_method(
                 self.delete_cluster,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -218,13 +256,13 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.list_operations: gapic_v1.method.wrap_method(
+            "list_operations": self._wrap_method(
                 self.list_operations,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -233,13 +271,13 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.get_operation: gapic_v1.method.wrap_method(
+            "get_operation": self._wrap_method(
                 self.get_operation,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -248,18 +286,18 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.cancel_operation: gapic_v1.method.wrap_method(
+            "cancel_operation": self._wrap_method(
                 self.cancel_operation,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.get_server_config: gapic_v1.method.wrap_method(
+            "get_server_config": self._wrap_method(
                 self.get_server_config,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -268,18 +306,18 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.get_json_web_keys: gapic_v1.method.wrap_method(
+            "get_json_web_keys": self._wrap_method(
                 self.get_json_web_keys,
                 default_timeout=None,
                 client_info=client_info,
             ),
-            self.list_node_pools: gapic_v1.method.wrap_method(
+            "list_node_pools": self._wrap_method(
                 self.list_node_pools,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -288,13 +326,13 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.get_node_pool: gapic_v1.method.wrap_method(
+            "get_node_pool": self._wrap_method(
                 self.get_node_pool,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -303,18 +341,18 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.create_node_pool: gapic_v1.method.wrap_method(
+            "create_node_pool": self._wrap_method(
                 self.create_node_pool,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.delete_node_pool: gapic_v1.method.wrap_method(
+            "delete_node_pool": self._wrap_method(
                 self.delete_node_pool,
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
                     multiplier=1.3,
-                    predicate=retries.if_exception_type(
+                    predicate=self._retry_predicate(
                         core_exceptions.DeadlineExceeded,
                         core_exceptions.ServiceUnavailable,
                     ),
@@ -323,72 +361,109 @@ class ClusterManagerTransport(abc.ABC):
                 default_timeout=20.0,
                 client_info=client_info,
             ),
-            self.complete_node_pool_upgrade: gapic_v1.method.wrap_method(
+            "complete_node_pool_upgrade": self._wrap_method(
                 self.complete_node_pool_upgrade,
                 default_timeout=None,
                 client_info=client_info,
             ),
-            self.rollback_node_pool_upgrade: gapic_v1.method.wrap_method(
+            "rollback_node_pool_upgrade": self._wrap_method(
                 self.rollback_node_pool_upgrade,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_node_pool_management: gapic_v1.method.wrap_method(
+            "set_node_pool_management": self._wrap_method(
                 self.set_node_pool_management,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_labels: gapic_v1.method.wrap_method(
+            "set_labels": self._wrap_method(
                 self.set_labels,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_legacy_abac: gapic_v1.method.wrap_method(
+            "set_legacy_abac": self._wrap_method(
                 self.set_legacy_abac,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.start_ip_rotation: gapic_v1.method.wrap_method(
+            "start_ip_rotation": self._wrap_method(
                 self.start_ip_rotation,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.complete_ip_rotation: gapic_v1.method.wrap_method(
+            "complete_ip_rotation": self._wrap_method(
                 self.complete_ip_rotation,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_node_pool_size: gapic_v1.method.wrap_method(
+            "set_node_pool_size": self._wrap_method(
                 self.set_node_pool_size,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_network_policy: gapic_v1.method.wrap_method(
+            "set_network_policy": self._wrap_method(
                 self.set_network_policy,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.set_maintenance_policy: gapic_v1.method.wrap_method(
+            "set_maintenance_policy": self._wrap_method(
                 self.set_maintenance_policy,
                 default_timeout=45.0,
                 client_info=client_info,
             ),
-            self.list_usable_subnetworks: gapic_v1.method.wrap_method(
+            "list_usable_subnetworks": self._wrap_method(
                 self.list_usable_subnetworks,
                 default_timeout=None,
                 client_info=client_info,
             ),
         }
+        self._wrapped_methods = {
+            getattr(self, name): rpc for name, rpc in self._dispatch.items()
+        }
+        if self._metrics is not None:
+            # Record the latency of whole calls, including retries.
+            self._wrapped_methods = self._metrics.instrument_wrapped_methods(
+                self._wrapped_methods, self._instrument_call
+            )
+            self._dispatch = {
+                name: self._wrapped_methods[getattr(self, name)]
+                for name in self._dispatch
+            }
 
     def close(self):
         """Closes resources associated with the transport.
 
+        A transport created with a ``channel_registry`` only releases
+        its reference to the shared channel.
+
         .. warning::
              Only call this method if the transport is NOT shared
              with other clients - this may cause errors in other clients!
         """
         raise NotImplementedError()
 
+    def with_response_format(self, response_format: str) -> "ClusterManagerTransport":
+        """Return a transport whose calls return ``response_format``."""
+        raise NotImplementedError()
+
+    def warm_up(
+        self, timeout: Optional[float] = DEFAULT_WARM_UP_TIMEOUT
+    ) -> Union[None, Awaitable[None]]:
+        """Connects the transport and refreshes its credentials.
+
+        The first call then does not wait for either.
+        """
+        raise NotImplementedError()
+
+    def _refresh_credentials(self) -> None:
+        """Refreshes the credentials if they hold no valid token.
+
+        Blocks on the token request, if one is made.
+        """
+        credentials = self._credentials
+        if credentials and not credentials.valid:
+            credentials.refresh(google.auth.transport.requests.Request())
+
     @property
     def list_clusters(
         self,
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Message compression for the gRPC transports.
+
+Calls are sent uncompressed by default. Pass ``compression`` to a gRPC
+transport to compress the requests of every call, to a client to
+compress the requests of its calls, or to a method to compress one
+call; the narrowest setting wins::
+
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(compression="auto")
+    )
+    client.create_cluster(request, compression="gzip")
+
+The settings are :data:`NONE`, :data:`GZIP`, :data:`DEFLATE`, a
+:class:`grpc.Compression`, or :data:`AUTO`, which compresses requests of
+at least :data:`DEFAULT_MIN_SIZE` bytes with gzip, such as those that
+carry a whole ``Cluster``, and sends the small ``Get*``, ``List*`` and
+``Set*`` requests as they are: compressing a few bytes costs more than
+it saves.
+
+gRPC leaves the compression of responses to the server, which may
+compress them with any algorithm the channel accepts; gRPC channels
+accept gzip and deflate. The large ``List*`` and ``Get*`` responses are
+compressed whenever the server chooses to, whatever the setting.
+
+The clients pass the algorithm of a call to the stub as its
+``compression`` argument. The transports wrap their methods with
+:data:`UNSET` as the default compression, since api-core only forwards
+the ``compression`` of a call to methods wrapped with a default one.
+"""
+import inspect
+from typing import Any, Callable, Dict, Optional, Union
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+import proto  # type: ignore
+
+from .forwarding import (
+    AsyncForwardingChannel,
+    AsyncForwardingUnaryUnaryMultiCallable,
+    ForwardingChannel,
+    ForwardingUnaryUnaryMultiCallable,
+)
+
+NONE = "none"
+GZIP = "gzip"
+DEFLATE = "deflate"
+AUTO = "auto"
+
+DEFAULT_MIN_SIZE = 1024
+"""The size in bytes from which :data:`AUTO` compresses a request."""
+
+_ALGORITHMS = {
+    NONE: grpc.Compression.NoCompression,
+    GZIP: grpc.Compression.Gzip,
+    DEFLATE: grpc.Compression.Deflate,
+}
+
+Compression = Union[str, grpc.Compression]
+
+
+class _Unset:
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "UNSET"
+
+
+UNSET: Any = _Unset()
+"""The ``compression`` of calls that leave the choice to the transport.
+
+gRPC ignores it, as it does None, and compressed channels replace it
+with their setting.
+"""
+
+
+def check_compression(compression: Optional[Compression]) -> None:
+    """Raises ValueError if ``compression`` is not a known setting."""
+    if (
+        compression is None
+        or compression == AUTO
+        or isinstance(compression, grpc.Compression)
+        or compression in _ALGORITHMS
+    ):
+        return
+    raise ValueError(
+        "Unknown compression {!r}; expected one of {}.".format(
+            compression, ", ".join(repr(name) for name in (*_ALGORITHMS, AUTO))
+        )
+    )
+
+
+def request_size(request) -> int:
+    """Returns the serialized size of a request, in bytes."""
+    if isinstance(request, proto.Message):
+        return type(request).pb(request).ByteSize()
+    if isinstance(request, bytes):
+        return len(request)
+    return request.ByteSize()
+
+
+def algorithm(
+    compression: Optional[Compression],
+    request=None,
+    min_size: int = DEFAULT_MIN_SIZE,
+) -> Optional[grpc.Compression]:
+    """Returns the algorithm that compresses ``request``.
+
+    Args:
+        compression (Optional[Union[str, grpc.Compression]]): The setting
+            of the call.
+        request: The request of the call. Only read for :data:`AUTO`.
+        min_size (int): The size from which :data:`AUTO` compresses.
+
+    Returns:
+        Optional[grpc.Compression]: The algorithm, or None to leave the
+            choice to the channel.
+
+    Raises:
+        ValueError: If ``compression`` is not a known setting.
+    """
+    if compression is None or isinstance(compression, grpc.Compression):
+        return compression
+    if compression == AUTO:
+        if request is not None and request_size(request) >= min_size:
+            return grpc.Compression.Gzip
+        return grpc.Compression.NoCompression
+    try:
+        return _ALGORITHMS[compression]
+    except (KeyError, TypeError):
+        check_compression(compression)
+        raise
+
+
+def wrap_method(wrap: Callable, func: Callable, **kwargs) -> Callable:
+    """Wraps an RPC method with ``wrap``, forwarding the call compression.
+
+    Args:
+        wrap (Callable): ``gapic_v1.method.wrap_method`` or
+            ``gapic_v1.method_async.wrap_method``.
+        func (Callable): The stub to wrap.
+        kwargs: The defaults of the wrapped method.
+    """
+    # Releases of api-core without default_compression forward the
+    # compression of every call.
+    if "default_compression" in inspect.signature(wrap).parameters:
+        kwargs["default_compression"] = UNSET
+    return wrap(func, **kwargs)
+
+
+def _sets_compression(kwargs: Dict) -> bool:
+    compression = kwargs.get("compression")
+    return compression is not None and compression is not UNSET
+
+
+def compress_channel(
+    channel, compression: Compression, min_size: int = DEFAULT_MIN_SIZE
+):
+    """Returns ``channel`` wrapped so that its unary calls are compressed.
+
+    Calls made with a ``compression`` of their own keep it. Accepts both
+    :class:`grpc.Channel` and :class:`grpc.aio.Channel`.
+
+    Raises:
+        ValueError: If ``compression`` is not a known setting.
+    """
+    check_compression(compression)
+    if isinstance(channel, aio.Channel):
+        return AsyncCompressedChannel(channel, compression, min_size)
+    return CompressedChannel(channel, compression, min_size)
+
+
+def _compress(stub, request, kwargs: Dict) -> Dict:
+    if not _sets_compression(kwargs):
+        kwargs["compression"] = algorithm(
+            stub._default_compression, request, stub._min_size
+        )
+    return kwargs
+
+
+class _CompressedUnaryUnaryMultiCallable(ForwardingUnaryUnaryMultiCallable):
+    def __init__(self, compression: Compression, min_size: int, callable_):
+        super().__init__(callable_)
+        # Not named ``_compression``: wrap_method copies the attributes of
+        # the callable onto the wrapped method, which has one.
+        self._default_compression = compression
+        self._min_size = min_size
+
+    _prepare = _compress
+
+
+class CompressedChannel(ForwardingChannel):
+    """A :class:`grpc.Channel` whose unary calls are compressed.
+
+    Args:
+        channel (grpc.Channel): The channel to send calls on.
+        compression (Union[str, grpc.Compression]): The setting of calls
+            made without one.
+        min_size (int): The size from which :data:`AUTO` compresses.
+    """
+
+    def __init__(
+        self,
+        channel: grpc.Channel,
+        compression: Compression,
+        min_size: int = DEFAULT_MIN_SIZE,
+    ):
+        super().__init__(channel)
+        self.compression = compression
+        self.min_size = min_size
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _CompressedUnaryUnaryMultiCallable(
+            self.compression,
+            self.min_size,
+            self.channel.unary_unary(method, *args, **kwargs),
+        )
+
+
+class _AsyncCompressedUnaryUnaryMultiCallable(AsyncForwardingUnaryUnaryMultiCallable):
+    def __init__(self, compression: Compression, min_size: int, callable_):
+        super().__init__(callable_)
+        self._default_compression = compression
+        self._min_size = min_size
+
+    _prepare = _compress
+
+
+class AsyncCompressedChannel(AsyncForwardingChannel):
+    """An :class:`grpc.aio.Channel` whose unary calls are compressed.
+
+    Args:
+        channel (grpc.aio.Channel): The channel to send calls on.
+        compression (Union[str, grpc.Compression]): The setting of calls
+            made without one.
+        min_size (int): The size from which :data:`AUTO` compresses.
+    """
+
+    def __init__(
+        self,
+        channel: aio.Channel,
+        compression: Compression,
+        min_size: int = DEFAULT_MIN_SIZE,
+    ):
+        super().__init__(channel)
+        self.compression = compression
+        self.min_size = min_size
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _AsyncCompressedUnaryUnaryMultiCallable(
+            self.compression,
+            self.min_size,
+            self.channel.unary_unary(method, *args, **kwargs),
+        )
+
+
+__all__ = (
+    "AUTO",
+    "AsyncCompressedChannel",
+    "CompressedChannel",
+    "Compression",
+    "DEFAULT_MIN_SIZE",
+    "DEFLATE",
+    "GZIP",
+    "NONE",
+    "UNSET",
+    "algorithm",
+    "check_compression",
+    "compress_channel",
+    "request_size",
+    "wrap_method",
+)
@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side rate limiting for the transports.
+
+The API enforces per-project quotas, most tightly on mutating RPCs such
+as ``SetNodePoolSize`` and ``UpdateNodePool``. Bursts over the quota fail
+with ``RESOURCE_EXHAUSTED``, and retrying them only adds to the load. Pass
+a :class:`RateLimiter` to a gRPC transport to space calls out on the
+client instead, so that they go through at the quota rate::
+
+    limiter = ratelimit.RateLimiter(
+        {ratelimit.MUTATE: ratelimit.RateLimit(rate=2.0, burst=10)}
+    )
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(rate_limiter=limiter)
+    )
+
+Every RPC belongs to a method group: :data:`READ` for the ``Get*`` and
+``List*`` RPCs and :data:`MUTATE` for the others, unless overridden. Each
+group with a :class:`RateLimit` has a token bucket per project, the
+project being read from the resource name or ``project_id`` of the
+request. Groups without a limit are not limited.
+
+Every attempt takes a token, so retries are limited too. Attempts wait
+for their token in the order they were made, and the time they waited is
+recorded per group in :meth:`RateLimiter.stats`.
+"""
+import asyncio
+import functools
+import threading
+import time
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from google.api_core import exceptions as core_exceptions
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import (
+    AsyncForwardingChannel,
+    AsyncForwardingUnaryUnaryMultiCallable,
+    ForwardingChannel,
+    ForwardingUnaryUnaryMultiCallable,
+)
+from .metrics import DEFAULT_LATENCY_BUCKETS, Histogram, _format, method_name
+
+READ = "read"
+MUTATE = "mutate"
+
+
+class RateLimit(NamedTuple):
+    """The quota of a method group.
+
+    Attributes:
+        rate (float): Calls per second, sustained.
+        burst (int): Calls that may be made at once after a quiet period.
+    """
+
+    rate: float
+    burst: int = 1
+
+
+def default_group(method: str) -> str:
+    """Returns :data:`READ` for ``Get*`` and ``List*`` RPCs, else :data:`MUTATE`."""
+    return READ if method.startswith(("Get", "List")) else MUTATE
+
+
+def request_project(request) -> str:
+    """Returns the project of a request, or ``""`` if it names none."""
+    for field in ("name", "parent"):
+        value = getattr(request, field, None)
+        if isinstance(value, str) and value.startswith("projects/"):
+            return value.split("/")[1]
+    project_id = getattr(request, "project_id", None)
+    return project_id if isinstance(project_id, str) else ""
+
+
+class RateLimitStats:
+    """The waits of the calls of one method group.
+
+    Attributes:
+        acquired (int): Tokens taken, one per attempt.
+        delayed (int): Attempts that waited for their token.
+        rejected (int): Attempts that failed instead of waiting longer
+            than ``max_wait`` or their timeout.
+        wait_time (Histogram): Seconds waited by each attempt.
+    """
+
+    def __init__(self, wait_buckets: Sequence[float]):
+        self.acquired = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.wait_time = Histogram(wait_buckets)
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RateLimiter:
+    """Token buckets for the calls of one or more transports.
+
+    Args:
+        limits (Mapping[str, RateLimit]): The quota of each method group.
+        groups (Optional[Mapping[str, str]]): The group of RPCs that are
+            not in their :func:`default_group`, by RPC name, for example
+            ``{"SetNodePoolSize": "resize"}``.
+        per_project (bool): Whether each project has buckets of its own.
+            If False, a group's quota is shared by all projects.
+        max_wait (Optional[float]): The longest an attempt may wait, in
+            seconds. Attempts that would wait longer fail with
+            :class:`~google.api_core.exceptions.ResourceExhausted`.
+        wait_buckets (Sequence[float]): The wait time histogram bounds,
+            in seconds.
+        clock (Callable[[], float]): The clock used to refill buckets.
+        sleep (Callable[[float], None]): Waits in synchronous calls.
+
+    Raises:
+        ValueError: If a limit has no positive rate or burst.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimit],
+        *,
+        groups: Optional[Mapping[str, str]] = None,
+        per_project: bool = True,
+        max_wait: Optional[float] = None,
+        wait_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        for group, limit in limits.items():
+            if limit.rate <= 0:
+                raise ValueError("The rate of {!r} must be positive.".format(group))
+            if limit.burst < 1:
+                raise ValueError("The burst of {!r} must be at least 1.".format(group))
+        self._limits = dict(limits)
+        self._groups = dict(groups or {})
+        self._per_project = per_project
+        self._max_wait = max_wait
+        self._wait_buckets = tuple(wait_buckets)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._stats: Dict[str, RateLimitStats] = {}
+
+    def group(self, method: str) -> str:
+        """Returns the group of an RPC, such as ``"SetNodePoolSize"``."""
+        return self._groups.get(method) or default_group(method)
+
+    def limit(self, group: str) -> Optional[RateLimit]:
+        """Returns the quota of a group, or None if it is not limited."""
+        return self._limits.get(group)
+
+    def _get(self, group: str) -> RateLimitStats:
+        # Must be called with the lock held.
+        stats = self._stats.get(group)
+        if stats is None:
+            stats = self._stats[group] = RateLimitStats(self._wait_buckets)
+        return stats
+
+    def stats(self, group: str) -> RateLimitStats:
+        """Returns the waits of one group, such as ``"mutate"``."""
+        with self._lock:
+            return self._get(group)
+
+    def groups(self) -> List[str]:
+        """Returns the names of the groups with recorded waits."""
+        with self._lock:
+            return sorted(self._stats)
+
+    def reset(self) -> None:
+        """Drops the recorded waits. The buckets are kept."""
+        with self._lock:
+            self._stats.clear()
+
+    def reserve(
+        self, method: str, project: str = "", timeout: Optional[float] = None
+    ) -> float:
+        """Takes a token for an attempt and returns how long it must wait.
+
+        The token is taken at once, so attempts are served in the order
+        they reserve, whether or not they have finished waiting.
+
+        Args:
+            method (str): The RPC name, such as ``"SetNodePoolSize"``.
+            project (str): The project the attempt is charged to.
+            timeout (Optional[float]): The timeout of the attempt, in
+                seconds.
+
+        Returns:
+            float: The seconds to wait before starting the attempt.
+
+        Raises:
+            google.api_core.exceptions.ResourceExhausted: If the wait would
+                exceed ``max_wait``.
+            google.api_core.exceptions.DeadlineExceeded: If the wait would
+                exceed ``timeout``.
+        """
+        group = self.group(method)
+        limit = self._limits.get(group)
+        if limit is None:
+            return 0.0
+        key = (group, project if self._per_project else "")
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(float(limit.burst), now)
+            else:
+                bucket.tokens = min(
+                    float(limit.burst),
+                    bucket.tokens + (now - bucket.updated) * limit.rate,
+                )
+                bucket.updated = now
+            wait = max(0.0, (1.0 - bucket.tokens) / limit.rate)
+            stats = self._get(group)
+            if self._max_wait is not None and wait > self._max_wait:
+                stats.rejected += 1
+                raise core_exceptions.ResourceExhausted(
+                    "{} would wait {:.3f}s for the {!r} rate limit.".format(
+                        method, wait, group
+                    )
+                )
+            if timeout is not None and wait > timeout:
+                stats.rejected += 1
+                raise core_exceptions.DeadlineExceeded(
+                    "{} would wait {:.3f}s for the {!r} rate limit, more than "
+                    "its {:.3f}s timeout.".format(method, wait, group, timeout)
+                )
+            bucket.tokens -= 1.0
+            stats.acquired += 1
+            if wait:
+                stats.delayed += 1
+            stats.wait_time.observe(wait)
+        return wait
+
+    def acquire(
+        self, method: str, project: str = "", timeout: Optional[float] = None
+    ) -> float:
+        """Waits for a token for an attempt. See :meth:`reserve`.
+
+        Returns:
+            float: The seconds waited.
+        """
+        wait = self.reserve(method, project, timeout)
+        if wait:
+            self._sleep(wait)
+        return wait
+
+    async def acquire_async(
+        self, method: str, project: str = "", timeout: Optional[float] = None
+    ) -> float:
+        """Waits for a token without blocking the event loop.
+
+        See :meth:`acquire`.
+        """
+        wait = self.reserve(method, project, timeout)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def limit_channel(self, channel):
+        """Returns ``channel`` wrapped so that its unary calls are limited.
+
+        Accepts both :class:`grpc.Channel` and :class:`grpc.aio.Channel`.
+        """
+        if isinstance(channel, aio.Channel):
+            return AsyncRateLimitedChannel(channel, self)
+        return RateLimitedChannel(channel, self)
+
+    # Export.
+
+    def to_prometheus(self, prefix: str = "container_cluster_manager") -> str:
+        """Renders the waits in the Prometheus text exposition format."""
+        with self._lock:
+            items = sorted(self._stats.items())
+            name = "{}_rate_limit_wait_seconds".format(prefix)
+            lines = [
+                "# HELP {} Time attempts waited for a rate limit token.".format(name),
+                "# TYPE {} histogram".format(name),
+            ]
+            for group, stats in items:
+                hist = stats.wait_time
+                for bound, count in zip(hist.bounds, hist.cumulative_counts()):
+                    lines.append(
+                        '{}_bucket{{group="{}",le="{}"}} {}'.format(
+                            name, group, _format(bound), count
+                        )
+                    )
+                lines.append(
+                    '{}_bucket{{group="{}",le="+Inf"}} {}'.format(
+                        name, group, hist.count
+                    )
+                )
+                lines.append(
+                    '{}_sum{{group="{}"}} {}'.format(name, group, _format(hist.sum))
+                )
+                lines.append(
+                    '{}_count{{group="{}"}} {}'.format(name, group, hist.count)
+                )
+
+            for attribute, help_text in (
+                ("acquired", "Rate limit tokens taken."),
+                ("delayed", "Attempts that waited for a rate limit token."),
+                ("rejected", "Attempts that failed instead of waiting."),
+            ):
+                name = "{}_rate_limit_{}_total".format(prefix, attribute)
+                lines.append("# HELP {} {}".format(name, help_text))
+                lines.append("# TYPE {} counter".format(name))
+                for group, stats in items:
+                    lines.append(
+                        '{}{{group="{}"}} {}'.format(
+                            name, group, getattr(stats, attribute)
+                        )
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def _remaining(kwargs: Dict, waited: float) -> Dict:
+    # The wait counts against the timeout of the attempt.
+    timeout = kwargs.get("timeout")
+    if waited and timeout is not None:
+        kwargs["timeout"] = max(timeout - waited, 0.0)
+    return kwargs
+
+
+class _RateLimitedUnaryUnaryMultiCallable(ForwardingUnaryUnaryMultiCallable):
+    def __init__(self, limiter: RateLimiter, method: str, callable_):
+        super().__init__(callable_)
+        self._limiter = limiter
+        self.method = method
+
+    def _prepare(self, request, kwargs: Dict) -> Dict:
+        waited = self._limiter.acquire(
+            self.method, request_project(request), kwargs.get("timeout")
+        )
+        return _remaining(kwargs, waited)
+
+
+class RateLimitedChannel(ForwardingChannel):
+    """A :class:`grpc.Channel` whose unary calls wait for a rate limiter.
+
+    Args:
+        channel (grpc.Channel): The channel to limit.
+        limiter (RateLimiter): The limiter calls take their tokens from.
+    """
+
+    def __init__(self, channel: grpc.Channel, limiter: RateLimiter):
+        super().__init__(channel)
+        self.limiter = limiter
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _RateLimitedUnaryUnaryMultiCallable(
+            self.limiter,
+            method_name(method),
+            self.channel.unary_unary(method, *args, **kwargs),
+        )
+
+
+class _RateLimitedCall(aio.UnaryUnaryCall):
+    """An asyncio call that starts once its rate limit wait is over."""
+
+    def __init__(self, wait: float, start: Callable[[], aio.UnaryUnaryCall]):
+        self._task = asyncio.ensure_future(self._start(wait, start))
+
+    @staticmethod
+    async def _start(wait, start):
+        await asyncio.sleep(wait)
+        return start()
+
+    def _call(self) -> Optional[aio.UnaryUnaryCall]:
+        task = self._task
+        if not task.done() or task.cancelled() or task.exception() is not None:
+            return None
+        return task.result()
+
+    def __await__(self):
+        call = yield from self._task.__await__()
+        response = yield from call.__await__()
+        return response
+
+    async def initial_metadata(self):
+        return await (await self._task).initial_metadata()
+
+    async def trailing_metadata(self):
+        return await (await self._task).trailing_metadata()
+
+    async def code(self):
+        return await (await self._task).code()
+
+    async def details(self):
+        return await (await self._task).details()
+
+    async def wait_for_connection(self):
+        await (await self._task).wait_for_connection()
+
+    def cancelled(self):
+        call = self._call()
+        return self._task.cancelled() if call is None else call.cancelled()
+
+    def done(self):
+        call = self._call()
+        return self._task.done() if call is None else call.done()
+
+    def time_remaining(self):
+        call = self._call()
+        return None if call is None else call.time_remaining()
+
+    def cancel(self):
+        if not self._task.done():
+            return self._task.cancel()
+        call = self._call()
+        return False if call is None else call.cancel()
+
+    def add_done_callback(self, callback):
+        def started(task):
+            call = self._call()
+            if call is None:
+                callback(self)
+            else:
+                call.add_done_callback(lambda _: callback(self))
+
+        self._task.add_done_callback(started)
+
+
+class _AsyncRateLimitedUnaryUnaryMultiCallable(AsyncForwardingUnaryUnaryMultiCallable):
+    def __init__(self, limiter: RateLimiter, method: str, callable_):
+        super().__init__(callable_)
+        self._limiter = limiter
+        self.method = method
+
+    def __call__(self, request, *args, **kwargs):
+        # Reserve now, so that calls are served in the order they are made.
+        wait = self._limiter.reserve(
+            self.method, request_project(request), kwargs.get("timeout")
+        )
+        if not wait:
+            return self.__wrapped__(request, *args, **kwargs)
+        return _RateLimitedCall(
+            wait,
+            functools.partial(
+                self.__wrapped__, request, *args, **_remaining(kwargs, wait)
+            ),
+        )
+
+
+class AsyncRateLimitedChannel(AsyncForwardingChannel):
+    """An :class:`grpc.aio.Channel` whose unary calls wait for a rate limiter.
+
+    Calls wait without blocking the event loop.
+
+    Args:
+        channel (grpc.aio.Channel): The channel to limit.
+        limiter (RateLimiter): The limiter calls take their tokens from.
+    """
+
+    def __init__(self, channel: aio.Channel, limiter: RateLimiter):
+        super().__init__(channel)
+        self.limiter = limiter
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _AsyncRateLimitedUnaryUnaryMultiCallable(
+            self.limiter,
+            method_name(method),
+            self.channel.unary_unary(method, *args, **kwargs),
+        )
+
+
+__all__ = (
+    "AsyncRateLimitedChannel",
+    "MUTATE",
+    "READ",
+    "RateLimit",
+    "RateLimitStats",
+    "RateLimitedChannel",
+    "RateLimiter",
+    "default_group",
+    "request_project",
+)
@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Helpers for waiting on long-running ClusterManager operations.
+
+Mutating ClusterManager RPCs return a bare
+:class:`~google.cloud.container_v1.types.Operation`. The helpers in this
+module poll ``get_operation`` until the operation is ``DONE``, spacing
+the polls according to the progress the server reports, and either
+return the final operation or raise the error it carries.
+"""
+import asyncio
+import concurrent.futures
+import re
+import threading
+import time
+from typing import Optional, Sequence, Tuple
+
+from google.api_core import exceptions as core_exceptions
+import grpc  # type: ignore
+
+from google.cloud.container_v1.types import cluster_service
+
+_OPERATION_PATH_RE = re.compile(
+    r"projects/(?P<project>[^/]+)/(?:locations|zones)/(?P<location>[^/]+)"
+    r"/operations/(?P<operation>[^/]+)$"
+)
+
+_DONE = cluster_service.Operation.Status.DONE
+_RUNNING = cluster_service.Operation.Status.RUNNING
+
+
+def operation_path(
+    operation: cluster_service.Operation, project: Optional[str] = None
+) -> str:
+    """Returns the fully-qualified resource name of an operation.
+
+    The name is taken from ``operation.self_link`` when it is set. Otherwise
+    it is built from ``project`` and the operation's ``location`` (or the
+    deprecated ``zone``).
+
+    Args:
+        operation (google.cloud.container_v1.types.Operation):
+            The operation returned by a mutating RPC.
+        project (Optional[str]): The project the operation belongs to.
+            Only needed when ``operation.self_link`` is unset.
+
+    Returns:
+        str: A name of the form
+        ``projects/*/locations/*/operations/*``.
+
+    Raises:
+        ValueError: If the name cannot be determined.
+    """
+    match = _OPERATION_PATH_RE.search(operation.self_link)
+    if match:
+        return "projects/{project}/locations/{location}/operations/{operation}".format(
+            **match.groupdict()
+        )
+    location = operation.location or operation.zone
+    if project and location and operation.name:
+        return "projects/{}/locations/{}/operations/{}".format(
+            project, location, operation.name
+        )
+    raise ValueError(
+        "Cannot determine the resource name of operation {!r}; "
+        "pass `project` explicitly.".format(operation.name)
+    )
+
+
+def operation_progress(operation: cluster_service.Operation) -> Optional[float]:
+    """Returns the completed fraction of an operation, if it is reported.
+
+    The fraction is read from the ``progress`` / ``progress scale``
+    metrics, or from a pair of ``<x> done`` / ``<x> total`` metrics. When
+    the top-level progress carries no usable metrics, the first running
+    stage is consulted instead.
+
+    Args:
+        operation (google.cloud.container_v1.types.Operation):
+            The operation to inspect.
+
+    Returns:
+        Optional[float]: A value between 0.0 and 1.0, or ``None`` if the
+        server did not report progress.
+    """
+    fraction = _metrics_fraction(operation.progress.metrics)
+    if fraction is None:
+        stage = _current_stage(operation.progress)
+        if stage is not None:
+            fraction = _metrics_fraction(stage.metrics)
+    return fraction
+
+
+def _metric_value(metric: cluster_service.OperationProgress.Metric) -> float:
+    value = cluster_service.OperationProgress.Metric.pb(metric).WhichOneof("value")
+    if value == "int_value":
+        return float(metric.int_value)
+    if value == "double_value":
+        return metric.double_value
+    return float("nan")
+
+
+def _metrics_fraction(
+    metrics: Sequence[cluster_service.OperationProgress.Metric],
+) -> Optional[float]:
+    values = {metric.name: _metric_value(metric) for metric in metrics}
+    if "progress" in values:
+        done, total = values["progress"], values.get("progress scale", 1.0)
+    else:
+        for name, total in values.items():
+            if name.endswith(" total"):
+                done = values.get(name[: -len(" total")] + " done")
+                if done is not None:
+                    break
+        else:
+            return None
+    if not total or total != total or done != done:
+        return None
+    return min(max(done / total, 0.0), 1.0)
+
+
+def _current_stage(
+    progress: cluster_service.OperationProgress,
+) -> Optional[cluster_service.OperationProgress]:
+    for stage in progress.stages:
+        if stage.status == _RUNNING:
+            return stage
+    return None
+
+
+class PollingPolicy:
+    """Decides how long to wait between ``get_operation`` polls.
+
+    Without progress information the delay grows exponentially from
+    ``initial`` by ``multiplier`` up to ``maximum``. Once the server
+    reports a completed fraction, the delay is instead derived from the
+    estimated time remaining, so that a nearly finished operation is
+    polled sooner. Entering a new stage resets the delay to ``initial``.
+
+    Args:
+        initial (float): The first delay, in seconds.
+        maximum (float): The largest delay, in seconds.
+        multiplier (float): The growth factor applied while the
+            operation reports no progress.
+        remaining_factor (float): The fraction of the estimated time
+            remaining to wait when progress is reported.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        multiplier: float = 1.5,
+        remaining_factor: float = 0.5,
+    ):
+        if initial <= 0 or maximum < initial:
+            raise ValueError("Expected 0 < initial <= maximum.")
+        if multiplier < 1.0:
+            raise ValueError("multiplier must be at least 1.0.")
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.remaining_factor = remaining_factor
+
+    def delays(self):
+        """Returns a generator of delays.
+
+        The generator is primed with :func:`next` and then fed each polled
+        operation together with the seconds elapsed since waiting began,
+        via ``send((operation, elapsed))``.
+        """
+        delay = self.initial
+        stage_name = None
+        operation, elapsed = yield delay
+        while True:
+            stage = _current_stage(operation.progress)
+            name = stage.name if stage is not None else None
+            fraction = operation_progress(operation)
+            if name != stage_name:
+                stage_name = name
+                delay = self.initial
+            elif fraction:
+                remaining = elapsed * (1.0 - fraction) / fraction
+                delay = remaining * self.remaining_factor
+            else:
+                delay = delay * self.multiplier
+            delay = min(max(delay, self.initial), self.maximum)
+            operation, elapsed = yield delay
+
+
+DEFAULT_POLLING_POLICY = PollingPolicy()
+
+
+def operation_exception(
+    operation: cluster_service.Operation,
+) -> Optional[core_exceptions.GoogleAPICallError]:
+    """Returns the exception described by a finished operation, if any.
+
+    Args:
+        operation (google.cloud.container_v1.types.Operation):
+            An operation whose status is ``DONE``.
+
+    Returns:
+        Optional[google.api_core.exceptions.GoogleAPICallError]: The typed
+        exception matching ``operation.error.code`` (for example
+        :class:`~google.api_core.exceptions.PermissionDenied`), with the
+        operation attached as ``response``. ``None`` if the operation
+        succeeded.
+    """
+    error = operation.error
+    if error.code:
+        code = _grpc_status_code(error.code)
+        message = error.message or operation.status_message
+        details = list(error.details)
+    elif operation.status_message:
+        code = grpc.StatusCode.UNKNOWN
+        message = operation.status_message
+        details = []
+    else:
+        return None
+    return core_exceptions.from_grpc_status(
+        code,
+        "Operation {} failed: {}".format(operation.name, message),
+        details=details,
+        response=operation,
+    )
+
+
+def _grpc_status_code(value: int) -> grpc.StatusCode:
+    for code in grpc.StatusCode:
+        if code.value[0] == value:
+            return code
+    return grpc.StatusCode.UNKNOWN
+
+
+def _result(operation: cluster_service.Operation) -> cluster_service.Operation:
+    exc = operation_exception(operation)
+    if exc is not None:
+        raise exc
+    return operation
+
+
+def wait_for_operation(
+    client,
+    operation: cluster_service.Operation,
+    *,
+    project: Optional[str] = None,
+    deadline: Optional[float] = None,
+    policy: PollingPolicy = DEFAULT_POLLING_POLICY,
+    cancel_event: Optional[threading.Event] = None,
+    cancel_on_deadline: bool = False,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> cluster_service.Operation:
+    """Blocks until a ClusterManager operation is done.
+
+    Args:
+        client (google.cloud.container_v1.services.cluster_manager.ClusterManagerClient):
+            The client used to poll and cancel the operation.
+        operation (google.cloud.container_v1.types.Operation):
+            The operation returned by a mutating RPC.
+        project (Optional[str]): The project the operation belongs to.
+            Only needed when ``operation.self_link`` is unset.
+        deadline (Optional[float]): The maximum number of seconds to wait.
+            ``None`` waits indefinitely.
+        policy (PollingPolicy): Controls the delay between polls.
+        cancel_event (Optional[threading.Event]): When set by another
+            thread, the operation is cancelled via ``cancel_operation`` and
+            :class:`~google.api_core.exceptions.Cancelled` is raised.
+        cancel_on_deadline (bool): Whether to cancel the operation when
+            ``deadline`` expires.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Returns:
+        google.cloud.container_v1.types.Operation: The finished operation.
+
+    Raises:
+        google.api_core.exceptions.GoogleAPICallError: If the operation
+            finished with an error, or was cancelled.
+        concurrent.futures.TimeoutError: If ``deadline`` expired first.
+    """
+    name = operation_path(operation, project)
+    start = time.monotonic()
+    delays = policy.delays()
+    delay = next(delays)
+    while operation.status != _DONE:
+        if deadline is not None:
+            remaining = deadline - (time.monotonic() - start)
+            if remaining <= 0:
+                if cancel_on_deadline:
+                    client.cancel_operation(name=name, metadata=metadata)
+                raise concurrent.futures.TimeoutError(
+                    "Operation {} did not complete within {} seconds.".format(
+                        name, deadline
+                    )
+                )
+            delay = min(delay, remaining)
+        if cancel_event is not None:
+            cancelled = cancel_event.wait(delay)
+        else:
+            time.sleep(delay)
+            cancelled = False
+        if cancelled:
+            client.cancel_operation(name=name, metadata=metadata)
+            raise core_exceptions.Cancelled(
+                "Operation {} was cancelled.".format(name), response=operation
+            )
+        operation = client.get_operation(name=name, metadata=metadata)
+        delay = delays.send((operation, time.monotonic() - start))
+    return _result(operation)
+
+
+async def wait_for_operation_async(
+    client,
+    operation: cluster_service.Operation,
+    *,
+    project: Optional[str] = None,
+    deadline: Optional[float] = None,
+    policy: PollingPolicy = DEFAULT_POLLING_POLICY,
+    cancel_on_deadline: bool = False,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> cluster_service.Operation:
+    """Waits until a ClusterManager operation is done.
+
+    Cancelling the awaiting task cancels the operation via
+    ``cancel_operation`` before the :class:`asyncio.CancelledError`
+    propagates.
+
+    Args:
+        client (google.cloud.container_v1.services.cluster_manager.ClusterManagerAsyncClient):
+            The client used to poll and cancel the operation.
+        operation (google.cloud.container_v1.types.Operation):
+            The operation returned by a mutating RPC.
+        project (Optional[str]): The project the operation belongs to.
+            Only needed when ``operation.self_link`` is unset.
+        deadline (Optional[float]): The maximum number of seconds to wait.
+            ``None`` waits indefinitely.
+        policy (PollingPolicy): Controls the delay between polls.
+        cancel_on_deadline (bool): Whether to cancel the operation when
+            ``deadline`` expires.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Returns:
+        google.cloud.container_v1.types.Operation: The finished operation.
+
+    Raises:
+        google.api_core.exceptions.GoogleAPICallError: If the operation
+            finished with an error.
+        asyncio.TimeoutError: If ``deadline`` expired first.
+    """
+    name = operation_path(operation, project)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    delays = policy.delays()
+    delay = next(delays)
+    while operation.status != _DONE:
+        if deadline is not None:
+            remaining = deadline - (loop.time() - start)
+            if remaining <= 0:
+                if cancel_on_deadline:
+                    await client.cancel_operation(name=name, metadata=metadata)
+                raise asyncio.TimeoutError(
+                    "Operation {} did not complete within {} seconds.".format(
+                        name, deadline
+                    )
+                )
+            delay = min(delay, remaining)
+        try:
+            await asyncio.sleep(delay)
+            operation = await client.get_operation(name=name, metadata=metadata)
+        except asyncio.CancelledError:
+            await asyncio.shield(client.cancel_operation(name=name, metadata=metadata))
+            raise
+        delay = delays.send((operation, loop.time() - start))
+    return _result(operation)
+
+
+__all__ = (
+    "DEFAULT_POLLING_POLICY",
+    "PollingPolicy",
+    "operation_exception",
+    "operation_path",
+    "operation_progress",
+    "wait_for_operation",
+    "wait_for_operation_async",
+)
@@ -14,10 +14,12 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import copy
 import functools
 import re
 from typing import (
     Dict,
+    Iterable,
     Mapping,
     MutableMapping,
     MutableSequence,
@@ -45,11 +47,23 @@ except AttributeError:  # pragma: NO COVER
 
 from google.rpc import status_pb2  # type: ignore
 
-from google.cloud.container_v1beta1.services.cluster_manager import pagers
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    cache,
+    fleet,
+    node_pools,
+    pagers,
+    projection,
+    request_builder,
+)
 from google.cloud.container_v1beta1.types import cluster_service
 
 from .client import ClusterManagerClient
-from .transports.base import DEFAULT_CLIENT_INFO, ClusterManagerTransport
+from .transports.base import (
+    DEFAULT_CLIENT_INFO,
+    DEFAULT_WARM_UP_TIMEOUT,
+    ClusterManagerTransport,
+)
+from .transports.compression import Compression
 from .transports.grpc_asyncio import ClusterManagerGrpcAsyncIOTransport
 
 
@@ -166,6 +180,26 @@ class ClusterManagerAsyncClient:
         """
         return self._client.transport
 
+    def with_response_format(self, response_format: str) -> "ClusterManagerAsyncClient":
+        """Returns a client whose calls return responses in ``response_format``.
+
+        See :meth:`ClusterManagerClient.with_response_format`.
+
+        Args:
+            response_format (str): ``"proto-plus"``, ``"protobuf"`` or
+                ``"bytes"``.
+
+        Returns:
+            ClusterManagerAsyncClient: This client if the transport already
+                returns ``response_format``, otherwise a new client.
+        """
+        client = self._client.with_response_format(response_format)
+        if client is self._client:
+            return self
+        async_client = copy.copy(self)
+        async_client._client = client
+        return async_client
+
     get_transport_class = functools.partial(
         type(ClusterManagerClient).get_transport_class, type(ClusterManagerClient)
     )
@@ -177,6 +211,9 @@ class ClusterManagerAsyncClient:
         transport: Union[str, ClusterManagerTransport] = "grpc_asyncio",
         client_options: Optional[ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[cache.ResponseCache] = None,
+        request_coalescer: Optional[cache.RequestCoalescer] = None,
+        compression: Optional[Compression] = None,
     ) -> None:
         """Instantiates the cluster manager client.
 
@@ -205,6 +242,21 @@ class ClusterManagerAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            response_cache (Optional[google.cloud.container_v1beta1.services.cluster_manager.cache.ResponseCache]):
+                An optional cache for the responses of slowly changing
+                methods such as ``get_server_config`` and
+                ``get_json_web_keys``. If ``None``, every call is sent
+                to the server.
+            request_coalescer (Optional[google.cloud.container_v1beta1.services.cluster_manager.cache.RequestCoalescer]):
+                Shares one in-flight call between identical concurrent
+                reads such as ``get_cluster`` and ``get_node_pool``. If
+                ``None``, every call sends its own request.
+            compression (Optional[Union[str, grpc.Compression]]): How the
+                requests of calls made without a ``compression`` of their
+                own are compressed: ``"none"``, ``"gzip"``, ``"deflate"``,
+                or ``"auto"`` to compress large requests only. If ``None``,
+                the transport's setting is used. See
+                :mod:`~.transports.compression`.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -215,8 +267,27 @@ class ClusterManagerAsyncClient:
             transport=transport,
             client_options=client_options,
             client_info=client_info,
+            response_cache=response_cache,
+            request_coalescer=request_coalescer,
+            compression=compression,
         )
 
+    async def warm_up(self, timeout: Optional[float] = DEFAULT_WARM_UP_TIMEOUT) -> None:
+        """Connects the client's channel and refreshes its credentials.
+
+        Await it after creating the client, so that the first call does
+        not wait for the connection and token.
+
+        Args:
+            timeout (Optional[float]): The longest to wait, in seconds.
+                Waits until the channel is ready if None.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel is
+                not ready within ``timeout``.
+        """
+        await self._client._transport.warm_up(timeout)
+
     async def list_clusters(
         self,
         request: Optional[Union[cluster_service.ListClustersRequest, dict]] = None,
@@ -226,6 +297,8 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.ListClustersResponse:
         r"""Lists all clusters owned by a project in either the
         specified zone or all zones.
@@ -286,6 +359,13 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                each cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. ``missing_zones`` is always
+                returned. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1beta1.types.ListClustersResponse:
@@ -294,55 +374,51 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListClustersRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
+        builder = request_builder.BUILDERS["list_clusters"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_clusters,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_clusters"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+        if fields is not None:
+            metadata += (
+                projection.field_mask_metadata(
+                    fields, prefix="clusters", extra=("missing_zones",)
+                ),
+            )
 
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "list_clusters"
+        ):
+            response = await request_coalescer.call_async(
+                "list_clusters",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -357,6 +433,8 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.Cluster:
         r"""Gets the details for a specific cluster.
 
@@ -426,63 +504,57 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                the cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1beta1.types.Cluster:
                 A Google Kubernetes Engine cluster.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["get_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_cluster,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+        if fields is not None:
+            metadata += (projection.field_mask_metadata(fields),)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces("get_cluster"):
+            response = await request_coalescer.call_async(
+                "get_cluster",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -497,6 +569,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a cluster, consisting of the specified number and type
         of Google Compute Engine instances.
@@ -575,6 +648,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -585,39 +661,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CreateClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster is not None:
-            request.cluster = cluster
+        builder = request_builder.BUILDERS["create_cluster"]
+        request = builder.build(request, project_id, zone, cluster)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_cluster,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["create_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -625,6 +679,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -641,6 +696,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the settings for a specific cluster.
 
@@ -717,6 +773,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -727,41 +786,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, update])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.UpdateClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if update is not None:
-            request.update = update
+        builder = request_builder.BUILDERS["update_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, update)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_cluster,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["update_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -769,6 +804,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -781,6 +817,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the version and/or image type of a specific
         node pool.
@@ -825,6 +862,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -835,21 +875,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.UpdateNodePoolRequest(request)
+        builder = request_builder.BUILDERS["update_node_pool"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_node_pool,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["update_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -857,6 +893,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -871,6 +908,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the autoscaling settings of a specific node
         pool.
@@ -913,6 +951,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -923,21 +964,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetNodePoolAutoscalingRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_autoscaling"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_node_pool_autoscaling,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_node_pool_autoscaling"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -945,6 +982,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -961,6 +999,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the logging service for a specific cluster.
 
@@ -1050,6 +1089,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1060,41 +1102,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, logging_service])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetLoggingServiceRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if logging_service is not None:
-            request.logging_service = logging_service
+        builder = request_builder.BUILDERS["set_logging_service"]
+        request = builder.build(request, project_id, zone, cluster_id, logging_service)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_logging_service,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_logging_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1102,6 +1120,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1120,6 +1139,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the monitoring service for a specific cluster.
 
@@ -1211,6 +1231,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1221,41 +1244,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, monitoring_service])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetMonitoringServiceRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if monitoring_service is not None:
-            request.monitoring_service = monitoring_service
+        builder = request_builder.BUILDERS["set_monitoring_service"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, monitoring_service
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_monitoring_service,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_monitoring_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1263,6 +1264,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1279,6 +1281,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the addons for a specific cluster.
 
@@ -1356,6 +1359,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1366,41 +1372,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, addons_config])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetAddonsConfigRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if addons_config is not None:
-            request.addons_config = addons_config
+        builder = request_builder.BUILDERS["set_addons_config"]
+        request = builder.build(request, project_id, zone, cluster_id, addons_config)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_addons_config,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_addons_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1408,6 +1390,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1424,6 +1407,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the locations for a specific cluster. Deprecated. Use
         `projects.locations.clusters.update <https://cloud.google.com/kubernetes-engine/docs/reference/rest/v1beta1/projects.locations.clusters/update>`__
@@ -1510,6 +1494,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1524,41 +1511,17 @@ class ClusterManagerAsyncClient:
         )
 
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, locations])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetLocationsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if locations:
-            request.locations.extend(locations)
+        builder = request_builder.BUILDERS["set_locations"]
+        request = builder.build(request, project_id, zone, cluster_id, locations)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_locations,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_locations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1566,6 +1529,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1582,6 +1546,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the master for a specific cluster.
 
@@ -1671,6 +1636,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1681,41 +1649,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, master_version])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.UpdateMasterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if master_version is not None:
-            request.master_version = master_version
+        builder = request_builder.BUILDERS["update_master"]
+        request = builder.build(request, project_id, zone, cluster_id, master_version)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_master,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["update_master"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1723,6 +1667,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1735,6 +1680,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets master auth materials. Currently supports
         changing the admin password or a specific cluster,
@@ -1779,6 +1725,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1789,21 +1738,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetMasterAuthRequest(request)
+        builder = request_builder.BUILDERS["set_master_auth"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_master_auth,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_master_auth"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1811,6 +1756,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1826,6 +1772,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes the cluster, including the Kubernetes
         endpoint and all worker nodes.
@@ -1904,6 +1851,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1914,49 +1864,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.DeleteClusterRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["delete_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_cluster,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["delete_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -1964,6 +1882,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1978,6 +1897,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListOperationsResponse:
         r"""Lists all operations in a project in the specified
         zone or all zones.
@@ -2039,6 +1959,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ListOperationsResponse:
@@ -2047,55 +1970,45 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListOperationsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
+        builder = request_builder.BUILDERS["list_operations"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_operations,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_operations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "list_operations"
+        ):
+            response = await request_coalescer.call_async(
+                "list_operations",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2110,6 +2023,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Gets the specified operation.
 
@@ -2178,6 +2092,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -2188,57 +2105,45 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetOperationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if operation_id is not None:
-            request.operation_id = operation_id
+        builder = request_builder.BUILDERS["get_operation"]
+        request = builder.build(request, project_id, zone, operation_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_operation,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "get_operation"
+        ):
+            response = await request_coalescer.call_async(
+                "get_operation",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2253,6 +2158,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""Cancels the specified operation.
 
@@ -2318,41 +2224,22 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CancelOperationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if operation_id is not None:
-            request.operation_id = operation_id
+        builder = request_builder.BUILDERS["cancel_operation"]
+        request = builder.build(request, project_id, zone, operation_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.cancel_operation,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["cancel_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         await rpc(
@@ -2360,6 +2247,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     async def get_server_config(
@@ -2371,6 +2259,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ServerConfig:
         r"""Returns configuration info about the Google
         Kubernetes Engine service.
@@ -2431,6 +2320,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ServerConfig:
@@ -2439,55 +2331,43 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetServerConfigRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
+        builder = request_builder.BUILDERS["get_server_config"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_server_config,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_server_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or serve it from the response cache.
+        response_cache = self._client._response_cache
+        if response_cache is not None and response_cache.caches("get_server_config"):
+            response = await response_cache.get_or_load_async(
+                "get_server_config",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2499,6 +2379,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.GetJSONWebKeysResponse:
         r"""Gets the public component of the cluster signing keys
         in JSON Web Key format.
@@ -2542,6 +2423,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.GetJSONWebKeysResponse:
@@ -2551,29 +2435,43 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.GetJSONWebKeysRequest(request)
+        builder = request_builder.BUILDERS["get_json_web_keys"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_json_web_keys,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_json_web_keys"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or serve it from the response cache.
+        response_cache = self._client._response_cache
+        if response_cache is not None and response_cache.caches("get_json_web_keys"):
+            response = await response_cache.get_or_load_async(
+                "get_json_web_keys",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2588,6 +2486,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListNodePoolsResponse:
         r"""Lists the node pools for a cluster.
 
@@ -2656,6 +2555,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ListNodePoolsResponse:
@@ -2664,57 +2566,45 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListNodePoolsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["list_node_pools"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_node_pools,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_node_pools"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "list_node_pools"
+        ):
+            response = await request_coalescer.call_async(
+                "list_node_pools",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2730,6 +2620,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.NodePool:
         r"""Retrieves the requested node pool.
 
@@ -2808,6 +2699,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.NodePool:
@@ -2857,59 +2751,45 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.GetNodePoolRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool_id is not None:
-            request.node_pool_id = node_pool_id
+        builder = request_builder.BUILDERS["get_node_pool"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_node_pool,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["get_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = await rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
+
+        # Send the request, or join an identical one in flight.
+        request_coalescer = self._client._request_coalescer
+        if request_coalescer is not None and request_coalescer.coalesces(
+            "get_node_pool"
+        ):
+            response = await request_coalescer.call_async(
+                "get_node_pool",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = await rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2925,6 +2805,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a node pool for a cluster.
 
@@ -2998,6 +2879,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3008,41 +2892,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CreateNodePoolRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool is not None:
-            request.node_pool = node_pool
+        builder = request_builder.BUILDERS["create_node_pool"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_node_pool,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["create_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3050,6 +2910,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3066,6 +2927,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes a node pool from a cluster.
 
@@ -3144,6 +3006,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3154,51 +3019,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.DeleteNodePoolRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool_id is not None:
-            request.node_pool_id = node_pool_id
+        builder = request_builder.BUILDERS["delete_node_pool"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_node_pool,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["delete_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3206,6 +3037,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3220,6 +3052,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""CompleteNodePoolUpgrade will signal an on-going node
         pool upgrade to complete.
@@ -3256,23 +3089,22 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.CompleteNodePoolUpgradeRequest(request)
+        builder = request_builder.BUILDERS["complete_node_pool_upgrade"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.complete_node_pool_upgrade,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["complete_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         await rpc(
@@ -3280,6 +3112,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     async def rollback_node_pool_upgrade(
@@ -3295,6 +3128,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Rolls back a previously Aborted or Failed NodePool
         upgrade. This makes no changes if the last upgrade
@@ -3379,6 +3213,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3389,41 +3226,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.RollbackNodePoolUpgradeRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool_id is not None:
-            request.node_pool_id = node_pool_id
+        builder = request_builder.BUILDERS["rollback_node_pool_upgrade"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.rollback_node_pool_upgrade,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["rollback_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3431,6 +3244,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3450,6 +3264,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the NodeManagement options for a node pool.
 
@@ -3537,6 +3352,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3547,45 +3365,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, node_pool_id, management]
+        builder = request_builder.BUILDERS["set_node_pool_management"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, management
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetNodePoolManagementRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if node_pool_id is not None:
-            request.node_pool_id = node_pool_id
-        if management is not None:
-            request.management = management
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_node_pool_management,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_node_pool_management"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3593,6 +3385,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3610,6 +3403,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets labels on a cluster.
 
@@ -3702,6 +3496,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3712,46 +3509,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, resource_labels, label_fingerprint]
+        builder = request_builder.BUILDERS["set_labels"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, resource_labels, label_fingerprint
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetLabelsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if label_fingerprint is not None:
-            request.label_fingerprint = label_fingerprint
-
-        if resource_labels:
-            request.resource_labels.update(resource_labels)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_labels,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_labels"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3759,6 +3529,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3775,6 +3546,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables the ABAC authorization mechanism
         on a cluster.
@@ -3854,6 +3626,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3864,41 +3639,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, enabled])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetLegacyAbacRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if enabled is not None:
-            request.enabled = enabled
+        builder = request_builder.BUILDERS["set_legacy_abac"]
+        request = builder.build(request, project_id, zone, cluster_id, enabled)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_legacy_abac,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_legacy_abac"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -3906,6 +3657,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3921,6 +3673,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Starts master IP rotation.
 
@@ -3991,6 +3744,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4001,39 +3757,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.StartIPRotationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["start_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.start_ip_rotation,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["start_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4041,6 +3775,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4058,6 +3793,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Completes master IP rotation.
 
@@ -4126,6 +3862,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4136,39 +3875,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.CompleteIPRotationRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["complete_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.complete_ip_rotation,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["complete_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4176,6 +3893,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4188,6 +3906,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""SetNodePoolSizeRequest sets the size of a node pool. The new
         size will be used for all replicas, including future replicas
@@ -4233,6 +3952,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4243,21 +3965,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        request = cluster_service.SetNodePoolSizeRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_size"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_node_pool_size,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_node_pool_size"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4265,6 +3983,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4281,6 +4000,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables Network Policy for a cluster.
 
@@ -4357,6 +4077,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4367,41 +4090,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, network_policy])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetNetworkPolicyRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if network_policy is not None:
-            request.network_policy = network_policy
+        builder = request_builder.BUILDERS["set_network_policy"]
+        request = builder.build(request, project_id, zone, cluster_id, network_policy)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_network_policy,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_network_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4409,6 +4108,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4427,6 +4127,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the maintenance policy for a cluster.
 
@@ -4498,6 +4199,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4508,41 +4212,19 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, maintenance_policy])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.SetMaintenancePolicyRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if project_id is not None:
-            request.project_id = project_id
-        if zone is not None:
-            request.zone = zone
-        if cluster_id is not None:
-            request.cluster_id = cluster_id
-        if maintenance_policy is not None:
-            request.maintenance_policy = maintenance_policy
+        builder = request_builder.BUILDERS["set_maintenance_policy"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, maintenance_policy
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_maintenance_policy,
-            default_timeout=45.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["set_maintenance_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4550,6 +4232,7 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4565,6 +4248,8 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        prefetch: int = 0,
     ) -> pagers.ListUsableSubnetworksAsyncPager:
         r"""Lists subnetworks that can be used for creating
         clusters in a project.
@@ -4614,6 +4299,13 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            prefetch (int): The maximum number of pages to request in
+                the background ahead of the caller while iterating the
+                returned pager. ``0`` (the default) fetches each page
+                only once the previous one has been consumed.
 
         Returns:
             google.cloud.container_v1beta1.services.cluster_manager.pagers.ListUsableSubnetworksAsyncPager:
@@ -4627,45 +4319,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListUsableSubnetworksRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        builder = request_builder.BUILDERS["list_usable_subnetworks"]
+        request = builder.build(request, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_usable_subnetworks,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_usable_subnetworks"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4673,15 +4337,17 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListUsableSubnetworksAsyncPager(
-            method=rpc,
+            method=functools.partial(rpc, compression=call_compression),
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -4695,6 +4361,7 @@ class ClusterManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListLocationsResponse:
         r"""Fetches locations that offer Google Kubernetes
         Engine.
@@ -4741,6 +4408,9 @@ class ClusterManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ListLocationsResponse:
@@ -4750,45 +4420,17 @@ class ClusterManagerAsyncClient:
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        request = cluster_service.ListLocationsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        builder = request_builder.BUILDERS["list_locations"]
+        request = builder.build(request, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_locations,
-            default_retry=retries.Retry(
-                initial=0.1,
-                maximum=60.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.DeadlineExceeded,
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=20.0,
-            ),
-            default_timeout=20.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._dispatch["list_locations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._client._call_compression(compression, request)
 
         # Send the request.
         response = await rpc(
@@ -4796,11 +4438,66 @@ class ClusterManagerAsyncClient:
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
         return response
 
+    async def batch_get_node_pools(
+        self,
+        names: Iterable[str],
+        *,
+        list_ratio: float = node_pools.DEFAULT_LIST_RATIO,
+        pool_counts: Optional[MutableMapping[str, int]] = None,
+        max_concurrency: int = fleet.DEFAULT_MAX_WORKERS,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Dict[str, node_pools.NodePoolResult]:
+        r"""Gets many node pools, across any number of clusters.
+
+        The names are grouped by cluster. Each cluster is read with one
+        ``list_node_pools`` call if the requested pools make up at least
+        ``list_ratio`` of its pools, and with a ``get_node_pool`` call
+        per requested pool otherwise. See :mod:`~.node_pools`.
+
+        Args:
+            names (Iterable[str]):
+                The node pool names, in the format
+                ``projects/*/locations/*/clusters/*/nodePools/*``.
+            list_ratio (float):
+                The share of a cluster's pools from which the cluster is
+                listed.
+            pool_counts (Optional[MutableMapping[str, int]]):
+                The number of pools of each cluster, by cluster name,
+                updated from every listing. A cluster whose count is
+                unknown is listed, unless a single pool is requested.
+            max_concurrency (int):
+                The maximum number of calls in flight.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each call.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Dict[str, google.cloud.container_v1beta1.services.cluster_manager.node_pools.NodePoolResult]:
+                A result per distinct name, in the order of ``names``,
+                holding the node pool or the error that prevented
+                reading it.
+        """
+        return await node_pools.get_node_pools(
+            self,
+            names,
+            list_ratio=list_ratio,
+            pool_counts=pool_counts,
+            max_concurrency=max_concurrency,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
     async def __aenter__(self):
         return self
 
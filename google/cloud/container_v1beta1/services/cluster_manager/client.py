@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import copy
+import functools
 import os
 import re
 from typing import (
@@ -39,6 +41,7 @@ from google.auth.exceptions import MutualTLSChannelError  # type: ignore
 from google.auth.transport import mtls  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
+import grpc  # type: ignore
 
 from google.cloud.container_v1beta1 import gapic_version as package_version
 
@@ -49,12 +52,24 @@ except AttributeError:  # pragma: NO COVER
 
 from google.rpc import status_pb2  # type: ignore
 
-from google.cloud.container_v1beta1.services.cluster_manager import pagers
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    cache,
+    pagers,
+    projection,
+    request_builder,
+)
 from google.cloud.container_v1beta1.types import cluster_service
 
-from .transports.base import DEFAULT_CLIENT_INFO, ClusterManagerTransport
+from .transports.base import (
+    DEFAULT_CLIENT_INFO,
+    DEFAULT_WARM_UP_TIMEOUT,
+    ClusterManagerTransport,
+)
+from .transports.compression import Compression, check_compression
+from .transports.compression import algorithm as compression_algorithm
 from .transports.grpc import ClusterManagerGrpcTransport
 from .transports.grpc_asyncio import ClusterManagerGrpcAsyncIOTransport
+from .transports.registry import ChannelRegistry
 
 
 class ClusterManagerClientMeta(type):
@@ -178,6 +193,70 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         """
         return self._transport
 
+    def with_response_format(self, response_format: str) -> "ClusterManagerClient":
+        """Returns a client whose calls return responses in ``response_format``.
+
+        The returned client shares this client's channel, and asking for
+        the same format again is cheap, so it can be used per call:
+
+        .. code-block:: python
+
+            raw_client = client.with_response_format("protobuf")
+            response = raw_client.list_clusters(parent=parent)
+            # response is a cluster_service_pb2.ListClustersResponse
+
+        Use :func:`~.transports.raw.wrap` to turn a raw response into a
+        proto-plus message later. The response cache and request coalescer
+        of this client are not used by clients with a different format, and
+        paged methods do not support ``"bytes"``.
+
+        Args:
+            response_format (str): ``"proto-plus"``, ``"protobuf"`` for the
+                underlying protobuf messages, or ``"bytes"`` for the
+                serialized responses.
+
+        Returns:
+            ClusterManagerClient: This client if the transport already
+                returns ``response_format``, otherwise a new client.
+
+        Raises:
+            ValueError: If ``response_format`` is unknown.
+        """
+        transport = self._transport.with_response_format(response_format)
+        if transport is self._transport:
+            return self
+        client = copy.copy(self)
+        client._transport = transport
+        client._response_cache = None
+        client._request_coalescer = None
+        return client
+
+    def warm_up(self, timeout: Optional[float] = DEFAULT_WARM_UP_TIMEOUT) -> None:
+        """Connects the client's channel and refreshes its credentials.
+
+        Call it after creating the client, or pass ``prewarm=True``, so
+        that the first call does not wait for the connection and token.
+
+        Args:
+            timeout (Optional[float]): The longest to wait, in seconds.
+                Waits until the channel is ready if None.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel is
+                not ready within ``timeout``.
+        """
+        self._transport.warm_up(timeout)
+
+    def _call_compression(self, compression, request) -> Optional[grpc.Compression]:
+        """Returns the algorithm that compresses the request of a call.
+
+        If neither the call nor the client set a compression, returns
+        None to leave the choice to the transport.
+        """
+        if compression is None:
+            compression = self._compression
+        return compression_algorithm(compression, request)
+
     @staticmethod
     def topic_path(
         project: str,
@@ -346,6 +425,11 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         transport: Optional[Union[str, ClusterManagerTransport]] = None,
         client_options: Optional[Union[client_options_lib.ClientOptions, dict]] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[cache.ResponseCache] = None,
+        request_coalescer: Optional[cache.RequestCoalescer] = None,
+        compression: Optional[Compression] = None,
+        prewarm: bool = False,
+        channel_registry: Optional[ChannelRegistry] = None,
     ) -> None:
         """Instantiates the cluster manager client.
 
@@ -379,11 +463,41 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            response_cache (Optional[google.cloud.container_v1beta1.services.cluster_manager.cache.ResponseCache]):
+                An optional cache for the responses of slowly changing
+                methods such as ``get_server_config`` and
+                ``get_json_web_keys``. If ``None``, every call is sent
+                to the server.
+            request_coalescer (Optional[google.cloud.container_v1beta1.services.cluster_manager.cache.RequestCoalescer]):
+                Shares one in-flight call between identical concurrent
+                reads such as ``get_cluster`` and ``get_node_pool``. If
+                ``None``, every call sends its own request.
+            compression (Optional[Union[str, grpc.Compression]]): How the
+                requests of calls made without a ``compression`` of their
+                own are compressed: ``"none"``, ``"gzip"``, ``"deflate"``,
+                or ``"auto"`` to compress large requests only. If ``None``,
+                the transport's setting is used. See
+                :mod:`~.transports.compression`.
+            prewarm (bool): Whether to connect the channel and refresh the
+                credentials before returning, so that the first call does
+                not wait for them. See :meth:`warm_up`.
+            channel_registry (Optional[google.cloud.container_v1beta1.services.cluster_manager.transports.registry.ChannelRegistry]):
+                Shares the gRPC channel with the other clients of the
+                registry that have the same endpoint, credentials and
+                options, such as those of
+                :func:`~.transports.registry.default_registry`. Closing the
+                client releases the channel. It won't take effect if a
+                ``transport`` instance is provided.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
                 creation failed for any reason.
         """
+        self._response_cache = response_cache
+        self._request_coalescer = request_coalescer
+        check_compression(compression)
+        self._compression = compression
+
         if isinstance(client_options, dict):
             client_options = client_options_lib.from_dict(client_options)
         if client_options is None:
@@ -415,6 +529,11 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if channel_registry is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its channel "
+                    "registry directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -427,6 +546,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 )
 
             Transport = type(self).get_transport_class(transport)
+            transport_kwargs = {}
+            if channel_registry is not None:
+                transport_kwargs["channel_registry"] = channel_registry
             self._transport = Transport(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
@@ -437,8 +559,12 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
                 client_info=client_info,
                 always_use_jwt_access=True,
                 api_audience=client_options.api_audience,
+                **transport_kwargs,
             )
 
+        if prewarm:
+            self.warm_up()
+
     def list_clusters(
         self,
         request: Optional[Union[cluster_service.ListClustersRequest, dict]] = None,
@@ -448,6 +574,8 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.ListClustersResponse:
         r"""Lists all clusters owned by a project in either the
         specified zone or all zones.
@@ -508,6 +636,13 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                each cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. ``missing_zones`` is always
+                returned. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1beta1.types.ListClustersResponse:
@@ -516,45 +651,50 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListClustersRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListClustersRequest):
-            request = cluster_service.ListClustersRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
+        builder = request_builder.BUILDERS["list_clusters"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_clusters]
+        rpc = self._transport._dispatch["list_clusters"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
+        if fields is not None:
+            metadata += (
+                projection.field_mask_metadata(
+                    fields, prefix="clusters", extra=("missing_zones",)
+                ),
+            )
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "list_clusters"
+        ):
+            response = self._request_coalescer.call(
+                "list_clusters",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -569,6 +709,8 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> cluster_service.Cluster:
         r"""Gets the details for a specific cluster.
 
@@ -638,53 +780,58 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            fields (Optional[Sequence[str]]): Return only these fields of
+                the cluster, as dotted paths such as ``"status"`` or
+                ``"node_pools.name"``. See :mod:`~.projection`.
 
         Returns:
             google.cloud.container_v1beta1.types.Cluster:
                 A Google Kubernetes Engine cluster.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetClusterRequest):
-            request = cluster_service.GetClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["get_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_cluster]
+        rpc = self._transport._dispatch["get_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
-
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
+        if fields is not None:
+            metadata += (projection.field_mask_metadata(fields),)
+
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "get_cluster"
+        ):
+            response = self._request_coalescer.call(
+                "get_cluster",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -699,6 +846,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a cluster, consisting of the specified number and type
         of Google Compute Engine instances.
@@ -777,6 +925,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -787,39 +938,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CreateClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CreateClusterRequest):
-            request = cluster_service.CreateClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster is not None:
-                request.cluster = cluster
+        builder = request_builder.BUILDERS["create_cluster"]
+        request = builder.build(request, project_id, zone, cluster)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_cluster]
+        rpc = self._transport._dispatch["create_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -827,6 +956,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -843,6 +973,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the settings for a specific cluster.
 
@@ -919,6 +1050,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -929,41 +1063,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, update])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.UpdateClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.UpdateClusterRequest):
-            request = cluster_service.UpdateClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if update is not None:
-                request.update = update
+        builder = request_builder.BUILDERS["update_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id, update)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_cluster]
+        rpc = self._transport._dispatch["update_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -971,6 +1081,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -983,6 +1094,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the version and/or image type of a specific
         node pool.
@@ -1027,6 +1139,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1037,22 +1152,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.UpdateNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.UpdateNodePoolRequest):
-            request = cluster_service.UpdateNodePoolRequest(request)
+        builder = request_builder.BUILDERS["update_node_pool"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_node_pool]
+        rpc = self._transport._dispatch["update_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1060,6 +1170,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1074,6 +1185,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the autoscaling settings of a specific node
         pool.
@@ -1116,6 +1228,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1126,24 +1241,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNodePoolAutoscalingRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNodePoolAutoscalingRequest):
-            request = cluster_service.SetNodePoolAutoscalingRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_autoscaling"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.set_node_pool_autoscaling
-        ]
+        rpc = self._transport._dispatch["set_node_pool_autoscaling"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1151,6 +1259,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1167,6 +1276,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the logging service for a specific cluster.
 
@@ -1256,6 +1366,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1266,41 +1379,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, logging_service])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLoggingServiceRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLoggingServiceRequest):
-            request = cluster_service.SetLoggingServiceRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if logging_service is not None:
-                request.logging_service = logging_service
+        builder = request_builder.BUILDERS["set_logging_service"]
+        request = builder.build(request, project_id, zone, cluster_id, logging_service)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_logging_service]
+        rpc = self._transport._dispatch["set_logging_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1308,6 +1397,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1326,6 +1416,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the monitoring service for a specific cluster.
 
@@ -1417,6 +1508,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1427,41 +1521,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, monitoring_service])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetMonitoringServiceRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetMonitoringServiceRequest):
-            request = cluster_service.SetMonitoringServiceRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if monitoring_service is not None:
-                request.monitoring_service = monitoring_service
+        builder = request_builder.BUILDERS["set_monitoring_service"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, monitoring_service
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_monitoring_service]
+        rpc = self._transport._dispatch["set_monitoring_service"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1469,6 +1541,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1485,6 +1558,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the addons for a specific cluster.
 
@@ -1562,6 +1636,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1572,41 +1649,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, addons_config])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetAddonsConfigRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetAddonsConfigRequest):
-            request = cluster_service.SetAddonsConfigRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if addons_config is not None:
-                request.addons_config = addons_config
+        builder = request_builder.BUILDERS["set_addons_config"]
+        request = builder.build(request, project_id, zone, cluster_id, addons_config)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_addons_config]
+        rpc = self._transport._dispatch["set_addons_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1614,6 +1667,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1630,6 +1684,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the locations for a specific cluster. Deprecated. Use
         `projects.locations.clusters.update <https://cloud.google.com/kubernetes-engine/docs/reference/rest/v1beta1/projects.locations.clusters/update>`__
@@ -1716,6 +1771,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1730,41 +1788,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         )
 
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, locations])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLocationsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLocationsRequest):
-            request = cluster_service.SetLocationsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if locations is not None:
-                request.locations = locations
+        builder = request_builder.BUILDERS["set_locations"]
+        request = builder.build(request, project_id, zone, cluster_id, locations)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_locations]
+        rpc = self._transport._dispatch["set_locations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1772,6 +1806,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1788,6 +1823,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Updates the master for a specific cluster.
 
@@ -1877,6 +1913,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1887,41 +1926,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, master_version])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.UpdateMasterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.UpdateMasterRequest):
-            request = cluster_service.UpdateMasterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if master_version is not None:
-                request.master_version = master_version
+        builder = request_builder.BUILDERS["update_master"]
+        request = builder.build(request, project_id, zone, cluster_id, master_version)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_master]
+        rpc = self._transport._dispatch["update_master"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -1929,6 +1944,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -1941,6 +1957,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets master auth materials. Currently supports
         changing the admin password or a specific cluster,
@@ -1985,6 +2002,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -1995,22 +2015,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetMasterAuthRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetMasterAuthRequest):
-            request = cluster_service.SetMasterAuthRequest(request)
+        builder = request_builder.BUILDERS["set_master_auth"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_master_auth]
+        rpc = self._transport._dispatch["set_master_auth"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -2018,6 +2033,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -2033,6 +2049,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes the cluster, including the Kubernetes
         endpoint and all worker nodes.
@@ -2111,6 +2128,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -2121,39 +2141,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.DeleteClusterRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.DeleteClusterRequest):
-            request = cluster_service.DeleteClusterRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["delete_cluster"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_cluster]
+        rpc = self._transport._dispatch["delete_cluster"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -2161,6 +2159,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -2175,6 +2174,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListOperationsResponse:
         r"""Lists all operations in a project in the specified
         zone or all zones.
@@ -2236,6 +2236,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ListOperationsResponse:
@@ -2244,45 +2247,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListOperationsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListOperationsRequest):
-            request = cluster_service.ListOperationsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
+        builder = request_builder.BUILDERS["list_operations"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_operations]
+        rpc = self._transport._dispatch["list_operations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "list_operations"
+        ):
+            response = self._request_coalescer.call(
+                "list_operations",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2297,6 +2299,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Gets the specified operation.
 
@@ -2365,6 +2368,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -2375,47 +2381,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetOperationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetOperationRequest):
-            request = cluster_service.GetOperationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if operation_id is not None:
-                request.operation_id = operation_id
+        builder = request_builder.BUILDERS["get_operation"]
+        request = builder.build(request, project_id, zone, operation_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_operation]
+        rpc = self._transport._dispatch["get_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "get_operation"
+        ):
+            response = self._request_coalescer.call(
+                "get_operation",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2430,6 +2433,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""Cancels the specified operation.
 
@@ -2495,41 +2499,22 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, operation_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CancelOperationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CancelOperationRequest):
-            request = cluster_service.CancelOperationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if operation_id is not None:
-                request.operation_id = operation_id
+        builder = request_builder.BUILDERS["cancel_operation"]
+        request = builder.build(request, project_id, zone, operation_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.cancel_operation]
+        rpc = self._transport._dispatch["cancel_operation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         rpc(
@@ -2537,6 +2522,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     def get_server_config(
@@ -2548,6 +2534,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ServerConfig:
         r"""Returns configuration info about the Google
         Kubernetes Engine service.
@@ -2608,6 +2595,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ServerConfig:
@@ -2616,45 +2606,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetServerConfigRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetServerConfigRequest):
-            request = cluster_service.GetServerConfigRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
+        builder = request_builder.BUILDERS["get_server_config"]
+        request = builder.build(request, project_id, zone)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_server_config]
+        rpc = self._transport._dispatch["get_server_config"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or serve it from the response cache.
+        if self._response_cache is not None and self._response_cache.caches(
+            "get_server_config"
+        ):
+            response = self._response_cache.get_or_load(
+                "get_server_config",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2666,6 +2655,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.GetJSONWebKeysResponse:
         r"""Gets the public component of the cluster signing keys
         in JSON Web Key format.
@@ -2709,6 +2699,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.GetJSONWebKeysResponse:
@@ -2718,30 +2711,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetJSONWebKeysRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetJSONWebKeysRequest):
-            request = cluster_service.GetJSONWebKeysRequest(request)
+        builder = request_builder.BUILDERS["get_json_web_keys"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_json_web_keys]
+        rpc = self._transport._dispatch["get_json_web_keys"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or serve it from the response cache.
+        if self._response_cache is not None and self._response_cache.caches(
+            "get_json_web_keys"
+        ):
+            response = self._response_cache.get_or_load(
+                "get_json_web_keys",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2756,6 +2763,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListNodePoolsResponse:
         r"""Lists the node pools for a cluster.
 
@@ -2824,6 +2832,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ListNodePoolsResponse:
@@ -2832,47 +2843,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListNodePoolsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListNodePoolsRequest):
-            request = cluster_service.ListNodePoolsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["list_node_pools"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_node_pools]
+        rpc = self._transport._dispatch["list_node_pools"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "list_node_pools"
+        ):
+            response = self._request_coalescer.call(
+                "list_node_pools",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -2888,6 +2896,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.NodePool:
         r"""Retrieves the requested node pool.
 
@@ -2966,6 +2975,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.NodePool:
@@ -3015,49 +3027,44 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.GetNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.GetNodePoolRequest):
-            request = cluster_service.GetNodePoolRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool_id is not None:
-                request.node_pool_id = node_pool_id
+        builder = request_builder.BUILDERS["get_node_pool"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_node_pool]
+        rpc = self._transport._dispatch["get_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
-        # Send the request.
-        response = rpc(
-            request,
-            retry=retry,
-            timeout=timeout,
-            metadata=metadata,
-        )
+        # Send the request, or join an identical one in flight.
+        if self._request_coalescer is not None and self._request_coalescer.coalesces(
+            "get_node_pool"
+        ):
+            response = self._request_coalescer.call(
+                "get_node_pool",
+                request,
+                metadata,
+                functools.partial(
+                    rpc,
+                    request,
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=call_compression,
+                ),
+                timeout=timeout,
+            )
+        else:
+            response = rpc(
+                request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                compression=call_compression,
+            )
 
         # Done; return the response.
         return response
@@ -3073,6 +3080,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Creates a node pool for a cluster.
 
@@ -3146,6 +3154,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3156,41 +3167,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CreateNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CreateNodePoolRequest):
-            request = cluster_service.CreateNodePoolRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool is not None:
-                request.node_pool = node_pool
+        builder = request_builder.BUILDERS["create_node_pool"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_node_pool]
+        rpc = self._transport._dispatch["create_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3198,6 +3185,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3214,6 +3202,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Deletes a node pool from a cluster.
 
@@ -3292,6 +3281,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3302,41 +3294,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.DeleteNodePoolRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.DeleteNodePoolRequest):
-            request = cluster_service.DeleteNodePoolRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool_id is not None:
-                request.node_pool_id = node_pool_id
+        builder = request_builder.BUILDERS["delete_node_pool"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_node_pool]
+        rpc = self._transport._dispatch["delete_node_pool"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3344,6 +3312,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3358,6 +3327,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> None:
         r"""CompleteNodePoolUpgrade will signal an on-going node
         pool upgrade to complete.
@@ -3394,26 +3364,22 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CompleteNodePoolUpgradeRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CompleteNodePoolUpgradeRequest):
-            request = cluster_service.CompleteNodePoolUpgradeRequest(request)
+        builder = request_builder.BUILDERS["complete_node_pool_upgrade"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.complete_node_pool_upgrade
-        ]
+        rpc = self._transport._dispatch["complete_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         rpc(
@@ -3421,6 +3387,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
     def rollback_node_pool_upgrade(
@@ -3436,6 +3403,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Rolls back a previously Aborted or Failed NodePool
         upgrade. This makes no changes if the last upgrade
@@ -3520,6 +3488,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3530,43 +3501,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, node_pool_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.RollbackNodePoolUpgradeRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.RollbackNodePoolUpgradeRequest):
-            request = cluster_service.RollbackNodePoolUpgradeRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool_id is not None:
-                request.node_pool_id = node_pool_id
+        builder = request_builder.BUILDERS["rollback_node_pool_upgrade"]
+        request = builder.build(request, project_id, zone, cluster_id, node_pool_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.rollback_node_pool_upgrade
-        ]
+        rpc = self._transport._dispatch["rollback_node_pool_upgrade"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3574,6 +3519,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3593,6 +3539,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the NodeManagement options for a node pool.
 
@@ -3680,6 +3627,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3690,45 +3640,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, node_pool_id, management]
+        builder = request_builder.BUILDERS["set_node_pool_management"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, node_pool_id, management
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNodePoolManagementRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNodePoolManagementRequest):
-            request = cluster_service.SetNodePoolManagementRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if node_pool_id is not None:
-                request.node_pool_id = node_pool_id
-            if management is not None:
-                request.management = management
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_node_pool_management]
+        rpc = self._transport._dispatch["set_node_pool_management"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3736,6 +3660,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3753,6 +3678,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets labels on a cluster.
 
@@ -3845,6 +3771,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -3855,45 +3784,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project_id, zone, cluster_id, resource_labels, label_fingerprint]
+        builder = request_builder.BUILDERS["set_labels"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, resource_labels, label_fingerprint
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLabelsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLabelsRequest):
-            request = cluster_service.SetLabelsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if resource_labels is not None:
-                request.resource_labels = resource_labels
-            if label_fingerprint is not None:
-                request.label_fingerprint = label_fingerprint
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_labels]
+        rpc = self._transport._dispatch["set_labels"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -3901,6 +3804,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -3917,6 +3821,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables the ABAC authorization mechanism
         on a cluster.
@@ -3996,6 +3901,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4006,41 +3914,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, enabled])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetLegacyAbacRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetLegacyAbacRequest):
-            request = cluster_service.SetLegacyAbacRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if enabled is not None:
-                request.enabled = enabled
+        builder = request_builder.BUILDERS["set_legacy_abac"]
+        request = builder.build(request, project_id, zone, cluster_id, enabled)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_legacy_abac]
+        rpc = self._transport._dispatch["set_legacy_abac"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4048,6 +3932,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4063,6 +3948,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Starts master IP rotation.
 
@@ -4133,6 +4019,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4143,39 +4032,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.StartIPRotationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.StartIPRotationRequest):
-            request = cluster_service.StartIPRotationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["start_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.start_ip_rotation]
+        rpc = self._transport._dispatch["start_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4183,6 +4050,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4200,6 +4068,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Completes master IP rotation.
 
@@ -4268,6 +4137,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4278,39 +4150,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.CompleteIPRotationRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.CompleteIPRotationRequest):
-            request = cluster_service.CompleteIPRotationRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
+        builder = request_builder.BUILDERS["complete_ip_rotation"]
+        request = builder.build(request, project_id, zone, cluster_id)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.complete_ip_rotation]
+        rpc = self._transport._dispatch["complete_ip_rotation"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4318,6 +4168,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4330,6 +4181,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""SetNodePoolSizeRequest sets the size of a node pool. The new
         size will be used for all replicas, including future replicas
@@ -4375,6 +4227,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4385,22 +4240,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNodePoolSizeRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNodePoolSizeRequest):
-            request = cluster_service.SetNodePoolSizeRequest(request)
+        builder = request_builder.BUILDERS["set_node_pool_size"]
+        request = builder.build(request)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_node_pool_size]
+        rpc = self._transport._dispatch["set_node_pool_size"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4408,6 +4258,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4424,6 +4275,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Enables or disables Network Policy for a cluster.
 
@@ -4500,6 +4352,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4510,41 +4365,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, network_policy])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetNetworkPolicyRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetNetworkPolicyRequest):
-            request = cluster_service.SetNetworkPolicyRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if network_policy is not None:
-                request.network_policy = network_policy
+        builder = request_builder.BUILDERS["set_network_policy"]
+        request = builder.build(request, project_id, zone, cluster_id, network_policy)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_network_policy]
+        rpc = self._transport._dispatch["set_network_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4552,6 +4383,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4570,6 +4402,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.Operation:
         r"""Sets the maintenance policy for a cluster.
 
@@ -4641,6 +4474,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.Operation:
@@ -4651,41 +4487,19 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project_id, zone, cluster_id, maintenance_policy])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.SetMaintenancePolicyRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.SetMaintenancePolicyRequest):
-            request = cluster_service.SetMaintenancePolicyRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project_id is not None:
-                request.project_id = project_id
-            if zone is not None:
-                request.zone = zone
-            if cluster_id is not None:
-                request.cluster_id = cluster_id
-            if maintenance_policy is not None:
-                request.maintenance_policy = maintenance_policy
+        builder = request_builder.BUILDERS["set_maintenance_policy"]
+        request = builder.build(
+            request, project_id, zone, cluster_id, maintenance_policy
+        )
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_maintenance_policy]
+        rpc = self._transport._dispatch["set_maintenance_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4693,6 +4507,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
@@ -4708,6 +4523,8 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
+        prefetch: int = 0,
     ) -> pagers.ListUsableSubnetworksPager:
         r"""Lists subnetworks that can be used for creating
         clusters in a project.
@@ -4757,6 +4574,13 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
+            prefetch (int): The maximum number of pages to request in
+                the background ahead of the caller while iterating the
+                returned pager. ``0`` (the default) fetches each page
+                only once the previous one has been consumed.
 
         Returns:
             google.cloud.container_v1beta1.services.cluster_manager.pagers.ListUsableSubnetworksPager:
@@ -4770,35 +4594,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListUsableSubnetworksRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListUsableSubnetworksRequest):
-            request = cluster_service.ListUsableSubnetworksRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+        builder = request_builder.BUILDERS["list_usable_subnetworks"]
+        request = builder.build(request, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_usable_subnetworks]
+        rpc = self._transport._dispatch["list_usable_subnetworks"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4806,15 +4612,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListUsableSubnetworksPager(
-            method=rpc,
+            method=functools.partial(rpc, compression=call_compression),
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -4828,6 +4636,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        compression: Optional[Compression] = None,
     ) -> cluster_service.ListLocationsResponse:
         r"""Fetches locations that offer Google Kubernetes
         Engine.
@@ -4874,6 +4683,9 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the request is compressed. If ``None``, the client's
+                setting is used.
 
         Returns:
             google.cloud.container_v1beta1.types.ListLocationsResponse:
@@ -4883,35 +4695,17 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
 
         """
         # Create or coerce a protobuf request object.
-        # Quick check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([parent])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a cluster_service.ListLocationsRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, cluster_service.ListLocationsRequest):
-            request = cluster_service.ListLocationsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+        builder = request_builder.BUILDERS["list_locations"]
+        request = builder.build(request, parent)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_locations]
+        rpc = self._transport._dispatch["list_locations"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
-        metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
-        )
+        metadata = tuple(metadata) + (builder.routing_metadata(request),)
+        call_compression = self._call_compression(compression, request)
 
         # Send the request.
         response = rpc(
@@ -4919,6 +4713,7 @@ class ClusterManagerClient(metaclass=ClusterManagerClientMeta):
             retry=retry,
             timeout=timeout,
             metadata=metadata,
+            compression=call_compression,
         )
 
         # Done; return the response.
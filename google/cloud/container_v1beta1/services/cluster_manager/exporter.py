@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Streaming inventory export.
+
+:func:`export_inventory` walks projects with a
+``ClusterManagerAsyncClient``, listing the clusters of each project, the
+node pools of each cluster and the usable subnetworks of each project,
+and hands one flattened row per resource to a writer as soon as it is
+read. Nothing is accumulated, so memory stays bounded by the number of
+calls in flight rather than by the size of the organization::
+
+    with open("inventory.ndjson", "w") as stream:
+        stats = await exporter.export_inventory(
+            client, ["project-a", "project-b"], exporter.NDJSONWriter(stream)
+        )
+
+Rows come in three kinds, ``"cluster"``, ``"node_pool"`` and
+``"subnetwork"``, whose columns are listed in :data:`COLUMNS`.
+:class:`NDJSONWriter` writes every kind to one stream, tagged with a
+``kind`` key. :class:`ParquetWriter` writes one Parquet file per kind and
+requires ``pyarrow``, installed with the ``parquet`` extra.
+"""
+import asyncio
+import json
+import os
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from google.api_core import gapic_v1
+
+from google.cloud.container_v1beta1.services.cluster_manager import fleet
+from google.cloud.container_v1beta1.types import cluster_service
+
+CLUSTER = "cluster"
+NODE_POOL = "node_pool"
+SUBNETWORK = "subnetwork"
+
+# The columns of each kind of row, with their Parquet types.
+COLUMNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    CLUSTER: (
+        ("project", "string"),
+        ("location", "string"),
+        ("name", "string"),
+        ("status", "string"),
+        ("current_master_version", "string"),
+        ("current_node_version", "string"),
+        ("current_node_count", "int64"),
+        ("node_pool_count", "int64"),
+        ("network", "string"),
+        ("subnetwork", "string"),
+        ("endpoint", "string"),
+        ("create_time", "string"),
+        ("autopilot", "bool"),
+        ("release_channel", "string"),
+        ("resource_labels", "map<string,string>"),
+        ("self_link", "string"),
+    ),
+    NODE_POOL: (
+        ("project", "string"),
+        ("location", "string"),
+        ("cluster", "string"),
+        ("name", "string"),
+        ("status", "string"),
+        ("version", "string"),
+        ("machine_type", "string"),
+        ("disk_size_gb", "int64"),
+        ("disk_type", "string"),
+        ("image_type", "string"),
+        ("spot", "bool"),
+        ("preemptible", "bool"),
+        ("initial_node_count", "int64"),
+        ("autoscaling_enabled", "bool"),
+        ("min_node_count", "int64"),
+        ("max_node_count", "int64"),
+        ("locations", "list<string>"),
+        ("self_link", "string"),
+    ),
+    SUBNETWORK: (
+        ("project", "string"),
+        ("subnetwork", "string"),
+        ("network", "string"),
+        ("ip_cidr_range", "string"),
+        ("secondary_ip_ranges", "list<string>"),
+        ("status_message", "string"),
+    ),
+}
+
+# The cluster fields the rows need. Node pools are listed separately, so
+# only their names are fetched with the clusters.
+CLUSTER_FIELDS = (
+    "name",
+    "location",
+    "status",
+    "current_master_version",
+    "current_node_version",
+    "current_node_count",
+    "network",
+    "subnetwork",
+    "endpoint",
+    "create_time",
+    "autopilot.enabled",
+    "release_channel.channel",
+    "resource_labels",
+    "self_link",
+    "node_pools.name",
+)
+
+
+def cluster_row(project: str, cluster: cluster_service.Cluster) -> Dict[str, Any]:
+    """Returns the row of a cluster."""
+    return {
+        "project": project,
+        "location": cluster.location,
+        "name": cluster.name,
+        "status": cluster.status.name,
+        "current_master_version": cluster.current_master_version,
+        "current_node_version": cluster.current_node_version,
+        "current_node_count": cluster.current_node_count,
+        "node_pool_count": len(cluster.node_pools),
+        "network": cluster.network,
+        "subnetwork": cluster.subnetwork,
+        "endpoint": cluster.endpoint,
+        "create_time": cluster.create_time,
+        "autopilot": cluster.autopilot.enabled,
+        "release_channel": cluster.release_channel.channel.name,
+        "resource_labels": dict(cluster.resource_labels),
+        "self_link": cluster.self_link,
+    }
+
+
+def node_pool_row(
+    project: str, cluster: cluster_service.Cluster, node_pool: cluster_service.NodePool
+) -> Dict[str, Any]:
+    """Returns the row of a node pool of ``cluster``."""
+    config = node_pool.config
+    autoscaling = node_pool.autoscaling
+    return {
+        "project": project,
+        "location": cluster.location,
+        "cluster": cluster.name,
+        "name": node_pool.name,
+        "status": node_pool.status.name,
+        "version": node_pool.version,
+        "machine_type": config.machine_type,
+        "disk_size_gb": config.disk_size_gb,
+        "disk_type": config.disk_type,
+        "image_type": config.image_type,
+        "spot": config.spot,
+        "preemptible": config.preemptible,
+        "initial_node_count": node_pool.initial_node_count,
+        "autoscaling_enabled": autoscaling.enabled,
+        "min_node_count": autoscaling.min_node_count,
+        "max_node_count": autoscaling.max_node_count,
+        "locations": list(node_pool.locations),
+        "self_link": node_pool.self_link,
+    }
+
+
+def subnetwork_row(
+    project: str, subnetwork: cluster_service.UsableSubnetwork
+) -> Dict[str, Any]:
+    """Returns the row of a usable subnetwork."""
+    return {
+        "project": project,
+        "subnetwork": subnetwork.subnetwork,
+        "network": subnetwork.network,
+        "ip_cidr_range": subnetwork.ip_cidr_range,
+        "secondary_ip_ranges": [
+            secondary.range_name for secondary in subnetwork.secondary_ip_ranges
+        ],
+        "status_message": subnetwork.status_message,
+    }
+
+
+class ExportStats:
+    """What :func:`export_inventory` exported.
+
+    Attributes:
+        rows (Dict[str, int]): The number of rows written, by kind.
+        errors (List[Tuple[str, Exception]]): The resources that could not
+            be listed, with the error raised. Their rows are missing.
+        missing_zones (List[Tuple[str, str]]): The ``(project, zone)``
+            pairs the server could not list clusters from.
+    """
+
+    def __init__(self):
+        self.rows: Dict[str, int] = {kind: 0 for kind in COLUMNS}
+        self.errors: List[Tuple[str, Exception]] = []
+        self.missing_zones: List[Tuple[str, str]] = []
+
+    def __repr__(self) -> str:
+        return "ExportStats(rows={!r}, errors={}, missing_zones={})".format(
+            self.rows, len(self.errors), len(self.missing_zones)
+        )
+
+
+async def export_inventory(
+    client,
+    projects: Iterable[str],
+    writer,
+    *,
+    node_pools: bool = True,
+    subnetworks: bool = True,
+    max_concurrency: int = fleet.DEFAULT_MAX_WORKERS,
+    subnetwork_page_size: int = 500,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> ExportStats:
+    """Writes a row for every cluster, node pool and subnetwork of ``projects``.
+
+    Projects are exported concurrently, and the node pools of the
+    clusters of a project are listed concurrently too, with at most
+    ``max_concurrency`` calls in flight overall. A resource that cannot
+    be listed is recorded in :attr:`ExportStats.errors` and the export
+    carries on.
+
+    Args:
+        client (ClusterManagerAsyncClient): The client to call.
+        projects (Iterable[str]): Project IDs or ``projects/*`` names.
+        writer (Union[NDJSONWriter, ParquetWriter]): Receives the rows
+            through ``writer.write(kind, row)``. It is not closed.
+        node_pools (bool): Whether to list the node pools of each cluster.
+        subnetworks (bool): Whether to list the usable subnetworks of
+            each project.
+        max_concurrency (int): The maximum number of calls in flight.
+        subnetwork_page_size (int): The page size used to list usable
+            subnetworks.
+        retry (google.api_core.retry.Retry): Designation of what errors,
+            if any, should be retried.
+        timeout (float): The timeout for each call.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Returns:
+        ExportStats: What was exported.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    stats = ExportStats()
+    calls = asyncio.Semaphore(max_concurrency)
+    options = {"retry": retry, "timeout": timeout, "metadata": metadata}
+
+    def write(kind, row):
+        writer.write(kind, row)
+        stats.rows[kind] += 1
+
+    async def export_node_pools(project, cluster):
+        parent = "projects/{}/locations/{}/clusters/{}".format(
+            project, cluster.location, cluster.name
+        )
+        try:
+            async with calls:
+                response = await client.list_node_pools(
+                    request={"parent": parent}, **options
+                )
+        except Exception as exc:
+            stats.errors.append((parent, exc))
+            return
+        for node_pool in response.node_pools:
+            write(NODE_POOL, node_pool_row(project, cluster, node_pool))
+
+    async def export_subnetworks(project):
+        parent = "projects/{}".format(project)
+        try:
+            async with calls:
+                pager = await client.list_usable_subnetworks(
+                    request={"parent": parent, "page_size": subnetwork_page_size},
+                    **options,
+                )
+                async for subnetwork in pager:
+                    write(SUBNETWORK, subnetwork_row(project, subnetwork))
+        except Exception as exc:
+            stats.errors.append((parent + "/aggregated/usableSubnetworks", exc))
+
+    async def export_project(parent):
+        project = fleet.project_of(parent)
+        async with calls:
+            response = await client.list_clusters(
+                request={"parent": parent + "/locations/-"},
+                fields=CLUSTER_FIELDS,
+                **options,
+            )
+        stats.missing_zones.extend((project, zone) for zone in response.missing_zones)
+        clusters = list(response.clusters)
+        del response
+        for cluster in clusters:
+            write(CLUSTER, cluster_row(project, cluster))
+        work = []
+        if node_pools:
+            work.extend(export_node_pools(project, cluster) for cluster in clusters)
+        if subnetworks:
+            work.append(export_subnetworks(project))
+        await asyncio.gather(*work)
+
+    parents = ["projects/{}".format(fleet.project_of(project)) for project in projects]
+    async for result in fleet.fan_out_async(
+        export_project, parents, max_concurrency=max_concurrency
+    ):
+        if result.error is not None:
+            stats.errors.append((result.parent, result.error))
+    return stats
+
+
+class NDJSONWriter:
+    """Writes rows as newline delimited JSON, one object per line.
+
+    Each object carries the kind of the row under ``kind``, followed by
+    the columns of that kind.
+
+    Args:
+        stream (TextIO): The stream to write to. It is flushed, not
+            closed, by :meth:`close`.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def write(self, kind: str, row: Dict[str, Any]) -> None:
+        line = {"kind": kind}
+        line.update(row)
+        self._stream.write(self._encoder.encode(line))
+        self._stream.write("\n")
+
+    def close(self) -> None:
+        self._stream.flush()
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ParquetWriter:
+    """Writes rows to one Parquet file per kind.
+
+    Rows are buffered and written as a row group every ``batch_size``
+    rows, so at most ``batch_size`` rows of each kind are held in memory.
+    The files are named after the kind, for example ``cluster.parquet``,
+    and are only created once a row of that kind is written.
+
+    Args:
+        directory (str): The directory to write the files to. It is
+            created if needed.
+        batch_size (int): The number of rows per row group.
+        compression (str): The Parquet compression codec.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+
+    def __init__(
+        self, directory: str, *, batch_size: int = 10000, compression: str = "snappy"
+    ):
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.parquet  # type: ignore
+        except ImportError as exc:  # pragma: NO COVER
+            raise ImportError(
+                "ParquetWriter requires pyarrow. Install it with "
+                "`pip install google-cloud-container[parquet]`."
+            ) from exc
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.directory = directory
+        self.batch_size = batch_size
+        self.compression = compression
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in COLUMNS}
+        self._writers: Dict[str, Any] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, kind: str) -> str:
+        """Returns the path of the file of ``kind`` rows."""
+        return os.path.join(self.directory, kind + ".parquet")
+
+    def _type(self, name: str):
+        pa = self._pa
+        return {
+            "string": pa.string(),
+            "int64": pa.int64(),
+            "bool": pa.bool_(),
+            "list<string>": pa.list_(pa.string()),
+            "map<string,string>": pa.map_(pa.string(), pa.string()),
+        }[name]
+
+    def schema(self, kind: str):
+        """Returns the Arrow schema of ``kind`` rows."""
+        return self._pa.schema(
+            [(column, self._type(type_name)) for column, type_name in COLUMNS[kind]]
+        )
+
+    def write(self, kind: str, row: Dict[str, Any]) -> None:
+        buffer = self._buffers[kind]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self._flush(kind)
+
+    def _flush(self, kind: str) -> None:
+        rows = self._buffers[kind]
+        if not rows:
+            return
+        schema = self.schema(kind)
+        columns = {}
+        for column, type_name in COLUMNS[kind]:
+            values = [row.get(column) for row in rows]
+            if type_name.startswith("map<"):
+                values = [
+                    None if value is None else sorted(value.items()) for value in values
+                ]
+            columns[column] = values
+        table = self._pa.Table.from_pydict(columns, schema=schema)
+        writer = self._writers.get(kind)
+        if writer is None:
+            writer = self._writers[kind] = self._pq.ParquetWriter(
+                self.path(kind), schema, compression=self.compression
+            )
+        writer.write_table(table)
+        self._buffers[kind] = []
+
+    def close(self) -> None:
+        """Writes the buffered rows and closes the files."""
+        for kind in COLUMNS:
+            self._flush(kind)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def __enter__(self) -> "ParquetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+__all__ = (
+    "CLUSTER",
+    "CLUSTER_FIELDS",
+    "COLUMNS",
+    "ExportStats",
+    "NDJSONWriter",
+    "NODE_POOL",
+    "ParquetWriter",
+    "SUBNETWORK",
+    "cluster_row",
+    "export_inventory",
+    "node_pool_row",
+    "subnetwork_row",
+)
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Bulk node-pool reads.
+
+:func:`get_node_pools` fetches many node pools, across any number of
+clusters, with a ``ClusterManagerAsyncClient``. The names are grouped by
+cluster, and each cluster is read either with one ``list_node_pools``
+call or with a ``get_node_pool`` call per requested pool, whichever
+reads less::
+
+    pool_counts = {}
+    results = await client.batch_get_node_pools(names, pool_counts=pool_counts)
+    for name, result in results.items():
+        if result.error is not None:
+            log.warning("%s: %s", name, result.error)
+            continue
+        reconcile(result.node_pool)
+
+A cluster is listed when the requested pools make up at least
+``list_ratio`` of its pools. The pool count of a cluster is read from
+``pool_counts``, which is updated from every listing so that it can be
+passed again to later calls; a cluster whose count is unknown is listed,
+unless a single pool of it is requested.
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Iterable, List, MutableMapping, NamedTuple, Optional
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+
+from google.cloud.container_v1beta1.services.cluster_manager import fleet, resize
+from google.cloud.container_v1beta1.types import cluster_service
+
+LIST = "list"
+GET = "get"
+
+DEFAULT_LIST_RATIO = 0.5
+"""The share of a cluster's pools from which the cluster is listed."""
+
+
+class NodePoolResult(NamedTuple):
+    """The outcome of reading one node pool.
+
+    Attributes:
+        name (str): The node pool name.
+        node_pool (Optional[google.cloud.container_v1beta1.types.NodePool]):
+            The node pool, or ``None`` if it could not be read.
+        error (Optional[Exception]): The error raised by the call that
+            read the node pool, or ``None`` if it succeeded.
+        method (str): The method that read it: :data:`LIST` or
+            :data:`GET`.
+    """
+
+    name: str
+    node_pool: Optional[cluster_service.NodePool]
+    error: Optional[Exception]
+    method: str
+
+
+def choose(
+    requested: int,
+    pool_count: Optional[int],
+    list_ratio: float = DEFAULT_LIST_RATIO,
+) -> str:
+    """Returns how to read ``requested`` pools of a cluster.
+
+    Args:
+        requested (int): The number of pools requested.
+        pool_count (Optional[int]): The number of pools of the cluster,
+            or None if unknown.
+        list_ratio (float): The share of the cluster's pools from which
+            the cluster is listed.
+
+    Returns:
+        str: :data:`LIST` or :data:`GET`.
+    """
+    if pool_count is None:
+        return GET if requested == 1 else LIST
+    return LIST if requested >= list_ratio * pool_count else GET
+
+
+def _group(names: Iterable[str]) -> Dict[str, List[str]]:
+    clusters: Dict[str, List[str]] = OrderedDict()
+    for name in OrderedDict.fromkeys(names):
+        clusters.setdefault(resize.cluster_of(name), []).append(name)
+    return clusters
+
+
+async def get_node_pools(
+    client,
+    names: Iterable[str],
+    *,
+    list_ratio: float = DEFAULT_LIST_RATIO,
+    pool_counts: Optional[MutableMapping[str, int]] = None,
+    max_concurrency: int = fleet.DEFAULT_MAX_WORKERS,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata=(),
+) -> Dict[str, NodePoolResult]:
+    """Reads many node pools concurrently.
+
+    Args:
+        client (ClusterManagerAsyncClient): The client to call.
+        names (Iterable[str]): The node pool names, in the format
+            ``projects/*/locations/*/clusters/*/nodePools/*``.
+        list_ratio (float): The share of a cluster's pools from which
+            the cluster is listed rather than read pool by pool. 0 always
+            lists the clusters.
+        pool_counts (Optional[MutableMapping[str, int]]): The number of
+            pools of each cluster, by cluster name. Updated with the
+            count of every cluster listed.
+        max_concurrency (int): The maximum number of calls in flight.
+        retry (google.api_core.retry.Retry): Designation of what errors,
+            if any, should be retried.
+        timeout (float): The timeout for each call.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Returns:
+        Dict[str, NodePoolResult]: A result per distinct name, in the
+        order of ``names``. A requested pool missing from a listing gets
+        a ``NotFound`` error.
+
+    Raises:
+        ValueError: If a name is not a node pool name, or
+            ``max_concurrency`` is less than 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    clusters = _group(names)
+    if pool_counts is None:
+        pool_counts = {}
+    calls = asyncio.Semaphore(max_concurrency)
+    options = {"retry": retry, "timeout": timeout, "metadata": metadata}
+    results: Dict[str, NodePoolResult] = {}
+
+    async def list_cluster(cluster, requested):
+        try:
+            async with calls:
+                response = await client.list_node_pools(
+                    request={"parent": cluster}, **options
+                )
+        except Exception as exc:
+            for name in requested:
+                results[name] = NodePoolResult(name, None, exc, LIST)
+            return
+        pool_counts[cluster] = len(response.node_pools)
+        node_pools = {
+            "{}/nodePools/{}".format(cluster, node_pool.name): node_pool
+            for node_pool in response.node_pools
+        }
+        for name in requested:
+            node_pool = node_pools.get(name)
+            error = None
+            if node_pool is None:
+                error = core_exceptions.NotFound("Node pool {} not found.".format(name))
+            results[name] = NodePoolResult(name, node_pool, error, LIST)
+
+    async def get(name):
+        try:
+            async with calls:
+                node_pool = await client.get_node_pool(
+                    request={"name": name}, **options
+                )
+        except Exception as exc:
+            results[name] = NodePoolResult(name, None, exc, GET)
+        else:
+            results[name] = NodePoolResult(name, node_pool, None, GET)
+
+    work = []
+    for cluster, requested in clusters.items():
+        if choose(len(requested), pool_counts.get(cluster), list_ratio) == LIST:
+            work.append(list_cluster(cluster, requested))
+        else:
+            work.extend(get(name) for name in requested)
+    await asyncio.gather(*work)
+    return OrderedDict(
+        (name, results[name]) for requested in clusters.values() for name in requested
+    )
+
+
+__all__ = (
+    "DEFAULT_LIST_RATIO",
+    "GET",
+    "LIST",
+    "NodePoolResult",
+    "choose",
+    "get_node_pools",
+)
@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Batched polling of many ClusterManager operations.
+
+Instead of issuing one ``get_operation`` call per tracked operation, the
+pollers in this module refresh every operation in a location with a
+single ``list_operations`` call per tick, and only fall back to
+``get_operation`` for operations missing from the listing.
+"""
+import asyncio
+from collections import OrderedDict
+import concurrent.futures
+import threading
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from google.api_core import exceptions as core_exceptions
+
+from google.cloud.container_v1beta1.services.cluster_manager import waiter
+from google.cloud.container_v1beta1.types import cluster_service
+
+_DONE = cluster_service.Operation.Status.DONE
+
+
+def _split_operation_path(name: str) -> Tuple[str, str]:
+    parent, _, operation_id = name.rpartition("/operations/")
+    return parent, operation_id
+
+
+class _BaseOperationPoller:
+    def __init__(
+        self,
+        client,
+        *,
+        interval: float = 5.0,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        self._client = client
+        self._interval = interval
+        self._metadata = metadata
+        # Maps the fully-qualified operation name to its future.
+        self._futures: Dict[str, "concurrent.futures.Future"] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def _groups(self) -> Dict[str, List[str]]:
+        """Groups the pending operations by ``projects/*/locations/*``."""
+        groups: Dict[str, List[str]] = OrderedDict()
+        for name, future in list(self._futures.items()):
+            if future.done():
+                # Cancelled by the caller.
+                del self._futures[name]
+                continue
+            parent, _ = _split_operation_path(name)
+            groups.setdefault(parent, []).append(name)
+        return groups
+
+    def _resolve(self, name: str, operation: cluster_service.Operation) -> None:
+        if operation.status != _DONE:
+            return
+        future = self._futures.pop(name, None)
+        if future is None or future.done():
+            return
+        exc = waiter.operation_exception(operation)
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(operation)
+
+    def _fail(self, name: str, exc: Exception) -> None:
+        future = self._futures.pop(name, None)
+        if future is not None and not future.done():
+            future.set_exception(exc)
+
+    def _fail_all(self, names: List[str], exc: Exception) -> None:
+        for name in names:
+            self._fail(name, exc)
+
+    def _listed(
+        self, names: List[str], response: cluster_service.ListOperationsResponse
+    ) -> List[str]:
+        """Resolves listed operations and returns the names that were missing."""
+        by_id = {operation.name: operation for operation in response.operations}
+        missing = []
+        for name in names:
+            _, operation_id = _split_operation_path(name)
+            operation = by_id.get(operation_id)
+            if operation is None:
+                missing.append(name)
+            else:
+                self._resolve(name, operation)
+        return missing
+
+
+class OperationPoller(_BaseOperationPoller):
+    """Tracks many operations with one ``list_operations`` call per location.
+
+    Each tracked operation is represented by a
+    :class:`concurrent.futures.Future` that resolves to the finished
+    :class:`~google.cloud.container_v1beta1.types.Operation`, or fails with the
+    typed error described by ``Operation.error``. API errors of
+    ``list_operations`` fall back to ``get_operation``; other errors, and
+    the errors of ``get_operation``, fail the futures being polled.
+
+    Polling happens on a background thread started by :meth:`start` (or on
+    entering the poller as a context manager), or explicitly by calling
+    :meth:`poll_once`.
+
+    Args:
+        client (google.cloud.container_v1beta1.services.cluster_manager.ClusterManagerClient):
+            The client used to list and get operations.
+        interval (float): The number of seconds between ticks.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        interval: float = 5.0,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        super().__init__(client, interval=interval, metadata=metadata)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(
+        self, operation: cluster_service.Operation, project: Optional[str] = None
+    ) -> "concurrent.futures.Future":
+        """Starts tracking an operation.
+
+        Args:
+            operation (google.cloud.container_v1beta1.types.Operation):
+                The operation returned by a mutating RPC.
+            project (Optional[str]): The project the operation belongs to.
+                Only needed when ``operation.self_link`` is unset.
+
+        Returns:
+            concurrent.futures.Future: A future for the finished operation.
+            Adding the same operation twice returns the same future.
+        """
+        name = waiter.operation_path(operation, project)
+        with self._lock:
+            future = self._futures.get(name)
+            if future is None:
+                future = concurrent.futures.Future()
+                self._futures[name] = future
+                self._resolve(name, operation)
+            return future
+
+    def poll_once(self) -> None:
+        """Refreshes every tracked operation once."""
+        with self._lock:
+            groups = self._groups()
+        for parent, names in groups.items():
+            self._poll_location(parent, names)
+
+    def _poll_location(self, parent: str, names: List[str]) -> None:
+        try:
+            response = self._client.list_operations(
+                request={"parent": parent}, metadata=self._metadata
+            )
+        except core_exceptions.GoogleAPICallError:
+            missing = names
+        except Exception as exc:
+            # Not an error of the service, such as a bad argument: every
+            # poll would fail the same way, so fail the operations.
+            with self._lock:
+                self._fail_all(names, exc)
+            return
+        else:
+            with self._lock:
+                missing = self._listed(names, response)
+        for name in missing:
+            try:
+                operation = self._client.get_operation(
+                    request={"name": name}, metadata=self._metadata
+                )
+            except Exception as exc:
+                with self._lock:
+                    self._fail(name, exc)
+            else:
+                with self._lock:
+                    self._resolve(name, operation)
+
+    def start(self) -> None:
+        """Starts polling on a background thread."""
+        with self._lock:
+            if self._stopped.is_set():
+                raise ValueError("Cannot start a closed poller.")
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="OperationPoller", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            if self._futures:
+                self.poll_once()
+
+    def close(self) -> None:
+        """Stops the background thread. Pending futures stay pending."""
+        self._stopped.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> Iterator["concurrent.futures.Future"]:
+        """Yields the tracked futures as they complete.
+
+        Starts background polling if needed.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to
+                wait for all tracked operations.
+        """
+        self.start()
+        with self._lock:
+            futures = list(self._futures.values())
+        return concurrent.futures.as_completed(futures, timeout=timeout)
+
+    def __enter__(self) -> "OperationPoller":
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+class AsyncOperationPoller(_BaseOperationPoller):
+    """Tracks many operations with one ``list_operations`` call per location.
+
+    Each tracked operation is represented by an :class:`asyncio.Future`
+    that resolves to the finished
+    :class:`~google.cloud.container_v1beta1.types.Operation`, or fails with the
+    typed error described by ``Operation.error``. Locations are listed
+    concurrently on each tick; errors are handled as by
+    :class:`OperationPoller`.
+
+    Args:
+        client (google.cloud.container_v1beta1.services.cluster_manager.ClusterManagerAsyncClient):
+            The client used to list and get operations.
+        interval (float): The number of seconds between ticks.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        interval: float = 5.0,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        super().__init__(client, interval=interval, metadata=metadata)
+        self._task: Optional["asyncio.Future"] = None
+
+    def add(
+        self, operation: cluster_service.Operation, project: Optional[str] = None
+    ) -> "asyncio.Future":
+        """Starts tracking an operation.
+
+        Args:
+            operation (google.cloud.container_v1beta1.types.Operation):
+                The operation returned by a mutating RPC.
+            project (Optional[str]): The project the operation belongs to.
+                Only needed when ``operation.self_link`` is unset.
+
+        Returns:
+            asyncio.Future: A future for the finished operation. Adding the
+            same operation twice returns the same future.
+
+        Raises:
+            RuntimeError: If no event loop is running.
+        """
+        name = waiter.operation_path(operation, project)
+        future = self._futures.get(name)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[name] = future
+            self._resolve(name, operation)
+        return future
+
+    async def poll_once(self) -> None:
+        """Refreshes every tracked operation once."""
+        groups = self._groups()
+        await asyncio.gather(
+            *(self._poll_location(parent, names) for parent, names in groups.items())
+        )
+
+    async def _poll_location(self, parent: str, names: List[str]) -> None:
+        try:
+            response = await self._client.list_operations(
+                request={"parent": parent}, metadata=self._metadata
+            )
+        except core_exceptions.GoogleAPICallError:
+            missing = names
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Not an error of the service, such as a bad argument: every
+            # poll would fail the same way, so fail the operations.
+            self._fail_all(names, exc)
+            return
+        else:
+            missing = self._listed(names, response)
+        for name in missing:
+            try:
+                operation = await self._client.get_operation(
+                    request={"name": name}, metadata=self._metadata
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._fail(name, exc)
+            else:
+                self._resolve(name, operation)
+
+    def start(self) -> None:
+        """Starts polling in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            if self._futures:
+                await self.poll_once()
+
+    async def close(self) -> None:
+        """Stops the background task. Pending futures stay pending."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def as_completed(self) -> AsyncIterator["asyncio.Future"]:
+        """Yields the tracked futures as they complete.
+
+        Starts background polling if needed.
+        """
+        pending = set(self._futures.values())
+        self.start()
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future
+
+    async def __aenter__(self) -> "AsyncOperationPoller":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+__all__ = (
+    "AsyncOperationPoller",
+    "OperationPoller",
+)
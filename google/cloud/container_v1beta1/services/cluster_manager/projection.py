@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Partial responses.
+
+The ``fields`` argument of :meth:`ClusterManagerClient.list_clusters
+<google.cloud.container_v1beta1.services.cluster_manager.ClusterManagerClient.list_clusters>`
+and :meth:`~.ClusterManagerClient.get_cluster` sends a field mask in the
+``x-goog-fieldmask`` header, asking the service to return only the listed
+fields of each cluster::
+
+    response = client.list_clusters(
+        parent="projects/p/locations/-",
+        fields=["name", "status", "current_master_version", "location"],
+    )
+
+Paths are dotted proto field names. A path through a repeated or map
+field selects the subfield of every entry, for example
+``node_pools.name``. :func:`project` applies the same mask to a message
+locally; the fake server uses it to honour the header.
+"""
+from typing import Dict, Iterable, Optional, Sequence, Tuple, TypeVar, Union
+
+from google.protobuf import descriptor  # type: ignore
+from google.protobuf import field_mask_pb2  # type: ignore
+import proto  # type: ignore
+
+FIELD_MASK_HEADER = "x-goog-fieldmask"
+
+M = TypeVar("M")
+
+_Tree = Dict[str, "_Tree"]
+
+
+def field_mask_paths(
+    fields: Union[str, Iterable[str], field_mask_pb2.FieldMask],
+    prefix: Optional[str] = None,
+) -> Tuple[str, ...]:
+    """Returns the paths of ``fields``, each below ``prefix`` if set.
+
+    Args:
+        fields (Union[str, Iterable[str], google.protobuf.field_mask_pb2.FieldMask]):
+            Field paths, as a sequence, a comma separated string or a
+            field mask.
+        prefix (Optional[str]): The path of the field the paths are
+            relative to, for example ``"clusters"``.
+    """
+    if isinstance(fields, field_mask_pb2.FieldMask):
+        fields = fields.paths
+    elif isinstance(fields, str):
+        fields = fields.split(",")
+    paths = []
+    for path in fields:
+        path = path.strip()
+        if not path:
+            continue
+        paths.append("{}.{}".format(prefix, path) if prefix else path)
+    return tuple(paths)
+
+
+def field_mask_metadata(
+    fields: Union[str, Iterable[str], field_mask_pb2.FieldMask],
+    prefix: Optional[str] = None,
+    extra: Sequence[str] = (),
+) -> Tuple[str, str]:
+    """Returns the metadata entry asking for a partial response.
+
+    Args:
+        fields (Union[str, Iterable[str], google.protobuf.field_mask_pb2.FieldMask]):
+            The fields to return.
+        prefix (Optional[str]): See :func:`field_mask_paths`.
+        extra (Sequence[str]): Paths of the response to return in
+            addition to ``fields``, which are not prefixed.
+
+    Raises:
+        ValueError: If ``fields`` is empty.
+    """
+    paths = field_mask_paths(fields, prefix)
+    if not paths:
+        raise ValueError("fields must name at least one field.")
+    return FIELD_MASK_HEADER, ",".join(paths + tuple(extra))
+
+
+def field_mask_from_metadata(
+    metadata: Iterable[Tuple[str, Union[str, bytes]]]
+) -> Optional[Tuple[str, ...]]:
+    """Returns the paths requested by ``metadata``, or None if it has none."""
+    for key, value in metadata or ():
+        if key.lower() == FIELD_MASK_HEADER:
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            return field_mask_paths(value)
+    return None
+
+
+def _tree(paths: Iterable[str]) -> _Tree:
+    tree: _Tree = {}
+    for path in paths:
+        node = tree
+        parts = path.split(".")
+        for index, part in enumerate(parts):
+            if part in node and not node[part]:
+                # An ancestor is already selected as a whole.
+                break
+            if index == len(parts) - 1:
+                node[part] = {}
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _project(source, target, tree: _Tree) -> None:
+    fields = source.DESCRIPTOR.fields_by_name
+    leaves = []
+    for name, subtree in tree.items():
+        field = fields.get(name)
+        if field is None:
+            raise ValueError(
+                "{} has no field {!r}.".format(source.DESCRIPTOR.full_name, name)
+            )
+        if not subtree:
+            leaves.append(name)
+            continue
+        if field.type != descriptor.FieldDescriptor.TYPE_MESSAGE:
+            raise ValueError(
+                "{}.{} has no subfields.".format(source.DESCRIPTOR.full_name, name)
+            )
+        if field.message_type.GetOptions().map_entry:
+            value_field = field.message_type.fields_by_name["value"]
+            if value_field.type != descriptor.FieldDescriptor.TYPE_MESSAGE:
+                raise ValueError(
+                    "{}.{} has no subfields.".format(source.DESCRIPTOR.full_name, name)
+                )
+            entries = getattr(target, name)
+            for key, value in getattr(source, name).items():
+                _project(value, entries[key], subtree)
+        elif field.label == descriptor.FieldDescriptor.LABEL_REPEATED:
+            items = getattr(target, name)
+            for value in getattr(source, name):
+                _project(value, items.add(), subtree)
+        elif source.HasField(name):
+            getattr(target, name).SetInParent()
+            _project(getattr(source, name), getattr(target, name), subtree)
+    if leaves:
+        # Whole fields are copied in a single pass over the source.
+        field_mask_pb2.FieldMask(paths=leaves).MergeMessage(source, target)
+
+
+def project(
+    message: M, fields: Union[str, Iterable[str], field_mask_pb2.FieldMask]
+) -> M:
+    """Returns a copy of ``message`` with only ``fields`` set.
+
+    Args:
+        message (Union[proto.Message, google.protobuf.message.Message]):
+            The message to project. It is not modified.
+        fields (Union[str, Iterable[str], google.protobuf.field_mask_pb2.FieldMask]):
+            The paths to keep.
+
+    Returns:
+        A message of the same type as ``message``.
+
+    Raises:
+        ValueError: If a path names a field the message does not have.
+    """
+    tree = _tree(field_mask_paths(fields))
+    if isinstance(message, proto.Message):
+        message_type = type(message)
+        source = message_type.pb(message)
+        target = type(source)()
+        _project(source, target, tree)
+        return message_type.wrap(target)
+    target = type(message)()
+    _project(message, target, tree)
+    return target
+
+
+__all__ = (
+    "FIELD_MASK_HEADER",
+    "field_mask_from_metadata",
+    "field_mask_metadata",
+    "field_mask_paths",
+    "project",
+)
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Channels, stubs and calls that forward to the ones they wrap.
+
+The transports wrap their channels to change unary calls: to record
+metrics, to wait for a rate limit, to hedge or to compress them. The
+classes here forward everything to the wrapped object, so that a wrapper
+only overrides what it changes, usually ``unary_unary`` and the stubs it
+returns.
+"""
+from typing import Dict
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+
+class ForwardingChannel(grpc.Channel):
+    """A :class:`grpc.Channel` that forwards to another channel.
+
+    Attributes the wrapper does not have, such as those of a channel
+    pool, are read from the wrapped channel.
+
+    Args:
+        channel (grpc.Channel): The channel to forward to.
+    """
+
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+
+    def unary_unary(self, *args, **kwargs):
+        return self.channel.unary_unary(*args, **kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return self.channel.unary_stream(*args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self.channel.stream_unary(*args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self.channel.stream_stream(*args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def close(self):
+        self.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __getattr__(self, name):
+        # Only called for missing attributes; ``channel`` is missing before
+        # __init__ runs, for example in copies.
+        if name == "channel":
+            raise AttributeError(name)
+        return getattr(self.channel, name)
+
+
+class AsyncForwardingChannel(aio.Channel):
+    """An :class:`grpc.aio.Channel` that forwards to another channel.
+
+    Attributes the wrapper does not have, such as those of a channel
+    pool, are read from the wrapped channel.
+
+    Args:
+        channel (grpc.aio.Channel): The channel to forward to.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        self.channel = channel
+
+    def unary_unary(self, *args, **kwargs):
+        return self.channel.unary_unary(*args, **kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return self.channel.unary_stream(*args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self.channel.stream_unary(*args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self.channel.stream_stream(*args, **kwargs)
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        return self.channel.get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        return await self.channel.wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await self.channel.channel_ready()
+
+    async def close(self, grace=None):
+        await self.channel.close(grace)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __getattr__(self, name):
+        if name == "channel":
+            raise AttributeError(name)
+        return getattr(self.channel, name)
+
+
+class ForwardingUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    """A unary stub that forwards to the stub it wraps.
+
+    Subclasses that only change the arguments of calls override
+    :meth:`_prepare`.
+
+    Args:
+        callable_ (grpc.UnaryUnaryMultiCallable): The stub to forward to,
+            kept as ``__wrapped__``.
+    """
+
+    def __init__(self, callable_):
+        self.__wrapped__ = callable_
+
+    def _prepare(self, request, kwargs: Dict) -> Dict:
+        """Returns the keyword arguments to send ``request`` with."""
+        return kwargs
+
+    def __call__(self, request, *args, **kwargs):
+        return self.__wrapped__(request, *args, **self._prepare(request, kwargs))
+
+    def with_call(self, request, *args, **kwargs):
+        return self.__wrapped__.with_call(
+            request, *args, **self._prepare(request, kwargs)
+        )
+
+    def future(self, request, *args, **kwargs):
+        return self.__wrapped__.future(request, *args, **self._prepare(request, kwargs))
+
+
+class AsyncForwardingUnaryUnaryMultiCallable(aio.UnaryUnaryMultiCallable):
+    """An asyncio unary stub that forwards to the stub it wraps.
+
+    Subclasses that only change the arguments of calls override
+    :meth:`_prepare`.
+
+    Args:
+        callable_ (grpc.aio.UnaryUnaryMultiCallable): The stub to forward
+            to, kept as ``__wrapped__``.
+    """
+
+    def __init__(self, callable_):
+        self.__wrapped__ = callable_
+
+    def _prepare(self, request, kwargs: Dict) -> Dict:
+        """Returns the keyword arguments to send ``request`` with."""
+        return kwargs
+
+    def __call__(self, request, *args, **kwargs):
+        return self.__wrapped__(request, *args, **self._prepare(request, kwargs))
+
+
+class ForwardingCall(aio.UnaryUnaryCall):
+    """An asyncio unary call that forwards to the call it wraps.
+
+    Args:
+        call (grpc.aio.UnaryUnaryCall): The call to forward to.
+    """
+
+    def __init__(self, call):
+        self._call = call
+
+    def __await__(self):
+        response = yield from self._call.__await__()
+        return response
+
+    async def initial_metadata(self):
+        return await self._call.initial_metadata()
+
+    async def trailing_metadata(self):
+        return await self._call.trailing_metadata()
+
+    async def code(self):
+        return await self._call.code()
+
+    async def details(self):
+        return await self._call.details()
+
+    async def wait_for_connection(self):
+        await self._call.wait_for_connection()
+
+    def cancelled(self):
+        return self._call.cancelled()
+
+    def done(self):
+        return self._call.done()
+
+    def time_remaining(self):
+        return self._call.time_remaining()
+
+    def cancel(self):
+        return self._call.cancel()
+
+    def add_done_callback(self, callback):
+        self._call.add_done_callback(callback)
+
+
+__all__ = (
+    "AsyncForwardingChannel",
+    "AsyncForwardingUnaryUnaryMultiCallable",
+    "ForwardingCall",
+    "ForwardingChannel",
+    "ForwardingUnaryUnaryMultiCallable",
+)
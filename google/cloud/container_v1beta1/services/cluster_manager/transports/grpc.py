@@ -13,9 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import copy
+import functools
+import time
 from typing import Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
+from google.api_core import exceptions as core_exceptions
 from google.api_core import gapic_v1, grpc_helpers
 import google.auth  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -25,7 +29,17 @@ import grpc  # type: ignore
 
 from google.cloud.container_v1beta1.types import cluster_service
 
-from .base import DEFAULT_CLIENT_INFO, ClusterManagerTransport
+from . import pool, raw
+from .compression import Compression, check_compression, compress_channel
+from .hedging import HedgingPolicy, RetryBudget, hedged_channel
+from .metrics import MetricsRegistry
+from .ratelimit import RateLimiter
+from .registry import ChannelRegistry, channel_key
+from .base import (
+    DEFAULT_CLIENT_INFO,
+    DEFAULT_WARM_UP_TIMEOUT,
+    ClusterManagerTransport,
+)
 
 
 class ClusterManagerGrpcTransport(ClusterManagerTransport):
@@ -59,6 +73,15 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         api_audience: Optional[str] = None,
+        channel_pool_size: int = 1,
+        channel_pool_strategy: str = pool.ROUND_ROBIN,
+        metrics: Optional[MetricsRegistry] = None,
+        response_format: str = raw.PROTO_PLUS,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        compression: Optional[Compression] = None,
+        channel_registry: Optional[ChannelRegistry] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -101,6 +124,43 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            channel_pool_size (int): The number of channels to open. When
+                greater than one, calls are spread across the channels by a
+                :class:`~.pool.ChannelPool`. It is ignored if ``channel`` is
+                provided.
+            channel_pool_strategy (str): How calls are assigned to pooled
+                channels: ``"round_robin"`` or ``"least_loaded"``.
+            metrics (Optional[~.metrics.MetricsRegistry]): Records per-RPC
+                latency, message size, status and in-flight metrics for
+                every call made through the transport, including calls on
+                a provided ``channel``. No instrumentation is installed
+                if unset.
+            response_format (str): What calls return: ``"proto-plus"``
+                messages (the default), the underlying ``"protobuf"``
+                messages, or the serialized ``"bytes"``. See
+                :mod:`~.raw`.
+            rate_limiter (Optional[~.ratelimit.RateLimiter]): Spaces out
+                calls to stay within API quotas. Every attempt, including
+                retries, waits for a token of its method group and
+                project. Calls are not limited if unset.
+            retry_budget (Optional[~.hedging.RetryBudget]): Caps the default
+                retries of the wrapped methods, and the hedges sent by
+                ``hedging``, at a ratio of the successful calls.
+            hedging (Optional[~.hedging.HedgingPolicy]): Sends a second
+                attempt of slow read-only calls and returns the first
+                success. Calls are not hedged if unset.
+            compression (Optional[Union[str, grpc.Compression]]): How
+                the requests of calls made without a ``compression`` of
+                their own are compressed: ``"none"``, ``"gzip"``,
+                ``"deflate"``, or ``"auto"`` to compress large requests
+                only. Requests are not compressed if unset. See
+                :mod:`~.compression`.
+            channel_registry (Optional[~.registry.ChannelRegistry]): Shares
+                the channel with the other transports of the registry that
+                have the same host, credentials and channel options.
+                :meth:`close` then releases the transport's reference to
+                the channel instead of closing it. It is ignored if
+                ``channel`` is provided. See :mod:`~.registry`.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -108,6 +168,10 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        if channel_pool_size < 1:
+            raise ValueError("channel_pool_size must be at least 1.")
+        raw.check_response_format(response_format)
+        check_compression(compression)
         self._grpc_channel = None
         self._ssl_channel_credentials = ssl_channel_credentials
         self._stubs: Dict[str, Callable] = {}
@@ -158,7 +222,17 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
         )
 
         if not self._grpc_channel:
-            self._grpc_channel = type(self).create_channel(
+            options = [
+                ("grpc.max_send_message_length", -1),
+                ("grpc.max_receive_message_length", -1),
+            ]
+            if channel_pool_size > 1:
+                # Channels with the same target and options share the
+                # connections of gRPC's global subchannel pool; give each
+                # pooled channel a connection of its own.
+                options.append(("grpc.use_local_subchannel_pool", 1))
+            create_channel = functools.partial(
+                type(self).create_channel,
                 self._host,
                 # use the credentials which are saved
                 credentials=self._credentials,
@@ -168,13 +242,61 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
                 scopes=self._scopes,
                 ssl_credentials=self._ssl_channel_credentials,
                 quota_project_id=quota_project_id,
-                options=[
-                    ("grpc.max_send_message_length", -1),
-                    ("grpc.max_receive_message_length", -1),
-                ],
+                options=options,
             )
+            if channel_pool_size > 1:
+                create_channel = functools.partial(
+                    _create_channel_pool,
+                    create_channel,
+                    channel_pool_size,
+                    channel_pool_strategy,
+                )
+            if channel_registry is not None:
+                key = channel_key(
+                    self._host,
+                    credentials,
+                    credentials_file,
+                    transport=type(self),
+                    scopes=scopes,
+                    quota_project_id=quota_project_id,
+                    ssl_credentials=self._ssl_channel_credentials,
+                    always_use_jwt_access=always_use_jwt_access,
+                    api_audience=api_audience,
+                    channel_pool_size=channel_pool_size,
+                    channel_pool_strategy=channel_pool_strategy,
+                )
+                self._grpc_channel = channel_registry.acquire(key, create_channel)
+            else:
+                self._grpc_channel = create_channel()
+
+        if compression is not None:
+            self._grpc_channel = compress_channel(self._grpc_channel, compression)
+
+        if metrics is not None:
+            self._metrics = metrics
+            self._grpc_channel = metrics.instrument_channel(self._grpc_channel)
+
+        if rate_limiter is not None:
+            # Wait outside of the instrumented channel, so that attempt
+            # latencies do not include rate limit waits.
+            self._rate_limiter = rate_limiter
+            self._grpc_channel = rate_limiter.limit_channel(self._grpc_channel)
+
+        if retry_budget is not None or hedging is not None:
+            # Hedges go through the rate limiter, like any other attempt.
+            self._retry_budget = retry_budget
+            self._grpc_channel = hedged_channel(
+                self._grpc_channel, retry_budget, hedging
+            )
+
+        # Swap the response deserializers last, so that metrics still see
+        # the deserializer of every response.
+        self._response_format = response_format
+        self._response_format_views = {response_format: self}
+        self._grpc_channel = raw.format_channel(self._grpc_channel, response_format)
 
         # Wrap messages. This must be done after self._grpc_channel exists
+        self._client_info = client_info
         self._prep_wrapped_messages(client_info)
 
     @classmethod
@@ -229,6 +351,29 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
         """Return the channel designed to connect to this service."""
         return self._grpc_channel
 
+    def with_response_format(
+        self, response_format: str
+    ) -> "ClusterManagerGrpcTransport":
+        """Return a transport whose calls return ``response_format``.
+
+        The returned transport shares this transport's channel, and is
+        created once per format, so it is cheap to ask for on every call.
+        Closing either transport closes the shared channel.
+
+        Args:
+            response_format (str): ``"proto-plus"``, ``"protobuf"`` or
+                ``"bytes"``. See :mod:`~.raw`.
+        """
+        view = self._response_format_views.get(response_format)
+        if view is None:
+            view = copy.copy(self)
+            view._response_format = response_format
+            view._grpc_channel = raw.format_channel(self._grpc_channel, response_format)
+            view._stubs = {}
+            view._prep_wrapped_messages(self._client_info)
+            self._response_format_views[response_format] = view
+        return view
+
     @property
     def list_clusters(
         self,
@@ -1185,6 +1330,44 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
             )
         return self._stubs["list_locations"]
 
+    def warm_up(self, timeout: Optional[float] = DEFAULT_WARM_UP_TIMEOUT) -> None:
+        """Connects the channel and refreshes the credentials.
+
+        The first call otherwise waits for the name resolution, TCP, TLS
+        and HTTP/2 handshakes and the token request. Every channel of a
+        pool is connected. The handshakes run while the credentials are
+        refreshed.
+
+        Args:
+            timeout (Optional[float]): The longest to wait, in seconds.
+                Waits until the channel is ready if None.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel is
+                not ready within ``timeout``.
+            google.auth.exceptions.RefreshError: If the credentials cannot
+                be refreshed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        channels = getattr(self.grpc_channel, "channels", None) or [self.grpc_channel]
+        futures = [grpc.channel_ready_future(channel) for channel in channels]
+        try:
+            self._refresh_credentials()
+            for future in futures:
+                remaining = None
+                if deadline is not None:
+                    remaining = max(deadline - time.monotonic(), 0.0)
+                future.result(timeout=remaining)
+        except grpc.FutureTimeoutError:
+            raise core_exceptions.DeadlineExceeded(
+                "The channel to {} was not ready within {}s.".format(
+                    self._host, timeout
+                )
+            ) from None
+        finally:
+            for future in futures:
+                future.cancel()
+
     def close(self):
         self.grpc_channel.close()
 
@@ -1193,4 +1376,10 @@ class ClusterManagerGrpcTransport(ClusterManagerTransport):
         return "grpc"
 
 
+def _create_channel_pool(
+    create_channel: Callable[[], grpc.Channel], size: int, strategy: str
+) -> pool.ChannelPool:
+    return pool.ChannelPool([create_channel() for _ in range(size)], strategy=strategy)
+
+
 __all__ = ("ClusterManagerGrpcTransport",)
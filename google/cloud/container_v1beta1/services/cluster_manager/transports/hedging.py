@@ -0,0 +1,540 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Retry budgets and hedged reads.
+
+The default retries of the wrapped methods retry every call on its own,
+so an outage that fails every call multiplies the load on the service. A
+:class:`RetryBudget` shared by the calls of a transport caps their retries
+at a ratio of its successful calls, plus a small reserve per second::
+
+    budget = hedging.RetryBudget(ratio=0.1)
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(retry_budget=budget)
+    )
+
+A retry the budget cannot pay for is not made, and the call fails with
+the error of its last attempt. The default retries of both clients are
+budgeted; a ``retry`` passed to a call is budgeted if its predicate is
+wrapped with :meth:`RetryBudget.predicate`.
+
+A :class:`HedgingPolicy` cuts the tail latency of read-only RPCs. When an
+attempt has not answered within the recent p95 latency of its RPC, a
+second attempt is sent and the first success is returned; the other
+attempt is cancelled. With a budget, each hedge is paid for like a retry.
+"""
+import asyncio
+from collections import deque
+import math
+import threading
+import time
+from typing import Callable, Collection, Deque, Dict, List, Optional
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import (
+    AsyncForwardingChannel,
+    AsyncForwardingUnaryUnaryMultiCallable,
+    ForwardingCall,
+    ForwardingChannel,
+    ForwardingUnaryUnaryMultiCallable,
+)
+from .metrics import method_name
+from .ratelimit import READ, _remaining, default_group
+
+
+class RetryBudget:
+    """Caps the retries of a transport at a ratio of its successful calls.
+
+    Args:
+        ratio (float): The retries earned by each successful call.
+        min_retries_per_second (float): Retries allowed regardless of
+            the ratio, so that transports making few calls can retry.
+        max_balance (float): The most retries successful calls may save
+            up.
+        clock (Callable[[], float]): The clock used to refill the
+            per-second reserve.
+
+    Raises:
+        ValueError: If an argument is negative.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        *,
+        min_retries_per_second: float = 1.0,
+        max_balance: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ratio < 0 or min_retries_per_second < 0 or max_balance < 0:
+            raise ValueError("Retry budget arguments must not be negative.")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._balance = 0.0
+        self._reserve_cap = max(1.0, min_retries_per_second)
+        self._reserve = self._reserve_cap if min_retries_per_second else 0.0
+        self._updated = clock()
+        self.deposits = 0
+        self.withdrawals = 0
+        self.rejected = 0
+
+    def _refill(self) -> None:
+        # Must be called with the lock held.
+        now = self._clock()
+        self._reserve = min(
+            self._reserve_cap,
+            self._reserve + (now - self._updated) * self.min_retries_per_second,
+        )
+        self._updated = now
+
+    @property
+    def balance(self) -> float:
+        """The retries that may be made now."""
+        with self._lock:
+            self._refill()
+            return self._balance + self._reserve
+
+    def deposit(self) -> None:
+        """Records a successful call."""
+        with self._lock:
+            self.deposits += 1
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Pays for a retry or hedge, returning False if it cannot be made."""
+        with self._lock:
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                self.withdrawals += 1
+                return True
+            self._refill()
+            if self._reserve >= 1.0:
+                self._reserve -= 1.0
+                self.withdrawals += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def predicate(
+        self, predicate: Callable[[Exception], bool]
+    ) -> Callable[[Exception], bool]:
+        """Returns ``predicate`` changed to only retry within the budget.
+
+        Args:
+            predicate (Callable[[Exception], bool]): The predicate of a
+                :class:`google.api_core.retry.Retry`.
+        """
+
+        def budgeted(exc: Exception) -> bool:
+            return predicate(exc) and self.try_withdraw()
+
+        return budgeted
+
+
+class HedgingPolicy:
+    """When to send a second attempt of a read-only call.
+
+    Args:
+        delay (Optional[float]): A fixed hedging delay, in seconds. If
+            unset, the ``percentile`` of the recent latencies of each RPC
+            is used once ``min_samples`` of them are known.
+        percentile (float): The latency percentile, between 0 and 1.
+        min_samples (int): The latencies needed before hedging an RPC.
+        window (int): The number of recent latencies kept per RPC.
+        methods (Optional[Collection[str]]): The RPCs to hedge, by name.
+            Only RPCs that are safe to send twice should be listed. All
+            ``Get*`` and ``List*`` RPCs are hedged if unset.
+        clock (Callable[[], float]): The clock used to time calls.
+
+    Raises:
+        ValueError: If ``percentile`` is not between 0 and 1, or
+            ``window`` is smaller than ``min_samples``.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        *,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+        methods: Optional[Collection[str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1].")
+        if window < max(min_samples, 1):
+            raise ValueError("window must hold at least min_samples latencies.")
+        self._delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.methods = frozenset(methods) if methods is not None else None
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._delays: Dict[str, Optional[float]] = {}
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedges_method(self, method: str) -> bool:
+        """Returns whether calls of an RPC, such as ``"GetCluster"``, are hedged."""
+        if self.methods is not None:
+            return method in self.methods
+        return default_group(method) == READ
+
+    def observe(self, method: str, seconds: float) -> None:
+        """Records the latency of a successful call."""
+        with self._lock:
+            latencies = self._latencies.get(method)
+            if latencies is None:
+                latencies = self._latencies[method] = deque(maxlen=self.window)
+            latencies.append(seconds)
+            self._delays.pop(method, None)
+
+    def delay(self, method: str) -> Optional[float]:
+        """Returns how long to wait before hedging a call, or None not to."""
+        if self._delay is not None:
+            return self._delay
+        with self._lock:
+            if method in self._delays:
+                return self._delays[method]
+            latencies = self._latencies.get(method, ())
+            delay = None
+            if latencies and len(latencies) >= self.min_samples:
+                ordered = sorted(latencies)
+                index = max(math.ceil(self.percentile * len(ordered)) - 1, 0)
+                delay = ordered[index]
+            self._delays[method] = delay
+            return delay
+
+    def _record_hedge(self) -> None:
+        with self._lock:
+            self.hedges += 1
+
+    def _record_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+
+class _HedgedStubMixin:
+    method: str
+    _budget: Optional[RetryBudget]
+    _policy: Optional[HedgingPolicy]
+    _clock: Callable[[], float]
+
+    def _delay(self) -> Optional[float]:
+        return self._policy.delay(self.method) if self._policy is not None else None
+
+    def _may_hedge(self) -> bool:
+        return self._budget is None or self._budget.try_withdraw()
+
+    def _succeeded(self, started: float) -> None:
+        if self._budget is not None:
+            self._budget.deposit()
+        if self._policy is not None:
+            self._policy.observe(self.method, self._clock() - started)
+
+
+class _HedgedUnaryUnaryMultiCallable(
+    _HedgedStubMixin, ForwardingUnaryUnaryMultiCallable
+):
+    def __init__(self, method: str, callable_, budget, policy):
+        super().__init__(callable_)
+        self.method = method
+        self._budget = budget
+        self._policy = policy
+        self._clock = policy.clock if policy is not None else time.monotonic
+
+    def _hedge(self, delay, request, args, kwargs):
+        settled = threading.Event()
+
+        def notify(_):
+            settled.set()
+
+        futures = [self.__wrapped__.future(request, *args, **kwargs)]
+        futures[0].add_done_callback(notify)
+        if not settled.wait(delay) and self._may_hedge():
+            self._policy._record_hedge()
+            futures.append(
+                self.__wrapped__.future(request, *args, **_remaining(kwargs, delay))
+            )
+            futures[1].add_done_callback(notify)
+        while True:
+            settled.wait()
+            settled.clear()
+            for index, future in enumerate(futures):
+                if (
+                    future.done()
+                    and not future.cancelled()
+                    and future.exception() is None
+                ):
+                    for other in futures:
+                        if other is not future:
+                            other.cancel()
+                    if index:
+                        self._policy._record_win()
+                    return future.result(), future
+            if all(future.done() for future in futures):
+                # Raises the error of the first attempt.
+                return futures[0].result(), futures[0]
+
+    def _invoke(self, with_call, request, args, kwargs):
+        delay = self._delay()
+        started = self._clock()
+        if delay is not None:
+            response, call = self._hedge(delay, request, args, kwargs)
+            result = (response, call) if with_call else response
+        elif with_call:
+            result = self.__wrapped__.with_call(request, *args, **kwargs)
+        else:
+            result = self.__wrapped__(request, *args, **kwargs)
+        self._succeeded(started)
+        return result
+
+    def __call__(self, request, *args, **kwargs):
+        return self._invoke(False, request, args, kwargs)
+
+    def with_call(self, request, *args, **kwargs):
+        return self._invoke(True, request, args, kwargs)
+
+    def future(self, request, *args, **kwargs):
+        started = self._clock()
+        future = self.__wrapped__.future(request, *args, **kwargs)
+
+        def done(future):
+            if future.code() == grpc.StatusCode.OK:
+                self._succeeded(started)
+
+        future.add_done_callback(done)
+        return future
+
+
+class HedgedChannel(ForwardingChannel):
+    """A :class:`grpc.Channel` that hedges reads and feeds a retry budget.
+
+    Args:
+        channel (grpc.Channel): The channel to wrap.
+        budget (Optional[RetryBudget]): Credited with every successful
+            call, and charged for every hedge.
+        policy (Optional[HedgingPolicy]): Which calls to hedge, and when.
+    """
+
+    def __init__(
+        self,
+        channel: grpc.Channel,
+        budget: Optional[RetryBudget] = None,
+        policy: Optional[HedgingPolicy] = None,
+    ):
+        super().__init__(channel)
+        self.budget = budget
+        self.policy = policy
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _hedged_stub(
+            _HedgedUnaryUnaryMultiCallable,
+            self.budget,
+            self.policy,
+            method,
+            self.channel.unary_unary(method, *args, **kwargs),
+        )
+
+
+class _SucceededCall(ForwardingCall):
+    """Reports an asyncio call once it has succeeded."""
+
+    def __init__(self, call, on_success: Callable[[], None]):
+        super().__init__(call)
+        self._on_success = on_success
+
+    def __await__(self):
+        response = yield from self._call.__await__()
+        self._on_success()
+        return response
+
+
+async def _response(call):
+    return await call
+
+
+class _HedgedCall(ForwardingCall):
+    """An asyncio call answered by the first of up to two attempts."""
+
+    def __init__(
+        self, stub: "_AsyncHedgedUnaryUnaryMultiCallable", delay, request, args, kwargs
+    ):
+        super().__init__(stub.__wrapped__(request, *args, **kwargs))
+        self._calls: List = [self._call]
+        self._task = asyncio.ensure_future(
+            self._run(stub, delay, request, args, kwargs)
+        )
+
+    async def _run(self, stub, delay, request, args, kwargs):
+        started = stub._clock()
+        attempts = [asyncio.ensure_future(_response(self._call))]
+        done, _ = await asyncio.wait(attempts, timeout=delay)
+        if not done and stub._may_hedge():
+            stub._policy._record_hedge()
+            self._calls.append(
+                stub.__wrapped__(request, *args, **_remaining(kwargs, delay))
+            )
+            attempts.append(asyncio.ensure_future(_response(self._calls[1])))
+        pending = set(attempts)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Retrieve every error, so that none is reported as unhandled.
+                succeeded = [
+                    attempt
+                    for attempt in done
+                    if not attempt.cancelled() and attempt.exception() is None
+                ]
+                if succeeded:
+                    index = attempts.index(succeeded[0])
+                    self._call = self._calls[index]
+                    if index:
+                        stub._policy._record_win()
+                    stub._succeeded(started)
+                    return succeeded[0].result()
+            # Raises the error of the first attempt.
+            return attempts[0].result()
+        finally:
+            for attempt in pending:
+                attempt.cancel()
+            for call in self._calls:
+                if call is not self._call:
+                    call.cancel()
+
+    def __await__(self):
+        response = yield from self._task.__await__()
+        return response
+
+    async def _settled(self):
+        await asyncio.wait([self._task])
+        return self._call
+
+    async def initial_metadata(self):
+        return await (await self._settled()).initial_metadata()
+
+    async def trailing_metadata(self):
+        return await (await self._settled()).trailing_metadata()
+
+    async def code(self):
+        return await (await self._settled()).code()
+
+    async def details(self):
+        return await (await self._settled()).details()
+
+    def done(self):
+        return self._task.done()
+
+    def cancel(self):
+        for call in self._calls:
+            call.cancel()
+        return self._task.cancel()
+
+    def add_done_callback(self, callback):
+        self._task.add_done_callback(lambda _: callback(self))
+
+
+class _AsyncHedgedUnaryUnaryMultiCallable(
+    _HedgedStubMixin, AsyncForwardingUnaryUnaryMultiCallable
+):
+    def __init__(self, method: str, callable_, budget, policy):
+        super().__init__(callable_)
+        self.method = method
+        self._budget = budget
+        self._policy = policy
+        self._clock = policy.clock if policy is not None else time.monotonic
+
+    def __call__(self, request, *args, **kwargs):
+        delay = self._delay()
+        if delay is not None:
+            return _HedgedCall(self, delay, request, args, kwargs)
+        started = self._clock()
+        return _SucceededCall(
+            self.__wrapped__(request, *args, **kwargs),
+            lambda: self._succeeded(started),
+        )
+
+
+class AsyncHedgedChannel(AsyncForwardingChannel):
+    """An :class:`grpc.aio.Channel` that hedges reads and feeds a retry budget.
+
+    Args:
+        channel (grpc.aio.Channel): The channel to wrap.
+        budget (Optional[RetryBudget]): Credited with every successful
+            call, and charged for every hedge.
+        policy (Optional[HedgingPolicy]): Which calls to hedge, and when.
+    """
+
+    def __init__(
+        self,
+        channel: aio.Channel,
+        budget: Optional[RetryBudget] = None,
+        policy: Optional[HedgingPolicy] = None,
+    ):
+        super().__init__(channel)
+        self.budget = budget
+        self.policy = policy
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _hedged_stub(
+            _AsyncHedgedUnaryUnaryMultiCallable,
+            self.budget,
+            self.policy,
+            method,
+            self.channel.unary_unary(method, *args, **kwargs),
+        )
+
+
+def _hedged_stub(stub_type, budget, policy, path, callable_):
+    method = method_name(path)
+    if policy is not None and not policy.hedges_method(method):
+        policy = None
+    if budget is None and policy is None:
+        # Nothing to do for this RPC.
+        return callable_
+    return stub_type(method, callable_, budget, policy)
+
+
+def hedged_channel(
+    channel,
+    budget: Optional[RetryBudget] = None,
+    policy: Optional[HedgingPolicy] = None,
+):
+    """Returns ``channel`` wrapped to hedge reads and feed a retry budget.
+
+    Accepts both :class:`grpc.Channel` and :class:`grpc.aio.Channel`.
+    """
+    if isinstance(channel, aio.Channel):
+        return AsyncHedgedChannel(channel, budget, policy)
+    return HedgedChannel(channel, budget, policy)
+
+
+__all__ = (
+    "AsyncHedgedChannel",
+    "HedgedChannel",
+    "HedgingPolicy",
+    "RetryBudget",
+    "hedged_channel",
+)
@@ -0,0 +1,699 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-RPC latency, size, status and concurrency metrics for the transports.
+
+Pass a :class:`MetricsRegistry` to a gRPC transport to record, for every
+RPC:
+
+- the latency of each attempt, and of each call including its retries,
+- the serialized size of requests and responses,
+- the status code of each attempt,
+- the number of attempts in flight.
+
+::
+
+    registry = metrics.MetricsRegistry()
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(metrics=registry)
+    )
+    ...
+    print(registry.to_prometheus())
+
+Without a registry the transports are not instrumented at all. Metrics can
+be forwarded to OpenTelemetry with :class:`OpenTelemetrySink`.
+"""
+import asyncio
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from google.api_core import exceptions as core_exceptions
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import (
+    AsyncForwardingChannel,
+    AsyncForwardingUnaryUnaryMultiCallable,
+    ForwardingCall,
+    ForwardingChannel,
+    ForwardingUnaryUnaryMultiCallable,
+)
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+DEFAULT_SIZE_BUCKETS: Tuple[float, ...] = tuple(float(4**i) for i in range(4, 14))
+
+_OK = "OK"
+
+
+class Histogram:
+    """A cumulative histogram with fixed bucket bounds.
+
+    Args:
+        bounds (Sequence[float]): The inclusive upper bounds of the
+            buckets, in increasing order. Values above the last bound are
+            only counted in :attr:`count` and :attr:`sum`.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.bucket_counts: List[int] = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        if index < len(self.bounds):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[int]:
+        """Returns the number of observations at or below each bound."""
+        counts, total = [], 0
+        for count in self.bucket_counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class RpcStats:
+    """The metrics recorded for one RPC.
+
+    Attributes:
+        attempt_latency (Histogram): Seconds taken by each attempt.
+        call_latency (Histogram): Seconds taken by each call, including
+            retries and the backoff between them.
+        request_bytes (Histogram): Serialized request sizes.
+        response_bytes (Histogram): Serialized response sizes.
+        status_codes (Dict[str, int]): The number of attempts that ended
+            with each status code name, such as ``"OK"``.
+        in_flight (int): The number of attempts currently in flight.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]):
+        self.attempt_latency = Histogram(latency_buckets)
+        self.call_latency = Histogram(latency_buckets)
+        self.request_bytes = Histogram(size_buckets)
+        self.response_bytes = Histogram(size_buckets)
+        self.status_codes: Dict[str, int] = {}
+        self.in_flight = 0
+
+    @property
+    def attempts(self) -> int:
+        return self.attempt_latency.count
+
+    @property
+    def calls(self) -> int:
+        return self.call_latency.count
+
+
+class MetricsSink:
+    """Receives every metric event as it is recorded.
+
+    Subclasses override the methods for the events they are interested
+    in; all of them do nothing by default. Sinks are called synchronously
+    on the calling thread and must not raise.
+    """
+
+    def on_attempt(self, method: str, seconds: float, code: str) -> None:
+        """Called when an attempt finishes."""
+
+    def on_call(self, method: str, seconds: float, code: str) -> None:
+        """Called when a call finishes, after all of its attempts."""
+
+    def on_request_bytes(self, method: str, size: int) -> None:
+        """Called when a request is serialized."""
+
+    def on_response_bytes(self, method: str, size: int) -> None:
+        """Called when a response is deserialized."""
+
+    def on_in_flight(self, method: str, delta: int) -> None:
+        """Called when an attempt starts (``+1``) or finishes (``-1``)."""
+
+
+def method_name(path: str) -> str:
+    """Returns the RPC name of a gRPC method path.
+
+    ``/google.container.v1beta1.ClusterManager/ListClusters`` becomes
+    ``ListClusters``.
+    """
+    return path.rpartition("/")[2] or path
+
+
+def _error_code(exc: BaseException) -> str:
+    if isinstance(exc, grpc.RpcError) and callable(getattr(exc, "code", None)):
+        return exc.code().name
+    if isinstance(exc, core_exceptions.GoogleAPICallError):
+        code = exc.grpc_status_code
+        return code.name if code is not None else "UNKNOWN"
+    if isinstance(exc, core_exceptions.RetryError):
+        return grpc.StatusCode.DEADLINE_EXCEEDED.name
+    return grpc.StatusCode.UNKNOWN.name
+
+
+class MetricsRegistry:
+    """Collects per-RPC metrics recorded by instrumented transports.
+
+    A registry may be shared by several transports; their metrics are
+    merged by RPC name.
+
+    Args:
+        latency_buckets (Sequence[float]): The latency histogram bounds,
+            in seconds.
+        size_buckets (Sequence[float]): The size histogram bounds, in
+            bytes.
+        sinks (Iterable[MetricsSink]): Sinks that receive every event,
+            for example an :class:`OpenTelemetrySink`.
+        clock (Callable[[], float]): The clock used to time calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+        sinks: Iterable[MetricsSink] = (),
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._latency_buckets = tuple(latency_buckets)
+        self._size_buckets = tuple(size_buckets)
+        self._sinks = list(sinks)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: Dict[str, RpcStats] = {}
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        self._sinks.append(sink)
+
+    def _get(self, method: str) -> RpcStats:
+        # Must be called with the lock held.
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = RpcStats(
+                self._latency_buckets, self._size_buckets
+            )
+        return stats
+
+    def stats(self, method: str) -> RpcStats:
+        """Returns the metrics of one RPC, such as ``"ListClusters"``."""
+        with self._lock:
+            return self._get(method)
+
+    def methods(self) -> List[str]:
+        """Returns the names of the RPCs with recorded metrics."""
+        with self._lock:
+            return sorted(self._stats)
+
+    def reset(self) -> None:
+        """Drops every recorded metric, except for in-flight counts."""
+        with self._lock:
+            for method, stats in list(self._stats.items()):
+                fresh = RpcStats(self._latency_buckets, self._size_buckets)
+                fresh.in_flight = stats.in_flight
+                self._stats[method] = fresh
+
+    # Recording.
+
+    def start_attempt(self, method: str) -> float:
+        """Records the start of an attempt and returns its start time."""
+        with self._lock:
+            self._get(method).in_flight += 1
+        for sink in self._sinks:
+            sink.on_in_flight(method, 1)
+        return self._clock()
+
+    def finish_attempt(self, method: str, started: float, code: str) -> None:
+        """Records the end of an attempt started by :meth:`start_attempt`."""
+        seconds = self._clock() - started
+        with self._lock:
+            stats = self._get(method)
+            stats.in_flight -= 1
+            stats.attempt_latency.observe(seconds)
+            stats.status_codes[code] = stats.status_codes.get(code, 0) + 1
+        for sink in self._sinks:
+            sink.on_in_flight(method, -1)
+            sink.on_attempt(method, seconds, code)
+
+    def record_call(self, method: str, seconds: float, code: str) -> None:
+        with self._lock:
+            self._get(method).call_latency.observe(seconds)
+        for sink in self._sinks:
+            sink.on_call(method, seconds, code)
+
+    def record_request_bytes(self, method: str, size: int) -> None:
+        with self._lock:
+            self._get(method).request_bytes.observe(size)
+        for sink in self._sinks:
+            sink.on_request_bytes(method, size)
+
+    def record_response_bytes(self, method: str, size: int) -> None:
+        with self._lock:
+            self._get(method).response_bytes.observe(size)
+        for sink in self._sinks:
+            sink.on_response_bytes(method, size)
+
+    # Instrumentation.
+
+    def instrument_channel(self, channel):
+        """Returns ``channel`` wrapped so that its unary calls are recorded.
+
+        Accepts both :class:`grpc.Channel` and :class:`grpc.aio.Channel`.
+        """
+        if isinstance(channel, aio.Channel):
+            return AsyncInstrumentedChannel(channel, self)
+        return InstrumentedChannel(channel, self)
+
+    def instrument_call(self, method: str, func: Callable) -> Callable:
+        """Returns ``func`` wrapped to record the latency of whole calls."""
+        clock = self._clock
+
+        def instrumented(*args, **kwargs):
+            started = clock()
+            try:
+                response = func(*args, **kwargs)
+            except Exception as exc:
+                self.record_call(method, clock() - started, _error_code(exc))
+                raise
+            self.record_call(method, clock() - started, _OK)
+            return response
+
+        instrumented.__wrapped__ = func  # type: ignore
+        return instrumented
+
+    def instrument_call_async(self, method: str, func: Callable) -> Callable:
+        """Returns the asyncio method ``func`` wrapped like :meth:`instrument_call`.
+
+        Cancelled calls are recorded as ``CANCELLED``.
+        """
+        clock = self._clock
+
+        async def instrumented(*args, **kwargs):
+            started = clock()
+            try:
+                response = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                self.record_call(
+                    method, clock() - started, grpc.StatusCode.CANCELLED.name
+                )
+                raise
+            except Exception as exc:
+                self.record_call(method, clock() - started, _error_code(exc))
+                raise
+            self.record_call(method, clock() - started, _OK)
+            return response
+
+        instrumented.__wrapped__ = func  # type: ignore
+        return instrumented
+
+    def instrument_wrapped_methods(
+        self,
+        wrapped_methods: Dict,
+        instrument_call: Optional[Callable[[str, Callable], Callable]] = None,
+    ) -> Dict:
+        """Instruments a transport's ``_wrapped_methods``.
+
+        Only the methods whose stubs were created on an instrumented
+        channel are wrapped, since their RPC name is known.
+
+        Args:
+            wrapped_methods (Dict): The wrapped methods, by stub.
+            instrument_call (Optional[Callable[[str, Callable], Callable]]):
+                Wraps a method given its RPC name. Defaults to
+                :meth:`instrument_call`.
+        """
+        instrument_call = instrument_call or self.instrument_call
+        instrumented = {}
+        for stub, wrapped in wrapped_methods.items():
+            method = _instrumented_method(stub)
+            instrumented[stub] = (
+                wrapped if method is None else instrument_call(method, wrapped)
+            )
+        return instrumented
+
+    # Export.
+
+    def to_prometheus(self, prefix: str = "container_cluster_manager") -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            items = sorted(self._stats.items())
+            lines: List[str] = []
+
+            def histogram(name, help_text, attribute):
+                lines.append("# HELP {}_{} {}".format(prefix, name, help_text))
+                lines.append("# TYPE {}_{} histogram".format(prefix, name))
+                for method, stats in items:
+                    hist = getattr(stats, attribute)
+                    for bound, count in zip(hist.bounds, hist.cumulative_counts()):
+                        lines.append(
+                            '{}_{}_bucket{{method="{}",le="{}"}} {}'.format(
+                                prefix, name, method, _format(bound), count
+                            )
+                        )
+                    lines.append(
+                        '{}_{}_bucket{{method="{}",le="+Inf"}} {}'.format(
+                            prefix, name, method, hist.count
+                        )
+                    )
+                    lines.append(
+                        '{}_{}_sum{{method="{}"}} {}'.format(
+                            prefix, name, method, _format(hist.sum)
+                        )
+                    )
+                    lines.append(
+                        '{}_{}_count{{method="{}"}} {}'.format(
+                            prefix, name, method, hist.count
+                        )
+                    )
+
+            histogram(
+                "attempt_latency_seconds",
+                "Latency of each RPC attempt.",
+                "attempt_latency",
+            )
+            histogram(
+                "call_latency_seconds",
+                "Latency of each RPC call, including retries.",
+                "call_latency",
+            )
+            histogram("request_bytes", "Serialized request size.", "request_bytes")
+            histogram("response_bytes", "Serialized response size.", "response_bytes")
+
+            lines.append(
+                "# HELP {}_attempts_total RPC attempts by status code.".format(prefix)
+            )
+            lines.append("# TYPE {}_attempts_total counter".format(prefix))
+            for method, stats in items:
+                for code, count in sorted(stats.status_codes.items()):
+                    lines.append(
+                        '{}_attempts_total{{method="{}",code="{}"}} {}'.format(
+                            prefix, method, code, count
+                        )
+                    )
+
+            lines.append(
+                "# HELP {}_in_flight RPC attempts currently in flight.".format(prefix)
+            )
+            lines.append("# TYPE {}_in_flight gauge".format(prefix))
+            for method, stats in items:
+                lines.append(
+                    '{}_in_flight{{method="{}"}} {}'.format(
+                        prefix, method, stats.in_flight
+                    )
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _format(value: float) -> str:
+    return repr(float(value))
+
+
+class OpenTelemetrySink(MetricsSink):
+    """Forwards metric events to OpenTelemetry instruments.
+
+    Args:
+        meter (opentelemetry.metrics.Meter): The meter that creates the
+            instruments, for example
+            ``opentelemetry.metrics.get_meter("google.cloud.container")``.
+        prefix (str): The prefix of the instrument names.
+    """
+
+    def __init__(self, meter: Any, prefix: str = "container.cluster_manager"):
+        self._attempt_latency = meter.create_histogram(
+            prefix + ".attempt.duration",
+            unit="s",
+            description="Latency of each RPC attempt.",
+        )
+        self._call_latency = meter.create_histogram(
+            prefix + ".call.duration",
+            unit="s",
+            description="Latency of each RPC call, including retries.",
+        )
+        self._request_bytes = meter.create_histogram(
+            prefix + ".request.size",
+            unit="By",
+            description="Serialized request size.",
+        )
+        self._response_bytes = meter.create_histogram(
+            prefix + ".response.size",
+            unit="By",
+            description="Serialized response size.",
+        )
+        self._in_flight = meter.create_up_down_counter(
+            prefix + ".attempt.in_flight",
+            unit="{attempt}",
+            description="RPC attempts currently in flight.",
+        )
+
+    def on_attempt(self, method, seconds, code):
+        self._attempt_latency.record(
+            seconds, {"rpc.method": method, "rpc.grpc.status_code": code}
+        )
+
+    def on_call(self, method, seconds, code):
+        self._call_latency.record(
+            seconds, {"rpc.method": method, "rpc.grpc.status_code": code}
+        )
+
+    def on_request_bytes(self, method, size):
+        self._request_bytes.record(size, {"rpc.method": method})
+
+    def on_response_bytes(self, method, size):
+        self._response_bytes.record(size, {"rpc.method": method})
+
+    def on_in_flight(self, method, delta):
+        self._in_flight.add(delta, {"rpc.method": method})
+
+
+def _measured(serializer, record):
+    if serializer is None:
+        serializer = bytes
+
+    def measure(value):
+        data = serializer(value)
+        record(len(data))
+        return data
+
+    return measure
+
+
+def _measured_deserializer(deserializer, record):
+    def measure(data):
+        record(len(data))
+        return deserializer(data) if deserializer is not None else data
+
+    return measure
+
+
+def _instrumented_stub_args(registry, path, request_serializer, response_deserializer):
+    method = method_name(path)
+    serializer = _measured(
+        request_serializer,
+        lambda size: registry.record_request_bytes(method, size),
+    )
+    deserializer = _measured_deserializer(
+        response_deserializer,
+        lambda size: registry.record_response_bytes(method, size),
+    )
+    return method, serializer, deserializer
+
+
+def _instrumented_method(stub) -> Optional[str]:
+    # Look through the stubs of channels that wrap an instrumented channel,
+    # such as a rate limited channel.
+    while stub is not None:
+        if isinstance(
+            stub,
+            (
+                _InstrumentedUnaryUnaryMultiCallable,
+                _AsyncInstrumentedUnaryUnaryMultiCallable,
+            ),
+        ):
+            return stub.method
+        stub = getattr(stub, "__wrapped__", None)
+    return None
+
+
+class _InstrumentedUnaryUnaryMultiCallable(ForwardingUnaryUnaryMultiCallable):
+    def __init__(self, registry: MetricsRegistry, method: str, callable_):
+        super().__init__(callable_)
+        self._registry = registry
+        self.method = method
+
+    def _invoke(self, func, *args, **kwargs):
+        started = self._registry.start_attempt(self.method)
+        try:
+            response = func(*args, **kwargs)
+        except BaseException as exc:
+            self._registry.finish_attempt(self.method, started, _error_code(exc))
+            raise
+        self._registry.finish_attempt(self.method, started, _OK)
+        return response
+
+    def __call__(self, *args, **kwargs):
+        return self._invoke(self.__wrapped__, *args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self._invoke(self.__wrapped__.with_call, *args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        started = self._registry.start_attempt(self.method)
+        try:
+            future = self.__wrapped__.future(*args, **kwargs)
+        except BaseException as exc:
+            self._registry.finish_attempt(self.method, started, _error_code(exc))
+            raise
+
+        def done(future):
+            code = future.code()
+            self._registry.finish_attempt(
+                self.method, started, code.name if code is not None else "UNKNOWN"
+            )
+
+        future.add_done_callback(done)
+        return future
+
+
+class InstrumentedChannel(ForwardingChannel):
+    """A :class:`grpc.Channel` that records the unary calls made through it.
+
+    Args:
+        channel (grpc.Channel): The channel to instrument.
+        registry (MetricsRegistry): Where metrics are recorded.
+    """
+
+    def __init__(self, channel: grpc.Channel, registry: MetricsRegistry):
+        super().__init__(channel)
+        self._registry = registry
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        name, serializer, deserializer = _instrumented_stub_args(
+            self._registry, method, request_serializer, response_deserializer
+        )
+        return _InstrumentedUnaryUnaryMultiCallable(
+            self._registry,
+            name,
+            self.channel.unary_unary(
+                method,
+                request_serializer=serializer,
+                response_deserializer=deserializer,
+                **kwargs,
+            ),
+        )
+
+
+class _InstrumentedCall(ForwardingCall):
+    """Records an asyncio call once its response has been awaited."""
+
+    def __init__(self, call, registry: MetricsRegistry, method: str, started: float):
+        super().__init__(call)
+        self._registry = registry
+        self._method = method
+        self._started = started
+        self._recorded = False
+
+    def _record(self, code: str) -> None:
+        if not self._recorded:
+            self._recorded = True
+            self._registry.finish_attempt(self._method, self._started, code)
+
+    def __await__(self):
+        try:
+            response = yield from self._call.__await__()
+        except BaseException as exc:
+            if isinstance(exc, grpc.RpcError):
+                self._record(_error_code(exc))
+            else:
+                self._record(grpc.StatusCode.CANCELLED.name)
+            raise
+        self._record(_OK)
+        return response
+
+
+class _AsyncInstrumentedUnaryUnaryMultiCallable(AsyncForwardingUnaryUnaryMultiCallable):
+    def __init__(self, registry: MetricsRegistry, method: str, callable_):
+        super().__init__(callable_)
+        self._registry = registry
+        self.method = method
+
+    def __call__(self, *args, **kwargs):
+        started = self._registry.start_attempt(self.method)
+        try:
+            call = self.__wrapped__(*args, **kwargs)
+        except BaseException as exc:
+            self._registry.finish_attempt(self.method, started, _error_code(exc))
+            raise
+        return _InstrumentedCall(call, self._registry, self.method, started)
+
+
+class AsyncInstrumentedChannel(AsyncForwardingChannel):
+    """An :class:`grpc.aio.Channel` that records the unary calls made through it.
+
+    Args:
+        channel (grpc.aio.Channel): The channel to instrument.
+        registry (MetricsRegistry): Where metrics are recorded.
+    """
+
+    def __init__(self, channel: aio.Channel, registry: MetricsRegistry):
+        super().__init__(channel)
+        self._registry = registry
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        name, serializer, deserializer = _instrumented_stub_args(
+            self._registry, method, request_serializer, response_deserializer
+        )
+        return _AsyncInstrumentedUnaryUnaryMultiCallable(
+            self._registry,
+            name,
+            self.channel.unary_unary(
+                method,
+                request_serializer=serializer,
+                response_deserializer=deserializer,
+                **kwargs,
+            ),
+        )
+
+
+__all__ = (
+    "AsyncInstrumentedChannel",
+    "DEFAULT_LATENCY_BUCKETS",
+    "DEFAULT_SIZE_BUCKETS",
+    "Histogram",
+    "InstrumentedChannel",
+    "MetricsRegistry",
+    "MetricsSink",
+    "OpenTelemetrySink",
+    "RpcStats",
+    "method_name",
+)
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pools of gRPC channels that spread calls over several connections.
+
+A single gRPC channel multiplexes every call over one HTTP/2 connection,
+which caps throughput at the server's max-concurrent-streams limit. The
+pools in this module hold several channels and present them as a single
+channel: each stub is built once per underlying channel, and every call
+is dispatched to one of them.
+"""
+import asyncio
+import itertools
+import threading
+from typing import Callable, List, Sequence
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+_STRATEGIES = (ROUND_ROBIN, LEAST_LOADED)
+
+
+class _Balancer:
+    """Chooses a channel index for each call and tracks in-flight calls."""
+
+    def __init__(self, size: int, strategy: str):
+        if size < 1:
+            raise ValueError("A channel pool needs at least one channel.")
+        if strategy not in _STRATEGIES:
+            raise ValueError(
+                "Unknown channel pool strategy {!r}; expected one of {}.".format(
+                    strategy, ", ".join(_STRATEGIES)
+                )
+            )
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._strategy = strategy
+        self.in_flight: List[int] = [0] * size
+
+    def acquire(self) -> int:
+        with self._lock:
+            if self._strategy == LEAST_LOADED:
+                index = min(range(len(self.in_flight)), key=self.in_flight.__getitem__)
+            else:
+                index = next(self._counter) % len(self.in_flight)
+            self.in_flight[index] += 1
+            return index
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self.in_flight[index] -= 1
+
+    def next_index(self) -> int:
+        return next(self._counter) % len(self.in_flight)
+
+
+class _PooledUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, balancer: _Balancer, callables: Sequence[Callable]):
+        self._balancer = balancer
+        self._callables = callables
+
+    def __call__(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index](*args, **kwargs)
+        finally:
+            self._balancer.release(index)
+
+    def with_call(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index].with_call(*args, **kwargs)
+        finally:
+            self._balancer.release(index)
+
+    def future(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            future = self._callables[index].future(*args, **kwargs)
+        except BaseException:
+            self._balancer.release(index)
+            raise
+        future.add_done_callback(lambda _: self._balancer.release(index))
+        return future
+
+
+class ChannelPool(grpc.Channel):
+    """A :class:`grpc.Channel` backed by several channels.
+
+    Unary-unary calls are spread across the channels, either in turn
+    (``"round_robin"``) or to the channel with the fewest calls in flight
+    (``"least_loaded"``). Streaming stubs are pinned to one channel each,
+    assigned in turn.
+
+    Args:
+        channels (Sequence[grpc.Channel]): The channels to pool. The pool
+            takes ownership of them and closes them on :meth:`close`.
+        strategy (str): How unary calls are assigned to channels.
+    """
+
+    def __init__(self, channels: Sequence[grpc.Channel], strategy: str = ROUND_ROBIN):
+        self._channels = list(channels)
+        self._balancer = _Balancer(len(self._channels), strategy)
+
+    @property
+    def channels(self) -> List[grpc.Channel]:
+        """The pooled channels."""
+        return list(self._channels)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """The number of unary calls currently in flight on each channel."""
+        return list(self._balancer.in_flight)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _PooledUnaryUnaryMultiCallable(
+            self._balancer,
+            [
+                channel.unary_unary(method, *args, **kwargs)
+                for channel in self._channels
+            ],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        channel = self._channels[self._balancer.next_index()]
+        return channel.unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        channel = self._channels[self._balancer.next_index()]
+        return channel.stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        channel = self._channels[self._balancer.next_index()]
+        return channel.stream_stream(method, *args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _AsyncPooledUnaryUnaryMultiCallable(aio.UnaryUnaryMultiCallable):
+    def __init__(self, balancer: _Balancer, callables: Sequence[Callable]):
+        self._balancer = balancer
+        self._callables = callables
+
+    def __call__(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            call = self._callables[index](*args, **kwargs)
+        except BaseException:
+            self._balancer.release(index)
+            raise
+        call.add_done_callback(lambda _: self._balancer.release(index))
+        return call
+
+
+class AsyncChannelPool(aio.Channel):
+    """An :class:`grpc.aio.Channel` backed by several channels.
+
+    See :class:`ChannelPool` for how calls are assigned to channels.
+
+    Args:
+        channels (Sequence[grpc.aio.Channel]): The channels to pool. The
+            pool takes ownership of them and closes them on :meth:`close`.
+        strategy (str): How unary calls are assigned to channels.
+    """
+
+    def __init__(self, channels: Sequence[aio.Channel], strategy: str = ROUND_ROBIN):
+        self._channels = list(channels)
+        self._balancer = _Balancer(len(self._channels), strategy)
+
+    @property
+    def channels(self) -> List[aio.Channel]:
+        """The pooled channels."""
+        return list(self._channels)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """The number of unary calls currently in flight on each channel."""
+        return list(self._balancer.in_flight)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _AsyncPooledUnaryUnaryMultiCallable(
+            self._balancer,
+            [
+                channel.unary_unary(method, *args, **kwargs)
+                for channel in self._channels
+            ],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        channel = self._channels[self._balancer.next_index()]
+        return channel.unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        channel = self._channels[self._balancer.next_index()]
+        return channel.stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        channel = self._channels[self._balancer.next_index()]
+        return channel.stream_stream(method, *args, **kwargs)
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        """Returns the least-connected state among the pooled channels."""
+        states = [channel.get_state(try_to_connect) for channel in self._channels]
+        for state in states:
+            if state != grpc.ChannelConnectivity.READY:
+                return state
+        return grpc.ChannelConnectivity.READY
+
+    async def wait_for_state_change(self, last_observed_state):
+        tasks = [
+            asyncio.ensure_future(channel.wait_for_state_change(last_observed_state))
+            for channel in self._channels
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def channel_ready(self):
+        await asyncio.gather(*(channel.channel_ready() for channel in self._channels))
+
+    async def close(self, grace=None):
+        await asyncio.gather(*(channel.close(grace) for channel in self._channels))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+__all__ = (
+    "AsyncChannelPool",
+    "ChannelPool",
+    "LEAST_LOADED",
+    "ROUND_ROBIN",
+)
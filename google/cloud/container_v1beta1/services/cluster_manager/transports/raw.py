@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Responses without proto-plus wrapping.
+
+By default every response is returned as a proto-plus message. Callers
+that only forward or store responses can skip that layer:
+
+- ``"protobuf"`` returns the underlying protobuf message, the same object
+  proto-plus would wrap. Fields are read with the protobuf API.
+- ``"bytes"`` returns the serialized response exactly as received.
+
+Select a format for every call of a transport with its
+``response_format`` argument, or for some calls only with
+:meth:`ClusterManagerClient.with_response_format
+<google.cloud.container_v1beta1.services.cluster_manager.ClusterManagerClient.with_response_format>`.
+:func:`wrap` and :func:`wrap_each` turn raw responses back into proto-plus
+messages when they are needed.
+"""
+from typing import Iterable, Iterator, Type, TypeVar, Union
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+import proto  # type: ignore
+
+from .forwarding import AsyncForwardingChannel, ForwardingChannel
+
+PROTO_PLUS = "proto-plus"
+PROTOBUF = "protobuf"
+BYTES = "bytes"
+
+RESPONSE_FORMATS = (PROTO_PLUS, PROTOBUF, BYTES)
+
+M = TypeVar("M", bound=proto.Message)
+
+
+def check_response_format(response_format: str) -> None:
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(
+            "Unknown response format {!r}; expected one of {}.".format(
+                response_format, ", ".join(RESPONSE_FORMATS)
+            )
+        )
+
+
+def raw_deserializer(deserializer, response_format: str):
+    """Returns the deserializer that produces ``response_format``.
+
+    Args:
+        deserializer (Callable[[bytes], Any]): The deserializer of a stub,
+            such as ``cluster_service.Cluster.deserialize``.
+        response_format (str): One of :data:`RESPONSE_FORMATS`.
+    """
+    if response_format == BYTES:
+        return None
+    if response_format == PROTOBUF:
+        message_type = getattr(deserializer, "__self__", None)
+        if isinstance(message_type, type) and issubclass(message_type, proto.Message):
+            return message_type.pb().FromString
+    return deserializer
+
+
+def wrap(message_type: Type[M], response: Union[M, bytes, object]) -> M:
+    """Returns ``response`` as a proto-plus ``message_type``.
+
+    Protobuf messages are wrapped without copying, so changes made through
+    the wrapper are visible in the protobuf message. Bytes are parsed.
+
+    Args:
+        message_type (Type[proto.Message]): The proto-plus class, for
+            example ``cluster_service.ListClustersResponse``.
+        response (Union[proto.Message, google.protobuf.message.Message, bytes]):
+            A response in any format.
+    """
+    if isinstance(response, message_type):
+        return response
+    if isinstance(response, (bytes, bytearray, memoryview)):
+        return message_type.deserialize(bytes(response))
+    return message_type.wrap(response)
+
+
+def wrap_each(message_type: Type[M], messages: Iterable) -> Iterator[M]:
+    """Wraps raw messages one by one, as they are iterated.
+
+    Useful for the repeated fields of a raw response::
+
+        response = raw_client.list_clusters(parent=parent)
+        for cluster in wrap_each(cluster_service.Cluster, response.clusters):
+            ...
+    """
+    for message in messages:
+        yield wrap(message_type, message)
+
+
+class RawResponseChannel(ForwardingChannel):
+    """A :class:`grpc.Channel` whose unary stubs return raw responses.
+
+    Args:
+        channel (grpc.Channel): The channel to wrap.
+        response_format (str): ``"protobuf"`` or ``"bytes"``.
+    """
+
+    def __init__(self, channel: grpc.Channel, response_format: str):
+        check_response_format(response_format)
+        super().__init__(channel)
+        self.response_format = response_format
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        return self.channel.unary_unary(
+            method,
+            request_serializer=request_serializer,
+            response_deserializer=raw_deserializer(
+                response_deserializer, self.response_format
+            ),
+            **kwargs,
+        )
+
+
+class AsyncRawResponseChannel(AsyncForwardingChannel):
+    """An :class:`grpc.aio.Channel` whose unary stubs return raw responses.
+
+    Args:
+        channel (grpc.aio.Channel): The channel to wrap.
+        response_format (str): ``"protobuf"`` or ``"bytes"``.
+    """
+
+    def __init__(self, channel: aio.Channel, response_format: str):
+        check_response_format(response_format)
+        super().__init__(channel)
+        self.response_format = response_format
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        return self.channel.unary_unary(
+            method,
+            request_serializer=request_serializer,
+            response_deserializer=raw_deserializer(
+                response_deserializer, self.response_format
+            ),
+            **kwargs,
+        )
+
+
+def format_channel(channel, response_format: str):
+    """Returns ``channel`` wrapped to produce ``response_format`` responses.
+
+    Any format wrapper already around ``channel`` is replaced, and the
+    default format returns the unwrapped channel.
+    """
+    check_response_format(response_format)
+    if isinstance(channel, (RawResponseChannel, AsyncRawResponseChannel)):
+        channel = channel.channel
+    if response_format == PROTO_PLUS:
+        return channel
+    if isinstance(channel, aio.Channel):
+        return AsyncRawResponseChannel(channel, response_format)
+    return RawResponseChannel(channel, response_format)
+
+
+__all__ = (
+    "AsyncRawResponseChannel",
+    "BYTES",
+    "PROTOBUF",
+    "PROTO_PLUS",
+    "RESPONSE_FORMATS",
+    "RawResponseChannel",
+    "format_channel",
+    "raw_deserializer",
+    "wrap",
+    "wrap_each",
+)
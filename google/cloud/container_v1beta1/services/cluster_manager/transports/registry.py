@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Channels shared between the transports of many clients.
+
+Every gRPC transport opens its own channel, and with it a connection and
+a TLS handshake. A process that creates a client per tenant or per
+request can share channels instead, by passing a :class:`ChannelRegistry`
+to its clients::
+
+    client = ClusterManagerClient(
+        credentials=tenant_credentials,
+        channel_registry=registry.default_registry(),
+    )
+
+Transports share a channel when they connect to the same host with the
+same credentials and channel options. Credentials are compared by
+identity: two clients share a channel if they are given the same
+credentials object, the same credentials file, or both use the
+application default credentials.
+
+The registry counts the transports that use each channel. Closing a
+transport releases its reference without closing the channel; a channel
+that no transport uses is closed once it has been idle for
+``idle_timeout`` seconds, so that a client created shortly after reuses
+its connection. Idle channels are closed on the next :meth:`acquire
+<ChannelRegistry.acquire>` or release, or by :meth:`evict_idle
+<ChannelRegistry.evict_idle>`.
+"""
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+import grpc  # type: ignore
+
+from .forwarding import ForwardingChannel
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+"""The seconds an unused channel stays open by default."""
+
+
+class _Identity:
+    """Hashes and compares an object by identity, and keeps it alive."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.value is self.value
+
+    def __repr__(self):
+        return "_Identity({!r})".format(self.value)
+
+
+def _hashable(value) -> Hashable:
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(_hashable(item) for item in value)
+    return _Identity(value)
+
+
+def channel_key(
+    host: str,
+    credentials=None,
+    credentials_file: Optional[str] = None,
+    **options,
+) -> Hashable:
+    """Returns the registry key of a channel.
+
+    Args:
+        host (str): The host the channel connects to.
+        credentials (Optional[google.auth.credentials.Credentials]): The
+            credentials given to the transport, compared by identity.
+            None for the application default credentials.
+        credentials_file (Optional[str]): The credentials file given to
+            the transport.
+        options: The other settings the channel is created with. Strings,
+            numbers and sequences of them are compared by value, other
+            objects by identity.
+    """
+    return (
+        host,
+        _hashable(credentials),
+        credentials_file,
+        tuple(sorted((name, _hashable(value)) for name, value in options.items())),
+    )
+
+
+class _Entry:
+    __slots__ = ("channel", "references", "idle_since")
+
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.references = 0
+        self.idle_since: Optional[float] = None
+
+
+class ChannelRegistry:
+    """Reference-counted gRPC channels, shared by key.
+
+    Args:
+        idle_timeout (Optional[float]): The seconds a channel that no
+            transport uses stays open. 0 closes it on its last release;
+            None keeps it open until :meth:`evict_idle` with a timeout or
+            :meth:`close`.
+        clock (Callable[[], float]): Returns the current time, in seconds.
+
+    Raises:
+        ValueError: If ``idle_timeout`` is negative.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError("idle_timeout must not be negative.")
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _Entry] = {}
+
+    def acquire(
+        self, key: Hashable, create: Callable[[], grpc.Channel]
+    ) -> "SharedChannel":
+        """Returns a new reference to the channel of ``key``.
+
+        Args:
+            key (Hashable): The key of the channel; see :func:`channel_key`.
+            create (Callable[[], grpc.Channel]): Creates the channel if
+                the registry has none for ``key``.
+
+        Returns:
+            SharedChannel: The reference. Closing it releases it.
+        """
+        with self._lock:
+            expired = self._pop_expired(self._idle_timeout)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(create())
+            entry.references += 1
+            entry.idle_since = None
+            channel = entry.channel
+        _close_all(expired)
+        return SharedChannel(self, key, channel)
+
+    def _release(self, key: Hashable, channel: grpc.Channel) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.channel is channel:
+                entry.references -= 1
+                if not entry.references:
+                    entry.idle_since = self._clock()
+            expired = self._pop_expired(self._idle_timeout)
+        _close_all(expired)
+
+    def _pop_expired(self, idle_timeout: Optional[float]) -> List[grpc.Channel]:
+        if idle_timeout is None:
+            return []
+        now = self._clock()
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.idle_since is not None and now - entry.idle_since >= idle_timeout
+        ]
+        return [self._entries.pop(key).channel for key in expired]
+
+    def evict_idle(self, idle_timeout: Optional[float] = None) -> int:
+        """Closes the channels that have been unused for ``idle_timeout``.
+
+        Args:
+            idle_timeout (Optional[float]): The seconds a channel must
+                have been unused. Defaults to the registry's timeout.
+
+        Returns:
+            int: The number of channels closed.
+        """
+        if idle_timeout is None:
+            idle_timeout = self._idle_timeout
+        with self._lock:
+            expired = self._pop_expired(idle_timeout)
+        _close_all(expired)
+        return len(expired)
+
+    def references(self, key: Hashable) -> int:
+        """Returns the number of open references to the channel of ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.references if entry is not None else 0
+
+    def __len__(self) -> int:
+        """Returns the number of open channels, used or idle."""
+        with self._lock:
+            return len(self._entries)
+
+    def close(self) -> None:
+        """Closes every channel, including those still in use.
+
+        .. warning::
+             Calls made through the transports that still use a channel
+             fail once it is closed.
+        """
+        with self._lock:
+            channels = [entry.channel for entry in self._entries.values()]
+            self._entries.clear()
+        _close_all(channels)
+
+
+def _close_all(channels: List[grpc.Channel]) -> None:
+    for channel in channels:
+        channel.close()
+
+
+class SharedChannel(ForwardingChannel):
+    """A reference to a channel of a :class:`ChannelRegistry`.
+
+    Calls are sent on the shared channel. :meth:`close` releases the
+    reference, once, and removes the connectivity callbacks subscribed
+    through it; the registry closes the channel when it is unused.
+    """
+
+    def __init__(self, registry: ChannelRegistry, key: Hashable, channel: grpc.Channel):
+        super().__init__(channel)
+        self._registry = registry
+        self._key = key
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable] = []
+        self._released = False
+
+    def subscribe(self, callback, try_to_connect=False):
+        with self._lock:
+            self._callbacks.append(callback)
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+        self.channel.unsubscribe(callback)
+
+    def close(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self.channel.unsubscribe(callback)
+        self._registry._release(self._key, self.channel)
+
+
+_default_registry: Optional[ChannelRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def default_registry() -> ChannelRegistry:
+    """Returns the process-wide registry, with the default idle timeout."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ChannelRegistry()
+        return _default_registry
+
+
+__all__ = (
+    "ChannelRegistry",
+    "DEFAULT_IDLE_TIMEOUT",
+    "SharedChannel",
+    "channel_key",
+    "default_registry",
+)
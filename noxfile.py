@@ -273,6 +273,37 @@ def cover(session):
     session.run("coverage", "erase")
 
 
+@nox.session(python=DEFAULT_PYTHON_VERSION)
+def benchmark(session):
+    """Run the client benchmarks against the in-process fake server.
+
+    Results are saved as JSON under ``.benchmarks/`` so that runs from
+    different releases can be compared, e.g. with
+    ``nox -s benchmark -- --benchmark-compare --benchmark-compare-fail=mean:10%``.
+    """
+    constraints_path = str(
+        CURRENT_DIRECTORY / "testing" / f"constraints-{session.python}.txt"
+    )
+    session.install("mock", "pytest", "pytest-benchmark", "-c", constraints_path)
+    session.install("-e", ".", "-c", constraints_path)
+
+    session.run(
+        "py.test",
+        "--quiet",
+        "--benchmark-only",
+        "--benchmark-autosave",
+        "--benchmark-sort=name",
+        os.path.join("tests", "benchmark"),
+        *session.posargs,
+    )
+    session.run(
+        "python",
+        os.path.join("scripts", "benchmark_import_time.py"),
+        "--output",
+        os.path.join(".benchmarks", "import_time.json"),
+    )
+
+
 @nox.session(python="3.9")
 def docs(session):
     """Build the docs for this library."""
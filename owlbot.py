@@ -31,11 +31,106 @@ default_version = json.load(open(".repo-metadata.json", "rt")).get(
     "default_version"
 )
 
+# Generated files that carry hand-written changes, with the changes each
+# one carries. Regeneration leaves them alone: when the generator output
+# changes, port it into these files by hand and keep the changes listed.
+hand_maintained = {
+    "docs/container_v*/cluster_manager.rst": [
+        "the waiter module",
+        "the poller module",
+        "the cache module",
+        "the transports.metrics module",
+        "the transports.raw module",
+        "the fleet module",
+        "the fake_server module",
+        "the projection module",
+        "the exporter module",
+        "the snapshot module",
+        "the transports.ratelimit module",
+        "the transports.hedging module",
+        "the request_builder module",
+        "the resize module",
+        "the transports.compression module",
+        "the transports.registry module",
+        "the node_pools module",
+    ],
+    "google/cloud/container/__init__.py": [
+        "lazy loading of the package symbols",
+    ],
+    "google/cloud/container_v*/__init__.py": [
+        "lazy loading of the package symbols",
+    ],
+    "google/cloud/container_v*/services/cluster_manager/async_client.py": [
+        "prefetch= on list_usable_subnetworks",
+        "the response_cache argument",
+        "with_response_format",
+        "fields= on list_clusters and get_cluster",
+        "the request_coalescer argument",
+        "requests and routing headers built by request_builder",
+        "the compression argument",
+        "warm_up",
+        "the transport dispatch table",
+        "batch_get_node_pools",
+    ],
+    "google/cloud/container_v*/services/cluster_manager/client.py": [
+        "prefetch= on list_usable_subnetworks",
+        "the response_cache argument",
+        "with_response_format",
+        "fields= on list_clusters and get_cluster",
+        "the request_coalescer argument",
+        "requests and routing headers built by request_builder",
+        "the compression argument",
+        "warm_up",
+        "the transport dispatch table",
+        "the channel_registry argument",
+    ],
+    "google/cloud/container_v*/services/cluster_manager/pagers.py": [
+        "page prefetching in the ListUsableSubnetworks pagers",
+    ],
+    "google/cloud/container_v*/services/cluster_manager/transports/base.py": [
+        "call metrics of the wrapped methods",
+        "with_response_format",
+        "the rate_limiter argument",
+        "the retry budget predicate of the default retries",
+        "_wrap_method, which forwards the call compression",
+        "warm_up",
+        "the dispatch table",
+        "the channel_registry argument",
+    ],
+    "google/cloud/container_v*/services/cluster_manager/transports/grpc.py": [
+        "channel pooling",
+        "the metrics argument",
+        "the response_format argument",
+        "the rate_limiter argument",
+        "the retry_budget and hedging arguments",
+        "the compression argument",
+        "warm_up",
+        "the channel_registry argument",
+    ],
+    "google/cloud/container_v*/services/cluster_manager/transports/grpc_asyncio.py": [
+        "channel pooling",
+        "the metrics argument",
+        "the response_format argument",
+        "the rate_limiter argument",
+        "the retry_budget and hedging arguments",
+        "the compression argument",
+        "warm_up",
+        "the asyncio dispatch table",
+        "call metrics of the async wrapped methods",
+    ],
+    "scripts/fixup_container_v*_keywords.py": [
+        "parallel runs and the result cache",
+    ],
+    "setup.py": [
+        "the parquet extra",
+    ],
+}
+
 for library in s.get_staging_dirs(default_version):
     if clean_up_generated_samples:
         shutil.rmtree("samples/generated_samples", ignore_errors=True)
         clean_up_generated_samples = False
-    s.move([library], excludes=["**/gapic_version.py"])
+    s.move([library], excludes=["**/gapic_version.py", *hand_maintained])
 s.remove_staging_dirs()
 
 # ----------------------------------------------------------------------------
@@ -49,6 +144,45 @@ templated_files = gcp.CommonTemplates().py_library(
 )
 s.move(templated_files, excludes=[".coveragerc", ".github/release-please.yml"])
 
+# Add the `benchmark` session ahead of the templated `docs` session.
+s.replace(
+    "noxfile.py",
+    r"""@nox.session\(python="3.9"\)
+def docs\(session\):""",
+    """@nox.session(python=DEFAULT_PYTHON_VERSION)
+def benchmark(session):
+    \"\"\"Run the client benchmarks against the in-process fake server.
+
+    Results are saved as JSON under ``.benchmarks/`` so that runs from
+    different releases can be compared, e.g. with
+    ``nox -s benchmark -- --benchmark-compare --benchmark-compare-fail=mean:10%``.
+    \"\"\"
+    constraints_path = str(
+        CURRENT_DIRECTORY / "testing" / f"constraints-{session.python}.txt"
+    )
+    session.install("mock", "pytest", "pytest-benchmark", "-c", constraints_path)
+    session.install("-e", ".", "-c", constraints_path)
+
+    session.run(
+        "py.test",
+        "--quiet",
+        "--benchmark-only",
+        "--benchmark-autosave",
+        "--benchmark-sort=name",
+        os.path.join("tests", "benchmark"),
+        *session.posargs,
+    )
+    session.run(
+        "python",
+        os.path.join("scripts", "benchmark_import_time.py"),
+        "--output",
+        os.path.join(".benchmarks", "import_time.json"),
+    )
+
+
+\\g<0>""",
+)
+
 python.py_samples(skip_readmes=True)
 
 # run format session for all directories which have a noxfile
@@ -0,0 +1,116 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures package import time with ``python -X importtime``.
+
+Each module is imported in a fresh interpreter ``--runs`` times and the
+median cumulative import time is reported as JSON, so results from
+different releases can be compared. With ``--max-us`` the script exits
+non-zero when any module exceeds the budget.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Sequence
+
+DEFAULT_MODULES = (
+    "google.cloud.container",
+    "google.cloud.container_v1",
+    "google.cloud.container_v1beta1",
+)
+
+
+def import_time_us(module: str, python: str = sys.executable) -> int:
+    """Returns the cumulative import time of ``module`` in microseconds."""
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", "import {}".format(module)],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:  self [us] | cumulative | name".
+        _, _, fields = line.partition("import time:")
+        parts = [part.strip() for part in fields.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError("{} was not reported by -X importtime.".format(module))
+
+
+def measure(modules: Sequence[str], runs: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for module in modules:
+        samples: List[int] = [import_time_us(module) for _ in range(runs)]
+        results[module] = {
+            "median_us": statistics.median(samples),
+            "min_us": min(samples),
+            "max_us": max(samples),
+            "runs": runs,
+        }
+    return results
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=DEFAULT_MODULES,
+        help="Modules to import (default: the public packages).",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Fresh interpreters per module."
+    )
+    parser.add_argument(
+        "--output", help="Write the JSON results to this file instead of stdout."
+    )
+    parser.add_argument(
+        "--max-us",
+        type=int,
+        help="Fail if any module's median import time exceeds this budget.",
+    )
+    args = parser.parse_args(argv)
+
+    results = measure(args.modules, args.runs)
+    report = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+
+    if args.max_us is not None:
+        over = [
+            module
+            for module, result in results.items()
+            if result["median_us"] > args.max_us
+        ]
+        for module in over:
+            print(
+                "{} took {}us to import (budget {}us)".format(
+                    module, results[module]["median_us"], args.max_us
+                ),
+                file=sys.stderr,
+            )
+        if over:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
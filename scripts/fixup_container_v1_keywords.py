@@ -15,11 +15,16 @@
 # limitations under the License.
 #
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import json
 import os
 import libcst as cst
 import pathlib
+import re
 import sys
-from typing import (Any, Callable, Dict, List, Sequence, Tuple)
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple)
 
 
 def partition(
@@ -116,14 +121,82 @@ cst.Element(value=arg.value)
         )
 
 
+def method_pattern(transformer) -> "re.Pattern":
+    """A pattern matching any API method name the transformer rewrites.
+
+    Sources without a match cannot contain a call to fix, so they are
+    copied as they are instead of being parsed.
+    """
+    names = sorted(transformer.METHOD_TO_PARAMS, key=len, reverse=True)
+    return re.compile(r"\b(?:{})\b".format("|".join(map(re.escape, names))))
+
+
+def cache_version(transformer) -> str:
+    """Identifies the rewrites made by the transformer, for the cache."""
+    params = json.dumps(
+        [transformer.CTRL_PARAMS, sorted(transformer.METHOD_TO_PARAMS.items())]
+    )
+    return hashlib.sha256(params.encode("utf-8")).hexdigest()
+
+
+def fix_source(src: str, *, transformer) -> Optional[str]:
+    """Fix the method calls in a source file.
+
+    Returns the updated source, or None when nothing was changed.
+    """
+    # Parse the code and insert method call fixes.
+    tree = cst.parse_module(src)
+    updated = tree.visit(transformer).code
+    return None if updated == src else updated
+
+
+def _load_cache(cache_path: Optional[pathlib.Path], version: str) -> Dict[str, Any]:
+    if cache_path is None or not cache_path.exists():
+        return {}
+    with open(cache_path, 'r') as f:
+        cache = json.load(f)
+    # Entries made for other method parameters are stale.
+    if cache.get("version") != version:
+        return {}
+    return cache.get("files", {})
+
+
+def _save_cache(cache_path: pathlib.Path, version: str, files: Dict[str, Any]):
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump({"version": version, "files": files}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def _write_file(in_dir: pathlib.Path, out_dir: pathlib.Path, fpath: pathlib.Path, src: str):
+    # Create the path and directory structure for the new file.
+    updated_path = out_dir.joinpath(fpath.relative_to(in_dir))
+    updated_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Generate the updated source file at the corresponding path.
+    with open(updated_path, 'w') as f:
+        f.write(src)
+
+
 def fix_files(
     in_dir: pathlib.Path,
     out_dir: pathlib.Path,
     *,
     transformer=containerCallTransformer(),
+    jobs: Optional[int] = None,
+    cache_path: Optional[pathlib.Path] = None,
 ):
     """Duplicate the input dir to the output dir, fixing file method calls.
 
+    Files are parsed by ``jobs`` worker processes (the number of CPUs by
+    default, no workers for 1). Files that do not mention any API method
+    name are copied without being parsed. Each file is written as soon
+    as it is fixed, so only the files being parsed are held in memory.
+
+    When ``cache_path`` is given, the result for each file is stored in
+    it under the SHA-256 of the file contents, so that later runs only
+    parse new or changed files.
+
     Preconditions:
     * in_dir is a real directory
     * out_dir is a real, empty directory
@@ -134,21 +207,67 @@ def fix_files(
         for f in files if os.path.splitext(f)[1] == ".py"
     )
 
-    for fpath in pyfile_gen:
-        with open(fpath, 'r') as f:
-            src = f.read()
+    pattern = method_pattern(transformer)
+    version = cache_version(transformer)
+    cache = _load_cache(cache_path, version)
+    used = {}
+    write = functools.partial(_write_file, in_dir, out_dir)
+    fix = functools.partial(fix_source, transformer=transformer)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
 
-        # Parse the code and insert method call fixes.
-        tree = cst.parse_module(src)
-        updated = tree.visit(transformer)
+    # The files being fixed, with their source and paths, by digest.
+    # Files with the same contents are only fixed once.
+    pending: Dict[str, Tuple[str, List[pathlib.Path]]] = {}
+    running: Dict[concurrent.futures.Future, str] = {}
+    executor = None
 
-        # Create the path and directory structure for the new file.
-        updated_path = out_dir.joinpath(fpath.relative_to(in_dir))
-        updated_path.parent.mkdir(parents=True, exist_ok=True)
+    def finish(digest: str, updated: Optional[str]):
+        used[digest] = updated
+        src, fpaths = pending.pop(digest)
+        for fpath in fpaths:
+            write(fpath, src if updated is None else updated)
 
-        # Generate the updated source file at the corresponding path.
-        with open(updated_path, 'w') as f:
-            f.write(updated.code)
+    def wait(return_when):
+        done, _ = concurrent.futures.wait(running, return_when=return_when)
+        for future in done:
+            finish(running.pop(future), future.result())
+
+    try:
+        for fpath in pyfile_gen:
+            with open(fpath, 'r') as f:
+                src = f.read()
+            if not pattern.search(src):
+                write(fpath, src)
+                continue
+            digest = hashlib.sha256(src.encode("utf-8")).hexdigest()
+            if digest in pending:
+                pending[digest][1].append(fpath)
+                continue
+            if digest in cache:
+                used[digest] = cache[digest]
+            if digest in used:
+                write(fpath, src if used[digest] is None else used[digest])
+                continue
+            pending[digest] = (src, [fpath])
+            if jobs <= 1:
+                finish(digest, fix(src))
+                continue
+            if executor is None:
+                executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+            # Bound the files held in memory while the workers are busy.
+            if len(running) >= jobs * 4:
+                wait(concurrent.futures.FIRST_COMPLETED)
+            running[executor.submit(fix, src)] = digest
+        if running:
+            wait(concurrent.futures.ALL_COMPLETED)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if cache_path is not None:
+        # Keep only the entries of files that still exist.
+        _save_cache(cache_path, version, used)
 
 
 if __name__ == '__main__':
@@ -181,6 +300,21 @@ Note: This tool operates at a best-effort level at converting positional
         dest='output_dir',
         help='the directory to output files fixed via un-flattening',
     )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=None,
+        dest='jobs',
+        help='the number of processes fixing files (default: the number of CPUs)',
+    )
+    parser.add_argument(
+        '-c',
+        '--cache-file',
+        default=None,
+        dest='cache_file',
+        help='a file caching the fixes by file contents, to speed up reruns',
+    )
     args = parser.parse_args()
     input_dir = pathlib.Path(args.input_dir)
     output_dir = pathlib.Path(args.output_dir)
@@ -205,4 +339,5 @@ Note: This tool operates at a best-effort level at converting positional
         )
         sys.exit(-1)
 
-    fix_files(input_dir, output_dir)
+    cache_path = pathlib.Path(args.cache_file) if args.cache_file else None
+    fix_files(input_dir, output_dir, jobs=args.jobs, cache_path=cache_path)
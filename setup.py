@@ -41,6 +41,9 @@ dependencies = [
     "proto-plus >= 1.22.2, <2.0.0dev; python_version>='3.11'",
     "protobuf>=3.19.5,<5.0.0dev,!=3.20.0,!=3.20.1,!=4.21.0,!=4.21.1,!=4.21.2,!=4.21.3,!=4.21.4,!=4.21.5",
 ]
+extras = {
+    "parquet": ["pyarrow >= 6.0.0"],
+}
 url = "https://github.com/googleapis/python-container"
 
 package_root = os.path.abspath(os.path.dirname(__file__))
@@ -85,6 +88,7 @@ setuptools.setup(
     python_requires=">=3.7",
     namespace_packages=namespaces,
     install_requires=dependencies,
+    extras_require=extras,
     include_package_data=True,
     zip_safe=False,
 )
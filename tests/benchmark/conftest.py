@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Shared fixtures for the client benchmarks.
+
+The benchmarks need pytest-benchmark and run against
+:class:`~google.cloud.container_v1.services.cluster_manager.fake_server.FakeServer`,
+so they never touch the network. Run them with ``nox -s benchmark``.
+"""
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import fake_server
+from google.cloud.container_v1.types import cluster_service
+
+PROJECT = "projects/bench"
+PARENT = PROJECT + "/locations/us-central1"
+CLUSTERS = 50
+SUBNETWORKS = 1000
+
+
+def make_node_pool(index: int) -> cluster_service.NodePool:
+    """Returns a node pool with the fields a production pool usually sets."""
+    return cluster_service.NodePool(
+        name="pool-{:03d}".format(index),
+        initial_node_count=3,
+        locations=["us-central1-a", "us-central1-b", "us-central1-c"],
+        version="1.27.3-gke.100",
+        config=cluster_service.NodeConfig(
+            machine_type="e2-standard-8",
+            disk_size_gb=100,
+            disk_type="pd-balanced",
+            image_type="COS_CONTAINERD",
+            oauth_scopes=[
+                "https://www.googleapis.com/auth/devstorage.read_only",
+                "https://www.googleapis.com/auth/logging.write",
+                "https://www.googleapis.com/auth/monitoring",
+            ],
+            service_account="nodes@bench.iam.gserviceaccount.com",
+            labels={"team": "team-{}".format(index % 7), "env": "prod"},
+            tags=["gke-node", "pool-{}".format(index)],
+            taints=[
+                cluster_service.NodeTaint(
+                    key="dedicated",
+                    value="pool-{}".format(index),
+                    effect=cluster_service.NodeTaint.Effect.NO_SCHEDULE,
+                )
+            ],
+            metadata={"disable-legacy-endpoints": "true"},
+        ),
+        autoscaling=cluster_service.NodePoolAutoscaling(
+            enabled=True, min_node_count=1, max_node_count=10
+        ),
+        management=cluster_service.NodeManagement(auto_upgrade=True, auto_repair=True),
+        instance_group_urls=[
+            "https://www.googleapis.com/compute/v1/projects/bench/zones/"
+            "us-central1-{}/instanceGroupManagers/gke-pool-{}-grp".format(zone, index)
+            for zone in "abc"
+        ],
+        status=cluster_service.NodePool.Status.RUNNING,
+    )
+
+
+def make_cluster(node_pools: int = 300, name: str = "large") -> cluster_service.Cluster:
+    """Returns a realistic cluster with ``node_pools`` node pools."""
+    return cluster_service.Cluster(
+        name=name,
+        description="Benchmark cluster",
+        network="projects/bench/global/networks/default",
+        subnetwork="projects/bench/regions/us-central1/subnetworks/default",
+        locations=["us-central1-a", "us-central1-b", "us-central1-c"],
+        resource_labels={"cost-center": "1234", "env": "prod"},
+        node_pools=[make_node_pool(index) for index in range(node_pools)],
+        logging_service="logging.googleapis.com/kubernetes",
+        monitoring_service="monitoring.googleapis.com/kubernetes",
+        ip_allocation_policy=cluster_service.IPAllocationPolicy(
+            use_ip_aliases=True,
+            cluster_ipv4_cidr_block="10.0.0.0/14",
+            services_ipv4_cidr_block="10.4.0.0/19",
+        ),
+        status=cluster_service.Cluster.Status.RUNNING,
+        current_master_version="1.27.3-gke.100",
+        current_node_version="1.27.3-gke.100",
+    )
+
+
+@pytest.fixture(scope="session")
+def large_cluster():
+    return make_cluster()
+
+
+@pytest.fixture(scope="session")
+def server():
+    servicer = fake_server.FakeClusterManager()
+    for index in range(CLUSTERS):
+        servicer.add_cluster(
+            PARENT, make_cluster(node_pools=3, name="cluster-{}".format(index))
+        )
+    servicer.subnetworks = [
+        cluster_service.UsableSubnetwork(
+            subnetwork="projects/bench/regions/us-central1/subnetworks/s{}".format(i),
+            network="projects/bench/global/networks/default",
+            ip_cidr_range="10.{}.{}.0/24".format(i // 256, i % 256),
+        )
+        for i in range(SUBNETWORKS)
+    ]
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def client(server):
+    return server.client()
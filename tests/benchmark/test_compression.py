@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Bytes on the wire and latency of compressed calls.
+
+The calls go through a TCP proxy that counts the bytes sent each way;
+the counts per call are reported in the ``extra_info`` of each result.
+"""
+import itertools
+import socket
+import threading
+
+import grpc
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import (
+    ClusterManagerClient,
+    fake_server,
+)
+from google.cloud.container_v1.services.cluster_manager.transports import (
+    ClusterManagerGrpcTransport,
+    compression,
+)
+
+from .conftest import CLUSTERS, PARENT, make_cluster
+
+
+class CountingProxy:
+    """Forwards TCP connections to ``target`` and counts their bytes."""
+
+    def __init__(self, target: str):
+        self.sent = 0
+        self.received = 0
+        self._lock = threading.Lock()
+        self._target = target.rsplit(":", 1)
+        self._listener = socket.socket()
+        self._listener.bind(("localhost", 0))
+        self._listener.listen()
+        self.address = "localhost:{}".format(self._listener.getsockname()[1])
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def reset(self):
+        with self._lock:
+            self.sent = self.received = 0
+
+    def _accept(self):
+        while True:
+            try:
+                downstream, _ = self._listener.accept()
+            except OSError:
+                return
+            upstream = socket.create_connection((self._target[0], int(self._target[1])))
+            for sock in (downstream, upstream):
+                # Forward small writes at once, as a direct connection would.
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            for source, sink, attribute in (
+                (downstream, upstream, "sent"),
+                (upstream, downstream, "received"),
+            ):
+                threading.Thread(
+                    target=self._pipe, args=(source, sink, attribute), daemon=True
+                ).start()
+
+    def _pipe(self, source, sink, attribute):
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                with self._lock:
+                    setattr(self, attribute, getattr(self, attribute) + len(data))
+                sink.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (source, sink):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def close(self):
+        self._listener.close()
+
+
+@pytest.fixture(scope="module", params=["uncompressed", "gzip"])
+def responses(request, server):
+    """Yields a proxy to a server that sends responses ``request.param``."""
+    if request.param == "uncompressed":
+        proxy = CountingProxy(server.address)
+        yield request.param, proxy
+    else:
+        with fake_server.FakeServer(
+            server.servicer, compression=grpc.Compression.Gzip
+        ) as compressed:
+            proxy = CountingProxy(compressed.address)
+            yield request.param, proxy
+    proxy.close()
+
+
+def _client(address, transport_compression=None):
+    transport = ClusterManagerGrpcTransport(
+        channel=grpc.insecure_channel(address), compression=transport_compression
+    )
+    return ClusterManagerClient(transport=transport)
+
+
+def _per_call(benchmark, proxy, calls):
+    benchmark.extra_info["bytes_sent_per_call"] = proxy.sent // calls
+    benchmark.extra_info["bytes_received_per_call"] = proxy.received // calls
+
+
+def test_list_clusters_response(benchmark, responses):
+    name, proxy = responses
+    client = _client(proxy.address, compression.AUTO)
+    client.list_clusters(parent=PARENT)  # Connect before counting.
+
+    proxy.reset()
+    calls = 20
+    for _ in range(calls):
+        client.list_clusters(parent=PARENT)
+    _per_call(benchmark, proxy, calls)
+    benchmark.extra_info["responses"] = name
+
+    response = benchmark(client.list_clusters, parent=PARENT)
+    assert len(response.clusters) == CLUSTERS
+
+
+@pytest.fixture
+def create_server():
+    with fake_server.FakeServer() as server:
+        proxy = CountingProxy(server.address)
+        yield proxy
+        proxy.close()
+
+
+@pytest.mark.parametrize(
+    "request_compression", [compression.NONE, compression.GZIP, compression.AUTO]
+)
+def test_create_cluster_request(benchmark, create_server, request_compression):
+    proxy = create_server
+    client = _client(proxy.address, request_compression)
+    cluster = make_cluster(node_pools=30)
+    names = ("cluster-{}".format(index) for index in itertools.count())
+
+    def create():
+        cluster.name = next(names)
+        return client.create_cluster(parent=PARENT, cluster=cluster)
+
+    create()  # Connect before counting.
+    proxy.reset()
+    calls = 20
+    for _ in range(calls):
+        create()
+    _per_call(benchmark, proxy, calls)
+
+    operation = benchmark(create)
+    assert operation.name
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""The per-call cost of finding the wrapped method of an RPC."""
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import ClusterManagerClient
+from google.cloud.container_v1.types import cluster_service
+
+from .conftest import PARENT
+
+
+@pytest.fixture(scope="module")
+def transport():
+    return ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).transport
+
+
+def _lookup_by_stub(transport):
+    # The lookup of the generated client.
+    return transport._wrapped_methods[transport.list_clusters]
+
+
+def _lookup_by_name(transport):
+    return transport._dispatch["list_clusters"]
+
+
+def test_lookup_by_stub(benchmark, transport):
+    assert benchmark(_lookup_by_stub, transport) is _lookup_by_name(transport)
+
+
+def test_lookup_by_name(benchmark, transport):
+    benchmark(_lookup_by_name, transport)
+
+
+def test_list_clusters_dispatch_overhead(benchmark, transport):
+    client = ClusterManagerClient(transport=transport)
+    response = cluster_service.ListClustersResponse()
+    with mock.patch.object(type(transport.list_clusters), "__call__") as call:
+        call.return_value = response
+        benchmark(client.list_clusters, parent=PARENT)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import ClusterManagerClient
+from google.cloud.container_v1.services.cluster_manager.transports import (
+    ClusterManagerGrpcTransport,
+    metrics,
+)
+
+from .conftest import PARENT
+
+
+@pytest.mark.parametrize("instrumented", [False, True])
+def test_get_cluster_metrics_overhead(benchmark, server, instrumented):
+    registry = metrics.MetricsRegistry() if instrumented else None
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(
+            channel=server.channel(), metrics=registry
+        )
+    )
+    benchmark(client.get_cluster, request={"name": PARENT + "/clusters/cluster-0"})
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from .conftest import PROJECT, SUBNETWORKS
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+@pytest.mark.parametrize("page_size", [50, 500])
+def test_list_usable_subnetworks(benchmark, client, page_size, prefetch):
+    def iterate():
+        pager = client.list_usable_subnetworks(
+            request={"parent": PROJECT, "page_size": page_size}, prefetch=prefetch
+        )
+        return sum(1 for _ in pager)
+
+    assert benchmark(iterate) == SUBNETWORKS
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_list_usable_subnetworks_with_latency(benchmark, server, client, prefetch):
+    server.servicer.latency = 0.005
+    try:
+
+        def iterate():
+            pager = client.list_usable_subnetworks(
+                request={"parent": PROJECT, "page_size": 100}, prefetch=prefetch
+            )
+            return sum(1 for _ in pager)
+
+        assert benchmark(iterate) == SUBNETWORKS
+    finally:
+        server.servicer.latency = 0.0
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from .conftest import CLUSTERS, PARENT
+
+DASHBOARD_FIELDS = ["name", "status", "current_master_version", "location"]
+
+
+@pytest.mark.parametrize("fields", [None, DASHBOARD_FIELDS], ids=["full", "dashboard"])
+def test_list_clusters(benchmark, client, fields):
+    response = benchmark(
+        client.list_clusters, request={"parent": PARENT}, fields=fields
+    )
+    assert len(response.clusters) == CLUSTERS
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager.transports import raw
+
+from .conftest import CLUSTERS, PARENT
+
+
+@pytest.mark.parametrize("response_format", raw.RESPONSE_FORMATS)
+def test_list_clusters(benchmark, client, response_format):
+    formatted = client.with_response_format(response_format)
+    response = benchmark(formatted.list_clusters, request={"parent": PARENT})
+    if response_format != raw.BYTES:
+        assert len(response.clusters) == CLUSTERS
+
+
+@pytest.mark.parametrize("response_format", [raw.PROTO_PLUS, raw.PROTOBUF])
+def test_list_clusters_node_pool_names(benchmark, client, response_format):
+    formatted = client.with_response_format(response_format)
+
+    def names():
+        response = formatted.list_clusters(request={"parent": PARENT})
+        return [
+            pool.name for cluster in response.clusters for pool in cluster.node_pools
+        ]
+
+    assert len(benchmark(names)) == CLUSTERS * 3
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import gapic_v1, grpc_helpers_async
+from google.auth import credentials as ga_credentials
+
+from google.cloud.container_v1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    request_builder,
+)
+from google.cloud.container_v1.types import cluster_service
+
+from .conftest import CLUSTERS, PARENT
+
+UPDATE_NODE_POOL = {
+    "name": PARENT + "/clusters/cluster-0/nodePools/pool-000",
+    "node_version": "1.27.4-gke.200",
+    "image_type": "COS_CONTAINERD",
+    "locations": ["us-central1-a", "us-central1-b"],
+    "labels": {"labels": {"team": "a", "env": "prod"}},
+    "taints": {"taints": [{"key": "dedicated", "value": "a", "effect": 1}]},
+}
+
+
+def _stubbed_client():
+    """Returns a client whose stubs answer immediately, without a server."""
+    return ClusterManagerClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def _coerce_request(request, project_id=None, zone=None, parent=None):
+    """The request construction of the generated client, for comparison."""
+    has_flattened_params = any([project_id, zone, parent])
+    if request is not None and has_flattened_params:
+        raise ValueError("request and flattened fields")
+    if not isinstance(request, cluster_service.ListClustersRequest):
+        request = cluster_service.ListClustersRequest(request)
+        if project_id is not None:
+            request.project_id = project_id
+        if zone is not None:
+            request.zone = zone
+        if parent is not None:
+            request.parent = parent
+    metadata = (
+        gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+    )
+    return request, metadata
+
+
+def _build_request(request, project_id=None, zone=None, parent=None):
+    builder = request_builder.BUILDERS["list_clusters"]
+    request = builder.build(request, project_id, zone, parent)
+    return request, (builder.routing_metadata(request),)
+
+
+def test_coerce_flattened_request(benchmark):
+    request, metadata = benchmark(_coerce_request, None, parent=PARENT)
+    assert (request, metadata) == _build_request(None, parent=PARENT)
+
+
+def test_build_flattened_request(benchmark):
+    request, _ = benchmark(_build_request, None, parent=PARENT)
+    assert request.parent == PARENT
+
+
+def test_coerce_dict_request(benchmark):
+    benchmark(_coerce_request, {"parent": PARENT})
+
+
+def test_build_dict_request(benchmark):
+    benchmark(_build_request, {"parent": PARENT})
+
+
+def test_list_clusters_flattened_overhead(benchmark):
+    client = _stubbed_client()
+    response = cluster_service.ListClustersResponse()
+    with mock.patch.object(type(client.transport.list_clusters), "__call__") as call:
+        call.return_value = response
+        benchmark(client.list_clusters, parent=PARENT)
+
+
+def test_list_clusters_request_overhead(benchmark):
+    client = _stubbed_client()
+    request = cluster_service.ListClustersRequest(parent=PARENT)
+    response = cluster_service.ListClustersResponse()
+    with mock.patch.object(type(client.transport.list_clusters), "__call__") as call:
+        call.return_value = response
+        benchmark(client.list_clusters, request=request)
+
+
+def test_update_node_pool_dict_overhead(benchmark):
+    client = _stubbed_client()
+    response = cluster_service.Operation()
+    with mock.patch.object(type(client.transport.update_node_pool), "__call__") as call:
+        call.return_value = response
+        benchmark(client.update_node_pool, request=UPDATE_NODE_POOL)
+
+
+def test_list_clusters_fake_server(benchmark, client):
+    response = benchmark(client.list_clusters, parent=PARENT)
+    assert len(response.clusters) == CLUSTERS
+
+
+def test_update_node_pool_fake_server(benchmark, client):
+    operation = benchmark(client.update_node_pool, request=UPDATE_NODE_POOL)
+    assert operation.name
+
+
+def test_async_list_clusters_flattened_overhead(benchmark):
+    client = ClusterManagerAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    response = cluster_service.ListClustersResponse()
+    loop = asyncio.new_event_loop()
+
+    def call(_, *args, **kwargs):
+        return grpc_helpers_async.FakeUnaryUnaryCall(response)
+
+    with mock.patch.object(type(client.transport.list_clusters), "__call__", call):
+        benchmark(lambda: loop.run_until_complete(client.list_clusters(parent=PARENT)))
+    loop.close()
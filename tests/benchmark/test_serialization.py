@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.cloud.container_v1.types import cluster_service
+
+from .conftest import make_cluster
+
+
+@pytest.fixture(scope="module")
+def payload(large_cluster):
+    return cluster_service.Cluster.serialize(large_cluster)
+
+
+def test_cluster_serialize(benchmark, large_cluster):
+    benchmark.extra_info["node_pools"] = len(large_cluster.node_pools)
+    data = benchmark(cluster_service.Cluster.serialize, large_cluster)
+    benchmark.extra_info["bytes"] = len(data)
+
+
+def test_cluster_deserialize(benchmark, payload):
+    cluster = benchmark(cluster_service.Cluster.deserialize, payload)
+    assert len(cluster.node_pools) == 300
+
+
+def test_cluster_construct(benchmark):
+    cluster = benchmark(make_cluster)
+    assert len(cluster.node_pools) == 300
+
+
+def test_node_pool_field_access(benchmark, large_cluster):
+    def count_nodes():
+        return sum(pool.initial_node_count for pool in large_cluster.node_pools)
+
+    assert benchmark(count_nodes) == 900
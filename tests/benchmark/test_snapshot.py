@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import snapshot
+from google.cloud.container_v1.types import cluster_service
+
+from .conftest import PROJECT, make_cluster
+
+FLEET = 200
+PARENT = PROJECT + "/locations/-"
+
+
+@pytest.fixture(scope="module")
+def fleet():
+    clusters = []
+    for index in range(FLEET):
+        cluster = make_cluster(node_pools=20, name="cluster-{}".format(index))
+        cluster.location = "us-central1"
+        cluster.etag = "1"
+        clusters.append(cluster_service.Cluster.pb(cluster))
+    return clusters
+
+
+@pytest.mark.parametrize("changed", [0, 10, FLEET])
+def test_snapshot_update(benchmark, fleet, changed):
+    polled = []
+    for index, cluster in enumerate(fleet):
+        if index < changed:
+            cluster = type(cluster).FromString(cluster.SerializeToString())
+            cluster.etag = "2"
+            cluster.current_node_count += 1
+        polled.append(cluster)
+
+    def setup():
+        store = snapshot.SnapshotStore()
+        store.update(PARENT, fleet)
+        return (store,), {}
+
+    events = benchmark.pedantic(
+        lambda store: store.update(PARENT, polled), setup=setup, rounds=20
+    )
+    assert len(events) == changed
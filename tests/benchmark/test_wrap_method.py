@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+
+RETRY = retries.Retry(
+    initial=0.1,
+    maximum=60.0,
+    multiplier=1.3,
+    predicate=retries.if_exception_type(
+        core_exceptions.DeadlineExceeded,
+        core_exceptions.ServiceUnavailable,
+    ),
+    deadline=20.0,
+)
+
+
+def _rpc(request, timeout=None, metadata=None):
+    return request
+
+
+def test_raw_call(benchmark):
+    benchmark(_rpc, "request", timeout=20.0, metadata=())
+
+
+def test_wrap_method(benchmark):
+    benchmark(
+        gapic_v1.method.wrap_method,
+        _rpc,
+        default_retry=RETRY,
+        default_timeout=20.0,
+        client_info=gapic_v1.client_info.DEFAULT_CLIENT_INFO,
+    )
+
+
+def test_wrapped_call(benchmark):
+    wrapped = gapic_v1.method.wrap_method(
+        _rpc,
+        default_retry=RETRY,
+        default_timeout=20.0,
+        client_info=gapic_v1.client_info.DEFAULT_CLIENT_INFO,
+    )
+    assert benchmark(wrapped, "request", metadata=()) == "request"
+
+
+def test_wrapped_call_without_retry(benchmark):
+    wrapped = gapic_v1.method.wrap_method(
+        _rpc,
+        default_retry=RETRY,
+        default_timeout=20.0,
+        client_info=gapic_v1.client_info.DEFAULT_CLIENT_INFO,
+    )
+    benchmark(wrapped, "request", retry=None, timeout=None, metadata=())
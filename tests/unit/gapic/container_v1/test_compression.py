@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    fake_server,
+)
+from google.cloud.container_v1.services.cluster_manager.transports import (
+    ClusterManagerGrpcAsyncIOTransport,
+    ClusterManagerGrpcTransport,
+    compression,
+)
+from google.cloud.container_v1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+# Large enough for "auto" to compress.
+BIG_CLUSTER = cluster_service.Cluster(
+    name="big", description="x" * compression.DEFAULT_MIN_SIZE
+)
+
+ENCODINGS = {
+    grpc.Compression.NoCompression: "identity",
+    grpc.Compression.Deflate: "deflate",
+    grpc.Compression.Gzip: "gzip",
+}
+
+# gRPC asyncio turns the compression argument of a call into this entry
+# before it runs the interceptors.
+ENCODING_REQUEST_KEY = "grpc-internal-encoding-request"
+
+
+def _compression(client_call_details):
+    # Returns the RPC and the algorithm its request is compressed with.
+    method = client_call_details.method
+    if isinstance(method, bytes):
+        method = method.decode()
+    encodings = [
+        value
+        for key, value in client_call_details.metadata or ()
+        if key == ENCODING_REQUEST_KEY
+    ]
+    compression_algorithm = getattr(client_call_details, "compression", None)
+    if encodings:
+        (compression_algorithm,) = encodings
+    elif compression_algorithm is not None:
+        compression_algorithm = ENCODINGS[compression_algorithm]
+    return method.rsplit("/", 1)[1], compression_algorithm
+
+
+class RecordCompression(grpc.UnaryUnaryClientInterceptor):
+    def __init__(self):
+        self.calls = []
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        self.calls.append(_compression(client_call_details))
+        return continuation(client_call_details, request)
+
+
+class AsyncRecordCompression(aio.UnaryUnaryClientInterceptor):
+    def __init__(self):
+        self.calls = []
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        self.calls.append(_compression(client_call_details))
+        return await continuation(client_call_details, request)
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+        yield server
+
+
+def _client(server, transport_compression=None, **kwargs):
+    recorder = RecordCompression()
+    channel = grpc.intercept_channel(server.channel(), recorder)
+    transport = ClusterManagerGrpcTransport(
+        channel=channel, compression=transport_compression
+    )
+    return ClusterManagerClient(transport=transport, **kwargs), recorder
+
+
+def test_algorithm():
+    assert compression.algorithm(None) is None
+    assert compression.algorithm("gzip") == grpc.Compression.Gzip
+    assert compression.algorithm("deflate") == grpc.Compression.Deflate
+    assert compression.algorithm("none") == grpc.Compression.NoCompression
+    assert compression.algorithm(grpc.Compression.Gzip) == grpc.Compression.Gzip
+
+    small = cluster_service.GetClusterRequest(name=CLUSTER)
+    big = cluster_service.CreateClusterRequest(parent=PARENT, cluster=BIG_CLUSTER)
+    assert compression.algorithm("auto", small) == grpc.Compression.NoCompression
+    assert compression.algorithm("auto", big) == grpc.Compression.Gzip
+    assert compression.algorithm("auto", cluster_service.CreateClusterRequest.pb(big))
+    assert compression.algorithm("auto", b"x" * 10, min_size=10)
+
+    with pytest.raises(ValueError):
+        compression.algorithm("brotli")
+    with pytest.raises(ValueError):
+        ClusterManagerGrpcTransport(channel=grpc.insecure_channel("x"), compression=1)
+    with pytest.raises(ValueError):
+        ClusterManagerClient(
+            transport=ClusterManagerGrpcTransport(channel=grpc.insecure_channel("x")),
+            compression="zstd",
+        )
+
+
+def test_compression_is_a_stub_argument(server):
+    client, _ = _client(server, compression="gzip")
+    stub = client.transport.get_cluster
+    with mock.patch.object(type(stub), "__call__") as call:
+        call.return_value = cluster_service.Cluster(name="c")
+        client.get_cluster(name=CLUSTER)
+        client.get_cluster(name=CLUSTER, compression="none")
+
+    first, second = call.call_args_list
+    assert first.kwargs["compression"] == grpc.Compression.Gzip
+    assert second.kwargs["compression"] == grpc.Compression.NoCompression
+    assert all(key != ENCODING_REQUEST_KEY for key, _ in first.kwargs["metadata"])
+
+
+def test_settings_precedence(server):
+    client, recorder = _client(server)
+    client.get_cluster(name=CLUSTER)
+    client.get_cluster(name=CLUSTER, compression="gzip")
+    assert recorder.calls == [
+        ("GetCluster", None),
+        ("GetCluster", "gzip"),
+    ]
+
+    client, recorder = _client(server, "deflate", compression="none")
+    client.get_cluster(name=CLUSTER)
+    client.get_cluster(name=CLUSTER, compression=grpc.Compression.Gzip)
+    assert recorder.calls == [
+        ("GetCluster", "identity"),
+        ("GetCluster", "gzip"),
+    ]
+
+    client, recorder = _client(server, "deflate")
+    client.list_clusters(parent=PARENT)
+    assert recorder.calls == [("ListClusters", "deflate")]
+
+
+def test_auto(server):
+    client, recorder = _client(server, "auto")
+    client.create_cluster(parent=PARENT, cluster=BIG_CLUSTER)
+    client.create_cluster(parent=PARENT, cluster=cluster_service.Cluster(name="small"))
+    response = client.list_clusters(parent=PARENT)
+
+    assert recorder.calls == [
+        ("CreateCluster", "gzip"),
+        ("CreateCluster", "identity"),
+        ("ListClusters", "identity"),
+    ]
+    # The compressed request and responses arrive intact.
+    created = server.servicer.clusters()[PARENT + "/clusters/big"]
+    assert created.description == BIG_CLUSTER.description
+    assert {cluster.name for cluster in response.clusters} == {"c", "big", "small"}
+
+
+@pytest.mark.asyncio
+async def test_async_client(server):
+    recorder = AsyncRecordCompression()
+    transport = ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel(server.address, interceptors=[recorder]),
+        compression="auto",
+    )
+    client = ClusterManagerAsyncClient(transport=transport)
+    await client.create_cluster(parent=PARENT, cluster=BIG_CLUSTER)
+    cluster = await client.get_cluster(name=CLUSTER, compression="deflate")
+
+    assert cluster.name == "c"
+    assert recorder.calls == [
+        ("CreateCluster", "gzip"),
+        ("GetCluster", "deflate"),
+    ]
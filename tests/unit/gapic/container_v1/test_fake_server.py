@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.api_core import exceptions as core_exceptions
+import grpc
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import fake_server, waiter
+from google.cloud.container_v1.services.cluster_manager.transports import pool
+from google.cloud.container_v1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+        yield server
+
+
+def test_list_and_get(server):
+    server.servicer.add_cluster(
+        "projects/p/locations/europe-west1", cluster_service.Cluster(name="d")
+    )
+    server.servicer.add_cluster(
+        "projects/other/locations/us-central1", cluster_service.Cluster(name="e")
+    )
+    client = server.client()
+
+    response = client.list_clusters(request={"parent": "projects/p/locations/-"})
+    assert [cluster.name for cluster in response.clusters] == ["d", "c"]
+    response = client.list_clusters(request={"parent": PARENT})
+    assert [cluster.name for cluster in response.clusters] == ["c"]
+
+    cluster = client.get_cluster(request={"name": CLUSTER})
+    assert cluster.status == cluster_service.Cluster.Status.RUNNING
+    assert cluster.location == "us-central1"
+    assert cluster.etag
+    assert [pool.name for pool in cluster.node_pools] == ["default-pool"]
+
+    # The deprecated project / zone fields address the same resources.
+    cluster = client.get_cluster(
+        request={"project_id": "p", "zone": "us-central1", "cluster_id": "c"}
+    )
+    assert cluster.name == "c"
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_cluster(request={"name": PARENT + "/clusters/missing"})
+
+
+def test_operation_progression():
+    now = [0.0]
+    servicer = fake_server.FakeClusterManager(
+        operation_duration=10.0, clock=lambda: now[0]
+    )
+    servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+    with fake_server.FakeServer(servicer) as server:
+        client = server.client()
+        operation = client.create_cluster(
+            request={"parent": PARENT, "cluster": {"name": "new"}}
+        )
+        assert operation.status == cluster_service.Operation.Status.RUNNING
+        assert operation.operation_type == (
+            cluster_service.Operation.Type.CREATE_CLUSTER
+        )
+        assert client.get_cluster(
+            request={"name": PARENT + "/clusters/new"}
+        ).status == (cluster_service.Cluster.Status.PROVISIONING)
+
+        now[0] = 5.0
+        name = waiter.operation_path(operation)
+        operation = client.get_operation(request={"name": name})
+        assert waiter.operation_progress(operation) == 0.5
+
+        now[0] = 10.0
+        response = client.list_operations(request={"parent": "projects/p/locations/-"})
+        assert [op.status for op in response.operations] == [
+            cluster_service.Operation.Status.DONE
+        ]
+        assert client.get_cluster(
+            request={"name": PARENT + "/clusters/new"}
+        ).status == (cluster_service.Cluster.Status.RUNNING)
+
+
+def test_mutations(server):
+    client = server.client()
+    node_pool = CLUSTER + "/nodePools/default-pool"
+
+    operation = client.set_node_pool_size(request={"name": node_pool, "node_count": 7})
+    waiter.wait_for_operation(client, operation, deadline=5)
+    assert client.get_node_pool(request={"name": node_pool}).initial_node_count == 7
+    assert client.get_cluster(request={"name": CLUSTER}).current_node_count == 7
+
+    operation = client.create_node_pool(
+        request={"parent": CLUSTER, "node_pool": {"name": "extra"}}
+    )
+    waiter.wait_for_operation(client, operation, deadline=5)
+    assert [
+        pool.name
+        for pool in client.list_node_pools(request={"parent": CLUSTER}).node_pools
+    ] == [
+        "default-pool",
+        "extra",
+    ]
+
+    fingerprint = client.get_cluster(request={"name": CLUSTER}).label_fingerprint
+    operation = client.set_labels(
+        request={
+            "name": CLUSTER,
+            "resource_labels": {"team": "a"},
+            "label_fingerprint": fingerprint,
+        }
+    )
+    waiter.wait_for_operation(client, operation, deadline=5)
+    assert client.get_cluster(request={"name": CLUSTER}).resource_labels == {
+        "team": "a"
+    }
+    with pytest.raises(core_exceptions.FailedPrecondition):
+        client.set_labels(request={"name": CLUSTER, "label_fingerprint": fingerprint})
+
+    before = client.get_cluster(request={"name": CLUSTER}).etag
+    operation = client.set_legacy_abac(request={"name": CLUSTER, "enabled": True})
+    waiter.wait_for_operation(client, operation, deadline=5)
+    assert client.get_cluster(request={"name": CLUSTER}).etag != before
+
+    operation = client.delete_cluster(request={"name": CLUSTER})
+    waiter.wait_for_operation(client, operation, deadline=5)
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_cluster(request={"name": CLUSTER})
+
+
+def test_cancel_operation():
+    servicer = fake_server.FakeClusterManager(operation_duration=60.0)
+    servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+    with fake_server.FakeServer(servicer) as server:
+        client = server.client()
+        operation = client.delete_cluster(request={"name": CLUSTER})
+        name = waiter.operation_path(operation)
+        client.cancel_operation(request={"name": name})
+
+        operation = client.get_operation(request={"name": name})
+        assert operation.status == cluster_service.Operation.Status.DONE
+        assert isinstance(
+            waiter.operation_exception(operation), core_exceptions.Cancelled
+        )
+        assert client.get_cluster(request={"name": CLUSTER}).status == (
+            cluster_service.Cluster.Status.STOPPING
+        )
+
+
+def test_inject_error(server):
+    client = server.client()
+    server.servicer.inject_error(
+        "GetCluster", grpc.StatusCode.PERMISSION_DENIED, count=2
+    )
+
+    for _ in range(2):
+        with pytest.raises(core_exceptions.PermissionDenied):
+            client.get_cluster(request={"name": CLUSTER})
+    client.get_cluster(request={"name": CLUSTER})
+    assert server.servicer.calls["GetCluster"] == 3
+
+    server.servicer.inject_error("*", grpc.StatusCode.INTERNAL)
+    with pytest.raises(core_exceptions.InternalServerError):
+        client.get_server_config(request={"name": PARENT})
+
+
+def test_error_rate():
+    servicer = fake_server.FakeClusterManager(
+        error_rate=1.0, error_code=grpc.StatusCode.RESOURCE_EXHAUSTED
+    )
+    with fake_server.FakeServer(servicer) as server:
+        with pytest.raises(core_exceptions.ResourceExhausted):
+            server.client().list_clusters(request={"parent": PARENT})
+
+
+def test_inject_operation_error(server):
+    client = server.client()
+    server.servicer.inject_operation_error(
+        "DeleteCluster", grpc.StatusCode.FAILED_PRECONDITION, "in use"
+    )
+
+    operation = client.delete_cluster(request={"name": CLUSTER})
+    with pytest.raises(core_exceptions.FailedPrecondition):
+        waiter.wait_for_operation(client, operation, deadline=5)
+    assert client.get_cluster(request={"name": CLUSTER}).name == "c"
+
+
+def test_latency():
+    latencies = []
+
+    def latency(method):
+        latencies.append(method)
+        return 0.001
+
+    with fake_server.FakeServer(
+        fake_server.FakeClusterManager(latency=latency)
+    ) as server:
+        server.client().get_json_web_keys(request={"parent": PARENT})
+    assert latencies == ["GetJSONWebKeys"]
+
+
+def test_usable_subnetworks_pages(server):
+    server.servicer.subnetworks = [
+        cluster_service.UsableSubnetwork(subnetwork="s{}".format(i)) for i in range(5)
+    ]
+    pager = server.client().list_usable_subnetworks(
+        request={"parent": "projects/p", "page_size": 2}
+    )
+    assert [subnetwork.subnetwork for subnetwork in pager] == [
+        "s0",
+        "s1",
+        "s2",
+        "s3",
+        "s4",
+    ]
+    assert server.servicer.calls["ListUsableSubnetworks"] == 3
+
+
+def test_channel_pool(server):
+    channels = pool.ChannelPool([server.channel() for _ in range(3)])
+    client = server.client(channel=channels)
+
+    for _ in range(6):
+        client.get_cluster(request={"name": CLUSTER})
+    assert server.servicer.calls["GetCluster"] == 6
+    assert channels.in_flight == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_async_client(server):
+    client = server.async_client()
+
+    response = await client.list_clusters(request={"parent": "projects/p/locations/-"})
+    assert [cluster.name for cluster in response.clusters] == ["c"]
+    operation = await client.delete_cluster(request={"name": CLUSTER})
+    await waiter.wait_for_operation_async(client, operation, deadline=5)
+    with pytest.raises(core_exceptions.NotFound):
+        await client.get_cluster(request={"name": CLUSTER})
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from collections import Counter
+import threading
+import time
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    fleet,
+)
+from google.cloud.container_v1.types import cluster_service
+
+PARENTS = [
+    "projects/{}/locations/{}".format(project, location)
+    for project in ("a", "b", "c")
+    for location in ("us-central1", "europe-west1", "asia-east1", "-")
+]
+
+
+def test_project_of():
+    assert fleet.project_of("projects/p/locations/-") == "p"
+    assert fleet.project_of("projects/p/locations/l/clusters/c") == "p"
+    assert fleet.project_of("other") == "other"
+
+
+class _Tracker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = Counter()
+        self.peak_total = 0
+        self.peak_project = 0
+
+    def enter(self, parent):
+        with self._lock:
+            self._running[fleet.project_of(parent)] += 1
+            self.peak_total = max(self.peak_total, sum(self._running.values()))
+            self.peak_project = max(self.peak_project, max(self._running.values()))
+
+    def exit(self, parent):
+        with self._lock:
+            self._running[fleet.project_of(parent)] -= 1
+
+
+def test_fan_out_limits():
+    tracker = _Tracker()
+
+    def call(parent):
+        tracker.enter(parent)
+        time.sleep(0.01)
+        tracker.exit(parent)
+        if parent.startswith("projects/b/locations/-"):
+            raise core_exceptions.PermissionDenied("denied")
+        return parent
+
+    results = list(fleet.fan_out(call, PARENTS, max_workers=4, per_project_limit=2))
+
+    assert sorted(result.parent for result in results) == sorted(PARENTS)
+    assert tracker.peak_total <= 4
+    assert tracker.peak_project <= 2
+    errors = [result for result in results if result.error is not None]
+    assert [result.parent for result in errors] == ["projects/b/locations/-"]
+    assert errors[0].response is None
+    assert isinstance(errors[0].error, core_exceptions.PermissionDenied)
+
+
+def test_fan_out_invalid_limits():
+    with pytest.raises(ValueError):
+        list(fleet.fan_out(lambda parent: parent, PARENTS, max_workers=0))
+    with pytest.raises(ValueError):
+        list(fleet.fan_out(lambda parent: parent, PARENTS, per_project_limit=0))
+
+
+def test_fan_out_close_cancels_pending():
+    calls = []
+
+    def call(parent):
+        calls.append(parent)
+        return parent
+
+    results = fleet.fan_out(call, PARENTS, max_workers=1)
+    next(results)
+    results.close()
+    assert len(calls) < len(PARENTS)
+
+
+def test_list_clusters():
+    client = ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+
+    def list_clusters(request, **kwargs):
+        if request.parent.startswith("projects/c/"):
+            raise core_exceptions.NotFound("no such project")
+        return cluster_service.ListClustersResponse(
+            clusters=[cluster_service.Cluster(name=request.parent)],
+            missing_zones=["us-central1-a"] if request.parent.endswith("/-") else [],
+        )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_clusters), "__call__") as call:
+        call.side_effect = list_clusters
+        results = {
+            result.parent: result
+            for result in fleet.list_clusters(client, PARENTS, metadata=(("k", "v"),))
+        }
+
+    assert set(results) == set(PARENTS)
+    assert results["projects/a/locations/-"].missing_zones == ("us-central1-a",)
+    assert results["projects/a/locations/us-central1"].missing_zones == ()
+    assert results["projects/a/locations/us-central1"].response.clusters[0].name == (
+        "projects/a/locations/us-central1"
+    )
+    assert isinstance(results["projects/c/locations/-"].error, core_exceptions.NotFound)
+    assert results["projects/c/locations/-"].missing_zones == ()
+    _, _, kw = call.mock_calls[0]
+    assert ("k", "v") in kw["metadata"]
+
+
+def test_get_clusters():
+    client = ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    names = ["projects/a/locations/l/clusters/{}".format(i) for i in range(5)]
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.get_cluster), "__call__") as call:
+        call.side_effect = lambda request, **kwargs: cluster_service.Cluster(
+            name=request.name
+        )
+        results = list(fleet.get_clusters(client, names, per_project_limit=2))
+
+    assert sorted(result.response.name for result in results) == names
+
+
+@pytest.mark.asyncio
+async def test_fan_out_async_limits():
+    tracker = _Tracker()
+
+    async def call(parent):
+        tracker.enter(parent)
+        await asyncio.sleep(0.01)
+        tracker.exit(parent)
+        if parent == "projects/a/locations/-":
+            raise core_exceptions.PermissionDenied("denied")
+        return parent
+
+    results = [
+        result
+        async for result in fleet.fan_out_async(
+            call, PARENTS, max_concurrency=5, per_project_limit=2
+        )
+    ]
+
+    assert sorted(result.parent for result in results) == sorted(PARENTS)
+    assert tracker.peak_total <= 5
+    assert tracker.peak_project == 2
+    errors = [result.parent for result in results if result.error is not None]
+    assert errors == ["projects/a/locations/-"]
+
+
+@pytest.mark.asyncio
+async def test_list_clusters_async():
+    client = ClusterManagerAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_clusters), "__call__") as call:
+        call.side_effect = (
+            lambda request, **kwargs: grpc_helpers_async.FakeUnaryUnaryCall(
+                cluster_service.ListClustersResponse(missing_zones=[request.parent])
+            )
+        )
+        results = [
+            result
+            async for result in fleet.list_clusters_async(
+                client, PARENTS, per_project_limit=1
+            )
+        ]
+
+    assert sorted(result.parent for result in results) == sorted(PARENTS)
+    for result in results:
+        assert result.error is None
+        assert result.missing_zones == (result.parent,)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import copy
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager.transports import forwarding
+
+METHOD = "/google.container.v1.ClusterManager/GetCluster"
+
+
+class _Timeout(forwarding.ForwardingUnaryUnaryMultiCallable):
+    def _prepare(self, request, kwargs):
+        kwargs.setdefault("timeout", 5.0)
+        return kwargs
+
+
+def test_forwarding_channel():
+    channel = mock.Mock()
+    forwarded = forwarding.ForwardingChannel(channel)
+
+    for name in ("unary_unary", "unary_stream", "stream_unary", "stream_stream"):
+        assert getattr(forwarded, name)(METHOD) is getattr(channel, name).return_value
+        getattr(channel, name).assert_called_once_with(METHOD)
+    forwarded.subscribe(print, try_to_connect=True)
+    channel.subscribe.assert_called_once_with(print, try_to_connect=True)
+    forwarded.unsubscribe(print)
+    channel.unsubscribe.assert_called_once_with(print)
+    with forwarded as entered:
+        assert entered is forwarded
+    channel.close.assert_called_once_with()
+
+    # Attributes the wrapper lacks come from the wrapped channel.
+    assert forwarded.channels is channel.channels
+
+
+def test_forwarding_channel_copy():
+    forwarded = copy.copy(forwarding.ForwardingChannel(mock.Mock()))
+    assert isinstance(forwarded.channel, mock.Mock)
+
+
+@pytest.mark.asyncio
+async def test_async_forwarding_channel():
+    channel = mock.Mock()
+    channel.wait_for_state_change = mock.AsyncMock(return_value="changed")
+    channel.channel_ready = mock.AsyncMock()
+    channel.close = mock.AsyncMock()
+    forwarded = forwarding.AsyncForwardingChannel(channel)
+
+    assert forwarded.unary_unary(METHOD) is channel.unary_unary.return_value
+    assert forwarded.get_state(True) is channel.get_state.return_value
+    channel.get_state.assert_called_once_with(True)
+    assert await forwarded.wait_for_state_change("idle") == "changed"
+    await forwarded.channel_ready()
+    channel.channel_ready.assert_awaited_once_with()
+    async with forwarded as entered:
+        assert entered is forwarded
+    channel.close.assert_awaited_once_with(None)
+
+
+def test_forwarding_stub_prepare():
+    stub = mock.Mock()
+    forwarded = _Timeout(stub)
+
+    assert forwarded("request") is stub.return_value
+    stub.assert_called_once_with("request", timeout=5.0)
+    forwarded.with_call("request", timeout=1.0)
+    stub.with_call.assert_called_once_with("request", timeout=1.0)
+    forwarded.future("request", metadata=())
+    stub.future.assert_called_once_with("request", metadata=(), timeout=5.0)
+
+
+@pytest.mark.asyncio
+async def test_forwarding_call():
+    call = mock.Mock()
+    call.code = mock.AsyncMock(return_value="OK")
+    forwarded = forwarding.ForwardingCall(call)
+
+    assert await forwarded.code() == "OK"
+    assert forwarded.done() is call.done.return_value
+    forwarded.cancel()
+    call.cancel.assert_called_once_with()
+    forwarded.add_done_callback(print)
+    call.add_done_callback.assert_called_once_with(print)
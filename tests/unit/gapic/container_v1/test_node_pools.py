@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import fake_server, node_pools
+from google.cloud.container_v1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+
+
+def _pool(cluster, pool):
+    return "{}/clusters/{}/nodePools/{}".format(PARENT, cluster, pool)
+
+
+def _cluster(cluster):
+    return "{}/clusters/{}".format(PARENT, cluster)
+
+
+@pytest.fixture
+def server():
+    servicer = fake_server.FakeClusterManager()
+    for cluster in ("a", "b", "c"):
+        servicer.add_cluster(
+            PARENT,
+            cluster_service.Cluster(
+                name=cluster,
+                node_pools=[
+                    cluster_service.NodePool(name="pool-{}".format(index))
+                    for index in range(4)
+                ],
+            ),
+        )
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+def test_choose():
+    assert node_pools.choose(1, None) == node_pools.GET
+    assert node_pools.choose(2, None) == node_pools.LIST
+    assert node_pools.choose(2, 4) == node_pools.LIST
+    assert node_pools.choose(1, 4) == node_pools.GET
+    assert node_pools.choose(3, 4, list_ratio=1) == node_pools.GET
+    assert node_pools.choose(1, 0) == node_pools.LIST
+
+
+@pytest.mark.asyncio
+async def test_batch_get_node_pools(server):
+    client = server.async_client()
+    names = [
+        # Listed: half of the pools.
+        _pool("a", "pool-0"),
+        _pool("a", "pool-1"),
+        # Read one by one.
+        _pool("b", "pool-2"),
+        # Listed: unknown count.
+        _pool("c", "pool-3"),
+        _pool("c", "missing"),
+        _pool("a", "pool-0"),
+    ]
+    pool_counts = {_cluster("a"): 4, _cluster("b"): 4}
+
+    results = await client.batch_get_node_pools(
+        names, pool_counts=pool_counts, max_concurrency=2
+    )
+
+    assert list(results) == names[:-1]
+    assert server.servicer.calls["ListNodePools"] == 2
+    assert server.servicer.calls["GetNodePool"] == 1
+    assert [result.method for result in results.values()] == [
+        node_pools.LIST,
+        node_pools.LIST,
+        node_pools.GET,
+        node_pools.LIST,
+        node_pools.LIST,
+    ]
+    for name in names[:4]:
+        assert results[name].error is None
+        assert results[name].node_pool.name == name.rsplit("/", 1)[1]
+    missing = results[_pool("c", "missing")]
+    assert missing.node_pool is None
+    assert isinstance(missing.error, core_exceptions.NotFound)
+    # The count of the listed cluster is learned.
+    assert pool_counts[_cluster("c")] == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_get_node_pools_errors(server):
+    client = server.async_client()
+    results = await client.batch_get_node_pools(
+        [
+            _pool("missing", "pool-0"),
+            _pool("missing", "pool-1"),
+            _pool("a", "missing"),
+        ]
+    )
+
+    assert results[_pool("missing", "pool-0")].method == node_pools.LIST
+    assert isinstance(results[_pool("a", "missing")].error, core_exceptions.NotFound)
+    assert all(result.node_pool is None for result in results.values())
+    assert all(
+        isinstance(result.error, core_exceptions.NotFound)
+        for result in results.values()
+    )
+
+    with pytest.raises(ValueError):
+        await client.batch_get_node_pools([_cluster("a")])
+    with pytest.raises(ValueError):
+        await client.batch_get_node_pools([], max_concurrency=0)
+    assert await client.batch_get_node_pools([]) == {}
+
+
+class SlowClient:
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_node_pool(self, request, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return cluster_service.NodePool(name=request["name"].rsplit("/", 1)[1])
+
+
+@pytest.mark.asyncio
+async def test_bounded_concurrency():
+    client = SlowClient()
+    names = [_pool("cluster-{}".format(index), "pool") for index in range(10)]
+
+    results = await node_pools.get_node_pools(client, names, max_concurrency=3)
+
+    assert client.peak == 3
+    assert [result.node_pool.name for result in results.values()] == ["pool"] * 10
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.rpc import code_pb2  # type: ignore
+from google.rpc import status_pb2  # type: ignore
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import fake_server, poller
+from google.cloud.container_v1.types import cluster_service
+
+RUNNING = cluster_service.Operation.Status.RUNNING
+DONE = cluster_service.Operation.Status.DONE
+
+
+def _operation(name, location="us-central1-a", status=RUNNING, **kwargs):
+    return cluster_service.Operation(
+        name=name,
+        self_link="https://container.googleapis.com/v1/projects/p/zones/{}/operations/{}".format(
+            location, name
+        ),
+        status=status,
+        **kwargs
+    )
+
+
+def _client():
+    client = mock.Mock()
+    client.list_operations.side_effect = lambda request, metadata: {
+        "projects/p/locations/us-central1-a": cluster_service.ListOperationsResponse(
+            operations=[
+                _operation("op-1", status=DONE),
+                _operation("op-2"),
+            ]
+        ),
+        "projects/p/locations/us-east1-b": cluster_service.ListOperationsResponse(
+            operations=[
+                _operation(
+                    "op-3",
+                    location="us-east1-b",
+                    status=DONE,
+                    error=status_pb2.Status(code=code_pb2.INTERNAL, message="boom"),
+                ),
+            ]
+        ),
+    }[request["parent"]]
+    client.get_operation.return_value = _operation("op-4", status=DONE)
+    return client
+
+
+def test_poll_once_batches_by_location():
+    client = _client()
+    operations = poller.OperationPoller(client)
+    futures = [
+        operations.add(_operation("op-1")),
+        operations.add(_operation("op-2")),
+        operations.add(_operation("op-3", location="us-east1-b")),
+        operations.add(_operation("op-4")),
+    ]
+    assert operations.add(_operation("op-1")) is futures[0]
+
+    operations.poll_once()
+
+    assert client.list_operations.call_count == 2
+    client.get_operation.assert_called_once_with(
+        request={"name": "projects/p/locations/us-central1-a/operations/op-4"},
+        metadata=(),
+    )
+    assert futures[0].result().name == "op-1"
+    assert not futures[1].done()
+    with pytest.raises(core_exceptions.InternalServerError):
+        futures[2].result()
+    assert futures[3].result().name == "op-4"
+    assert len(operations) == 1
+
+
+def test_add_done_operation():
+    operations = poller.OperationPoller(mock.Mock())
+    future = operations.add(_operation("op-1", status=DONE))
+    assert future.result().name == "op-1"
+    assert len(operations) == 0
+
+
+def test_poll_once_list_error_falls_back():
+    client = mock.Mock()
+    client.list_operations.side_effect = core_exceptions.ServiceUnavailable("down")
+    client.get_operation.side_effect = [
+        _operation("op-1", status=DONE),
+        core_exceptions.NotFound("gone"),
+    ]
+    operations = poller.OperationPoller(client)
+    first = operations.add(_operation("op-1"))
+    second = operations.add(_operation("op-2"))
+
+    operations.poll_once()
+
+    assert first.result().name == "op-1"
+    with pytest.raises(core_exceptions.NotFound):
+        second.result()
+
+
+def test_poll_once_unexpected_error_fails_operations():
+    client = mock.Mock()
+    client.list_operations.side_effect = TypeError("unexpected keyword argument")
+    operations = poller.OperationPoller(client)
+    future = operations.add(_operation("op-1"))
+
+    operations.poll_once()
+
+    with pytest.raises(TypeError):
+        future.result()
+    client.get_operation.assert_not_called()
+    assert len(operations) == 0
+
+
+def test_polling_thread_survives_unexpected_errors():
+    client = mock.Mock()
+    client.list_operations.side_effect = TypeError("unexpected keyword argument")
+    client.get_operation.side_effect = ValueError("bad name")
+    with poller.OperationPoller(client, interval=0.001) as operations:
+        first = operations.add(_operation("op-1"))
+        assert isinstance(first.exception(timeout=5), TypeError)
+
+        client.list_operations.side_effect = None
+        client.list_operations.return_value = cluster_service.ListOperationsResponse()
+        second = operations.add(_operation("op-2"))
+        assert isinstance(second.exception(timeout=5), ValueError)
+
+
+def test_cancelled_future_is_dropped():
+    client = _client()
+    operations = poller.OperationPoller(client)
+    operations.add(_operation("op-2")).cancel()
+
+    operations.poll_once()
+
+    client.list_operations.assert_not_called()
+    assert len(operations) == 0
+
+
+def test_as_completed():
+    client = _client()
+    with poller.OperationPoller(client, interval=0.001) as operations:
+        futures = [
+            operations.add(_operation("op-1")),
+            operations.add(_operation("op-4")),
+        ]
+        completed = list(operations.as_completed(timeout=5))
+
+    assert set(completed) == set(futures)
+
+    with pytest.raises(ValueError):
+        operations.start()
+
+
+@pytest.mark.asyncio
+async def test_async_poll_once():
+    client = _client()
+    client.list_operations = mock.AsyncMock(side_effect=client.list_operations)
+    client.get_operation = mock.AsyncMock(return_value=_operation("op-4", status=DONE))
+    operations = poller.AsyncOperationPoller(client)
+    first = operations.add(_operation("op-1"))
+    second = operations.add(_operation("op-2"))
+    third = operations.add(_operation("op-3", location="us-east1-b"))
+    fourth = operations.add(_operation("op-4"))
+
+    await operations.poll_once()
+
+    assert client.list_operations.await_count == 2
+    assert client.get_operation.await_count == 1
+    assert first.result().name == "op-1"
+    assert not second.done()
+    assert isinstance(third.exception(), core_exceptions.InternalServerError)
+    assert fourth.result().name == "op-4"
+
+
+@pytest.mark.asyncio
+async def test_async_polling_task_survives_unexpected_errors():
+    client = mock.Mock()
+    client.list_operations = mock.AsyncMock(
+        side_effect=TypeError("unexpected keyword argument")
+    )
+    client.get_operation = mock.AsyncMock(side_effect=ValueError("bad name"))
+    async with poller.AsyncOperationPoller(client, interval=0.001) as operations:
+        first = operations.add(_operation("op-1"))
+        with pytest.raises(TypeError):
+            await asyncio.wait_for(first, timeout=5)
+
+        client.list_operations.side_effect = None
+        client.list_operations.return_value = cluster_service.ListOperationsResponse()
+        second = operations.add(_operation("op-2"))
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(second, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_async_as_completed():
+    client = _client()
+    client.list_operations = mock.AsyncMock(side_effect=client.list_operations)
+    client.get_operation = mock.AsyncMock(return_value=_operation("op-4", status=DONE))
+
+    async with poller.AsyncOperationPoller(client, interval=0.001) as operations:
+        futures = [
+            operations.add(_operation("op-1")),
+            operations.add(_operation("op-4")),
+        ]
+        completed = [future async for future in operations.as_completed()]
+
+    assert set(completed) == set(futures)
+
+
+@pytest.fixture
+def server():
+    servicer = fake_server.FakeClusterManager(operation_duration=0.05)
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+def _create_clusters(server):
+    client = server.client()
+    return client, [
+        client.create_cluster(
+            request={
+                "parent": "projects/p/locations/{}".format(location),
+                "cluster": {"name": "c"},
+            }
+        )
+        for location in ("us-central1", "us-east1")
+    ]
+
+
+def test_poll_real_client(server):
+    client, created = _create_clusters(server)
+
+    with poller.OperationPoller(client, interval=0.01) as operations:
+        futures = [operations.add(operation) for operation in created]
+        completed = list(operations.as_completed(timeout=5))
+
+    assert set(completed) == set(futures)
+    assert {future.result().status for future in futures} == {DONE}
+    assert server.servicer.calls["ListOperations"] >= 2
+
+
+async def _completed(operations):
+    return [future async for future in operations.as_completed()]
+
+
+@pytest.mark.asyncio
+async def test_async_poll_real_client(server):
+    _, created = _create_clusters(server)
+
+    async with poller.AsyncOperationPoller(
+        server.async_client(), interval=0.01
+    ) as operations:
+        futures = [operations.add(operation) for operation in created]
+        completed = await asyncio.wait_for(_completed(operations), timeout=5)
+
+    assert set(completed) == set(futures)
+    assert {future.result().status for future in futures} == {DONE}
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import transports
+from google.cloud.container_v1.types import cluster_service
+
+
+def test_cluster_manager_grpc_transport_channel_pool():
+    with mock.patch.object(
+        transports.ClusterManagerGrpcTransport, "create_channel"
+    ) as create_channel:
+        create_channel.side_effect = lambda *args, **kwargs: mock.Mock()
+        transport = transports.ClusterManagerGrpcTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            channel_pool_size=3,
+        )
+
+    assert create_channel.call_count == 3
+    # Each pooled channel opens its own connection.
+    for call in create_channel.call_args_list:
+        assert ("grpc.use_local_subchannel_pool", 1) in call[1]["options"]
+    assert isinstance(transport.grpc_channel, transports.pool.ChannelPool)
+    assert len(transport.grpc_channel.channels) == 3
+
+    # Every pooled channel gets its own stub, and calls rotate through them.
+    transport.list_clusters(cluster_service.ListClustersRequest())
+    transport.list_clusters(cluster_service.ListClustersRequest())
+    transport.list_clusters(cluster_service.ListClustersRequest())
+    for channel in transport.grpc_channel.channels:
+        channel.unary_unary.assert_any_call(
+            "/google.container.v1.ClusterManager/ListClusters",
+            request_serializer=cluster_service.ListClustersRequest.serialize,
+            response_deserializer=cluster_service.ListClustersResponse.deserialize,
+        )
+        channel.unary_unary.return_value.assert_called_once()
+
+    transport.close()
+    for channel in transport.grpc_channel.channels:
+        channel.close.assert_called_once_with()
+
+
+def test_cluster_manager_grpc_transport_channel_pool_size():
+    with pytest.raises(ValueError):
+        transports.ClusterManagerGrpcTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            channel_pool_size=0,
+        )
+
+
+def test_channel_pool_least_loaded():
+    channels = [mock.Mock(), mock.Mock()]
+    pool = transports.pool.ChannelPool(channels, strategy=transports.pool.LEAST_LOADED)
+    for channel in channels:
+        channel.unary_unary.return_value.future.side_effect = lambda *args: mock.Mock()
+    rpc = pool.unary_unary("/google.container.v1.ClusterManager/ListClusters")
+
+    first = rpc.future(cluster_service.ListClustersRequest())
+    rpc.future(cluster_service.ListClustersRequest())
+    assert pool.in_flight == [1, 1]
+
+    # Completing the call on the first channel makes it the least loaded.
+    done_callback = first.add_done_callback.call_args[0][0]
+    done_callback(first)
+    assert pool.in_flight == [0, 1]
+    rpc.future(cluster_service.ListClustersRequest())
+    assert pool.in_flight == [1, 1]
+    assert channels[0].unary_unary.return_value.future.call_count == 2
+
+
+def test_channel_pool_unknown_strategy():
+    with pytest.raises(ValueError):
+        transports.pool.ChannelPool([mock.Mock()], strategy="random")
+
+
+@pytest.mark.asyncio
+async def test_cluster_manager_grpc_asyncio_transport_channel_pool():
+    with mock.patch.object(
+        transports.ClusterManagerGrpcAsyncIOTransport, "create_channel"
+    ) as create_channel:
+        create_channel.side_effect = lambda *args, **kwargs: mock.Mock()
+        transport = transports.ClusterManagerGrpcAsyncIOTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            channel_pool_size=2,
+            channel_pool_strategy=transports.pool.LEAST_LOADED,
+        )
+
+    assert create_channel.call_count == 2
+    # Each pooled channel opens its own connection.
+    for call in create_channel.call_args_list:
+        assert ("grpc.use_local_subchannel_pool", 1) in call[1]["options"]
+    pool = transport.grpc_channel
+    assert isinstance(pool, transports.pool.AsyncChannelPool)
+    transport.get_cluster(cluster_service.GetClusterRequest())
+    assert pool.in_flight == [1, 0]
+    transport.get_cluster(cluster_service.GetClusterRequest())
+    assert pool.in_flight == [1, 1]
+
+    call = pool.channels[0].unary_unary.return_value.return_value
+    done_callback = call.add_done_callback.call_args[0][0]
+    done_callback(call)
+    assert pool.in_flight == [0, 1]
+
+    for channel in pool.channels:
+        channel.close = mock.AsyncMock()
+    await transport.close()
+    for channel in pool.channels:
+        channel.close.assert_awaited_once_with(None)
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    fake_server,
+)
+from google.cloud.container_v1.services.cluster_manager.transports import (
+    ClusterManagerGrpcAsyncIOTransport,
+    ClusterManagerGrpcTransport,
+    metrics,
+    ratelimit,
+)
+from google.cloud.container_v1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+NODE_POOL = CLUSTER + "/nodePools/default-pool"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+        yield server
+
+
+def _limiter(clock, limits, **kwargs):
+    return ratelimit.RateLimiter(limits, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_default_group():
+    assert ratelimit.default_group("ListClusters") == ratelimit.READ
+    assert ratelimit.default_group("GetOperation") == ratelimit.READ
+    assert ratelimit.default_group("SetNodePoolSize") == ratelimit.MUTATE
+    limiter = ratelimit.RateLimiter({}, groups={"SetNodePoolSize": "resize"})
+    assert limiter.group("SetNodePoolSize") == "resize"
+    assert limiter.group("UpdateNodePool") == ratelimit.MUTATE
+
+
+def test_request_project():
+    assert (
+        ratelimit.request_project(cluster_service.GetClusterRequest(name=CLUSTER))
+        == "p"
+    )
+    assert (
+        ratelimit.request_project(
+            cluster_service.ListUsableSubnetworksRequest(parent="projects/q")
+        )
+        == "q"
+    )
+    assert (
+        ratelimit.request_project(
+            cluster_service.SetNodePoolSizeRequest(project_id="r", zone="z")
+        )
+        == "r"
+    )
+    assert ratelimit.request_project(cluster_service.ListOperationsRequest()) == ""
+
+
+def test_token_bucket():
+    clock = FakeClock()
+    limiter = _limiter(clock, {ratelimit.MUTATE: ratelimit.RateLimit(2.0, burst=2)})
+
+    waits = [limiter.reserve("SetNodePoolSize", "p") for _ in range(4)]
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+    # Other projects and unlimited groups do not wait.
+    assert limiter.reserve("UpdateNodePool", "q") == 0.0
+    assert limiter.reserve("ListClusters", "p") == 0.0
+
+    # The bucket refills at the rate, up to the burst.
+    clock.now = 1.5
+    assert limiter.reserve("SetNodePoolSize", "p") == 0.0
+    clock.now = 100.0
+    assert [limiter.reserve("SetNodePoolSize", "p") for _ in range(3)] == [
+        0.0,
+        0.0,
+        0.5,
+    ]
+
+    stats = limiter.stats(ratelimit.MUTATE)
+    assert (stats.acquired, stats.delayed, stats.rejected) == (9, 3, 0)
+    assert stats.wait_time.count == 9
+    assert stats.wait_time.sum == 2.0
+    assert limiter.groups() == [ratelimit.MUTATE]
+
+
+def test_shared_quota():
+    clock = FakeClock()
+    limiter = _limiter(
+        clock, {ratelimit.MUTATE: ratelimit.RateLimit(1.0)}, per_project=False
+    )
+    assert limiter.reserve("SetNodePoolSize", "p") == 0.0
+    assert limiter.reserve("SetNodePoolSize", "q") == 1.0
+
+
+def test_rejects_long_waits():
+    clock = FakeClock()
+    limiter = _limiter(
+        clock, {ratelimit.MUTATE: ratelimit.RateLimit(1.0)}, max_wait=1.5
+    )
+    assert limiter.reserve("SetNodePoolSize") == 0.0
+    assert limiter.reserve("SetNodePoolSize") == 1.0
+    with pytest.raises(core_exceptions.ResourceExhausted):
+        limiter.reserve("SetNodePoolSize")
+
+    # Rejected attempts do not take a token.
+    clock.now = 1.0
+    with pytest.raises(core_exceptions.DeadlineExceeded):
+        limiter.reserve("SetNodePoolSize", timeout=0.5)
+    assert limiter.reserve("SetNodePoolSize") == 1.0
+    assert limiter.stats(ratelimit.MUTATE).rejected == 2
+
+    with pytest.raises(ValueError):
+        ratelimit.RateLimiter({ratelimit.READ: ratelimit.RateLimit(0.0)})
+    with pytest.raises(ValueError):
+        ratelimit.RateLimiter({ratelimit.READ: ratelimit.RateLimit(1.0, burst=0)})
+
+
+def test_wait_counts_against_timeout():
+    clock = FakeClock()
+    limiter = _limiter(clock, {ratelimit.MUTATE: ratelimit.RateLimit(1.0)})
+    callable_ = mock.Mock()
+    channel = mock.Mock(spec=grpc.Channel)
+    channel.unary_unary.return_value = callable_
+    stub = limiter.limit_channel(channel).unary_unary(
+        "/google.container.v1.ClusterManager/SetNodePoolSize"
+    )
+    request = cluster_service.SetNodePoolSizeRequest(name=NODE_POOL)
+
+    stub(request, timeout=10.0)
+    stub.with_call(request, timeout=10.0)
+
+    assert clock.sleeps == [1.0]
+    callable_.assert_called_once_with(request, timeout=10.0)
+    callable_.with_call.assert_called_once_with(request, timeout=9.0)
+
+
+def test_limits_client_calls(server):
+    clock = FakeClock()
+    limiter = _limiter(clock, {ratelimit.MUTATE: ratelimit.RateLimit(1.0)})
+    registry = metrics.MetricsRegistry()
+    transport = ClusterManagerGrpcTransport(
+        channel=server.channel(), metrics=registry, rate_limiter=limiter
+    )
+    client = ClusterManagerClient(transport=transport)
+
+    for size in (1, 2, 3):
+        client.set_node_pool_size(request={"name": NODE_POOL, "node_count": size})
+    client.get_cluster(request={"name": CLUSTER})
+
+    # Each call waits for the token of the previous one to be refilled.
+    assert clock.sleeps == [1.0, 1.0]
+    assert limiter.stats(ratelimit.MUTATE).delayed == 2
+    assert limiter.groups() == [ratelimit.MUTATE]
+    # Whole calls are still recorded through the limited channel.
+    assert registry.stats("SetNodePoolSize").calls == 3
+    assert transport._rate_limiter is limiter
+
+
+def test_retries_take_tokens(server):
+    clock = FakeClock()
+    limiter = _limiter(clock, {ratelimit.READ: ratelimit.RateLimit(1.0, burst=5)})
+    transport = ClusterManagerGrpcTransport(
+        channel=server.channel(), rate_limiter=limiter
+    )
+    client = ClusterManagerClient(transport=transport)
+    server.servicer.inject_error("ListClusters", grpc.StatusCode.UNAVAILABLE)
+
+    client.list_clusters(request={"parent": PARENT})
+
+    assert limiter.stats(ratelimit.READ).acquired == 2
+
+
+def test_prometheus():
+    clock = FakeClock()
+    limiter = _limiter(
+        clock,
+        {ratelimit.MUTATE: ratelimit.RateLimit(1.0)},
+        wait_buckets=[1.0],
+    )
+    limiter.acquire("SetNodePoolSize")
+    limiter.acquire("SetNodePoolSize")
+
+    text = limiter.to_prometheus()
+    assert (
+        'container_cluster_manager_rate_limit_wait_seconds_bucket{group="mutate",le="1.0"} 2'
+        in text
+    )
+    assert (
+        'container_cluster_manager_rate_limit_wait_seconds_sum{group="mutate"} 1.0'
+        in text
+    )
+    assert (
+        'container_cluster_manager_rate_limit_delayed_total{group="mutate"} 1' in text
+    )
+
+    limiter.reset()
+    assert limiter.groups() == []
+
+
+@pytest.mark.asyncio
+async def test_async_limits_client_calls(server):
+    clock = FakeClock()
+    limiter = ratelimit.RateLimiter(
+        {ratelimit.READ: ratelimit.RateLimit(50.0)}, clock=clock
+    )
+    transport = ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel(server.address), rate_limiter=limiter
+    )
+    client = ClusterManagerAsyncClient(transport=transport)
+
+    clusters = await asyncio.gather(
+        *[client.get_cluster(request={"name": CLUSTER}) for _ in range(3)]
+    )
+
+    assert [cluster.name for cluster in clusters] == ["c"] * 3
+    stats = limiter.stats(ratelimit.READ)
+    assert (stats.acquired, stats.delayed) == (3, 2)
+    assert stats.wait_time.sum == pytest.approx(0.06)
+
+
+@pytest.mark.asyncio
+async def test_async_cancel_while_waiting():
+    clock = FakeClock()
+    limiter = ratelimit.RateLimiter(
+        {ratelimit.MUTATE: ratelimit.RateLimit(1.0)}, clock=clock
+    )
+    callable_ = mock.Mock()
+    channel = mock.Mock(spec=aio.Channel)
+    channel.unary_unary.return_value = callable_
+    stub = limiter.limit_channel(channel).unary_unary(
+        "/google.container.v1.ClusterManager/SetNodePoolSize"
+    )
+    request = cluster_service.SetNodePoolSizeRequest(name=NODE_POOL)
+
+    stub(request, timeout=10.0)
+    call = stub(request, timeout=10.0)
+    assert not call.done()
+    assert call.time_remaining() is None
+    assert call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert call.cancelled()
+    callable_.assert_called_once_with(request, timeout=10.0)
+
+    assert await limiter.acquire_async("ListClusters") == 0.0
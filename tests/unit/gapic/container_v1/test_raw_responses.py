@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    cache,
+    fake_server,
+)
+from google.cloud.container_v1.services.cluster_manager.transports import (
+    ClusterManagerGrpcAsyncIOTransport,
+    ClusterManagerGrpcTransport,
+    metrics,
+    raw,
+)
+from google.cloud.container_v1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+        yield server
+
+
+def test_transport_protobuf_format(server):
+    transport = ClusterManagerGrpcTransport(
+        channel=server.channel(), response_format=raw.PROTOBUF
+    )
+    client = ClusterManagerClient(transport=transport)
+
+    response = client.list_clusters(request={"parent": PARENT})
+    assert isinstance(response, cluster_service.ListClustersResponse.pb())
+    assert [cluster.name for cluster in response.clusters] == ["c"]
+
+    wrapped = raw.wrap(cluster_service.ListClustersResponse, response)
+    assert isinstance(wrapped, cluster_service.ListClustersResponse)
+    assert cluster_service.ListClustersResponse.pb(wrapped) is response
+
+
+def test_transport_bytes_format(server):
+    transport = ClusterManagerGrpcTransport(
+        channel=server.channel(), response_format=raw.BYTES
+    )
+    client = ClusterManagerClient(transport=transport)
+
+    response = client.get_cluster(request={"name": CLUSTER})
+    assert isinstance(response, bytes)
+    cluster = raw.wrap(cluster_service.Cluster, response)
+    assert cluster.name == "c"
+    assert cluster.status == cluster_service.Cluster.Status.RUNNING
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        ClusterManagerGrpcTransport(channel=mock.Mock(), response_format="json")
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(channel=mock.Mock())
+    )
+    with pytest.raises(ValueError):
+        client.with_response_format("json")
+
+
+def test_with_response_format(server):
+    client = server.client()
+    assert client.with_response_format(raw.PROTO_PLUS) is client
+
+    raw_client = client.with_response_format(raw.PROTOBUF)
+    assert raw_client is not client
+    assert raw_client.transport is client.with_response_format(raw.PROTOBUF).transport
+    assert raw_client.transport.grpc_channel.channel is client.transport.grpc_channel
+    assert raw_client.with_response_format(raw.PROTO_PLUS).transport is (
+        client.transport
+    )
+
+    response = raw_client.get_cluster(request={"name": CLUSTER})
+    assert isinstance(response, cluster_service.Cluster.pb())
+    assert isinstance(
+        client.get_cluster(request={"name": CLUSTER}), cluster_service.Cluster
+    )
+    bytes_client = raw_client.with_response_format(raw.BYTES)
+    assert bytes_client.get_cluster(request={"name": CLUSTER}) == (
+        response.SerializeToString()
+    )
+
+
+def test_with_response_format_skips_cache(server):
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(channel=server.channel()),
+        response_cache=cache.ResponseCache(),
+    )
+    client.get_server_config(request={"name": PARENT})
+
+    raw_client = client.with_response_format(raw.BYTES)
+    assert isinstance(raw_client.get_server_config(request={"name": PARENT}), bytes)
+    assert server.servicer.calls["GetServerConfig"] == 2
+
+
+def test_pager_protobuf_format(server):
+    server.servicer.subnetworks = [
+        cluster_service.UsableSubnetwork(subnetwork="s{}".format(i)) for i in range(5)
+    ]
+    client = server.client().with_response_format(raw.PROTOBUF)
+    pager = client.list_usable_subnetworks(
+        request={"parent": "projects/p", "page_size": 2}
+    )
+
+    subnetworks = list(raw.wrap_each(cluster_service.UsableSubnetwork, pager))
+    assert [subnetwork.subnetwork for subnetwork in subnetworks] == [
+        "s0",
+        "s1",
+        "s2",
+        "s3",
+        "s4",
+    ]
+
+
+def test_metrics_see_raw_responses(server):
+    registry = metrics.MetricsRegistry()
+    transport = ClusterManagerGrpcTransport(
+        channel=server.channel(), metrics=registry, response_format=raw.BYTES
+    )
+    client = ClusterManagerClient(transport=transport)
+
+    response = client.get_cluster(request={"name": CLUSTER})
+    stats = registry.stats("GetCluster")
+    assert stats.calls == 1
+    assert stats.response_bytes.sum == len(response)
+
+
+def test_wrap():
+    cluster = cluster_service.Cluster(name="c")
+    assert raw.wrap(cluster_service.Cluster, cluster) is cluster
+    assert raw.wrap(cluster_service.Cluster, bytearray(b"\n\x01c")).name == "c"
+
+    pb = cluster_service.Cluster.pb(cluster)
+    wrapped = raw.wrap(cluster_service.Cluster, pb)
+    wrapped.description = "shared"
+    assert pb.description == "shared"
+
+
+def test_raw_deserializer():
+    deserializer = cluster_service.Cluster.deserialize
+    assert raw.raw_deserializer(deserializer, raw.PROTO_PLUS) is deserializer
+    assert raw.raw_deserializer(deserializer, raw.BYTES) is None
+    assert (
+        raw.raw_deserializer(deserializer, raw.PROTOBUF)
+        == cluster_service.Cluster.pb().FromString
+    )
+
+    # Deserializers that already return protobuf messages are kept.
+    other = mock.Mock()
+    assert raw.raw_deserializer(other, raw.PROTOBUF) is other
+
+
+@pytest.mark.asyncio
+async def test_async_with_response_format(server):
+    client = server.async_client()
+    assert client.with_response_format(raw.PROTO_PLUS) is client
+
+    raw_client = client.with_response_format(raw.PROTOBUF)
+    response = await raw_client.list_clusters(request={"parent": PARENT})
+    assert isinstance(response, cluster_service.ListClustersResponse.pb())
+    assert isinstance(raw_client.transport.grpc_channel, raw.AsyncRawResponseChannel)
+
+    transport = ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel(server.address), response_format=raw.BYTES
+    )
+    client = ClusterManagerAsyncClient(transport=transport)
+    response = await client.get_cluster(request={"name": CLUSTER})
+    assert raw.wrap(cluster_service.Cluster, response).name == "c"
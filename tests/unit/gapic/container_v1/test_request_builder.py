@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import gapic_v1, grpc_helpers_async
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    request_builder,
+)
+from google.cloud.container_v1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+
+def test_build():
+    builder = request_builder.BUILDERS["list_clusters"]
+    request = cluster_service.ListClustersRequest(parent=PARENT)
+    # Request messages are not copied.
+    assert builder.build(request, None, None, None) is request
+    assert builder.build(
+        None, "p", None, PARENT
+    ) == cluster_service.ListClustersRequest(project_id="p", parent=PARENT)
+    assert builder.build(
+        {"zone": "z"}, None, "", None
+    ) == cluster_service.ListClustersRequest(zone="")
+    assert builder.build(None) == cluster_service.ListClustersRequest()
+
+    with pytest.raises(ValueError):
+        builder.build(request, None, None, PARENT)
+
+
+def test_builders_cover_every_method():
+    methods = {
+        name
+        for name in dir(ClusterManagerClient)
+        if not name.startswith("_") and name in dir(ClusterManagerAsyncClient)
+    }
+    assert set(request_builder.BUILDERS) <= methods
+    for name, builder in request_builder.BUILDERS.items():
+        for field in builder.flattened + (builder.routing_field,):
+            assert field in builder.request_type.meta.fields, (name, field)
+
+
+def test_routing_metadata():
+    builder = request_builder.BUILDERS["get_cluster"]
+    request = builder.build(None, None, None, None, CLUSTER)
+    metadata = builder.routing_metadata(request)
+    assert metadata == gapic_v1.routing_header.to_grpc_metadata((("name", CLUSTER),))
+    # Entries are shared between calls for the same resource.
+    assert builder.routing_metadata(request) is metadata
+
+
+def test_client_dispatches_without_stub_lookup():
+    client = ClusterManagerClient(credentials=ga_credentials.AnonymousCredentials())
+    with mock.patch.object(
+        type(client.transport.get_cluster), "__call__"
+    ) as call, mock.patch.object(
+        type(client.transport),
+        "get_cluster",
+        new_callable=mock.PropertyMock,
+        return_value=client.transport.get_cluster,
+    ) as stub:
+        call.return_value = cluster_service.Cluster(name="c")
+        client.get_cluster(name=CLUSTER)
+        client.get_cluster(name=CLUSTER)
+
+    # The wrapped method comes from the transport's dispatch table.
+    assert stub.call_count == 0
+    _, args, kwargs = call.mock_calls[0]
+    assert args[0] == cluster_service.GetClusterRequest(name=CLUSTER)
+    assert ("x-goog-request-params", "name=" + CLUSTER) in kwargs["metadata"]
+
+
+def test_dispatch_table():
+    transport = ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).transport
+    assert set(transport._dispatch) == set(request_builder.BUILDERS)
+    for name, rpc in transport._dispatch.items():
+        assert transport._wrapped_methods[getattr(transport, name)] is rpc
+
+
+@pytest.mark.asyncio
+async def test_async_dispatch_table():
+    with mock.patch.object(
+        gapic_v1.method_async,
+        "wrap_method",
+        wraps=gapic_v1.method_async.wrap_method,
+    ) as wrap_method:
+        transport = ClusterManagerAsyncClient(
+            credentials=ga_credentials.AnonymousCredentials()
+        ).transport
+    assert set(transport._dispatch) == set(request_builder.BUILDERS)
+    # Every method is wrapped for asyncio, once.
+    assert wrap_method.call_count == len(request_builder.BUILDERS)
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_the_transport_dispatch():
+    client = ClusterManagerAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    with mock.patch.object(
+        type(client.transport.get_cluster), "__call__"
+    ) as call, mock.patch.object(
+        gapic_v1.method_async,
+        "wrap_method",
+        wraps=gapic_v1.method_async.wrap_method,
+    ) as wrap_method:
+        call.side_effect = lambda *args, **kwargs: (
+            grpc_helpers_async.FakeUnaryUnaryCall(cluster_service.Cluster(name="c"))
+        )
+        await client.get_cluster(request=request)
+        await client.get_cluster(name=CLUSTER)
+
+    # The transport wrapped its methods when it was created.
+    assert wrap_method.call_count == 0
+    # The request is sent as is.
+    _, args, _ = call.mock_calls[0]
+    assert args[0] is request
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from collections import defaultdict
+
+from google.api_core import exceptions as core_exceptions
+import grpc
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import (
+    fake_server,
+    resize,
+    waiter,
+)
+from google.cloud.container_v1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+POLICY = waiter.PollingPolicy(initial=0.01, maximum=0.02)
+
+
+def _autoscaling(**kwargs):
+    return cluster_service.NodePoolAutoscaling(**kwargs)
+
+
+def _pool(cluster, pool):
+    return "{}/clusters/{}/nodePools/{}".format(PARENT, cluster, pool)
+
+
+@pytest.fixture
+def server():
+    servicer = fake_server.FakeClusterManager(
+        operation_duration=0.05, one_operation_per_cluster=True
+    )
+    for cluster in ("a", "b"):
+        servicer.add_cluster(
+            PARENT,
+            cluster_service.Cluster(
+                name=cluster,
+                node_pools=[
+                    cluster_service.NodePool(name="pool-1", initial_node_count=1),
+                    cluster_service.NodePool(
+                        name="pool-2",
+                        initial_node_count=2,
+                        autoscaling=_autoscaling(
+                            enabled=True, min_node_count=1, max_node_count=5
+                        ),
+                    ),
+                ],
+            ),
+        )
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+def _node_pools(server):
+    return {
+        "{}/nodePools/{}".format(name, pool.name): pool
+        for name, cluster in server.servicer.clusters().items()
+        for pool in cluster.node_pools
+    }
+
+
+def test_diff(server):
+    node_pools = _node_pools(server)
+    changes = resize.diff(
+        [
+            # No-ops.
+            resize.NodePoolTarget(_pool("a", "pool-1"), node_count=1),
+            resize.NodePoolTarget(
+                _pool("a", "pool-2"),
+                autoscaling=_autoscaling(enabled=True, max_node_count=5),
+            ),
+            resize.NodePoolTarget(
+                _pool("b", "pool-1"), autoscaling=_autoscaling(max_node_count=3)
+            ),
+            # Changes, autoscaling first.
+            resize.NodePoolTarget(
+                _pool("b", "pool-2"),
+                node_count=4,
+                autoscaling=_autoscaling(enabled=False),
+            ),
+        ],
+        node_pools,
+    )
+
+    assert [(c.node_pool, c.method) for c in changes] == [
+        (_pool("b", "pool-2"), resize.SET_AUTOSCALING),
+        (_pool("b", "pool-2"), resize.SET_SIZE),
+    ]
+    assert changes[0].cluster == PARENT + "/clusters/b"
+    assert changes[0].current.max_node_count == 5
+    assert changes[1].request == cluster_service.SetNodePoolSizeRequest(
+        name=_pool("b", "pool-2"), node_count=4
+    )
+    assert changes[1].current == 2
+
+    with pytest.raises(ValueError):
+        resize.diff([resize.NodePoolTarget(_pool("a", "pool-1"))] * 2, node_pools)
+    with pytest.raises(core_exceptions.NotFound):
+        resize.diff([resize.NodePoolTarget(_pool("a", "missing"))], node_pools)
+    with pytest.raises(ValueError):
+        resize.cluster_of(PARENT + "/clusters/a")
+
+
+def test_execute_serializes_per_cluster(server):
+    client = server.client()
+    targets = [
+        resize.NodePoolTarget(_pool(cluster, "pool-1"), node_count=3)
+        for cluster in ("a", "b")
+    ] + [
+        resize.NodePoolTarget(
+            _pool(cluster, "pool-2"),
+            node_count=6,
+            autoscaling=_autoscaling(enabled=True, min_node_count=2, max_node_count=9),
+        )
+        for cluster in ("a", "b")
+    ]
+    changes = resize.plan(client, targets)
+    assert len(changes) == 6
+    assert server.servicer.calls["ListNodePools"] == 2
+
+    events = list(resize.execute(client, changes, policy=POLICY, conflict_delay=0))
+
+    # Without serialization, the service would reject the calls made while
+    # another operation runs on the cluster.
+    assert server.servicer.calls["SetNodePoolSize"] == 4
+    assert server.servicer.calls["SetNodePoolAutoscaling"] == 2
+    states = defaultdict(list)
+    for event in events:
+        assert event.error is None
+        states[event.change.cluster].append((event.change.method, event.state))
+    assert states[PARENT + "/clusters/a"] == [
+        (resize.SET_SIZE, resize.STARTED),
+        (resize.SET_SIZE, resize.DONE),
+        (resize.SET_AUTOSCALING, resize.STARTED),
+        (resize.SET_AUTOSCALING, resize.DONE),
+        (resize.SET_SIZE, resize.STARTED),
+        (resize.SET_SIZE, resize.DONE),
+    ]
+    assert resize.plan(client, targets) == []
+
+
+def test_execute_retries_conflicts(server):
+    client = server.client()
+    # An operation started by someone else.
+    client.set_node_pool_size(request={"name": _pool("a", "pool-1"), "node_count": 2})
+    change = resize.diff(
+        [resize.NodePoolTarget(_pool("a", "pool-2"), node_count=1)],
+        _node_pools(server),
+    )
+
+    events = list(
+        resize.execute(
+            client, change, policy=POLICY, conflict_retries=20, conflict_delay=0.01
+        )
+    )
+
+    assert [event.state for event in events] == [resize.STARTED, resize.DONE]
+    assert server.servicer.calls["SetNodePoolSize"] > 2
+
+    client.set_node_pool_size(request={"name": _pool("a", "pool-1"), "node_count": 3})
+    (event,) = resize.execute(client, change, policy=POLICY, conflict_retries=0)
+    assert event.state == resize.FAILED
+    assert isinstance(event.error, core_exceptions.FailedPrecondition)
+    assert event.operation is None
+
+
+def test_execute_continues_after_failure(server):
+    client = server.client()
+    server.servicer.inject_operation_error("SetNodePoolSize", grpc.StatusCode.INTERNAL)
+    changes = resize.plan(
+        client,
+        [
+            resize.NodePoolTarget(_pool("a", "pool-1"), node_count=5),
+            resize.NodePoolTarget(_pool("a", "pool-2"), node_count=5),
+        ],
+    )
+
+    events = [
+        event
+        for event in resize.execute(client, changes, policy=POLICY)
+        if event.state != resize.STARTED
+    ]
+
+    assert [event.state for event in events] == [resize.FAILED, resize.DONE]
+    assert isinstance(events[0].error, core_exceptions.InternalServerError)
+    assert events[0].operation.name
+    pools = _node_pools(server)
+    assert pools[_pool("a", "pool-1")].initial_node_count == 1
+    assert pools[_pool("a", "pool-2")].initial_node_count == 5
+
+
+def test_execute_nothing():
+    assert list(resize.execute(None, [])) == []
+    with pytest.raises(ValueError):
+        list(resize.execute(None, [], max_workers=0))
+
+
+@pytest.mark.asyncio
+async def test_execute_async(server):
+    client = server.async_client()
+    targets = [
+        resize.NodePoolTarget(
+            _pool(cluster, pool),
+            node_count=7,
+            autoscaling=_autoscaling(enabled=True, max_node_count=10),
+        )
+        for cluster in ("a", "b")
+        for pool in ("pool-1", "pool-2")
+    ]
+    changes = await resize.plan_async(client, targets)
+    assert len(changes) == 8
+
+    events = [
+        event
+        async for event in resize.execute_async(
+            client, changes, policy=POLICY, conflict_delay=0
+        )
+    ]
+
+    assert [event.state for event in events].count(resize.DONE) == 8
+    assert all(event.error is None for event in events)
+    pools = _node_pools(server)
+    assert {pool.initial_node_count for pool in pools.values()} == {7}
+    assert {pool.autoscaling.max_node_count for pool in pools.values()} == {10}
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import concurrent.futures
+import itertools
+import threading
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.rpc import code_pb2  # type: ignore
+from google.rpc import status_pb2  # type: ignore
+import pytest
+
+from google.cloud.container_v1.services.cluster_manager import fake_server, waiter
+from google.cloud.container_v1.types import cluster_service
+
+SELF_LINK = (
+    "https://container.googleapis.com/v1/projects/my-project/zones/"
+    "us-central1-a/operations/operation-123"
+)
+NAME = "projects/my-project/locations/us-central1-a/operations/operation-123"
+
+
+def _operation(status=cluster_service.Operation.Status.RUNNING, **kwargs):
+    return cluster_service.Operation(
+        name="operation-123", self_link=SELF_LINK, status=status, **kwargs
+    )
+
+
+def _metric(name, **value):
+    return cluster_service.OperationProgress.Metric(name=name, **value)
+
+
+def test_operation_path_from_self_link():
+    assert waiter.operation_path(_operation()) == NAME
+
+
+def test_operation_path_from_project():
+    operation = cluster_service.Operation(name="op", location="us-east1")
+    assert (
+        waiter.operation_path(operation, project="p")
+        == "projects/p/locations/us-east1/operations/op"
+    )
+    with pytest.raises(ValueError):
+        waiter.operation_path(operation)
+
+
+def test_operation_progress():
+    assert waiter.operation_progress(_operation()) is None
+
+    operation = _operation(
+        progress=cluster_service.OperationProgress(
+            metrics=[
+                _metric("progress", double_value=0.25),
+                _metric("progress scale", double_value=0.5),
+            ]
+        )
+    )
+    assert waiter.operation_progress(operation) == 0.5
+
+    operation = _operation(
+        progress=cluster_service.OperationProgress(
+            stages=[
+                cluster_service.OperationProgress(
+                    name="drain",
+                    status=cluster_service.Operation.Status.DONE,
+                ),
+                cluster_service.OperationProgress(
+                    name="upgrade",
+                    status=cluster_service.Operation.Status.RUNNING,
+                    metrics=[
+                        _metric("nodes done", int_value=3),
+                        _metric("nodes total", int_value=12),
+                    ],
+                ),
+            ]
+        )
+    )
+    assert waiter.operation_progress(operation) == 0.25
+
+
+def test_polling_policy_backoff():
+    policy = waiter.PollingPolicy(initial=1.0, maximum=4.0, multiplier=2.0)
+    delays = policy.delays()
+    assert next(delays) == 1.0
+    assert delays.send((_operation(), 1.0)) == 2.0
+    assert delays.send((_operation(), 3.0)) == 4.0
+    assert delays.send((_operation(), 7.0)) == 4.0
+
+
+def test_polling_policy_progress_and_stages():
+    policy = waiter.PollingPolicy(initial=1.0, maximum=100.0, remaining_factor=0.5)
+    delays = policy.delays()
+    next(delays)
+
+    def staged(name, done):
+        return _operation(
+            progress=cluster_service.OperationProgress(
+                stages=[
+                    cluster_service.OperationProgress(
+                        name=name,
+                        status=cluster_service.Operation.Status.RUNNING,
+                        metrics=[
+                            _metric("progress", double_value=done),
+                        ],
+                    )
+                ]
+            )
+        )
+
+    # Entering a stage resets to the initial delay.
+    assert delays.send((staged("a", 0.2), 10.0)) == 1.0
+    # 20% done after 20s leaves an estimated 80s; wait half of it.
+    assert delays.send((staged("a", 0.2), 20.0)) == 40.0
+    assert delays.send((staged("b", 0.0), 30.0)) == 1.0
+
+
+def test_operation_exception():
+    assert waiter.operation_exception(_operation()) is None
+
+    operation = _operation(
+        status=cluster_service.Operation.Status.DONE,
+        error=status_pb2.Status(code=code_pb2.PERMISSION_DENIED, message="nope"),
+    )
+    exc = waiter.operation_exception(operation)
+    assert isinstance(exc, core_exceptions.PermissionDenied)
+    assert exc.response is operation
+    assert "nope" in exc.message
+
+
+def test_wait_for_operation():
+    client = mock.Mock()
+    client.get_operation.side_effect = [
+        _operation(),
+        _operation(status=cluster_service.Operation.Status.DONE),
+    ]
+    with mock.patch.object(waiter.time, "sleep") as sleep:
+        result = waiter.wait_for_operation(client, _operation())
+
+    assert result.status == cluster_service.Operation.Status.DONE
+    assert sleep.call_count == 2
+    client.get_operation.assert_called_with(name=NAME, metadata=())
+
+
+def test_wait_for_operation_done():
+    client = mock.Mock()
+    operation = _operation(status=cluster_service.Operation.Status.DONE)
+    assert waiter.wait_for_operation(client, operation) is operation
+    client.get_operation.assert_not_called()
+
+
+def test_wait_for_operation_error():
+    client = mock.Mock()
+    client.get_operation.return_value = _operation(
+        status=cluster_service.Operation.Status.DONE,
+        error=status_pb2.Status(code=code_pb2.RESOURCE_EXHAUSTED, message="quota"),
+    )
+    with mock.patch.object(waiter.time, "sleep"):
+        with pytest.raises(core_exceptions.ResourceExhausted):
+            waiter.wait_for_operation(client, _operation())
+
+
+def test_wait_for_operation_deadline():
+    client = mock.Mock()
+    client.get_operation.return_value = _operation()
+    with mock.patch.object(waiter.time, "sleep"), mock.patch.object(
+        waiter.time, "monotonic", side_effect=itertools.count(0.0, 3.0)
+    ):
+        with pytest.raises(concurrent.futures.TimeoutError):
+            waiter.wait_for_operation(
+                client, _operation(), deadline=10.0, cancel_on_deadline=True
+            )
+
+    client.cancel_operation.assert_called_once_with(name=NAME, metadata=())
+
+
+def test_wait_for_operation_cancel_event():
+    client = mock.Mock()
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(core_exceptions.Cancelled):
+        waiter.wait_for_operation(client, _operation(), cancel_event=cancel_event)
+
+    client.cancel_operation.assert_called_once_with(name=NAME, metadata=())
+    client.get_operation.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_operation_async():
+    client = mock.Mock()
+    client.get_operation = mock.AsyncMock(
+        side_effect=[
+            _operation(),
+            _operation(status=cluster_service.Operation.Status.DONE),
+        ]
+    )
+    policy = waiter.PollingPolicy(initial=0.001, maximum=0.001)
+    result = await waiter.wait_for_operation_async(client, _operation(), policy=policy)
+
+    assert result.status == cluster_service.Operation.Status.DONE
+    assert client.get_operation.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_operation_async_cancelled():
+    client = mock.Mock()
+    client.get_operation = mock.AsyncMock(return_value=_operation())
+    client.cancel_operation = mock.AsyncMock()
+    policy = waiter.PollingPolicy(initial=0.001, maximum=0.001)
+
+    task = asyncio.ensure_future(
+        waiter.wait_for_operation_async(client, _operation(), policy=policy)
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    client.cancel_operation.assert_awaited_once_with(name=NAME, metadata=())
+
+
+@pytest.mark.asyncio
+async def test_wait_for_operation_async_deadline():
+    client = mock.Mock()
+    client.get_operation = mock.AsyncMock(return_value=_operation())
+    client.cancel_operation = mock.AsyncMock()
+    policy = waiter.PollingPolicy(initial=0.001, maximum=0.001)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await waiter.wait_for_operation_async(
+            client, _operation(), policy=policy, deadline=0.01
+        )
+
+    client.cancel_operation.assert_not_called()
+
+
+@pytest.fixture
+def server():
+    servicer = fake_server.FakeClusterManager(operation_duration=0.05)
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+def _create_cluster(server):
+    return server.client().create_cluster(
+        request={"parent": "projects/p/locations/us-central1", "cluster": {"name": "c"}}
+    )
+
+
+FAST_POLICY = waiter.PollingPolicy(initial=0.01, maximum=0.01)
+
+
+def test_wait_for_operation_real_client(server):
+    result = waiter.wait_for_operation(
+        server.client(), _create_cluster(server), policy=FAST_POLICY, deadline=5
+    )
+
+    assert result.status == cluster_service.Operation.Status.DONE
+    assert server.servicer.calls["GetOperation"] >= 1
+
+
+def test_wait_for_operation_real_client_cancel(server):
+    server.servicer.operation_duration = 60
+    with pytest.raises(concurrent.futures.TimeoutError):
+        waiter.wait_for_operation(
+            server.client(),
+            _create_cluster(server),
+            policy=FAST_POLICY,
+            deadline=0.05,
+            cancel_on_deadline=True,
+        )
+
+    assert server.servicer.calls["CancelOperation"] == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_operation_async_real_client(server):
+    result = await waiter.wait_for_operation_async(
+        server.async_client(), _create_cluster(server), policy=FAST_POLICY, deadline=5
+    )
+
+    assert result.status == cluster_service.Operation.Status.DONE
+    assert server.servicer.calls["GetOperation"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_operation_async_real_client_cancel(server):
+    server.servicer.operation_duration = 60
+    with pytest.raises(asyncio.TimeoutError):
+        await waiter.wait_for_operation_async(
+            server.async_client(),
+            _create_cluster(server),
+            policy=FAST_POLICY,
+            deadline=0.05,
+            cancel_on_deadline=True,
+        )
+
+    assert server.servicer.calls["CancelOperation"] == 1
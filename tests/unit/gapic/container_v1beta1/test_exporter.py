@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import json
+
+from google.api_core import exceptions as core_exceptions
+import grpc
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    exporter,
+    fake_server,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+
+def make_cluster(name, node_pools=2):
+    return cluster_service.Cluster(
+        name=name,
+        resource_labels={"env": "prod"},
+        release_channel=cluster_service.ReleaseChannel(
+            channel=cluster_service.ReleaseChannel.Channel.REGULAR
+        ),
+        node_pools=[
+            cluster_service.NodePool(
+                name="pool-{}".format(index),
+                initial_node_count=3,
+                locations=["us-central1-a"],
+                config=cluster_service.NodeConfig(
+                    machine_type="e2-standard-8", disk_size_gb=100, spot=True
+                ),
+                autoscaling=cluster_service.NodePoolAutoscaling(
+                    enabled=True, min_node_count=1, max_node_count=5
+                ),
+            )
+            for index in range(node_pools)
+        ],
+    )
+
+
+@pytest.fixture
+def server():
+    servicer = fake_server.FakeClusterManager()
+    servicer.add_cluster("projects/a/locations/us-central1", make_cluster("a1"))
+    servicer.add_cluster("projects/a/locations/europe-west1", make_cluster("a2", 1))
+    servicer.add_cluster("projects/b/locations/us-central1", make_cluster("b1", 3))
+    servicer.subnetworks = [
+        cluster_service.UsableSubnetwork(
+            subnetwork="s{}".format(index),
+            network="default",
+            ip_cidr_range="10.0.{}.0/24".format(index),
+            secondary_ip_ranges=[
+                cluster_service.UsableSubnetworkSecondaryRange(range_name="pods")
+            ],
+        )
+        for index in range(3)
+    ]
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+def read_ndjson(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(server):
+    stream = io.StringIO()
+    with exporter.NDJSONWriter(stream) as writer:
+        stats = await exporter.export_inventory(
+            server.async_client(),
+            ["a", "projects/b"],
+            writer,
+            subnetwork_page_size=2,
+        )
+
+    assert stats.rows == {"cluster": 3, "node_pool": 6, "subnetwork": 6}
+    assert not stats.errors
+    rows = read_ndjson(stream)
+    assert len(rows) == 15
+    for row in rows:
+        assert list(row)[1:] == [column for column, _ in exporter.COLUMNS[row["kind"]]]
+
+    clusters = {row["name"]: row for row in rows if row["kind"] == "cluster"}
+    assert clusters["a1"]["project"] == "a"
+    assert clusters["a1"]["location"] == "us-central1"
+    assert clusters["a1"]["status"] == "RUNNING"
+    assert clusters["a1"]["release_channel"] == "REGULAR"
+    assert clusters["a1"]["resource_labels"] == {"env": "prod"}
+    assert clusters["b1"]["node_pool_count"] == 3
+
+    node_pools = [row for row in rows if row["kind"] == "node_pool"]
+    assert {(row["cluster"], row["name"]) for row in node_pools} == {
+        ("a1", "pool-0"),
+        ("a1", "pool-1"),
+        ("a2", "pool-0"),
+        ("b1", "pool-0"),
+        ("b1", "pool-1"),
+        ("b1", "pool-2"),
+    }
+    pool = node_pools[0]
+    assert pool["machine_type"] == "e2-standard-8"
+    assert pool["spot"] is True
+    assert pool["autoscaling_enabled"] is True
+    assert pool["max_node_count"] == 5
+    assert pool["locations"] == ["us-central1-a"]
+
+    subnetworks = [row for row in rows if row["kind"] == "subnetwork"]
+    assert subnetworks[0]["secondary_ip_ranges"] == ["pods"]
+
+    # Clusters are fetched without their node pool details.
+    assert server.servicer.calls["ListClusters"] == 2
+    assert server.servicer.calls["ListNodePools"] == 3
+
+
+@pytest.mark.asyncio
+async def test_export_errors(server):
+    server.servicer.inject_error("ListNodePools", grpc.StatusCode.UNAVAILABLE)
+    server.servicer.add_cluster("projects/c/locations/us-central1", make_cluster("c1"))
+    server.servicer.inject_error("ListClusters", grpc.StatusCode.PERMISSION_DENIED)
+    stream = io.StringIO()
+
+    stats = await exporter.export_inventory(
+        server.async_client(),
+        ["a"],
+        exporter.NDJSONWriter(stream),
+        subnetworks=False,
+        max_concurrency=1,
+    )
+
+    assert stats.rows["cluster"] == 0
+    assert [parent for parent, _ in stats.errors] == ["projects/a"]
+    assert isinstance(stats.errors[0][1], core_exceptions.PermissionDenied)
+
+    stats = await exporter.export_inventory(
+        server.async_client(),
+        ["a"],
+        exporter.NDJSONWriter(stream),
+        subnetworks=False,
+        max_concurrency=1,
+    )
+    assert stats.rows == {"cluster": 2, "node_pool": 2, "subnetwork": 0}
+    (parent, error) = stats.errors[0]
+    assert parent.startswith("projects/a/locations/")
+    assert isinstance(error, core_exceptions.ServiceUnavailable)
+
+
+@pytest.mark.asyncio
+async def test_export_clusters_only(server):
+    stream = io.StringIO()
+    stats = await exporter.export_inventory(
+        server.async_client(),
+        ["b"],
+        exporter.NDJSONWriter(stream),
+        node_pools=False,
+        subnetworks=False,
+    )
+    assert stats.rows == {"cluster": 1, "node_pool": 0, "subnetwork": 0}
+    assert [row["kind"] for row in read_ndjson(stream)] == ["cluster"]
+    assert "ListNodePools" not in server.servicer.calls
+
+    with pytest.raises(ValueError):
+        await exporter.export_inventory(
+            server.async_client(),
+            ["b"],
+            exporter.NDJSONWriter(stream),
+            max_concurrency=0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(server, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    with exporter.ParquetWriter(str(tmp_path), batch_size=2) as writer:
+        stats = await exporter.export_inventory(
+            server.async_client(), ["a", "b"], writer
+        )
+
+    for kind, count in stats.rows.items():
+        parquet_file = pq.ParquetFile(writer.path(kind))
+        assert parquet_file.metadata.num_rows == count
+        assert parquet_file.metadata.num_row_groups == (count + 1) // 2
+        assert parquet_file.schema_arrow == writer.schema(kind)
+
+    table = pq.read_table(writer.path(exporter.CLUSTER)).to_pylist()
+    assert sorted(row["name"] for row in table) == ["a1", "a2", "b1"]
+    assert table[0]["resource_labels"] == [("env", "prod")]
+
+
+def test_parquet_writer_only_creates_written_kinds(tmp_path):
+    pytest.importorskip("pyarrow")
+    directory = tmp_path / "out"
+    writer = exporter.ParquetWriter(str(directory))
+    writer.write(
+        exporter.SUBNETWORK,
+        exporter.subnetwork_row("p", cluster_service.UsableSubnetwork(subnetwork="s")),
+    )
+    writer.close()
+    assert [path.name for path in directory.iterdir()] == ["subnetwork.parquet"]
+
+    with pytest.raises(ValueError):
+        exporter.ParquetWriter(str(directory), batch_size=0)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+from google.api_core import exceptions as core_exceptions
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    fake_server,
+)
+from google.cloud.container_v1beta1.services.cluster_manager.transports import (
+    ClusterManagerGrpcAsyncIOTransport,
+    ClusterManagerGrpcTransport,
+    hedging,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+SLOW = 0.5
+
+
+class FirstCallSlow:
+    """Delays the first call of each RPC."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seen = set()
+
+    def __call__(self, method):
+        with self._lock:
+            if method in self._seen:
+                return 0.0
+            self._seen.add(method)
+            return SLOW
+
+
+@pytest.fixture
+def server():
+    servicer = fake_server.FakeClusterManager(latency=FirstCallSlow())
+    servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+def _client(server, **kwargs):
+    transport = ClusterManagerGrpcTransport(channel=server.channel(), **kwargs)
+    return ClusterManagerClient(transport=transport)
+
+
+def _async_client(server, **kwargs):
+    transport = ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel(server.address), **kwargs
+    )
+    return ClusterManagerAsyncClient(transport=transport)
+
+
+def test_retry_budget():
+    now = [0.0]
+    budget = hedging.RetryBudget(
+        ratio=0.5, min_retries_per_second=1.0, max_balance=1.0, clock=lambda: now[0]
+    )
+    # The per-second reserve.
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    now[0] = 1.0
+    assert budget.try_withdraw()
+
+    for _ in range(4):
+        budget.deposit()
+    # Deposits beyond the maximum balance are lost.
+    assert budget.balance == 1.0
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    assert (budget.deposits, budget.withdrawals, budget.rejected) == (4, 3, 2)
+
+    predicate = budget.predicate(lambda exc: isinstance(exc, ValueError))
+    budget.deposit()
+    budget.deposit()
+    assert not predicate(KeyError())
+    assert predicate(ValueError())
+    assert not predicate(ValueError())
+
+    with pytest.raises(ValueError):
+        hedging.RetryBudget(ratio=-1)
+
+
+def test_hedging_policy():
+    policy = hedging.HedgingPolicy(min_samples=10)
+    assert policy.hedges_method("GetCluster")
+    assert policy.hedges_method("ListNodePools")
+    assert not policy.hedges_method("SetNodePoolSize")
+
+    for seconds in range(1, 10):
+        policy.observe("GetCluster", float(seconds))
+    assert policy.delay("GetCluster") is None
+    for seconds in range(10, 101):
+        policy.observe("GetCluster", float(seconds))
+    assert policy.delay("GetCluster") == 95.0
+    assert policy.delay("ListClusters") is None
+
+    policy = hedging.HedgingPolicy(0.5, methods=["GetOperation"])
+    assert policy.delay("GetCluster") == 0.5
+    assert not policy.hedges_method("GetCluster")
+
+    with pytest.raises(ValueError):
+        hedging.HedgingPolicy(percentile=0)
+    with pytest.raises(ValueError):
+        hedging.HedgingPolicy(min_samples=10, window=5)
+
+
+def test_retry_budget_limits_default_retries(server):
+    budget = hedging.RetryBudget(ratio=1.0, min_retries_per_second=0)
+    client = _client(server, retry_budget=budget)
+
+    server.servicer.inject_error("ListClusters", grpc.StatusCode.UNAVAILABLE)
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        client.list_clusters(request={"parent": PARENT})
+    assert budget.rejected == 1
+
+    # A successful call pays for a retry.
+    client.list_clusters(request={"parent": PARENT})
+    server.servicer.inject_error("ListClusters", grpc.StatusCode.UNAVAILABLE)
+    client.list_clusters(request={"parent": PARENT})
+    assert (budget.deposits, budget.withdrawals) == (2, 1)
+    assert server.servicer.calls["ListClusters"] == 4
+
+
+def test_hedged_read(server):
+    policy = hedging.HedgingPolicy(0.05)
+    client = _client(server, hedging=policy)
+    transport = client.transport
+    assert isinstance(transport.get_cluster, hedging._HedgedUnaryUnaryMultiCallable)
+    # Mutations are not hedged, so their stubs are not wrapped.
+    assert not isinstance(
+        transport.set_node_pool_size, hedging._HedgedUnaryUnaryMultiCallable
+    )
+
+    started = time.monotonic()
+    cluster = client.get_cluster(request={"name": CLUSTER})
+    assert time.monotonic() - started < SLOW
+    assert cluster.name == "c"
+    assert (policy.hedges, policy.hedge_wins) == (1, 1)
+
+    # Fast calls are not hedged.
+    client.get_cluster(request={"name": CLUSTER})
+    assert policy.hedges == 1
+
+
+def test_hedges_are_budgeted(server):
+    policy = hedging.HedgingPolicy(0.05)
+    budget = hedging.RetryBudget(min_retries_per_second=0)
+    client = _client(server, hedging=policy, retry_budget=budget)
+
+    started = time.monotonic()
+    client.get_cluster(request={"name": CLUSTER})
+    assert time.monotonic() - started >= SLOW
+    assert policy.hedges == 0
+    assert (budget.deposits, budget.rejected) == (1, 1)
+
+
+def test_hedged_read_errors(server):
+    policy = hedging.HedgingPolicy(0.05)
+    client = _client(server, hedging=policy)
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_cluster(request={"name": PARENT + "/clusters/missing"})
+    assert policy.hedges == 1
+
+
+@pytest.mark.asyncio
+async def test_async_hedged_read(server):
+    policy = hedging.HedgingPolicy(0.05)
+    budget = hedging.RetryBudget()
+    client = _async_client(server, hedging=policy, retry_budget=budget)
+
+    started = time.monotonic()
+    cluster = await client.get_cluster(request={"name": CLUSTER})
+    assert time.monotonic() - started < SLOW
+    assert cluster.name == "c"
+    assert (policy.hedges, policy.hedge_wins) == (1, 1)
+    assert budget.deposits == 1
+
+    # The first hedge used the per-second reserve of the budget.
+    await client.list_node_pools(request={"parent": CLUSTER})
+    assert policy.hedges == 1
+    assert budget.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retry_budget(server):
+    budget = hedging.RetryBudget(min_retries_per_second=0)
+    client = _async_client(server, retry_budget=budget)
+    server.servicer.inject_error("GetCluster", grpc.StatusCode.UNAVAILABLE)
+
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        await client.get_cluster(request={"name": CLUSTER})
+    await client.get_cluster(request={"name": CLUSTER})
+    assert budget.deposits == 1
+
+    # The default retries of the async client use the budget too.
+    predicate = client.transport._retry_predicate(core_exceptions.ServiceUnavailable)
+    assert not predicate(core_exceptions.ServiceUnavailable("unavailable"))
+    assert budget.rejected == 1
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    fake_server,
+)
+from google.cloud.container_v1beta1.services.cluster_manager.transports import (
+    ClusterManagerGrpcAsyncIOTransport,
+    ClusterManagerGrpcTransport,
+    metrics,
+    pool,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+        yield server
+
+
+def _client(server, registry, channel=None):
+    transport = ClusterManagerGrpcTransport(
+        channel=channel or server.channel(), metrics=registry
+    )
+    return ClusterManagerClient(transport=transport)
+
+
+def test_histogram():
+    histogram = metrics.Histogram([1.0, 2.0])
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.bucket_counts == [2, 1]
+    assert histogram.cumulative_counts() == [2, 3]
+    assert histogram.count == 4
+    assert histogram.sum == 6.0
+
+
+def test_method_name():
+    assert (
+        metrics.method_name("/google.container.v1beta1.ClusterManager/ListClusters")
+        == "ListClusters"
+    )
+
+
+def test_uninstrumented_by_default(server):
+    channel = server.channel()
+    transport = ClusterManagerGrpcTransport(channel=channel)
+    assert transport.grpc_channel is channel
+    assert transport._metrics is None
+
+
+def test_records_calls(server):
+    registry = metrics.MetricsRegistry()
+    client = _client(server, registry)
+
+    client.get_cluster(request={"name": CLUSTER})
+
+    stats = registry.stats("GetCluster")
+    assert stats.attempts == 1
+    assert stats.calls == 1
+    assert stats.status_codes == {"OK": 1}
+    assert stats.in_flight == 0
+    assert stats.request_bytes.count == 1
+    assert stats.request_bytes.sum == len(
+        cluster_service.GetClusterRequest.serialize(
+            cluster_service.GetClusterRequest(name=CLUSTER)
+        )
+    )
+    assert stats.response_bytes.count == 1
+    assert stats.response_bytes.sum > 0
+    assert registry.methods() == ["GetCluster"]
+
+
+def test_records_retried_attempts(server):
+    registry = metrics.MetricsRegistry()
+    client = _client(server, registry)
+    server.servicer.inject_error("ListClusters", grpc.StatusCode.UNAVAILABLE)
+
+    client.list_clusters(request={"parent": PARENT})
+
+    stats = registry.stats("ListClusters")
+    assert stats.attempts == 2
+    assert stats.calls == 1
+    assert stats.status_codes == {"UNAVAILABLE": 1, "OK": 1}
+    assert stats.call_latency.sum >= stats.attempt_latency.sum
+
+
+def test_records_errors(server):
+    registry = metrics.MetricsRegistry()
+    client = _client(server, registry)
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_cluster(request={"name": PARENT + "/clusters/missing"})
+
+    stats = registry.stats("GetCluster")
+    assert stats.status_codes == {"NOT_FOUND": 1}
+    assert stats.calls == 1
+    assert stats.response_bytes.count == 0
+
+
+def test_in_flight():
+    registry = metrics.MetricsRegistry()
+    observed = []
+    callable_ = mock.Mock(
+        side_effect=lambda *args, **kwargs: observed.append(
+            registry.stats("GetCluster").in_flight
+        )
+    )
+    channel = mock.Mock(spec=grpc.Channel)
+    channel.unary_unary.return_value = callable_
+
+    stub = registry.instrument_channel(channel).unary_unary(
+        "/google.container.v1beta1.ClusterManager/GetCluster"
+    )
+    stub(b"")
+
+    assert observed == [1]
+    assert registry.stats("GetCluster").in_flight == 0
+
+
+def test_with_channel_pool(server):
+    registry = metrics.MetricsRegistry()
+    channels = pool.ChannelPool([server.channel() for _ in range(2)])
+    client = _client(server, registry, channel=channels)
+
+    for _ in range(4):
+        client.get_cluster(request={"name": CLUSTER})
+
+    assert registry.stats("GetCluster").attempts == 4
+    assert client.transport.grpc_channel.in_flight == [0, 0]
+
+
+def test_prometheus(server):
+    registry = metrics.MetricsRegistry(latency_buckets=[0.5, 60.0])
+    client = _client(server, registry)
+    client.get_cluster(request={"name": CLUSTER})
+
+    text = registry.to_prometheus(prefix="gke")
+
+    assert "# TYPE gke_attempt_latency_seconds histogram" in text
+    assert 'gke_attempt_latency_seconds_bucket{method="GetCluster",le="60.0"} 1' in text
+    assert 'gke_attempt_latency_seconds_bucket{method="GetCluster",le="+Inf"} 1' in text
+    assert 'gke_call_latency_seconds_count{method="GetCluster"} 1' in text
+    assert 'gke_request_bytes_count{method="GetCluster"} 1' in text
+    assert 'gke_attempts_total{method="GetCluster",code="OK"} 1' in text
+    assert 'gke_in_flight{method="GetCluster"} 0' in text
+    assert text.endswith("\n")
+
+
+def test_reset(server):
+    registry = metrics.MetricsRegistry()
+    _client(server, registry).get_cluster(request={"name": CLUSTER})
+
+    registry.reset()
+    assert registry.stats("GetCluster").attempts == 0
+
+
+def test_open_telemetry_sink(server):
+    meter = mock.Mock()
+    histograms = {}
+
+    def create_histogram(name, **kwargs):
+        return histograms.setdefault(name, mock.Mock())
+
+    meter.create_histogram.side_effect = create_histogram
+    registry = metrics.MetricsRegistry(sinks=[metrics.OpenTelemetrySink(meter)])
+    _client(server, registry).get_cluster(request={"name": CLUSTER})
+
+    attempt = histograms["container.cluster_manager.attempt.duration"]
+    (seconds, attributes), _ = attempt.record.call_args
+    assert seconds >= 0
+    assert attributes == {"rpc.method": "GetCluster", "rpc.grpc.status_code": "OK"}
+    histograms["container.cluster_manager.call.duration"].record.assert_called_once()
+    histograms["container.cluster_manager.request.size"].record.assert_called_once()
+    histograms["container.cluster_manager.response.size"].record.assert_called_once()
+    in_flight = meter.create_up_down_counter.return_value
+    assert [call.args[0] for call in in_flight.add.call_args_list] == [1, -1]
+
+
+def _async_client(server, registry):
+    transport = ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel(server.address), metrics=registry
+    )
+    return ClusterManagerAsyncClient(transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_async_records_calls(server):
+    sink = mock.Mock(spec=metrics.MetricsSink)
+    registry = metrics.MetricsRegistry(sinks=[sink])
+    client = _async_client(server, registry)
+    server.servicer.inject_error("GetCluster", grpc.StatusCode.PERMISSION_DENIED)
+
+    with pytest.raises(core_exceptions.PermissionDenied):
+        await client.get_cluster(request={"name": CLUSTER})
+    cluster = await client.get_cluster(request={"name": CLUSTER})
+
+    assert cluster.name == "c"
+    stats = registry.stats("GetCluster")
+    assert stats.attempts == 2
+    assert stats.status_codes == {"PERMISSION_DENIED": 1, "OK": 1}
+    assert stats.in_flight == 0
+    assert stats.response_bytes.count == 1
+    assert stats.calls == 2
+    assert [call.args[2] for call in sink.on_call.call_args_list] == [
+        "PERMISSION_DENIED",
+        "OK",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_records_cancelled_calls():
+    registry = metrics.MetricsRegistry()
+
+    async def hang(request):
+        await asyncio.sleep(60)
+
+    instrumented = registry.instrument_call_async("GetCluster", hang)
+    task = asyncio.ensure_future(instrumented(b""))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert registry.stats("GetCluster").calls == 1
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    pagers,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+
+def test_list_usable_subnetworks_prefetch_pages(transport_name: str = "grpc"):
+    client = ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials,
+        transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_usable_subnetworks), "__call__"
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token="abc",
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[],
+                next_page_token="def",
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token="ghi",
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pager = client.list_usable_subnetworks(request={}, prefetch=2)
+        pages = list(pager.pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+        assert len(pages) == 4
+        assert pager.next_page_token == ""
+        assert call.call_count == 4
+
+
+def test_list_usable_subnetworks_prefetch_error(transport_name: str = "grpc"):
+    client = ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials,
+        transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_usable_subnetworks), "__call__"
+    ) as call:
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[cluster_service.UsableSubnetwork()],
+                next_page_token="abc",
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[cluster_service.UsableSubnetwork()],
+                next_page_token="def",
+            ),
+            core_exceptions.InternalServerError("boom"),
+        )
+        pager = client.list_usable_subnetworks(request={}, prefetch=1)
+        results = []
+        with pytest.raises(core_exceptions.InternalServerError):
+            for result in pager:
+                results.append(result)
+
+        # Every page fetched before the failure is still delivered in order.
+        assert len(results) == 2
+
+
+def test_list_usable_subnetworks_prefetch_negative():
+    with pytest.raises(ValueError):
+        pagers.ListUsableSubnetworksPager(
+            method=mock.Mock(),
+            request=cluster_service.ListUsableSubnetworksRequest(),
+            response=cluster_service.ListUsableSubnetworksResponse(),
+            prefetch=-1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_usable_subnetworks_async_prefetch_pages():
+    client = ClusterManagerAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_usable_subnetworks),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token="abc",
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[],
+                next_page_token="def",
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                ],
+                next_page_token="ghi",
+            ),
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[
+                    cluster_service.UsableSubnetwork(),
+                    cluster_service.UsableSubnetwork(),
+                ],
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.list_usable_subnetworks(request={}, prefetch=2)
+        responses = []
+        async for response in async_pager:  # pragma: no branch
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, cluster_service.UsableSubnetwork) for i in responses)
+        assert call.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_list_usable_subnetworks_async_prefetch_error():
+    client = ClusterManagerAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_usable_subnetworks),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        call.side_effect = (
+            cluster_service.ListUsableSubnetworksResponse(
+                subnetworks=[cluster_service.UsableSubnetwork()],
+                next_page_token="abc",
+            ),
+            core_exceptions.InternalServerError("boom"),
+        )
+        async_pager = await client.list_usable_subnetworks(request={}, prefetch=1)
+        responses = []
+        with pytest.raises(core_exceptions.InternalServerError):
+            async for response in async_pager:  # pragma: no branch
+                responses.append(response)
+
+        assert len(responses) == 1
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.api_core import exceptions as core_exceptions
+from google.protobuf import field_mask_pb2
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    fake_server,
+    fleet,
+    projection,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+DASHBOARD_FIELDS = ["name", "status", "current_master_version", "location"]
+
+
+def make_cluster():
+    return cluster_service.Cluster(
+        name="c",
+        description="full",
+        status=cluster_service.Cluster.Status.RUNNING,
+        resource_labels={"team": "a"},
+        node_pools=[
+            cluster_service.NodePool(
+                name="pool-{}".format(index),
+                initial_node_count=3,
+                config=cluster_service.NodeConfig(machine_type="e2-standard-8"),
+                instance_group_urls=["url-{}".format(index)],
+            )
+            for index in range(3)
+        ],
+        addons_config=cluster_service.AddonsConfig(
+            http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True),
+            horizontal_pod_autoscaling=cluster_service.HorizontalPodAutoscaling(
+                disabled=True
+            ),
+        ),
+    )
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, make_cluster())
+        yield server
+
+
+def test_project():
+    cluster = make_cluster()
+    projected = projection.project(
+        cluster,
+        [
+            "name",
+            "resource_labels",
+            "node_pools.name",
+            "addons_config.http_load_balancing",
+        ],
+    )
+
+    assert isinstance(projected, cluster_service.Cluster)
+    assert projected.name == "c"
+    assert projected.description == ""
+    assert projected.resource_labels == {"team": "a"}
+    assert [pool.name for pool in projected.node_pools] == [
+        "pool-0",
+        "pool-1",
+        "pool-2",
+    ]
+    assert not projected.node_pools[0].instance_group_urls
+    assert "config" not in projected.node_pools[0]
+    assert projected.addons_config.http_load_balancing.disabled
+    assert "horizontal_pod_autoscaling" not in projected.addons_config
+    # The source is left untouched.
+    assert cluster.description == "full"
+
+
+def test_project_protobuf_and_masks():
+    pb = cluster_service.Cluster.pb(make_cluster())
+
+    projected = projection.project(pb, field_mask_pb2.FieldMask(paths=["name"]))
+    assert isinstance(projected, cluster_service.Cluster.pb())
+    assert projected.name == "c"
+    assert not projected.node_pools
+
+    # A parent path keeps the whole field whatever the order.
+    for fields in ("node_pools,node_pools.name", "node_pools.name, node_pools"):
+        projected = projection.project(pb, fields)
+        assert projected.node_pools[0].config.machine_type == "e2-standard-8"
+
+    # Unset singular messages stay unset.
+    projected = projection.project(pb, ["autopilot.enabled"])
+    assert not projected.HasField("autopilot")
+
+
+def test_project_invalid_paths():
+    cluster = make_cluster()
+    with pytest.raises(ValueError):
+        projection.project(cluster, ["no_such_field"])
+    with pytest.raises(ValueError):
+        projection.project(cluster, ["name.first"])
+    with pytest.raises(ValueError):
+        projection.project(cluster, ["resource_labels.team"])
+
+
+def test_field_mask_metadata():
+    assert projection.field_mask_metadata(["name", "status"]) == (
+        "x-goog-fieldmask",
+        "name,status",
+    )
+    assert projection.field_mask_metadata(
+        "name", prefix="clusters", extra=("missing_zones",)
+    ) == ("x-goog-fieldmask", "clusters.name,missing_zones")
+    with pytest.raises(ValueError):
+        projection.field_mask_metadata([])
+
+    assert projection.field_mask_from_metadata(
+        [("x-goog-request-params", "name=c"), ("X-Goog-FieldMask", b"a, b.c")]
+    ) == ("a", "b.c")
+    assert projection.field_mask_from_metadata([]) is None
+
+
+def test_list_clusters_fields(server):
+    client = server.client()
+    full = client.list_clusters(request={"parent": PARENT})
+    response = client.list_clusters(request={"parent": PARENT}, fields=DASHBOARD_FIELDS)
+
+    (cluster,) = response.clusters
+    assert cluster.name == "c"
+    assert cluster.status == cluster_service.Cluster.Status.RUNNING
+    assert cluster.location == "us-central1"
+    assert cluster.current_master_version
+    assert not cluster.node_pools
+    assert (
+        len(cluster_service.ListClustersResponse.serialize(response))
+        < len(cluster_service.ListClustersResponse.serialize(full)) / 4
+    )
+
+
+def test_get_cluster_fields(server):
+    client = server.client()
+    cluster = client.get_cluster(
+        request={"name": CLUSTER}, fields=["name", "node_pools.name"]
+    )
+    assert cluster.name == "c"
+    assert cluster.status == cluster_service.Cluster.Status.STATUS_UNSPECIFIED
+    assert [pool.name for pool in cluster.node_pools] == [
+        "pool-0",
+        "pool-1",
+        "pool-2",
+    ]
+    assert not cluster.node_pools[0].initial_node_count
+
+    with pytest.raises(core_exceptions.InvalidArgument):
+        client.get_cluster(request={"name": CLUSTER}, fields=["no_such_field"])
+
+
+def test_fleet_fields(server):
+    results = list(fleet.get_clusters(server.client(), [CLUSTER], fields=["status"]))
+    assert [result.response.status for result in results] == [
+        cluster_service.Cluster.Status.RUNNING
+    ]
+    assert not results[0].response.name
+
+
+@pytest.mark.asyncio
+async def test_async_fields(server):
+    client = server.async_client()
+    response = await client.list_clusters(request={"parent": PARENT}, fields=["name"])
+    assert [cluster.name for cluster in response.clusters] == ["c"]
+    assert not response.clusters[0].node_pools
+
+    cluster = await client.get_cluster(request={"name": CLUSTER}, fields=["status"])
+    assert cluster.status == cluster_service.Cluster.Status.RUNNING
+    assert not cluster.name
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.auth import credentials as ga_credentials
+import grpc
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    ClusterManagerClient,
+    fake_server,
+)
+from google.cloud.container_v1beta1.services.cluster_manager.transports import (
+    ClusterManagerGrpcTransport,
+    registry,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+        yield server
+
+
+@pytest.fixture
+def channels(server):
+    """Patches the transport to open channels to ``server``."""
+    opened = []
+
+    def create_channel(*args, **kwargs):
+        channel = mock.Mock(wraps=server.channel())
+        opened.append(channel)
+        return channel
+
+    with mock.patch.object(
+        ClusterManagerGrpcTransport, "create_channel", side_effect=create_channel
+    ):
+        yield opened
+
+
+def test_clients_share_channels(channels):
+    channel_registry = registry.ChannelRegistry()
+    credentials = ga_credentials.AnonymousCredentials()
+    clients = [
+        ClusterManagerClient(credentials=credentials, channel_registry=channel_registry)
+        for _ in range(3)
+    ]
+    assert len(channels) == 1
+    for client in clients:
+        assert client.get_cluster(request={"name": CLUSTER}).name == "c"
+
+    # Other credentials or options get a channel of their own.
+    ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        channel_registry=channel_registry,
+    )
+    ClusterManagerClient(
+        credentials=credentials,
+        client_options={"api_endpoint": "other.googleapis.com"},
+        channel_registry=channel_registry,
+    )
+    ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(
+            credentials=credentials,
+            channel_pool_size=2,
+            channel_registry=channel_registry,
+        )
+    )
+    assert len(channels) == 5
+    assert len(channel_registry) == 4
+
+
+def test_close_releases_reference(channels):
+    clock = Clock()
+    channel_registry = registry.ChannelRegistry(idle_timeout=10, clock=clock)
+    credentials = ga_credentials.AnonymousCredentials()
+    first, second = (
+        ClusterManagerClient(credentials=credentials, channel_registry=channel_registry)
+        for _ in range(2)
+    )
+    (channel,) = channels
+    key = first.transport.grpc_channel._key
+
+    with first:
+        pass
+    first.transport.close()
+    assert channel_registry.references(key) == 1
+    assert second.get_cluster(request={"name": CLUSTER}).name == "c"
+
+    second.transport.close()
+    assert channel_registry.references(key) == 0
+    clock.now = 9
+    assert channel_registry.evict_idle() == 0
+    # An idle channel is reused.
+    third = ClusterManagerClient(
+        credentials=credentials, channel_registry=channel_registry
+    )
+    assert len(channels) == 1
+    third.transport.close()
+
+    clock.now = 19
+    assert channel_registry.evict_idle() == 1
+    channel.close.assert_called_once_with()
+    assert len(channel_registry) == 0
+    ClusterManagerClient(credentials=credentials, channel_registry=channel_registry)
+    assert len(channels) == 2
+
+
+def test_idle_channels_closed_on_release():
+    channel_registry = registry.ChannelRegistry(idle_timeout=0)
+    channel = mock.Mock(spec=grpc.Channel)
+    shared = channel_registry.acquire("key", lambda: channel)
+    callback = mock.Mock()
+    shared.subscribe(callback)
+
+    shared.close()
+    shared.close()
+
+    channel.unsubscribe.assert_called_once_with(callback)
+    channel.close.assert_called_once_with()
+    assert len(channel_registry) == 0
+
+
+def test_registry_close():
+    channel_registry = registry.ChannelRegistry(idle_timeout=None)
+    opened = [mock.Mock(spec=grpc.Channel) for _ in range(2)]
+    shared = [channel_registry.acquire(key, opened[key].__call__) for key in (0, 1)]
+    assert channel_registry.acquire(0, mock.Mock()).channel is shared[0].channel
+    shared[1].close()
+    assert channel_registry.evict_idle() == 0
+    assert channel_registry.evict_idle(idle_timeout=0) == 1
+
+    channel_registry.close()
+    assert len(channel_registry) == 0
+    for channel in opened:
+        channel.return_value.close.assert_called_once_with()
+    # Releasing a closed channel is a no-op.
+    shared[0].close()
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        registry.ChannelRegistry(idle_timeout=-1)
+    with pytest.raises(ValueError):
+        ClusterManagerClient(
+            transport=ClusterManagerGrpcTransport(channel=grpc.insecure_channel("x")),
+            channel_registry=registry.ChannelRegistry(),
+        )
+    assert registry.default_registry() is registry.default_registry()
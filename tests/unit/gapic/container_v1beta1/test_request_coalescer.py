@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+import threading
+import time
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    cache,
+    fake_server,
+    projection,
+)
+from google.cloud.container_v1beta1.services.cluster_manager.transports import (
+    ClusterManagerGrpcAsyncIOTransport,
+    ClusterManagerGrpcTransport,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+CLUSTER = PARENT + "/clusters/c"
+
+
+@pytest.fixture
+def server():
+    servicer = fake_server.FakeClusterManager(latency=0.2)
+    servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+    servicer.add_cluster(PARENT, cluster_service.Cluster(name="d"))
+    with fake_server.FakeServer(servicer) as server:
+        yield server
+
+
+def _metadata(name):
+    return (gapic_v1.routing_header.to_grpc_metadata((("name", name),)),)
+
+
+def test_cache_key_includes_field_mask():
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    metadata = _metadata(CLUSTER)
+    masked = metadata + (projection.field_mask_metadata(["name"]),)
+    assert cache.cache_key("get_cluster", request, masked) != cache.cache_key(
+        "get_cluster", request, metadata
+    )
+
+
+def test_concurrent_calls_share_one_load():
+    coalescer = cache.RequestCoalescer()
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    release = threading.Event()
+    loads = []
+
+    def load():
+        loads.append(1)
+        release.wait()
+        return cluster_service.Cluster(name="c")
+
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = [
+            executor.submit(coalescer.call, "get_cluster", request, (), load)
+            for _ in range(4)
+        ]
+        while coalescer.coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        clusters = [result.result() for result in results]
+
+    assert len(loads) == 1
+    assert (coalescer.calls, coalescer.coalesced) == (1, 3)
+    assert all(cluster == cluster_service.Cluster(name="c") for cluster in clusters)
+    # Every caller gets a response of its own.
+    assert len({id(cluster) for cluster in clusters}) == 4
+    assert coalescer.in_flight() == 0
+
+
+def test_errors_are_shared():
+    coalescer = cache.RequestCoalescer()
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    started = threading.Event()
+    release = threading.Event()
+
+    def load():
+        started.set()
+        release.wait()
+        raise core_exceptions.NotFound("missing")
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(coalescer.call, "get_cluster", request, (), load)
+        started.wait()
+        follower = executor.submit(coalescer.call, "get_cluster", request, (), load)
+        while coalescer.coalesced < 1:
+            time.sleep(0.001)
+        release.set()
+        with pytest.raises(core_exceptions.NotFound):
+            leader.result()
+        with pytest.raises(core_exceptions.NotFound):
+            follower.result()
+
+    # Nothing is kept once the call finished.
+    assert coalescer.call("get_cluster", request, (), lambda: "fresh") == "fresh"
+
+
+def test_client_coalesces_concurrent_reads(server):
+    coalescer = cache.RequestCoalescer()
+    transport = ClusterManagerGrpcTransport(channel=server.channel())
+    client = ClusterManagerClient(transport=transport, request_coalescer=coalescer)
+    assert coalescer.coalesces("get_cluster")
+    assert not coalescer.coalesces("set_node_pool_size")
+
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        clusters = list(
+            executor.map(
+                lambda _: client.get_cluster(request={"name": CLUSTER}), range(4)
+            )
+        )
+
+    assert [cluster.name for cluster in clusters] == ["c"] * 4
+    assert server.servicer.calls["GetCluster"] == 1
+    assert coalescer.calls + coalescer.coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_concurrent_reads(server):
+    coalescer = cache.RequestCoalescer()
+    transport = ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel(server.address)
+    )
+    client = ClusterManagerAsyncClient(transport=transport, request_coalescer=coalescer)
+
+    results = await asyncio.gather(
+        *[client.get_cluster(request={"name": CLUSTER}) for _ in range(5)],
+        client.get_cluster(request={"name": PARENT + "/clusters/d"}),
+        client.get_cluster(request={"name": CLUSTER}, fields=["name"]),
+        client.get_node_pool(request={"name": CLUSTER + "/nodePools/default-pool"}),
+        client.get_node_pool(request={"name": CLUSTER + "/nodePools/default-pool"}),
+    )
+
+    assert [result.name for result in results[:7]] == ["c"] * 5 + ["d", "c"]
+    assert results[7] == results[8]
+    assert results[7] is not results[8]
+    assert server.servicer.calls["GetCluster"] == 3
+    assert server.servicer.calls["GetNodePool"] == 1
+    assert (coalescer.calls, coalescer.coalesced) == (4, 5)
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_leader():
+    coalescer = cache.RequestCoalescer()
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return cluster_service.Cluster(name="c")
+
+    leader = asyncio.ensure_future(
+        coalescer.call_async("get_cluster", request, (), load)
+    )
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(
+        coalescer.call_async("get_cluster", request, (), load)
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    # The follower made its own call.
+    assert (await follower).name == "c"
+    assert leader.cancelled()
+    assert coalescer.calls == 2
+
+
+def test_follower_honours_its_timeout():
+    coalescer = cache.RequestCoalescer()
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    started = threading.Event()
+    release = threading.Event()
+
+    def load():
+        started.set()
+        release.wait()
+        return cluster_service.Cluster(name="c")
+
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(coalescer.call, "get_cluster", request, (), load)
+        started.wait()
+        with pytest.raises(core_exceptions.DeadlineExceeded):
+            coalescer.call("get_cluster", request, (), load, timeout=0.01)
+        release.set()
+        # The joined call is unaffected.
+        assert leader.result().name == "c"
+
+    assert (coalescer.calls, coalescer.coalesced) == (1, 1)
+
+
+def test_client_follower_honours_its_timeout(server):
+    coalescer = cache.RequestCoalescer()
+    transport = ClusterManagerGrpcTransport(channel=server.channel())
+    client = ClusterManagerClient(transport=transport, request_coalescer=coalescer)
+
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(client.get_cluster, request={"name": CLUSTER})
+        while coalescer.in_flight() < 1:
+            time.sleep(0.001)
+        with pytest.raises(core_exceptions.DeadlineExceeded):
+            client.get_cluster(request={"name": CLUSTER}, timeout=0.01)
+        assert leader.result().name == "c"
+
+    assert server.servicer.calls["GetCluster"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_follower_honours_its_timeout():
+    coalescer = cache.RequestCoalescer()
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return cluster_service.Cluster(name="c")
+
+    leader = asyncio.ensure_future(
+        coalescer.call_async("get_cluster", request, (), load)
+    )
+    await asyncio.sleep(0)
+    with pytest.raises(core_exceptions.DeadlineExceeded):
+        await coalescer.call_async("get_cluster", request, (), load, timeout=0.01)
+    release.set()
+
+    assert (await leader).name == "c"
+    assert (coalescer.calls, coalescer.coalesced) == (1, 1)
+
+
+def test_async_calls_are_coalesced_per_event_loop():
+    coalescer = cache.RequestCoalescer()
+    request = cluster_service.GetClusterRequest(name=CLUSTER)
+    started = threading.Barrier(2)
+
+    async def load():
+        # Both loops are in flight at once.
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        return cluster_service.Cluster(name="c")
+
+    def run():
+        return asyncio.run(coalescer.call_async("get_cluster", request, (), load))
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        clusters = list(executor.map(lambda _: run(), range(2)))
+
+    assert [cluster.name for cluster in clusters] == ["c", "c"]
+    assert (coalescer.calls, coalescer.coalesced) == (2, 0)
+    assert coalescer.in_flight() == 0
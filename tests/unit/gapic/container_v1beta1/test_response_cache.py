@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+    from unittest.mock import AsyncMock  # pragma: NO COVER
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1, grpc_helpers_async
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    cache,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+
+def _metadata(name):
+    return (gapic_v1.routing_header.to_grpc_metadata((("name", name),)),)
+
+
+def test_cache_key_ignores_non_routing_metadata():
+    request = cluster_service.GetServerConfigRequest(name="projects/p/locations/l")
+    assert cache.cache_key(
+        "get_server_config", request, (("x-trace", "1"),) + _metadata("a")
+    ) == cache.cache_key("get_server_config", request, _metadata("a"))
+    assert cache.cache_key(
+        "get_server_config", request, _metadata("a")
+    ) != cache.cache_key("get_server_config", request, _metadata("b"))
+
+
+def test_ttl_expiry():
+    now = [0.0]
+    responses = cache.ResponseCache({"get_server_config": 10.0}, clock=lambda: now[0])
+    request = cluster_service.GetServerConfigRequest(name="n")
+    load = mock.Mock(return_value=cluster_service.ServerConfig(default_image_type="A"))
+
+    first = responses.get_or_load("get_server_config", request, (), load)
+    second = responses.get_or_load("get_server_config", request, (), load)
+    assert first == second
+    assert first is not second
+    assert load.call_count == 1
+
+    now[0] = 11.0
+    responses.get_or_load("get_server_config", request, (), load)
+    assert load.call_count == 2
+    assert (responses.hits, responses.misses) == (1, 2)
+
+
+def test_copies_protect_cached_response():
+    responses = cache.ResponseCache()
+    request = cluster_service.GetServerConfigRequest(name="n")
+    load = mock.Mock(return_value=cluster_service.ServerConfig(default_image_type="A"))
+
+    first = responses.get_or_load("get_server_config", request, (), load)
+    first.default_image_type = "B"
+    second = responses.get_or_load("get_server_config", request, (), load)
+    assert second.default_image_type == "A"
+
+
+def test_lru_eviction():
+    responses = cache.ResponseCache(maxsize=2)
+    load = mock.Mock(return_value=cluster_service.ServerConfig())
+
+    def get(name):
+        request = cluster_service.GetServerConfigRequest(name=name)
+        responses.get_or_load("get_server_config", request, (), load)
+
+    get("a")
+    get("b")
+    get("a")
+    get("c")
+    assert len(responses) == 2
+    get("a")
+    assert load.call_count == 3
+    get("b")
+    assert load.call_count == 4
+
+
+def test_invalidate():
+    responses = cache.ResponseCache()
+    load = mock.Mock(return_value=cluster_service.ServerConfig())
+    server_config = cluster_service.GetServerConfigRequest(name="n")
+    json_web_keys = cluster_service.GetJSONWebKeysRequest(parent="p")
+    responses.get_or_load("get_server_config", server_config, (), load)
+    responses.get_or_load("get_json_web_keys", json_web_keys, (), load)
+
+    responses.invalidate("get_server_config")
+    assert len(responses) == 1
+    responses.invalidate()
+    assert len(responses) == 0
+
+
+def test_errors_are_not_cached():
+    responses = cache.ResponseCache()
+    request = cluster_service.GetServerConfigRequest(name="n")
+    load = mock.Mock(
+        side_effect=[
+            core_exceptions.ServiceUnavailable("x"),
+            cluster_service.ServerConfig(),
+        ]
+    )
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        responses.get_or_load("get_server_config", request, (), load)
+    responses.get_or_load("get_server_config", request, (), load)
+    assert load.call_count == 2
+
+
+def test_concurrent_misses_are_coalesced():
+    responses = cache.ResponseCache()
+    request = cluster_service.GetServerConfigRequest(name="n")
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return cluster_service.ServerConfig(default_image_type="A")
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                responses.get_or_load("get_server_config", request, (), load)
+            )
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while not calls:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [result.default_image_type for result in results] == ["A"] * 5
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_misses_are_coalesced():
+    responses = cache.ResponseCache()
+    request = cluster_service.GetServerConfigRequest(name="n")
+    load = mock.AsyncMock(return_value=cluster_service.ServerConfig())
+
+    async def slow_load():
+        await asyncio.sleep(0.01)
+        return await load()
+
+    results = await asyncio.gather(
+        *(
+            responses.get_or_load_async("get_server_config", request, (), slow_load)
+            for _ in range(5)
+        )
+    )
+    assert len(results) == 5
+    assert load.await_count == 1
+
+
+def test_client_get_server_config_cached():
+    client = ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        response_cache=cache.ResponseCache(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.get_server_config), "__call__"
+    ) as call:
+        call.return_value = cluster_service.ServerConfig(default_cluster_version="1")
+        first = client.get_server_config(request={"name": "projects/p/locations/l"})
+        second = client.get_server_config(request={"name": "projects/p/locations/l"})
+        client.get_server_config(request={"name": "projects/p/locations/other"})
+
+    assert first.default_cluster_version == second.default_cluster_version == "1"
+    assert call.call_count == 2
+
+
+def test_client_without_cache():
+    client = ClusterManagerClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.get_json_web_keys), "__call__"
+    ) as call:
+        call.return_value = cluster_service.GetJSONWebKeysResponse()
+        client.get_json_web_keys(request={"parent": "p"})
+        client.get_json_web_keys(request={"parent": "p"})
+
+    assert call.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_get_json_web_keys_cached():
+    responses = cache.ResponseCache()
+    client = ClusterManagerAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        response_cache=responses,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.get_json_web_keys), "__call__"
+    ) as call:
+        call.side_effect = (
+            lambda *args, **kwargs: grpc_helpers_async.FakeUnaryUnaryCall(
+                cluster_service.GetJSONWebKeysResponse(
+                    keys=[cluster_service.Jwk(kid="k")]
+                )
+            )
+        )
+        first = await client.get_json_web_keys(request={"parent": "p"})
+        second = await client.get_json_web_keys(request={"parent": "p"})
+        responses.invalidate("get_json_web_keys")
+        await client.get_json_web_keys(request={"parent": "p"})
+
+    assert first.keys[0].kid == second.keys[0].kid == "k"
+    assert call.call_count == 2
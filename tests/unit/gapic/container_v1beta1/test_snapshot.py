@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.api_core import exceptions as core_exceptions
+import grpc
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    fake_server,
+    snapshot,
+    waiter,
+)
+from google.cloud.container_v1beta1.types import cluster_service
+
+PARENT = "projects/p/locations/us-central1"
+ALL = "projects/p/locations/-"
+CLUSTER = PARENT + "/clusters/c"
+NODE_POOL = CLUSTER + "/nodePools/default-pool"
+
+
+def make_cluster(name="c", etag="1", **kwargs):
+    return cluster_service.Cluster(
+        name=name,
+        location="us-central1",
+        etag=etag,
+        node_pools=[cluster_service.NodePool(name="default-pool", etag="1")],
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        server.servicer.add_cluster(PARENT, cluster_service.Cluster(name="c"))
+        server.servicer.add_cluster(
+            "projects/p/locations/europe-west1", cluster_service.Cluster(name="d")
+        )
+        yield server
+
+
+def test_update_added_and_unchanged():
+    store = snapshot.SnapshotStore()
+    events = store.update(ALL, [make_cluster()])
+    assert events == [
+        snapshot.ChangeEvent(snapshot.CLUSTER, snapshot.ADDED, CLUSTER),
+        snapshot.ChangeEvent(snapshot.NODE_POOL, snapshot.ADDED, NODE_POOL),
+    ]
+    assert CLUSTER in store
+    assert store.get(CLUSTER).name == "c"
+
+    # The etag is unchanged, so the cluster is not compared at all.
+    assert store.update(ALL, [make_cluster(description="ignored")]) == []
+    assert (store.compared, store.skipped) == (0, 1)
+    assert store.get(CLUSTER).description == ""
+
+
+def test_update_modified():
+    store = snapshot.SnapshotStore()
+    store.update(
+        ALL,
+        [
+            make_cluster(
+                status=cluster_service.Cluster.Status.RUNNING,
+                resource_labels={"team": "a"},
+                addons_config=cluster_service.AddonsConfig(
+                    http_load_balancing=cluster_service.HttpLoadBalancing(disabled=True)
+                ),
+            )
+        ],
+    )
+    cluster = make_cluster(
+        etag="2",
+        status=cluster_service.Cluster.Status.RECONCILING,
+        resource_labels={"team": "b"},
+        addons_config=cluster_service.AddonsConfig(
+            http_load_balancing=cluster_service.HttpLoadBalancing(disabled=False)
+        ),
+    )
+    cluster.node_pools[0].etag = "2"
+    cluster.node_pools[0].initial_node_count = 5
+    cluster.node_pools.append(cluster_service.NodePool(name="extra", etag="1"))
+
+    events = store.update(ALL, [cluster])
+    assert events == [
+        snapshot.ChangeEvent(
+            snapshot.CLUSTER,
+            snapshot.MODIFIED,
+            CLUSTER,
+            "addons_config.http_load_balancing.disabled",
+            True,
+            None,
+        ),
+        snapshot.ChangeEvent(
+            snapshot.CLUSTER,
+            snapshot.MODIFIED,
+            CLUSTER,
+            "resource_labels",
+            {"team": "a"},
+            {"team": "b"},
+        ),
+        snapshot.ChangeEvent(
+            snapshot.CLUSTER,
+            snapshot.MODIFIED,
+            CLUSTER,
+            "status",
+            "RUNNING",
+            "RECONCILING",
+        ),
+        snapshot.ChangeEvent(
+            snapshot.NODE_POOL,
+            snapshot.MODIFIED,
+            NODE_POOL,
+            "initial_node_count",
+            None,
+            5,
+        ),
+        snapshot.ChangeEvent(
+            snapshot.NODE_POOL, snapshot.ADDED, CLUSTER + "/nodePools/extra"
+        ),
+    ]
+    assert (store.compared, store.skipped) == (2, 0)
+
+
+def test_update_node_pool_etag_skips():
+    store = snapshot.SnapshotStore()
+    store.update(ALL, [make_cluster()])
+    cluster = make_cluster(etag="2", description="new")
+    cluster.node_pools[0].initial_node_count = 9
+
+    events = store.update(ALL, [cluster])
+    assert [event.field for event in events] == ["description"]
+    assert (store.compared, store.skipped) == (1, 1)
+
+
+def test_update_removed():
+    store = snapshot.SnapshotStore()
+    store.update(ALL, [make_cluster(), make_cluster(name="d")])
+    other = cluster_service.Cluster(name="x", location="us-east1", etag="1")
+    store.update("projects/q/locations/-", [other])
+
+    # Only clusters in the scope of the parent can be removed.
+    events = store.update(PARENT, [make_cluster(name="d")])
+    assert events == [
+        snapshot.ChangeEvent(snapshot.CLUSTER, snapshot.REMOVED, CLUSTER),
+        snapshot.ChangeEvent(snapshot.NODE_POOL, snapshot.REMOVED, NODE_POOL),
+    ]
+    assert store.names() == [
+        PARENT + "/clusters/d",
+        "projects/q/locations/us-east1/clusters/x",
+    ]
+
+    # Clusters in unreachable locations are kept.
+    assert store.update(ALL, [], missing_zones=["us-central1"]) == []
+    assert len(store) == 2
+
+
+def test_diff_messages():
+    old = cluster_service.Cluster.pb(
+        cluster_service.Cluster(name="c", locations=["a"], initial_node_count=1)
+    )
+    new = cluster_service.Cluster.pb(
+        cluster_service.Cluster(
+            name="c",
+            locations=["a", "b"],
+            autopilot=cluster_service.Autopilot(enabled=True),
+        )
+    )
+    assert list(snapshot.diff_messages(old, new, prefix="x.")) == [
+        ("x.initial_node_count", 1, None),
+        ("x.locations", ["a"], ["a", "b"]),
+        ("x.autopilot", None, {"enabled": True}),
+    ]
+    assert list(snapshot.diff_messages(old, old)) == []
+
+
+def test_poll(server):
+    client = server.client()
+    store = snapshot.SnapshotStore()
+
+    events = store.poll(client, [ALL])
+    assert [(event.action, event.kind) for event in events] == [
+        ("added", "cluster"),
+        ("added", "node_pool"),
+        ("added", "cluster"),
+        ("added", "node_pool"),
+    ]
+    assert store.poll(client, [ALL]) == []
+    assert (store.compared, store.skipped) == (0, 2)
+
+    operation = client.set_node_pool_size(request={"name": NODE_POOL, "node_count": 5})
+    waiter.wait_for_operation(client, operation, deadline=5)
+    events = store.poll(client, [ALL])
+    assert [(event.name, event.field, event.new) for event in events] == [
+        (CLUSTER, "current_node_count", 5),
+        (NODE_POOL, "initial_node_count", 5),
+    ]
+    assert (store.compared, store.skipped) == (2, 1)
+
+    server.servicer.inject_error("ListClusters", grpc.StatusCode.PERMISSION_DENIED)
+    assert store.poll(client, [ALL]) == []
+    assert [parent for parent, _ in store.errors] == [ALL]
+    assert isinstance(store.errors[0][1], core_exceptions.PermissionDenied)
+    assert len(store) == 2
+
+    operation = client.delete_cluster(request={"name": CLUSTER})
+    waiter.wait_for_operation(client, operation, deadline=5)
+    events = store.poll(client, [ALL])
+    assert [(event.action, event.name) for event in events] == [
+        ("removed", CLUSTER),
+        ("removed", NODE_POOL),
+    ]
+    assert store.errors == []
+
+
+@pytest.mark.asyncio
+async def test_poll_async(server):
+    store = snapshot.SnapshotStore()
+    events = await store.poll_async(server.async_client(), [PARENT])
+    assert [event.name for event in events] == [CLUSTER, NODE_POOL]
+    assert await store.poll_async(server.async_client(), [PARENT]) == []
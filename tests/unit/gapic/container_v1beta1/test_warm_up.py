@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import socket
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.container_v1beta1.services.cluster_manager import (
+    ClusterManagerAsyncClient,
+    ClusterManagerClient,
+    fake_server,
+)
+from google.cloud.container_v1beta1.services.cluster_manager.transports import (
+    ClusterManagerGrpcAsyncIOTransport,
+    ClusterManagerGrpcTransport,
+    pool,
+)
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeServer() as server:
+        yield server
+
+
+@pytest.fixture
+def unused_address():
+    # Nothing listens on the port once the socket is closed.
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return "localhost:{}".format(sock.getsockname()[1])
+
+
+class States:
+    def __init__(self, channel):
+        self.seen = []
+        channel.subscribe(self.seen.append)
+
+    @property
+    def ready(self):
+        return grpc.ChannelConnectivity.READY in self.seen
+
+
+def test_warm_up(server):
+    channel = server.channel()
+    states = States(channel)
+    transport = ClusterManagerGrpcTransport(channel=channel)
+    assert not states.ready
+
+    transport.warm_up()
+
+    assert states.ready
+    # No call was made.
+    assert not server.servicer.calls
+
+
+def test_warm_up_refreshes_credentials(server):
+    transport = ClusterManagerGrpcTransport(channel=server.channel())
+    credentials = mock.Mock(spec=ga_credentials.Credentials, valid=False)
+    transport._credentials = credentials
+
+    transport.warm_up()
+    credentials.refresh.assert_called_once()
+
+    credentials.valid = True
+    transport.warm_up()
+    credentials.refresh.assert_called_once()
+
+
+def test_warm_up_connects_every_pooled_channel(server):
+    channels = [server.channel(), server.channel()]
+    states = [States(channel) for channel in channels]
+    client = ClusterManagerClient(
+        transport=ClusterManagerGrpcTransport(channel=pool.ChannelPool(channels)),
+        prewarm=True,
+    )
+
+    assert all(state.ready for state in states)
+    client.transport.close()
+
+
+def test_warm_up_timeout(unused_address):
+    transport = ClusterManagerGrpcTransport(
+        channel=grpc.insecure_channel(unused_address)
+    )
+    with pytest.raises(core_exceptions.DeadlineExceeded):
+        transport.warm_up(timeout=0.1)
+    with pytest.raises(core_exceptions.DeadlineExceeded):
+        ClusterManagerClient(transport=transport).warm_up(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_async_warm_up(server, unused_address):
+    channel = aio.insecure_channel(server.address)
+    client = ClusterManagerAsyncClient(
+        transport=ClusterManagerGrpcAsyncIOTransport(channel=channel)
+    )
+    credentials = mock.Mock(spec=ga_credentials.Credentials, valid=False)
+    client.transport._credentials = credentials
+    assert channel.get_state() != grpc.ChannelConnectivity.READY
+
+    await client.warm_up()
+
+    assert channel.get_state() == grpc.ChannelConnectivity.READY
+    credentials.refresh.assert_called_once()
+    assert not server.servicer.calls
+
+    transport = ClusterManagerGrpcAsyncIOTransport(
+        channel=aio.insecure_channel(unused_address)
+    )
+    with pytest.raises(core_exceptions.DeadlineExceeded):
+        await transport.warm_up(timeout=0.1)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import importlib.util
+import pathlib
+import sys
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import pytest
+
+pytest.importorskip("libcst")
+
+SCRIPTS = pathlib.Path(__file__).parents[2] / "scripts"
+
+CALL = "client.list_clusters('p', 'z')\n"
+FIXED = "client.list_clusters(request = {'project_id': 'p', 'zone': 'z'})\n"
+
+
+@pytest.fixture(params=["v1", "v1beta1"])
+def fixup(request):
+    name = "fixup_container_{}_keywords".format(request.param)
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS / (name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    # Registered, so that worker processes can unpickle its functions.
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[name]
+
+
+def _tree(directory, files):
+    for name, src in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(src)
+    return directory
+
+
+def _read(directory):
+    return {
+        str(path.relative_to(directory)): path.read_text()
+        for path in sorted(directory.rglob("*.py"))
+    }
+
+
+def _run(fixup, in_dir, out_dir, **kwargs):
+    out_dir.mkdir()
+    fix = mock.Mock(wraps=fixup.fix_source)
+    with mock.patch.object(fixup, "fix_source", fix):
+        fixup.fix_files(in_dir, out_dir, **kwargs)
+    return fix.call_count
+
+
+def test_prefilter_skips_files_without_methods(fixup, tmp_path):
+    in_dir = _tree(
+        tmp_path / "in",
+        {
+            "plain.py": "print('hello')\n",
+            "pkg/call.py": CALL,
+            "notes.txt": CALL,
+        },
+    )
+
+    calls = _run(fixup, in_dir, tmp_path / "out", jobs=1)
+
+    assert calls == 1
+    assert _read(tmp_path / "out") == {
+        "pkg/call.py": FIXED,
+        "plain.py": "print('hello')\n",
+    }
+
+
+def test_cache_hits_and_misses(fixup, tmp_path):
+    in_dir = _tree(tmp_path / "in", {"a.py": CALL, "b.py": "list_clusters = 1\n"})
+    cache_path = tmp_path / "cache.json"
+
+    assert _run(fixup, in_dir, tmp_path / "first", jobs=1, cache_path=cache_path) == 2
+    # Unchanged files are read from the cache.
+    assert _run(fixup, in_dir, tmp_path / "second", jobs=1, cache_path=cache_path) == 0
+    assert _read(tmp_path / "second") == _read(tmp_path / "first")
+    assert _read(tmp_path / "second")["a.py"] == FIXED
+
+    # Changed files are parsed again.
+    (in_dir / "b.py").write_text("client.list_clusters('q')\n")
+    assert _run(fixup, in_dir, tmp_path / "third", jobs=1, cache_path=cache_path) == 1
+
+    # Entries made by other method parameters are ignored.
+    with mock.patch.object(fixup, "cache_version", return_value="other"):
+        calls = _run(fixup, in_dir, tmp_path / "fourth", jobs=1, cache_path=cache_path)
+    assert calls == 2
+
+
+def test_parallel_matches_serial(fixup, tmp_path):
+    files = {
+        "pkg/mod{}.py".format(index): CALL * (index % 3) + "x = {}\n".format(index)
+        for index in range(20)
+    }
+    files["copy.py"] = files["pkg/mod1.py"]
+    in_dir = _tree(tmp_path / "in", files)
+
+    fixup.fix_files(in_dir, _mkdir(tmp_path / "serial"), jobs=1)
+    fixup.fix_files(in_dir, _mkdir(tmp_path / "parallel"), jobs=2)
+
+    assert _read(tmp_path / "parallel") == _read(tmp_path / "serial")
+    assert _read(tmp_path / "parallel")["copy.py"] == FIXED + "x = 1\n"
+
+
+def _mkdir(directory):
+    directory.mkdir()
+    return directory
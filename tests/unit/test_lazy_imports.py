@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = (
+    ("google.cloud.container", "google.cloud.container_v1"),
+    ("google.cloud.container_v1", "google.cloud.container_v1"),
+    ("google.cloud.container_v1beta1", "google.cloud.container_v1beta1"),
+)
+
+
+def _imported_modules(package):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import {}".format(package)],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    return {
+        line.rpartition("|")[2].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize("package,versioned", PACKAGES)
+def test_import_is_lazy(package, versioned):
+    modules = _imported_modules(package)
+
+    assert package in modules
+    assert versioned + ".types.cluster_service" not in modules
+    assert versioned + ".services.cluster_manager.client" not in modules
+    assert "grpc" not in modules
+
+
+@pytest.mark.parametrize("package,versioned", PACKAGES)
+def test_lazy_attributes(package, versioned):
+    module = importlib.import_module(package)
+
+    assert module.ClusterManagerClient.__module__ == (
+        versioned + ".services.cluster_manager.client"
+    )
+    assert module.Cluster.__module__ == versioned + ".types.cluster_service"
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+
+
+@pytest.mark.parametrize("package,versioned", PACKAGES)
+def test_unknown_attribute(package, versioned):
+    module = importlib.import_module(package)
+
+    with pytest.raises(AttributeError):
+        module.NotAMessage
+
+
+@pytest.mark.parametrize(
+    "package", ["google.cloud.container_v1", "google.cloud.container_v1beta1"]
+)
+def test_subpackage_attributes(package):
+    # In a fresh interpreter, so that no test has imported them already.
+    code = "\n".join(
+        [
+            "import {} as package".format(package),
+            "assert package.types.Cluster is package.Cluster",
+            "assert package.services.cluster_manager.ClusterManagerClient",
+            "assert package.gapic_version.__version__ == package.__version__",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)